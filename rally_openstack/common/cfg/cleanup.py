@@ -24,5 +24,25 @@ OPTS = {"openstack": [
     cfg.IntOpt("cleanup_threads",
                default=20,
                deprecated_group="cleanup",
-               help="Number of cleanup threads to run")
+               help="Number of cleanup threads to run"),
+    cfg.BoolOpt("cleanup_batched_deletion_check",
+                default=False,
+                help="Send all deletion requests of a resource type first and "
+                     "then confirm them by listing the resources once per "
+                     "tenant per poll interval, instead of polling every "
+                     "deleted resource separately. Applies only to resource "
+                     "managers relying on the default is_deleted() check."),
+    cfg.IntOpt("cleanup_resource_managers_workers",
+               default=1,
+               min=1,
+               help="Number of resource managers (resource types) to clean "
+                    "up simultaneously. A resource manager starts as soon as "
+                    "all the resource managers that must be deleted before "
+                    "it are finished (see 'delete_before' argument of the "
+                    "cleanup resource decorator)."),
+    cfg.IntOpt("cleanup_swift_listing_workers",
+               default=10,
+               min=1,
+               help="Number of Swift containers to list objects of "
+                    "simultaneously during the cleanup.")
 ]}
@@ -56,5 +56,16 @@ OPTS = {"openstack": [
     cfg.FloatOpt("glance_image_import_poll_interval",
                  default=2.0,
                  help="Interval between checks when waiting for image "
-                      "import.")
+                      "import."),
+    cfg.StrOpt("glance_image_cache_dir",
+               default="~/.rally/openstack/image_cache",
+               help="Directory to keep image sources downloaded from HTTP(S) "
+                    "urls in, so every source is downloaded only once."),
+    cfg.IntOpt("glance_image_cache_size",
+               default=0,
+               min=0,
+               help="Max total size (in MB) of the image sources cache. The "
+                    "least recently used sources are evicted first. 0 "
+                    "disables the cache, so sources are downloaded for "
+                    "every upload without extra requests.")
 ]}
@@ -39,8 +39,10 @@ OPTS = {"openstack": [
     cfg.FloatOpt("k8s_pod_create_poll_interval",
                  default=1.0,
                  deprecated_group="benchmark",
-                 help="Time interval(in sec) between checks when waiting for "
-                      "k8s pod creation."),
+                 help="Maximum time interval(in sec) between retries of k8s "
+                      "pod creation which is forbidden until the service "
+                      "account of a new cluster is ready. Readiness of pods "
+                      "is watched without polling."),
     cfg.FloatOpt("k8s_rc_create_timeout",
                  default=1200.0,
                  deprecated_group="benchmark",
@@ -48,6 +50,9 @@ OPTS = {"openstack": [
     cfg.FloatOpt("k8s_rc_create_poll_interval",
                  default=1.0,
                  deprecated_group="benchmark",
+                 deprecated_for_removal=True,
+                 deprecated_reason="Readiness of k8s replication "
+                                   "controllers is watched without polling.",
                  help="Time interval(in sec) between checks when waiting for "
                       "k8s rc creation.")
 ]}
@@ -37,4 +37,9 @@ OPTS = {"openstack": [
                     "Linux bridge agent",
                 ],
                 help="Neutron L2 agent types to find hosts to bind"),
+    cfg.IntOpt("neutron_ports_list_page_size",
+               default=1000,
+               min=0,
+               help="Page size to use while listing ports during the "
+                    "cleanup. 0 means to fetch all ports with one request."),
 ]}
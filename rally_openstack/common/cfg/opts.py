@@ -27,8 +27,10 @@ from rally_openstack.common.cfg import neutron
 from rally_openstack.common.cfg import nova
 from rally_openstack.common.cfg import octavia
 from rally_openstack.common.cfg import osclients
+from rally_openstack.common.cfg import polling
 from rally_openstack.common.cfg import profiler
 from rally_openstack.common.cfg import tempest
+from rally_openstack.common.cfg import types
 from rally_openstack.common.cfg import vm
 from rally_openstack.common.cfg import watcher
 from rally_openstack.task.ui.charts import osprofilerchart
@@ -42,7 +44,7 @@ def list_opts():
                    nova.OPTS, osclients.OPTS, profiler.OPTS,
                    vm.OPTS, glance.OPTS, watcher.OPTS, tempest.OPTS,
                    keystone_roles.OPTS, keystone_users.OPTS, cleanup.OPTS,
-                   neutron.OPTS, octavia.OPTS,
+                   neutron.OPTS, octavia.OPTS, polling.OPTS, types.OPTS,
                    osprofilerchart.OPTS):
         for category, opt in l_opts.items():
             opts.setdefault(category, [])
@@ -22,6 +22,20 @@ OPTS = {
             "openstack_client_http_timeout",
             default=180.0,
             help="HTTP timeout for any of OpenStack service in seconds"),
+        cfg.IntOpt(
+            "openstack_client_http_pool_connections",
+            default=10,
+            min=1,
+            help="Number of hosts to keep pooled keep-alive connections for. "
+                 "The pool is shared by all OpenStack clients of a process "
+                 "that use the same TLS settings."),
+        cfg.IntOpt(
+            "openstack_client_http_pool_maxsize",
+            default=50,
+            min=1,
+            help="Maximum number of keep-alive connections to keep per host "
+                 "in the shared pool. Should not be lower than the number "
+                 "of concurrent requests sent from a single process."),
         cfg.IntOpt(
             "openstack_client_token_refresh_margin",
             default=600,
@@ -29,6 +43,13 @@ OPTS = {
                  "this many seconds of expiry, it is refreshed once at "
                  "iteration init (before any atomic action) so the refresh "
                  "never pollutes a measured action's duration. Should be "
-                 "generously larger than keystoneauth's own ~120s floor.")
+                 "generously larger than keystoneauth's own ~120s floor."),
+        cfg.FloatOpt(
+            "openstack_client_token_refresh_jitter",
+            default=0.5,
+            min=0.0,
+            help="Tokens issued at the same time are not refreshed all at "
+                 "once: the refresh margin of every user is extended by a "
+                 "random fraction of it, up to this value.")
     ]
 }
@@ -0,0 +1,29 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from rally.common import cfg
+
+
+OPTS = {"openstack": [
+    cfg.StrOpt("poll_policy",
+               default="fixed",
+               choices=["fixed", "exponential", "learned"],
+               help="How the poll interval of an operation is used while "
+               "waiting for a status of a resource. 'fixed' checks the "
+               "status every interval. 'exponential' checks it after a "
+               "fraction of the interval first and doubles the delay with "
+               "jitter up to several intervals. 'learned' remembers how "
+               "long earlier waits of the same kind took and checks rarely "
+               "until the expected time comes close."),
+]}
@@ -22,6 +22,12 @@ OPTS = {"openstack": [
                        "0.5.2/cirros-0.5.2-x86_64-disk.img",
                deprecated_group="tempest",
                help="image URL"),
+    cfg.StrOpt("img_checksum",
+               regex=r"^\w+:[0-9a-fA-F]+$",
+               help="Checksum of the image at 'img_url' in "
+                    "'<algorithm>:<hex digest>' format (e.g. 'sha256:...'). "
+                    "The downloaded image and the image downloaded by "
+                    "earlier runs are verified against it."),
     cfg.StrOpt("img_disk_format",
                default="qcow2",
                deprecated_group="tempest",
@@ -0,0 +1,28 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from rally.common import cfg
+
+
+OPTS = {"openstack": [
+    cfg.IntOpt("resource_types_cache_ttl",
+               default=120,
+               min=0,
+               help="Time in seconds to reuse resources (images, flavors, "
+                    "networks, volume types) listed to resolve task "
+                    "arguments by name across workloads and contexts of the "
+                    "same task. A name which is not found in a cached "
+                    "listing is always looked up again. Set to 0 to list "
+                    "resources for every workload.")
+]}
@@ -24,5 +24,10 @@ OPTS = {"openstack": [
     cfg.FloatOpt("vm_ping_timeout",
                  default=120.0,
                  deprecated_group="benchmark",
-                 help="Time to wait for a VM to become pingable")
+                 help="Time to wait for a VM to become pingable"),
+    cfg.PortOpt("vm_ping_tcp_port",
+                default=22,
+                help="TCP port to check reachability of a VM with when "
+                     "unprivileged ICMP sockets are not permitted on the "
+                     "host")
 ]}
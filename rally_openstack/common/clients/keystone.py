@@ -28,6 +28,7 @@ from rally.common import cfg
 from rally.common import logging
 from rally.task import atomic
 
+from rally_openstack.common import http_session
 from rally_openstack.common.clients import base
 
 
@@ -119,6 +120,11 @@ class Keystone(base.LegacyClientCompat):
             from keystoneauth1 import identity
             from keystoneauth1 import session
 
+            # keep-alive connections are shared with other Clients instances
+            requests_session = http_session.get_session(
+                cacert=self.credential.https_cacert,
+                insecure=self.credential.https_insecure,
+                cert=self.credential.https_cert)
             version = self.spec.choose_version(self.credential, version)
             auth_url = self.credential.auth_url
             if version is not None:
@@ -141,11 +147,11 @@ class Keystone(base.LegacyClientCompat):
                     verify=(self.credential.https_cacert
                             or not self.credential.https_insecure),
                     cert=self.credential.https_cert,
-                    timeout=CONF.openstack_client_http_timeout)
+                    timeout=CONF.openstack_client_http_timeout,
+                    session=requests_session)
                 version = str(discover.Discover(
                     temp_session,
                     password_args["auth_url"]).version_data()[0]["version"][0])
-                temp_session.session.close()
 
             if "v2.0" not in password_args["auth_url"] and version != "2":
                 password_args.update({
@@ -165,7 +171,8 @@ class Keystone(base.LegacyClientCompat):
                         or not self.credential.https_insecure),
                 cert=self.credential.https_cert,
                 timeout=CONF.openstack_client_http_timeout,
-                discovery_cache=self.credential.discovery_cache
+                discovery_cache=self.credential.discovery_cache,
+                session=requests_session
             )
             self._cache[key] = (sess, identity_plugin)
         return self._cache[key]
@@ -783,11 +790,14 @@ class Keystone(base.LegacyClientCompat):
             project_id=data.get("tenant_id"))
 
     def close(self) -> None:
-        """Close the keystoneauth sessions opened by this client."""
+        """Drop the keystoneauth sessions opened by this client.
+
+        The underlying connections belong to the process-wide pool shared
+        with other clients, so they are kept open for reuse.
+        """
         for key in [k for k in self._cache
                     if k.startswith("keystone_session_and_plugin_")]:
-            sess, _plugin = self._cache.pop(key)
-            sess.session.close()
+            self._cache.pop(key)
         self._cache.pop("keystone_auth_ref", None)
 
     @atomic.action_timer("keystone.fetch_token")
@@ -795,9 +805,8 @@ class Keystone(base.LegacyClientCompat):
         with self._atomic_action(f"keystone_v{self.version}.fetch_token"):
             # Build a fresh client with the cached token cleared so this
             # measures a real authentication instead of returning the token
-            # the context already fetched. Its session is private to that
-            # client, so it has to be closed here -- otherwise every iteration
-            # of this scenario would leak a connection pool.
+            # the context already fetched. Closing the client afterwards
+            # returns its connections to the shared pool.
             credential = copy.deepcopy(self.credential)
             credential.auth = None
             client = Keystone(credential)
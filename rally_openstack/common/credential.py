@@ -148,6 +148,16 @@ class OpenStackCredential:
         return {f.name: getattr(self, f.name)
                 for f in dataclasses.fields(self)}
 
+    def auth_key(self) -> tuple[str | None, ...]:
+        """Return a hashable key of the identity this credential stands for.
+
+        Credentials with equal keys authenticate as the same user in the same
+        scope, so they can share one auth state.
+        """
+        return (self.auth_url, self.region_name, self.username,
+                self.user_domain_name, self.tenant_name,
+                self.project_domain_name, self.domain_name)
+
     def __deepcopy__(
         self, memodict: dict | None = None
     ) -> "OpenStackCredential":
@@ -0,0 +1,64 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""HTTP sessions sharing keep-alive connections within a process.
+
+Keystone sessions of different Clients instances and monitoring systems
+(Grafana, Pushgateway, Elasticsearch), which are queried again and again by
+scenarios, talk to the same endpoints, so their requests reuse connections
+of a process-wide pool instead of opening a connection per request.
+"""
+
+import os
+import threading
+
+import requests
+from requests import adapters
+
+from rally.common import cfg
+
+
+CONF = cfg.CONF
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+
+def get_session(cacert=None, insecure=False, cert=None):
+    """Return a requests session backed by the process-wide connection pool.
+
+    Sessions with equal TLS settings share HTTP adapters (and the keep-alive
+    connections pooled in them). Cookies stay private, since each call
+    returns a new requests session.
+
+    Adapters are never shared between processes: a forked runner worker
+    starts its own pool instead of reusing the sockets of its parent.
+
+    :param cacert: CA bundle to verify servers with
+    :param insecure: whether verification of servers is disabled
+    :param cert: client certificate, a path or a pair of paths to the
+        certificate and its key
+    """
+    if isinstance(cert, list):
+        cert = tuple(cert)
+    key = (os.getpid(), cacert, bool(insecure), cert)
+    with _adapters_lock:
+        if key not in _adapters:
+            _adapters[key] = adapters.HTTPAdapter(
+                pool_connections=CONF.openstack_client_http_pool_connections,
+                pool_maxsize=CONF.openstack_client_http_pool_maxsize)
+        adapter = _adapters[key]
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
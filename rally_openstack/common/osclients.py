@@ -15,8 +15,11 @@
 
 from __future__ import annotations
 
+import collections
 import copy
 import os
+import random
+import threading
 import typing as t
 
 from rally import exceptions
@@ -44,6 +47,26 @@ configure = base.configure
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
+# auth states refreshed within the process, shared by all Clients instances
+# built from equal credentials (see OpenStackCredential.auth_key)
+_auth_states: dict[tuple[str | None, ...], str] = {}
+_auth_states_locks: collections.defaultdict[
+    tuple[str | None, ...], threading.Lock] = collections.defaultdict(
+        threading.Lock)
+_auth_states_guard = threading.Lock()
+
+
+def _get_refresh_margin(auth_key: tuple[str | None, ...]) -> float:
+    """Return the token refresh margin of the credential, with jitter.
+
+    The jitter is derived from the credential itself, so all processes
+    agree on it while tokens of different users issued at the same time
+    are refreshed at different moments.
+    """
+    margin = CONF.openstack_client_token_refresh_margin
+    jitter = CONF.openstack_client_token_refresh_jitter
+    return margin * (1 + random.Random(repr(auth_key)).uniform(0, jitter))
+
 
 class NovaSpec(base.ClientSpec):
     def validate_version(self, version):
@@ -612,16 +635,33 @@ class Clients:
         atomic action, so the refresh request never lands inside a measured
         action. Does nothing when no token was seeded (the plugin authenticates
         on first use anyway) or when the token is still valid.
+
+        A refreshed auth state is kept for the whole process, so every other
+        iteration of the same user picks it up instead of authenticating once
+        again.
         """
         # A seeded auth state is the string produced by ``get_auth_state()``;
         # anything else (None, or a test mock) means there is nothing to
         # refresh.
         if not isinstance(self.credential.auth, str):
             return
-        sess, plugin = self.keystone.get_session()
-        margin = CONF.openstack_client_token_refresh_margin
-        if plugin.get_access(sess).will_expire_soon(margin):
-            plugin.invalidate()
-            # overwrite the auth_ref memoized by the keystone client, otherwise
-            # it would keep handing out the token we have just invalidated.
-            self.cache["keystone_auth_ref"] = plugin.get_access(sess)
+        auth_key = self.credential.auth_key()
+        with _auth_states_guard:
+            lock = _auth_states_locks[auth_key]
+        with lock:
+            sess, plugin = self.keystone.get_session()
+            auth_state = _auth_states.get(auth_key)
+            if auth_state is not None and auth_state != self.credential.auth:
+                # already refreshed by another iteration of this process
+                plugin.set_auth_state(auth_state)
+                self.credential.auth = auth_state
+                self.cache.pop("keystone_auth_ref", None)
+            margin = _get_refresh_margin(auth_key)
+            if plugin.get_access(sess).will_expire_soon(margin):
+                plugin.invalidate()
+                # overwrite the auth_ref memoized by the keystone client,
+                # otherwise it would keep handing out the token we have just
+                # invalidated.
+                self.cache["keystone_auth_ref"] = plugin.get_access(sess)
+                self.credential.auth = plugin.get_auth_state()
+                _auth_states[auth_key] = self.credential.auth
@@ -0,0 +1,196 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Waiting for statuses of resources with a configurable poll policy.
+
+Every wait is given the poll interval configured for its operation (e.g.
+`nova_server_boot_poll_interval`) and `poll_policy` option decides how the
+delays between status checks are derived from it. Checks which are not
+about a status of a resource can be waited for with backoff as well.
+"""
+
+import inspect
+import random
+import threading
+import time
+
+from rally.common import cfg
+from rally.common import utils as commonutils
+from rally.task import utils
+
+
+CONF = cfg.CONF
+
+# bounds of delays relative to the configured poll interval
+_MIN_FACTOR = 0.125
+_MAX_FACTOR = 8
+# weight of the latest duration in the expected duration of waits
+_LEARNING_RATE = 0.3
+
+# durations learned by waits, keyed by workload and kind of the wait
+_durations = {}
+_durations_lock = threading.Lock()
+# workload which waits of the thread belong to
+_workload = threading.local()
+
+
+def set_workload(workload_id):
+    """Scope durations learned by waits of the current thread to a workload.
+
+    Durations learned for other workloads are dropped, so waits of one
+    workload never choose delays for an unrelated one.
+
+    :param workload_id: uuid of the workload (`owner_id` of the context)
+    """
+    _workload.id = workload_id
+    with _durations_lock:
+        for key in [k for k in _durations if k[0] != workload_id]:
+            del _durations[key]
+
+
+class ExponentialPolicy:
+    """Doubles the delay after every check, starting below the interval."""
+
+    def __init__(self, check_interval, key=None):
+        """Init the policy.
+
+        :param check_interval: poll interval configured for the wait
+        :param key: kind of the wait. All policies are created by
+            wait_for_status() with the same arguments; this policy does not
+            depend on earlier waits, so it ignores the key.
+        """
+        self._min_delay = check_interval * _MIN_FACTOR
+        self._max_delay = check_interval * _MAX_FACTOR
+        self._delay = self._min_delay
+
+    def next_delay(self, elapsed):
+        delay = min(self._delay, self._max_delay)
+        self._delay *= 2
+        # jitter keeps checks of resources created at once apart
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def finished(self, elapsed):
+        pass
+
+
+class LearnedPolicy(ExponentialPolicy):
+    """Checks rarely until the time earlier waits of the kind took.
+
+    Only waits of the same workload (see set_workload()) are taken into
+    account.
+
+    Once the expected time passes (or nothing is known yet), delays grow
+    exponentially.
+    """
+
+    def __init__(self, check_interval, key=None):
+        super().__init__(check_interval)
+        self._key = (getattr(_workload, "id", None), key)
+        with _durations_lock:
+            self._expected = _durations.get(self._key)
+
+    def next_delay(self, elapsed):
+        if self._expected is not None and elapsed < self._expected:
+            return min(max((self._expected - elapsed) / 2, self._min_delay),
+                       self._max_delay)
+        return super().next_delay(elapsed)
+
+    def finished(self, elapsed):
+        with _durations_lock:
+            expected = _durations.get(self._key)
+            if expected is None:
+                _durations[self._key] = elapsed
+            else:
+                _durations[self._key] = (
+                    expected + _LEARNING_RATE * (elapsed - expected))
+
+
+_POLICIES = {"exponential": ExponentialPolicy, "learned": LearnedPolicy}
+
+
+def get_policy(check_interval, key):
+    """Return the configured poll policy or None for 'fixed' one.
+
+    :param check_interval: poll interval configured for the wait
+    :param key: kind of the wait
+    """
+    policy_cls = _POLICIES.get(CONF.openstack.poll_policy)
+    return policy_cls and policy_cls(check_interval, key=key)
+
+
+def wait_for_status(*args, **kwargs):
+    """Wait for a status of a resource.
+
+    Arguments are the same as of `rally.task.utils.wait_for_status`. With
+    'fixed' poll policy the status is checked every `check_interval`,
+    otherwise delays are chosen by the policy.
+    """
+    policy_cls = _POLICIES.get(CONF.openstack.poll_policy)
+    if policy_cls is None:
+        return utils.wait_for_status(*args, **kwargs)
+
+    params = inspect.signature(utils.wait_for_status).bind(*args, **kwargs)
+    params.apply_defaults()
+    params = params.arguments
+    resource = params["resource"]
+    update_resource = params["update_resource"]
+    policy = policy_cls(
+        params["check_interval"],
+        key=(type(resource).__name__, params["status_attr"],
+             frozenset(s.upper() for s in params["ready_statuses"]),
+             params["check_interval"]))
+    started_at = time.monotonic()
+    deadline = started_at + params["timeout"]
+    first_check = True
+
+    def update(resource, **kw):
+        nonlocal first_check
+        if not first_check:
+            now = time.monotonic()
+            time.sleep(max(min(policy.next_delay(now - started_at),
+                               deadline - now), 0))
+        first_check = False
+        return update_resource(resource, **kw)
+
+    params["update_resource"] = update_resource and update
+    params["check_interval"] = 0
+    result = utils.wait_for_status(**params)
+    policy.finished(time.monotonic() - started_at)
+    return result
+
+
+def _backoff_delays(max_delay):
+    delay = max_delay * _MIN_FACTOR
+    while True:
+        yield min(delay, max_delay)
+        delay *= 2
+
+
+def wait_for_result(check, max_delay, timeout):
+    """Call check until it returns a true value or the timeout passes.
+
+    Delays between calls grow from a fraction of max_delay up to it, so a
+    result which comes fast is noticed sooner than with fixed delays.
+
+    :param check: callable without arguments
+    :param max_delay: maximum delay between calls in seconds
+    :param timeout: time to wait for the result in seconds
+    :returns: the last result of check
+    """
+    deadline = time.time() + timeout
+    delays = _backoff_delays(max_delay)
+    while True:
+        result = check()
+        remaining = deadline - time.time()
+        if result or remaining <= 0:
+            return result
+        commonutils.interruptable_sleep(min(next(delays), remaining))
@@ -12,13 +12,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import requests
-
 from rally.common import logging
-from rally.common import utils as commonutils
 from rally.task import atomic
 from rally.task import service
 
+from rally_openstack.common import http_session
+from rally_openstack.common import polling
+
 
 LOG = logging.getLogger(__name__)
 
@@ -39,8 +39,15 @@ class GrafanaService(service.Service):
     def check_metric(self, seed, sleep_time, retries_total):
         """Check metric with seed name in Grafana datasource.
 
+        Delays between checks grow up to sleep_time, and the metric is
+        checked for as long as retries_total checks with sleep_time between
+        them would take. The time from the start of checking until the
+        metric is found is reported as grafana.metric_ingest_latency atomic
+        action.
+
         :param seed: random metric name
-        :param sleep_time: sleep time between checking metrics in seconds
+        :param sleep_time: maximum sleep time between checking metrics in
+                           seconds
         :param retries_total: total number of retries to check metric in
                               Grafana
         :return: True if metric in Grafana datasource and False otherwise
@@ -52,26 +59,26 @@ class GrafanaService(service.Service):
                          "datasource": self._spec["datasource_id"],
                          "seed": seed
                      })
-        i = 0
-        LOG.info("Check metric %s in Grafana" % seed)
-        while i < retries_total:
-            LOG.debug("Attempt number %s" % (i + 1))
-            resp = requests.get(check_url,
-                                auth=(self._spec["grafana"]["user"],
-                                      self._spec["grafana"]["password"]))
+        session = http_session.get_session()
+
+        def check():
+            resp = session.get(check_url,
+                               auth=(self._spec["grafana"]["user"],
+                                     self._spec["grafana"]["password"]))
             result = resp.json()
             LOG.debug("Grafana response code: %s" % resp.status_code)
-            no_result = (result.get("data") is None
-                         or len(result["data"]["result"]) < 1)
-            if no_result and i + 1 >= retries_total:
-                LOG.debug("No instance metrics found in Grafana")
-                return False
-            elif no_result:
-                i += 1
-                commonutils.interruptable_sleep(sleep_time)
-            else:
-                LOG.debug("Metric instance found in Grafana")
-                return True
+            return (result.get("data") is not None
+                    and len(result["data"]["result"]) > 0)
+
+        LOG.info("Check metric %s in Grafana" % seed)
+        with atomic.ActionTimer(self, "grafana.metric_ingest_latency"):
+            found = polling.wait_for_result(
+                check, sleep_time, sleep_time * (retries_total - 1))
+        if not found:
+            LOG.debug("No instance metrics found in Grafana")
+            return False
+        LOG.debug("Metric instance found in Grafana")
+        return True
 
     @atomic.action_timer("grafana.push_metric")
     def push_metric(self, seed):
@@ -84,9 +91,9 @@ class GrafanaService(service.Service):
             "port": self._spec["pushgateway_port"],
             "job": self._spec["job_name"]
         }
-        resp = requests.post(push_url,
-                             headers={"Content-type": "text/xml"},
-                             data="%s 12345\n" % seed)
+        resp = http_session.get_session().post(
+            push_url, headers={"Content-type": "text/xml"},
+            data="%s 12345\n" % seed)
         if resp.ok:
             LOG.info("Metric %s pushed" % seed)
         else:
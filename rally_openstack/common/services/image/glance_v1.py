@@ -17,8 +17,8 @@ import os
 from rally.common import cfg
 from rally.common import utils as rutils
 from rally.task import atomic
-from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.common import service
 from rally_openstack.common.services.image import glance_common
 from rally_openstack.common.services.image import image
@@ -69,7 +69,7 @@ class GlanceV1Service(service.Service, glance_common.GlanceMixin):
             rutils.interruptable_sleep(CONF.openstack.
                                        glance_image_create_prepoll_delay)
 
-            image_obj = utils.wait_for_status(
+            image_obj = polling.wait_for_status(
                 image_obj, ["active"],
                 update_resource=self.get_image,
                 timeout=CONF.openstack.glance_image_create_timeout,
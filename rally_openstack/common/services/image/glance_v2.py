@@ -12,19 +12,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import os
 import time
 
-import requests
-
 from rally.common import cfg
 from rally.common import utils as rutils
 from rally.task import atomic
-from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.common import service
 from rally_openstack.common.services.image import glance_common
 from rally_openstack.common.services.image import image
+from rally_openstack.common.services.image import source_cache
 
 
 CONF = cfg.CONF
@@ -40,22 +38,8 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
         :param image_id: Image ID to upload data to.
         :param image_location: Location of the data to upload to.
         """
-        image_location = os.path.expanduser(image_location)
-        image_data = None
-        response = None
-        try:
-            if os.path.isfile(image_location):
-                image_data = open(image_location, "rb")
-            else:
-                response = requests.get(image_location, stream=True,
-                                        verify=False)
-                image_data = response.raw
+        with source_cache.open_image_data(image_location) as image_data:
             self._clients.glance("2").images.upload(image_id, image_data)
-        finally:
-            if image_data is not None:
-                image_data.close()
-            if response is not None:
-                response.close()
 
     @atomic.action_timer("glance_v2.create_image")
     def create_image(self, image_name=None, container_format=None,
@@ -89,7 +73,7 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
                                    glance_image_create_prepoll_delay)
 
         start = time.time()
-        image_obj = utils.wait_for_status(
+        image_obj = polling.wait_for_status(
             image_obj.id, ["queued"],
             update_resource=self.get_image,
             timeout=CONF.openstack.glance_image_create_timeout,
@@ -98,7 +82,7 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
 
         self.upload_data(image_obj.id, image_location=image_location)
 
-        image_obj = utils.wait_for_status(
+        image_obj = polling.wait_for_status(
             image_obj, ["active"],
             update_resource=self.get_image,
             timeout=timeout,
@@ -139,7 +123,7 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
                                    glance_image_create_prepoll_delay)
 
         # Wait for queued state
-        image_obj = utils.wait_for_status(
+        image_obj = polling.wait_for_status(
             image_obj.id, ["queued"],
             update_resource=self.get_image,
             timeout=CONF.openstack.glance_image_create_timeout,
@@ -154,22 +138,8 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
         :param image_id: ID of image to stage data for
         :param image_location: Location of the data (path or URL)
         """
-        image_location = os.path.expanduser(image_location)
-        image_data = None
-        response = None
-        try:
-            if os.path.isfile(image_location):
-                image_data = open(image_location, "rb")
-            else:
-                response = requests.get(image_location, stream=True,
-                                        verify=False)
-                image_data = response.raw
+        with source_cache.open_image_data(image_location) as image_data:
             self._clients.glance("2").images.stage(image_id, image_data)
-        finally:
-            if image_data is not None:
-                image_data.close()
-            if response is not None:
-                response.close()
 
     @atomic.action_timer("glance_v2.import_image")
     def import_image(self, image_id, import_method="glance-direct",
@@ -213,7 +183,7 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
                 "Image import requires python-glanceclient >= 2.9.0")
 
         # Poll until import completes (image becomes 'active')
-        image_obj = utils.wait_for_status(
+        image_obj = polling.wait_for_status(
             image_id,
             ready_statuses=["active"],
             failure_statuses=["killed", "deleted", "pending_delete", "error"],
@@ -0,0 +1,198 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Local cache of image sources downloaded from HTTP(S) URLs.
+
+Every cached file is named after a hash of the URL and the validators
+(ETag/Last-Modified) returned by the server, so a changed source is
+downloaded again instead of being served stale. The total size of the cache
+directory is bounded; the least recently used files are evicted first, but
+files which are in use are never evicted.
+"""
+
+import collections
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+import requests
+
+from rally.common import cfg
+from rally.common import logging
+
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+_locks = collections.defaultdict(threading.Lock)
+_locks_guard = threading.Lock()
+# number of users of every cached file which is in use
+_in_use = collections.Counter()
+
+
+def _get_lock(key):
+    with _locks_guard:
+        return _locks[key]
+
+
+def _pin(path):
+    with _locks_guard:
+        _in_use[path] += 1
+
+
+def release(path):
+    """Allow eviction of a file returned by fetch()."""
+    with _locks_guard:
+        _in_use[path] -= 1
+        if not _in_use[path]:
+            del _in_use[path]
+
+
+def _cache_key(url, headers):
+    etag = headers.get("ETag", "")
+    last_modified = headers.get("Last-Modified", "")
+    if not etag and not last_modified:
+        # nothing to detect changes of the source with
+        return None
+    return hashlib.sha256(
+        ("%s\n%s\n%s" % (url, etag, last_modified)).encode("utf-8")
+    ).hexdigest()
+
+
+def _evict(cache_dir, max_size):
+    """Remove least recently used files until the cache fits max_size."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.startswith("."):
+            # partially downloaded file
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        with _locks_guard, contextlib.suppress(OSError):
+            if path in _in_use:
+                continue
+            os.remove(path)
+            total -= size
+            LOG.debug("Image source %s is evicted from the cache." % path)
+
+
+def _download(url, path):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with requests.get(url, stream=True, verify=False) as response:
+                response.raise_for_status()
+                shutil.copyfileobj(response.raw, f, _CHUNK_SIZE)
+        os.replace(tmp_path, path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def fetch(url):
+    """Return path to a local copy of the url, downloading it only once.
+
+    The file is not evicted from the cache until release() is called with
+    its path.
+
+    :param url: HTTP(S) url of the image source
+    :returns: path to the cached file or None if the source can't be cached
+    """
+    max_size = CONF.openstack.glance_image_cache_size * 1024 * 1024
+    if not max_size or not url.startswith(("http://", "https://")):
+        return None
+
+    try:
+        response = requests.head(url, allow_redirects=True, verify=False)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        LOG.debug("Image source %s can't be cached: %s" % (url, e))
+        return None
+
+    key = _cache_key(url, response.headers)
+    if key is None:
+        LOG.debug("Image source %s can't be cached: the server returned "
+                  "neither ETag nor Last-Modified header." % url)
+        return None
+    if int(response.headers.get("Content-Length", 0)) > max_size:
+        LOG.debug("Image source %s doesn't fit into the cache." % url)
+        return None
+
+    cache_dir = os.path.expanduser(CONF.openstack.glance_image_cache_dir)
+    path = os.path.join(cache_dir, key)
+    with _get_lock(key):
+        _pin(path)
+        try:
+            # touch the file to mark it as recently used
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(cache_dir, exist_ok=True)
+        LOG.debug("Downloading image source %s to %s" % (url, path))
+        try:
+            _download(url, path)
+        except Exception as e:
+            release(path)
+            LOG.warning("Failed to cache image source %s: %s" % (url, e))
+            return None
+
+    _evict(cache_dir, max_size)
+    return path
+
+
+@contextlib.contextmanager
+def open_image_data(image_location):
+    """Open image data from a local path or an url for reading.
+
+    Data of urls is read from the local cache if possible. Every call gets
+    its own file object, so concurrent uploads never share a file position.
+
+    :param image_location: path or url of the image source
+    """
+    image_location = os.path.expanduser(image_location)
+    if not os.path.isfile(image_location):
+        cached_path = fetch(image_location)
+        if cached_path:
+            try:
+                with open(cached_path, "rb") as image_data:
+                    yield image_data
+            finally:
+                release(cached_path)
+            return
+
+    if os.path.isfile(image_location):
+        with open(image_location, "rb") as image_data:
+            yield image_data
+    else:
+        response = requests.get(image_location, stream=True, verify=False)
+        try:
+            yield response.raw
+        finally:
+            response.raw.close()
+            response.close()
@@ -12,18 +12,137 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import queue
+import threading
+import time
+
 from rally import exceptions
 from rally.common import cfg
 from rally.common import logging
 from rally.task import atomic
 from rally.task import service
-from rally.task import utils
 
 
 CONF = cfg.CONF
 
 LOG = logging.getLogger(__name__)
 
+# provisioning waiters shared by all services of a process, keyed by
+#   credential, project and kind of objects
+_waiters = {}
+_waiters_lock = threading.Lock()
+
+
+class _Waiter:
+    def __init__(self, obj, status, poller, done):
+        self.obj = obj
+        self.status = status
+        self.poller = poller
+        self.done = done
+        self.current = obj
+        self.result = None
+        self.error = None
+
+    def resolve(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.done.put(self)
+
+
+class _ProvisioningWaiter:
+    """Waits for provisioning status of many objects of one project.
+
+    Objects of all threads which wait at the same time are checked by one
+    list call per interval, filtered by their ids, instead of a show call
+    per object.
+    """
+
+    # list calls which may fail in a row before the waiting fails
+    max_failed_polls = 3
+
+    def __init__(self, list_objects, interval):
+        self._list_objects = list_objects
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._poller = None
+
+    def add(self, waiter):
+        with self._lock:
+            self._pending.setdefault(waiter.obj["id"], []).append(waiter)
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll,
+                                                daemon=True)
+                self._poller.start()
+
+    @property
+    def idle(self):
+        with self._lock:
+            return not self._pending and self._poller is None
+
+    def discard(self, waiter):
+        with self._lock:
+            waiters = self._pending.get(waiter.obj["id"], [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._pending[waiter.obj["id"]]
+
+    def _poll(self):
+        failed_polls = 0
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                if not self._pending:
+                    self._poller = None
+                    return
+                ids = sorted(self._pending)
+            try:
+                current = {o["id"]: o for o in self._list_objects(ids)}
+            except Exception as e:
+                failed_polls += 1
+                if failed_polls < self.max_failed_polls:
+                    LOG.warning("Failed to check provisioning status, "
+                                "retrying: %s" % e)
+                    continue
+                current = None
+                error = e
+            else:
+                failed_polls = 0
+            with self._lock:
+                for obj_id, waiters in list(self._pending.items()):
+                    for waiter in list(waiters):
+                        if current is None:
+                            waiter.resolve(
+                                error=exceptions.GetResourceFailure(
+                                    resource=waiter.obj, err=error))
+                        elif not self._check(waiter, current.get(obj_id)):
+                            continue
+                        waiters.remove(waiter)
+                    if not waiters:
+                        del self._pending[obj_id]
+
+    @staticmethod
+    def _check(waiter, obj):
+        if obj is None:
+            if waiter.status == "DELETED":
+                waiter.resolve()
+            else:
+                waiter.resolve(error=exceptions.GetResourceNotFound(
+                    resource=waiter.obj))
+            return True
+        waiter.current = obj
+        status = obj["provisioning_status"].upper()
+        if status == waiter.status:
+            waiter.resolve(result=obj)
+        elif status == "ERROR":
+            waiter.resolve(error=exceptions.GetResourceErrorStatus(
+                resource=obj, status=status,
+                fault="Status in failure list ['ERROR']"))
+        else:
+            return False
+        return True
+
 
 class Octavia(service.Service):
 
@@ -249,17 +368,7 @@ class Octavia(service.Service):
         }
         pool = self._clients.octavia().pool_create(
             json={"pool": args})
-        pool = pool["pool"]
-        pool = utils.wait_for_status(
-            pool,
-            ready_statuses=["ACTIVE"],
-            status_attr="provisioning_status",
-            update_resource=self.update_pool_resource,
-            timeout=CONF.openstack.octavia_create_loadbalancer_timeout,
-            check_interval=(
-                CONF.openstack.octavia_create_loadbalancer_poll_interval)
-        )
-        return pool
+        return self._wait_for_prov_status("pools", [pool["pool"]])[0]
 
     @atomic.action_timer("octavia.pool_delete")
     def pool_delete(self, pool_id):
@@ -624,14 +733,94 @@ class Octavia(service.Service):
         """
         return self._clients.octavia().amphora_list(**kwargs)
 
+    def _list_all(self, kind, **filters):
+        """List objects of the kind, following all pages of the listing."""
+        if kind == "pools":
+            list_method = self._clients.octavia().pool_list
+        else:
+            list_method = self._clients.octavia().load_balancer_list
+        objects = []
+        while True:
+            response = list_method(**filters)
+            objects.extend(response[kind])
+            if not response[kind] or not any(
+                    link.get("rel") == "next"
+                    for link in response.get("%s_links" % kind, [])):
+                return objects
+            filters = dict(filters, marker=response[kind][-1]["id"])
+
+    def _get_waiter(self, kind, project_id):
+        key = (self._clients.credential.auth_key(), project_id, kind)
+        with _waiters_lock:
+            if key not in _waiters:
+                # waiters of finished waits are not kept
+                for k in [k for k, w in _waiters.items() if w.idle]:
+                    del _waiters[k]
+                filters = {"project_id": project_id} if project_id else {}
+                _waiters[key] = _ProvisioningWaiter(
+                    lambda ids: self._list_all(kind, id=ids, **filters),
+                    CONF.openstack.octavia_create_loadbalancer_poll_interval)
+            return _waiters[key]
+
+    def _wait_for_prov_status(self, kind, objects, prov_status="ACTIVE"):
+        timeout = CONF.openstack.octavia_create_loadbalancer_timeout
+        deadline = time.monotonic() + timeout
+        done = queue.Queue()
+        waiters = []
+        try:
+            for obj in objects:
+                waiter = _Waiter(
+                    obj, prov_status.upper(),
+                    self._get_waiter(kind, obj.get("project_id")), done)
+                waiter.poller.add(waiter)
+                waiters.append(waiter)
+            pending = list(waiters)
+            while pending:
+                try:
+                    waiter = done.get(
+                        timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    waiter = pending[0]
+                    raise exceptions.TimeoutException(
+                        desired_status=prov_status,
+                        resource_name=waiter.obj.get("name"),
+                        resource_type=kind[:-1],
+                        resource_id=waiter.obj["id"],
+                        resource_status=waiter.current.get(
+                            "provisioning_status"),
+                        timeout=timeout)
+                pending.remove(waiter)
+                if waiter.error is not None:
+                    raise waiter.error
+        finally:
+            for waiter in waiters:
+                waiter.poller.discard(waiter)
+        return [waiter.result for waiter in waiters]
+
     @atomic.action_timer("octavia.wait_for_loadbalancers")
     def wait_for_loadbalancer_prov_status(self, lb, prov_status="ACTIVE"):
-        return utils.wait_for_status(
-            lb,
-            ready_statuses=[prov_status],
-            status_attr="provisioning_status",
-            update_resource=lambda lb: self.load_balancer_show(lb["id"]),
-            timeout=CONF.openstack.octavia_create_loadbalancer_timeout,
-            check_interval=(
-                CONF.openstack.octavia_create_loadbalancer_poll_interval)
-        )
+        """Wait for a load balancer to reach the provisioning status
+
+        :param lb: the load balancer to wait for
+        :param prov_status: the provisioning status to wait for
+        :return:
+            A dict of the load balancer's settings
+        """
+        return self._wait_for_prov_status("loadbalancers", [lb],
+                                          prov_status=prov_status)[0]
+
+    @atomic.action_timer("octavia.wait_for_loadbalancers")
+    def wait_for_loadbalancers_prov_status(self, lbs,
+                                           prov_status="ACTIVE"):
+        """Wait for load balancers to reach the provisioning status
+
+        All load balancers are checked at once, so waiting fails as soon as
+        any of them gets ERROR status.
+
+        :param lbs: the load balancers to wait for
+        :param prov_status: the provisioning status to wait for
+        :return:
+            A list of dicts of the load balancers' settings
+        """
+        return self._wait_for_prov_status("loadbalancers", lbs,
+                                          prov_status=prov_status)
@@ -109,17 +109,73 @@ class NeutronService(service.Service):
             ('cidr', 'start_cidr', 'ip_version') keys, subnets_dualstack
             parameter will be ignored.
         """
-        subnet_create_args = dict(subnet_create_args or {})
-
         network = self.create_network(**(network_create_args or {}))
-        subnet_create_args["network_id"] = network["id"]
+        routers = self._create_topology_routers(
+            router_create_args, router_per_subnet, subnets_count)
+        subnets = [
+            self.create_subnet(**args)
+            for args in self._topology_subnets_args(
+                network, routers, subnet_create_args, subnets_count,
+                subnets_dualstack)]
+
+        network["subnets"] = [s["id"] for s in subnets]
+
+        return {
+            "network": network,
+            "subnets": subnets,
+            "routers": routers
+        }
+
+    def create_network_topologies(
+            self, count, network_create_args=None,
+            router_create_args=None, router_per_subnet=False,
+            subnet_create_args=None, subnets_count=1, subnets_dualstack=False
+    ):
+        """Create several net infrastructures with bulk requests.
 
+        The result is the same as of calling create_network_topology method
+        *count* times, but all networks are created with one request and all
+        subnets with another one. Routers are still created one by one.
+
+        :param count: Number of topologies to create
+        :returns: list of topologies in the format of create_network_topology
+            method
+
+        Other parameters are equal to the create_network_topology method.
+        """
+        networks = self.create_networks(count, **(network_create_args or {}))
+        topologies = []
+        subnets_args = []
+        for network in networks:
+            routers = self._create_topology_routers(
+                router_create_args, router_per_subnet, subnets_count)
+            subnets_args.extend(self._topology_subnets_args(
+                network, routers, subnet_create_args, subnets_count,
+                subnets_dualstack))
+            topologies.append({"network": network, "routers": routers})
+
+        subnets = self.create_subnets(subnets_args)
+        for i, topology in enumerate(topologies):
+            topology["subnets"] = subnets[i * subnets_count:
+                                          (i + 1) * subnets_count]
+            topology["network"]["subnets"] = [
+                s["id"] for s in topology["subnets"]]
+        return topologies
+
+    def _create_topology_routers(self, router_create_args, router_per_subnet,
+                                 subnets_count):
         routers = []
         if router_create_args is not None:
             for i in range(subnets_count if router_per_subnet else 1):
                 routers.append(self.create_router(**router_create_args))
+        return routers
+
+    def _topology_subnets_args(self, network, routers, subnet_create_args,
+                               subnets_count, subnets_dualstack):
+        """Return arguments of subnets of a network topology."""
+        subnet_create_args = dict(subnet_create_args or {})
+        subnet_create_args["network_id"] = network["id"]
 
-        subnets = []
         ip_versions = itertools.cycle([4, 6] if subnets_dualstack else [4])
         use_subnets_dualstack = (
             "cidr" not in subnet_create_args
@@ -127,25 +183,18 @@ class NeutronService(service.Service):
             and "ip_version" not in subnet_create_args
         )
 
+        subnets_args = []
         for i in range(subnets_count):
             if use_subnets_dualstack:
                 subnet_create_args["ip_version"] = next(ip_versions)
             if routers:
-                if router_per_subnet:
+                if len(routers) > 1:
                     router = routers[i]
                 else:
                     router = routers[0]
                 subnet_create_args["router_id"] = router["id"]
-
-            subnets.append(self.create_subnet(**subnet_create_args))
-
-        network["subnets"] = [s["id"] for s in subnets]
-
-        return {
-            "network": network,
-            "subnets": subnets,
-            "routers": routers
-        }
+            subnets_args.append(dict(subnet_create_args))
+        return subnets_args
 
     def delete_network_topology(self, topo):
         """Delete network topology
@@ -235,7 +284,57 @@ class NeutronService(service.Service):
             the network.
         :returns: neutron network dict
         """
-        body = _clean_dict(
+        body = self._network_body(
+            project_id=project_id,
+            admin_state_up=admin_state_up,
+            dns_domain=dns_domain,
+            mtu=mtu,
+            port_security_enabled=port_security_enabled,
+            provider_network_type=provider_network_type,
+            provider_physical_network=provider_physical_network,
+            provider_segmentation_id=provider_segmentation_id,
+            qos_policy_id=qos_policy_id,
+            router_external=router_external,
+            segments=segments,
+            shared=shared,
+            vlan_transparent=vlan_transparent,
+            description=description,
+            availability_zone_hints=availability_zone_hints)
+        resp = self.client.create_network({"network": body})
+        return resp["network"]
+
+    @atomic.action_timer("neutron.create_networks")
+    @_create_network_arg_adapter()
+    def create_networks(self, count, **network_create_args):
+        """Create several neutron networks with one request.
+
+        :param count: Number of networks to create
+        :param network_create_args: Arguments of every network. The format is
+            equal to the create_network method
+        :returns: list of neutron network dicts
+        """
+        bodies = [self._network_body(**network_create_args)
+                  for i in range(count)]
+        resp = self.client.create_network({"networks": bodies})
+        return resp["networks"]
+
+    def _network_body(self,
+                      project_id=_NONE,
+                      admin_state_up=_NONE,
+                      dns_domain=_NONE,
+                      mtu=_NONE,
+                      port_security_enabled=_NONE,
+                      provider_network_type=_NONE,
+                      provider_physical_network=_NONE,
+                      provider_segmentation_id=_NONE,
+                      qos_policy_id=_NONE,
+                      router_external=_NONE,
+                      segments=_NONE,
+                      shared=_NONE,
+                      vlan_transparent=_NONE,
+                      description=_NONE,
+                      availability_zone_hints=_NONE):
+        return _clean_dict(
             name=self.generate_random_name(),
             tenant_id=project_id,
             admin_state_up=admin_state_up,
@@ -255,8 +354,6 @@ class NeutronService(service.Service):
                 "router:external": router_external
             }
         )
-        resp = self.client.create_network({"network": body})
-        return resp["network"]
 
     @atomic.action_timer("neutron.show_network")
     def get_network(self, network_id, fields=_NONE):
@@ -464,6 +561,57 @@ class NeutronService(service.Service):
             from this subnet. Default is false.
         """
 
+        body = self._subnet_body(
+            network_id,
+            project_id=project_id,
+            enable_dhcp=enable_dhcp,
+            dns_nameservers=dns_nameservers,
+            allocation_pools=allocation_pools,
+            host_routes=host_routes,
+            ip_version=ip_version,
+            gateway_ip=gateway_ip,
+            cidr=cidr,
+            start_cidr=start_cidr,
+            prefixlen=prefixlen,
+            ipv6_address_mode=ipv6_address_mode,
+            ipv6_ra_mode=ipv6_ra_mode,
+            segment_id=segment_id,
+            subnetpool_id=subnetpool_id,
+            use_default_subnetpool=use_default_subnetpool,
+            service_types=service_types,
+            dns_publish_fixed_ip=dns_publish_fixed_ip)
+        subnet = self.client.create_subnet({"subnet": body})["subnet"]
+        if router_id:
+            self.add_interface_to_router(router_id=router_id,
+                                         subnet_id=subnet["id"])
+        return subnet
+
+    @atomic.action_timer("neutron.create_subnets")
+    def create_subnets(self, subnets_create_args):
+        """Create several neutron subnets with one request.
+
+        :param subnets_create_args: List of dicts with arguments of each
+            subnet. The format is equal to the create_subnet method.
+        :returns: list of neutron subnet dicts in the same order
+        """
+        subnets_create_args = [dict(args) for args in subnets_create_args]
+        routers = [args.pop("router_id", None) for args in subnets_create_args]
+        bodies = [self._subnet_body(**args) for args in subnets_create_args]
+        subnets = self.client.create_subnet({"subnets": bodies})["subnets"]
+        for router_id, subnet in zip(routers, subnets):
+            if router_id:
+                self.add_interface_to_router(router_id=router_id,
+                                             subnet_id=subnet["id"])
+        return subnets
+
+    def _subnet_body(self, network_id, project_id=_NONE, enable_dhcp=_NONE,
+                     dns_nameservers=_NONE, allocation_pools=_NONE,
+                     host_routes=_NONE, ip_version=_NONE, gateway_ip=_NONE,
+                     cidr=_NONE, start_cidr=_NONE, prefixlen=_NONE,
+                     ipv6_address_mode=_NONE, ipv6_ra_mode=_NONE,
+                     segment_id=_NONE, subnetpool_id=_NONE,
+                     use_default_subnetpool=_NONE, service_types=_NONE,
+                     dns_publish_fixed_ip=_NONE):
         if cidr == _NONE:
             ip_version, cidr = net_utils.generate_cidr(
                 ip_version=ip_version, start_cidr=(start_cidr or None))
@@ -476,7 +624,7 @@ class NeutronService(service.Service):
             else:
                 dns_nameservers = self.IPv6_DEFAULT_DNS_NAMESERVERS
 
-        body = _clean_dict(
+        return _clean_dict(
             name=self.generate_random_name(),
             network_id=network_id,
             tenant_id=project_id,
@@ -497,12 +645,6 @@ class NeutronService(service.Service):
             dns_publish_fixed_ip=dns_publish_fixed_ip
         )
 
-        subnet = self.client.create_subnet({"subnet": body})["subnet"]
-        if router_id:
-            self.add_interface_to_router(router_id=router_id,
-                                         subnet_id=subnet["id"])
-        return subnet
-
     @atomic.action_timer("neutron.show_subnet")
     def get_subnet(self, subnet_id):
         """Get subnet
@@ -1263,8 +1405,8 @@ class NeutronService(service.Service):
         :param description: A human-readable description for the resource.
             Default is an empty string.
         """
-        body = _clean_dict(
-            security_group_id=security_group_id,
+        body = self._security_group_rule_body(
+            security_group_id,
             direction=direction,
             protocol=protocol,
             ethertype=ethertype,
@@ -1276,6 +1418,37 @@ class NeutronService(service.Service):
         return self.client.create_security_group_rule(
             {"security_group_rule": body})["security_group_rule"]
 
+    @atomic.action_timer("neutron.create_security_group_rules")
+    def create_security_group_rules(self, security_group_id, rules):
+        """Create several security group rules with one request.
+
+        :param security_group_id: The security group ID to associate with
+            the security group rules.
+        :param rules: List of dicts with arguments of each rule. The format
+            is equal to the create_security_group_rule method.
+        :returns: list of security group rule dicts in the same order
+        """
+        bodies = [self._security_group_rule_body(security_group_id, **rule)
+                  for rule in rules]
+        return self.client.create_security_group_rule(
+            {"security_group_rules": bodies})["security_group_rules"]
+
+    def _security_group_rule_body(self, security_group_id,
+                                  direction="ingress", protocol="tcp",
+                                  ethertype=_NONE, port_range_min=_NONE,
+                                  port_range_max=_NONE,
+                                  remote_ip_prefix=_NONE, description=_NONE):
+        return _clean_dict(
+            security_group_id=security_group_id,
+            direction=direction,
+            protocol=protocol,
+            ethertype=ethertype,
+            port_range_min=port_range_min,
+            port_range_max=port_range_max,
+            remote_ip_prefix=remote_ip_prefix,
+            description=description
+        )
+
     @atomic.action_timer("neutron.show_security_group_rule")
     def get_security_group_rule(self, security_group_rule_id, verbose=_NONE,
                                 fields=_NONE):
@@ -19,8 +19,8 @@ import typing as t
 
 from rally import exceptions
 from rally.task import atomic
-from rally.task import utils as bench_utils
 
+from rally_openstack.common import polling
 from rally_openstack.common.services.image import image
 from rally_openstack.common.services.storage import block
 
@@ -58,7 +58,7 @@ class CinderMixin(atomic.ActionTimerMixin):
     def _wait_available_volume(
         self, volume: t.Any, ready_statuses: list[str] | None = None
     ) -> t.Any:
-        return bench_utils.wait_for_status(
+        return polling.wait_for_status(
             volume,
             ready_statuses=ready_statuses or ["available"],
             update_resource=self._update_resource,
@@ -77,7 +77,7 @@ class CinderMixin(atomic.ActionTimerMixin):
         aname = "cinder_v%s.delete_volume" % self.version
         with atomic.ActionTimer(self, aname):
             self._get_client().volumes.delete(volume)
-            bench_utils.wait_for_status(
+            polling.wait_for_status(
                 volume,
                 ready_statuses=["deleted"],
                 check_deletion=True,
@@ -201,7 +201,7 @@ class CinderMixin(atomic.ActionTimerMixin):
             glance = image.Image(self._clients)
 
             image_inst = glance.get_image(image_id)
-            image_inst = bench_utils.wait_for_status(
+            image_inst = polling.wait_for_status(
                 image_inst,
                 ready_statuses=["active"],
                 update_resource=glance.get_image,
@@ -295,7 +295,7 @@ class CinderMixin(atomic.ActionTimerMixin):
         aname = "cinder_v%s.delete_snapshot" % self.version
         with atomic.ActionTimer(self, aname):
             self._get_client().volume_snapshots.delete(snapshot)
-            bench_utils.wait_for_status(
+            polling.wait_for_status(
                 snapshot,
                 ready_statuses=["deleted"],
                 check_deletion=True,
@@ -315,7 +315,7 @@ class CinderMixin(atomic.ActionTimerMixin):
         aname = "cinder_v%s.delete_backup" % self.version
         with atomic.ActionTimer(self, aname):
             self._get_client().backups.delete(backup)
-            bench_utils.wait_for_status(
+            polling.wait_for_status(
                 backup,
                 ready_statuses=["deleted"],
                 check_deletion=True,
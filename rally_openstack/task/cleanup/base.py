@@ -55,7 +55,8 @@ def resource(
     max_attempts: int = 3,
     timeout: float = CONF.openstack.resource_deletion_timeout,
     interval: int = 1,
-    threads: int = CONF.openstack.cleanup_threads
+    threads: int = CONF.openstack.cleanup_threads,
+    delete_before: t.Sequence[str] | None = None
 ) -> t.Callable[[type[R]], type[R]]:
     """Decorator that overrides resource specification.
 
@@ -76,6 +77,13 @@ def resource(
     :param interval: Resource status pooling interval
     :param threads: Amount of threads (workers) that are deleting resources
                     simultaneously
+    :param delete_before: Names of resources in format <service> or
+                          <service>.<resource> which can be cleaned up only
+                          after this resource. Resources of the same service
+                          are always cleaned up according to their order.
+                          None means that the resource depends on all
+                          resources with lower order and all resources with
+                          higher order depend on it.
     """
 
     def inner(cls: type[R]) -> type[R]:
@@ -90,6 +98,8 @@ def resource(
         cls._interval = interval
         cls._threads = threads
         cls._tenant_resource = tenant_resource
+        cls._delete_before = (
+            None if delete_before is None else tuple(delete_before))
 
         return cls
 
@@ -117,6 +127,11 @@ class ResourceManager:
     _timeout: float
     _interval: int
     _threads: int
+    _delete_before: tuple[str, ...] | None
+
+    # The max number of resources passed to bulk_delete() at once. 0 means
+    # that resources are deleted one by one.
+    _bulk_delete_size = 0
 
     def __init__(self, resource=None, admin=None, user=None, tenant_uuid=None):
         self.admin = admin
@@ -154,6 +169,17 @@ class ResourceManager:
         """Delete resource that corresponds to instance of this class."""
         self._manager().delete(self.id())
 
+    def bulk_delete(self, raw_resources):
+        """Delete several resources with one request.
+
+        Used only if _bulk_delete_size is set.
+
+        :param raw_resources: resources (as returned by list()) to delete
+        :returns: resources that were not deleted and have to be deleted
+            one by one
+        """
+        return list(raw_resources)
+
     def list(self):
         """List all resources specific for admin or user."""
         return self._manager().list()
@@ -13,25 +13,94 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import queue
+import re
+import threading
 import time
 import typing as t
 
 from rally.common import broker
+from rally.common import cfg
 from rally.common import logging
 from rally.common import utils as rutils
 from rally.common.plugin import discover
 from rally.common.plugin import plugin
+from rally.task import utils as task_utils
 
 from rally_openstack.task.cleanup import base
 
 
+CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 
 
+class NameMatcher:
+    """Checks if resource names could have been generated by given classes.
+
+    It gives the same answers as rutils.name_matches_object(), but name
+    formats of all classes are deduplicated and compiled into one regular
+    expression once, instead of doing it for every checked name.
+    """
+
+    def __init__(self, resource_classes, task_id=None, exact=False):
+        """Build the matcher.
+
+        :param resource_classes: Subclasses of RandomNameGeneratorMixin
+        :param task_id: The UUID of task that must match the task portion
+                        of names
+        :param exact: If False, then additional information may follow
+                      the expected name
+        """
+        patterns = {}
+        for cls in resource_classes:
+            key = (cls._get_resource_name_format(),
+                   cls._get_resource_name_allowed_characters())
+            if key not in patterns:
+                patterns[key] = self._get_pattern(cls, task_id, exact)
+        # without classes nothing matches, like in name_matches_object()
+        self._name_re = re.compile(
+            "|".join("(?:%s)" % pattern for pattern in patterns.values())
+            or "(?!)")
+
+    @staticmethod
+    def _get_pattern(cls, task_id, exact):
+        name_format = cls._get_resource_name_format()
+        match = cls._resource_name_placeholder_re.match(name_format)
+        if match is None:
+            raise ValueError(
+                "%s is not a valid resource name format" % name_format)
+        parts = match.groupdict()
+        chars = re.escape(cls._get_resource_name_allowed_characters())
+        if task_id:
+            task_id_re = re.escape(
+                cls._generate_task_id_part(task_id, len(parts["task"])))
+        else:
+            task_id_re = "[%s]{%s}" % (chars, len(parts["task"]))
+        return "%s%s%s[%s]{%s}%s%s$" % (
+            re.escape(parts["prefix"]), task_id_re, re.escape(parts["sep"]),
+            chars, len(parts["rand"]), re.escape(parts["suffix"]),
+            "" if exact else ".*")
+
+    def match(self, name):
+        """Check the resource name."""
+        return bool(self._name_re.match(name))
+
+
+class _JobQueue(queue.Queue):
+    """Bounded queue of deletion jobs.
+
+    The publisher appends jobs to it as to the deque of broker.run(), but is
+    blocked while the queue is full until consumers take jobs from it.
+    """
+
+    def append(self, job):
+        self.put(job)
+
+
 class SeekAndDestroy:
 
     def __init__(self, manager_cls, admin, users,
-                 resource_classes=None, task_id=None):
+                 resource_classes=None, task_id=None, name_matcher=None):
         """Resource deletion class.
 
         This class contains method exterminate() that finds and deletes
@@ -43,6 +112,8 @@ class SeekAndDestroy:
         :param resource_classes: Resource classes to match resource names
                                  against
         :param task_id: The UUID of task to match resource names against
+        :param name_matcher: NameMatcher to use instead of building one from
+                             resource_classes and task_id
         """
         self.manager_cls = manager_cls
         self.admin = admin
@@ -50,6 +121,21 @@ class SeekAndDestroy:
         self.resource_classes = resource_classes or [
             rutils.RandomNameGeneratorMixin]
         self.task_id = task_id
+        self.name_matcher = name_matcher or NameMatcher(
+            self.resource_classes, task_id=task_id)
+
+        # Only the default is_deleted() check (GET by id) can be replaced by
+        # a listing. Managers with custom checks keep polling every resource
+        # on its own.
+        self._batched_deletion_check = (
+            CONF.openstack.cleanup_batched_deletion_check
+            and getattr(manager_cls, "is_deleted", None)
+            is base.ResourceManager.is_deleted)
+        self._pending_deletions = {}
+        self._pending_deletions_lock = threading.Lock()
+        self._bulk_deletions = {}
+        self._bulk_deletions_lock = threading.Lock()
+        self._bulk_managers = {}
 
     def _get_cached_client(self, user):
         """Simplifies initialization and caching OpenStack clients."""
@@ -58,7 +144,16 @@ class SeekAndDestroy:
         # NOTE(astudenov): Credential now supports caching by default
         return user["credential"].clients()
 
-    def _delete_single_resource(self, resource):
+    @staticmethod
+    def _msg_kw(resource):
+        return {
+            "uuid": resource.id(),
+            "name": resource.name() or "",
+            "service": resource._service,
+            "resource": resource._resource
+        }
+
+    def _delete_single_resource(self, resource, wait=True):
         """Safe resource deletion with retries and timeouts.
 
         Send request to delete resource, in case of failures repeat it few
@@ -68,14 +163,14 @@ class SeekAndDestroy:
 
         :param resource: instance of resource manager initiated with resource
                          that should be deleted.
+        :param wait: Pull status of resource until it's deleted. If False,
+                     only the deletion request is sent and it is up to the
+                     caller to confirm the deletion.
+        :returns: True if the deletion request was sent successfully,
+                  otherwise False
         """
 
-        msg_kw = {
-            "uuid": resource.id(),
-            "name": resource.name() or "",
-            "service": resource._service,
-            "resource": resource._resource
-        }
+        msg_kw = self._msg_kw(resource)
 
         LOG.debug(
             "Deleting %(service)s.%(resource)s object %(name)s (%(uuid)s)"
@@ -91,30 +186,92 @@ class SeekAndDestroy:
                 LOG.exception(msg)
             else:
                 LOG.warning("%(msg)s Reason: %(e)s" % {"msg": msg, "e": e})
-        else:
-            started = time.time()
-            failures_count = 0
-            while time.time() - started < resource._timeout:
+            return False
+
+        if not wait:
+            return True
+
+        started = time.time()
+        failures_count = 0
+        while time.time() - started < resource._timeout:
+            try:
+                if resource.is_deleted():
+                    return True
+            except Exception:
+                LOG.exception(
+                    "Seems like %s.%s.is_deleted(self) method is broken "
+                    "It shouldn't raise any exceptions."
+                    % (resource.__module__, type(resource).__name__))
+
+                # NOTE(boris-42): Avoid LOG spamming in case of bad
+                #                 is_deleted() method
+                failures_count += 1
+                if failures_count > resource._max_attempts:
+                    break
+
+            rutils.interruptable_sleep(resource._interval)
+
+        LOG.warning("Resource deletion failed, timeout occurred for "
+                    "%(service)s.%(resource)s: %(uuid)s." % msg_kw)
+        return True
+
+    def _list_existing_ids(self, admin, user):
+        """Returns ids of resources that are not deleted yet.
+
+        Single listing call replaces is_deleted() calls for all resources of
+        the tenant (or of the admin).
+        """
+        kwargs = {"admin": self._get_cached_client(admin),
+                  "user": self._get_cached_client(user),
+                  "tenant_uuid": user and user["tenant_id"]}
+        existing = set()
+        for raw_resource in self.manager_cls(**kwargs).list():
+            status = task_utils.get_status(raw_resource)
+            if status not in ("DELETED", "DELETE_COMPLETE"):
+                existing.add(
+                    self.manager_cls(resource=raw_resource, **kwargs).id())
+        return existing
+
+    def _wait_for_pending_deletions(self):
+        """Confirm deletion of all resources deleted with wait=False.
+
+        Instead of pulling the status of every resource, list the resources
+        once per tenant on every poll and drop the ones that disappeared.
+
+        Writes in LOG warning with UUID of resources that weren't deleted.
+        """
+        pending = self._pending_deletions
+        started = time.time()
+        failures_count = 0
+        while pending and time.time() - started < self.manager_cls._timeout:
+            for key, batch in list(pending.items()):
                 try:
-                    if resource.is_deleted():
-                        return
+                    existing = self._list_existing_ids(batch["admin"],
+                                                       batch["user"])
                 except Exception:
                     LOG.exception(
-                        "Seems like %s.%s.is_deleted(self) method is broken "
+                        "Seems like %s.%s.list(self) method is broken. "
                         "It shouldn't raise any exceptions."
-                        % (resource.__module__, type(resource).__name__))
-
-                    # NOTE(boris-42): Avoid LOG spamming in case of bad
-                    #                 is_deleted() method
+                        % (self.manager_cls.__module__,
+                           self.manager_cls.__name__))
                     failures_count += 1
-                    if failures_count > resource._max_attempts:
-                        break
-
-                finally:
-                    rutils.interruptable_sleep(resource._interval)
-
-            LOG.warning("Resource deletion failed, timeout occurred for "
-                        "%(service)s.%(resource)s: %(uuid)s." % msg_kw)
+                    continue
+                for uuid in set(batch["resources"]) - existing:
+                    batch["resources"].pop(uuid)
+                if not batch["resources"]:
+                    pending.pop(key)
+
+            # Avoid LOG spamming in case of bad list() method
+            if failures_count > self.manager_cls._max_attempts:
+                break
+            if pending:
+                rutils.interruptable_sleep(self.manager_cls._interval)
+
+        for batch in pending.values():
+            for msg_kw in batch["resources"].values():
+                LOG.warning("Resource deletion failed, timeout occurred for "
+                            "%(service)s.%(resource)s: %(uuid)s." % msg_kw)
+        pending.clear()
 
     def _publisher(self, queue):
         """Publisher for deletion jobs.
@@ -130,6 +287,9 @@ class SeekAndDestroy:
         """
         def _publish(admin, user, manager):
             try:
+                # NOTE: retry() covers only listings returned as a whole.
+                #   Listings which yield resources page by page retry the
+                #   request of every page on their own.
                 for raw_resource in rutils.retry(3, manager.list):
                     queue.append((admin, user, raw_resource))
             except Exception:
@@ -159,6 +319,41 @@ class SeekAndDestroy:
                     tenant_uuid=user["tenant_id"])
                 _publish(self.admin, user, manager)
 
+    def _get_bulk_manager(self, admin, user):
+        """Return the resource manager deleting resources of the user at once.
+
+        One manager is used for all batches of the user, so it can cache
+        what it learns about the cloud (e.g. capabilities of Swift).
+        """
+        key = (user and user["tenant_id"], user and user["id"])
+        with self._bulk_deletions_lock:
+            if key not in self._bulk_managers:
+                self._bulk_managers[key] = self.manager_cls(
+                    admin=self._get_cached_client(admin),
+                    user=self._get_cached_client(user),
+                    tenant_uuid=user and user["tenant_id"])
+            return self._bulk_managers[key]
+
+    def _bulk_delete(self, admin, user, raw_resources):
+        """Delete resources at once, falling back to one by one deletion."""
+        manager = self._get_bulk_manager(admin, user)
+        try:
+            raw_resources = manager.bulk_delete(raw_resources)
+        except Exception as e:
+            LOG.warning(
+                "Failed to delete %(count)s %(service)s.%(resource)s "
+                "resources at once, deleting them one by one: %(error)s" % {
+                    "count": len(raw_resources),
+                    "service": self.manager_cls._service,
+                    "resource": self.manager_cls._resource,
+                    "error": e})
+        for raw_resource in raw_resources:
+            self._delete_single_resource(self.manager_cls(
+                resource=raw_resource,
+                admin=self._get_cached_client(admin),
+                user=self._get_cached_client(user),
+                tenant_uuid=user and user["tenant_id"]))
+
     def _consumer(self, cache, args):
         """Method that consumes single deletion job."""
         admin, user, raw_resource = args
@@ -170,16 +365,91 @@ class SeekAndDestroy:
             tenant_uuid=user and user["tenant_id"])
 
         if (isinstance(manager.name(), base.NoName)
-                or rutils.name_matches_object(
-                    manager.name(), *self.resource_classes,
-                    task_id=self.task_id, exact=False)):
-            self._delete_single_resource(manager)
+                or self.name_matcher.match(manager.name())):
+            if self.manager_cls._bulk_delete_size:
+                key = (user and user["tenant_id"], user and user["id"])
+                with self._bulk_deletions_lock:
+                    batch = self._bulk_deletions.setdefault(
+                        key, {"admin": admin, "user": user, "resources": []})
+                    batch["resources"].append(raw_resource)
+                    if (len(batch["resources"])
+                            < self.manager_cls._bulk_delete_size):
+                        return
+                    del self._bulk_deletions[key]
+                self._bulk_delete(admin, user, batch["resources"])
+            elif not self._batched_deletion_check:
+                self._delete_single_resource(manager)
+            elif self._delete_single_resource(manager, wait=False):
+                key = (user and user["tenant_id"], user and user["id"])
+                with self._pending_deletions_lock:
+                    batch = self._pending_deletions.setdefault(
+                        key, {"admin": admin, "user": user, "resources": {}})
+                    batch["resources"][manager.id()] = self._msg_kw(manager)
+
+    def _run_broker(self):
+        """Delete resources while they are still being listed.
+
+        broker.run() calls the publisher to the end before it starts the
+        consumers, and the consumers stop as soon as its queue is empty. So
+        here broker.run() only runs the workers: one of them lists resources
+        into a bounded queue which the others drain at the same time. The
+        deletion starts with the first listed resources and listings which
+        yield resources page by page (SwiftObject, NeutronPort) are never
+        held in memory as a whole.
+        """
+        consumers_count = self.manager_cls._threads
+        jobs = _JobQueue(maxsize=consumers_count * 10)
+
+        def publish():
+            try:
+                self._publisher(jobs)
+            except Exception as e:
+                msg = "Failed to publish a task to the queue"
+                if logging.is_debug():
+                    LOG.exception(msg)
+                else:
+                    LOG.warning("%s: %s" % (msg, e))
+            finally:
+                # one stop mark for every consumer
+                for _i in range(consumers_count):
+                    jobs.put(None)
+
+        def consume():
+            cache = {}
+            while True:
+                job = jobs.get()
+                if job is None:
+                    break
+                try:
+                    self._consumer(cache, job)
+                except Exception as e:
+                    msg = "Failed to consume a task from the queue"
+                    if logging.is_debug():
+                        LOG.exception(msg)
+                    else:
+                        LOG.warning("%s: %s" % (msg, e))
+
+        workers = [publish] + [consume] * consumers_count
+        broker.run(
+            lambda queue: queue.extend(workers),
+            lambda cache, worker: worker(),
+            consumers_count=consumers_count + 1)
 
     def exterminate(self):
         """Delete all resources for passed users, admin and resource_mgr."""
 
-        broker.run(self._publisher, self._consumer,
-                   consumers_count=self.manager_cls._threads)
+        self._run_broker()
+        if self._bulk_deletions:
+            # delete what is left in not filled batches
+            batches = list(self._bulk_deletions.values())
+            self._bulk_deletions.clear()
+            broker.run(
+                lambda queue: queue.extend(batches),
+                lambda cache, batch: self._bulk_delete(
+                    batch["admin"], batch["user"], batch["resources"]),
+                consumers_count=min(self.manager_cls._threads, len(batches)))
+        if self._batched_deletion_check:
+            self._wait_for_pending_deletions()
 
 
 def list_resource_names(admin_required=None):
@@ -241,6 +511,79 @@ def find_resource_managers(names=None, admin_required=None):
     return resource_managers
 
 
+def _must_be_deleted_before(first, second):
+    """Checks whether resource manager first should finish before second.
+
+    :param first: subclass of base.ResourceManager
+    :param second: subclass of base.ResourceManager
+    """
+    if first._order >= second._order:
+        return False
+    if first._delete_before is None or second._delete_before is None:
+        return True
+    return (first._service == second._service
+            or second._service in first._delete_before
+            or "%s.%s" % (second._service, second._resource)
+            in first._delete_before)
+
+
+def _run_by_dependencies(resource_managers, func, workers):
+    """Call func for each resource manager in several threads.
+
+    The call for a resource manager starts only after calls for all the
+    resource managers which must be deleted before it are finished.
+
+    :param resource_managers: List of base.ResourceManager subclasses
+    :param func: Function that processes a single resource manager
+    :param workers: Number of threads
+    """
+    pending = list(resource_managers)
+    requirements = dict(
+        (mgr, [dep for dep in resource_managers
+               if _must_be_deleted_before(dep, mgr)])
+        for mgr in resource_managers)
+    finished = set()
+    condition = threading.Condition()
+
+    def _worker():
+        while True:
+            with condition:
+                while True:
+                    if not pending:
+                        return
+                    ready = [mgr for mgr in pending
+                             if all(dep in finished
+                                    for dep in requirements[mgr])]
+                    if ready:
+                        manager = ready[0]
+                        pending.remove(manager)
+                        break
+                    condition.wait()
+            try:
+                func(manager)
+            except Exception as e:
+                msg = ("Failed to cleanup %(service)s %(resource)s objects"
+                       % {"service": manager._service,
+                          "resource": manager._resource})
+                if logging.is_debug():
+                    LOG.exception(msg)
+                else:
+                    LOG.warning("%s: %s" % (msg, e))
+            finally:
+                with condition:
+                    finished.add(manager)
+                    condition.notify_all()
+
+    threads = []
+    for i in range(min(workers, len(resource_managers))):
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+
 def cleanup(names=None, admin_required=None, admin=None, users=None,
             superclass=plugin.Plugin, task_id=None):
     """Generic cleaner.
@@ -277,10 +620,24 @@ def cleanup(names=None, admin_required=None, admin=None, users=None,
     if not resource_classes and issubclass(superclass,
                                            rutils.RandomNameGeneratorMixin):
         resource_classes.append(superclass)
-    for manager in find_resource_managers(names, admin_required):
+    # shared by all managers, there are hundreds of resource classes
+    name_matcher = NameMatcher(
+        resource_classes or [rutils.RandomNameGeneratorMixin],
+        task_id=task_id)
+
+    def _exterminate(manager):
         LOG.debug("Cleaning up %(service)s %(resource)s objects"
                   % {"service": manager._service,
                      "resource": manager._resource})
         SeekAndDestroy(manager, admin, users,
                        resource_classes=resource_classes,
-                       task_id=task_id).exterminate()
+                       task_id=task_id,
+                       name_matcher=name_matcher).exterminate()
+
+    resource_managers = find_resource_managers(names, admin_required)
+    workers = CONF.openstack.cleanup_resource_managers_workers
+    if workers > 1:
+        _run_by_dependencies(resource_managers, _exterminate, workers)
+    else:
+        for manager in resource_managers:
+            _exterminate(manager)
@@ -13,12 +13,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import queue
+import threading
 import typing as t
+import urllib.parse
+from concurrent import futures
 
 from rally.common import cfg
 from rally.common import logging
-from rally.task import utils as task_utils
+from rally.common import utils as rutils
 
+from rally_openstack.common import polling
 from rally_openstack.common.services.image import glance_v2
 from rally_openstack.common.services.image import image
 from rally_openstack.common.services.network import neutron
@@ -111,7 +117,8 @@ _nova_order = get_order(200)
 
 
 @base.resource("nova", "servers", order=next(_nova_order),
-               tenant_resource=True)
+               tenant_resource=True,
+               delete_before=("neutron", "cinder", "manila", "ironic"))
 class NovaServer(base.ResourceManager):
     def list(self):
         """List all servers."""
@@ -130,24 +137,25 @@ class NovaServer(base.ResourceManager):
 
 
 @base.resource("nova", "server_groups", order=next(_nova_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NovaServerGroups(base.ResourceManager):
     pass
 
 
-@base.resource("nova", "keypairs", order=next(_nova_order))
+@base.resource("nova", "keypairs", order=next(_nova_order), delete_before=())
 class NovaKeypair(SynchronizedDeletion, base.ResourceManager):
     pass
 
 
 @base.resource("nova", "quotas", order=next(_nova_order),
-               admin_required=True, tenant_resource=True)
+               admin_required=True, tenant_resource=True, delete_before=())
 class NovaQuotas(QuotaMixin):
     pass
 
 
 @base.resource("nova", "flavors", order=next(_nova_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class NovaFlavors(base.ResourceManager):
     pass
 
@@ -163,7 +171,8 @@ class NovaFlavors(base.ResourceManager):
 
 
 @base.resource("nova", "aggregates", order=next(_nova_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class NovaAggregate(SynchronizedDeletion, base.ResourceManager):
 
     def delete(self):
@@ -226,19 +235,19 @@ class NeutronLbaasV1Mixin(NeutronMixin):
 
 
 @base.resource("neutron", "vip", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronV1Vip(NeutronLbaasV1Mixin):
     pass
 
 
 @base.resource("neutron", "health_monitor", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronV1Healthmonitor(NeutronLbaasV1Mixin):
     pass
 
 
 @base.resource("neutron", "pool", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronV1Pool(NeutronLbaasV1Mixin):
     pass
 
@@ -252,7 +261,7 @@ class NeutronLbaasV2Mixin(NeutronMixin):
 
 
 @base.resource("neutron", "loadbalancer", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronV2Loadbalancer(NeutronLbaasV2Mixin):
 
     def is_deleted(self):
@@ -306,7 +315,7 @@ class OctaviaMixIn(NeutronMixin):
 
 
 @base.resource("octavia", "load_balancer", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=("neutron",))
 class OctaviaLoadBalancers(OctaviaMixIn):
     def delete(self):
         from octaviaclient.api.v2 import octavia as octavia_exc
@@ -324,31 +333,32 @@ class OctaviaLoadBalancers(OctaviaMixIn):
 
 
 @base.resource("octavia", "pool", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class OctaviaPools(OctaviaMixIn):
     pass
 
 
 @base.resource("octavia", "listener", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class OctaviaListeners(OctaviaMixIn):
     pass
 
 
 @base.resource("octavia", "l7policy", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class OctaviaL7Policies(OctaviaMixIn):
     pass
 
 
 @base.resource("octavia", "health_monitor", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class OctaviaHealthMonitors(OctaviaMixIn):
     pass
 
 
 @base.resource("neutron", "bgpvpn", order=next(_neutron_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class NeutronBgpvpn(NeutronMixin):
     def list(self):
         if self._neutron.supports_extension("bgpvpn", silent=True):
@@ -357,7 +367,7 @@ class NeutronBgpvpn(NeutronMixin):
 
 
 @base.resource("neutron", "firewall_group", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronFirewallGroup(NeutronMixin):
 
     def list(self):
@@ -377,7 +387,7 @@ class NeutronFirewallGroup(NeutronMixin):
 
 
 @base.resource("neutron", "firewall_policy", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronFirewallPolicy(NeutronMixin):
 
     def list(self):
@@ -397,7 +407,7 @@ class NeutronFirewallPolicy(NeutronMixin):
 
 
 @base.resource("neutron", "firewall_rule", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronFirewallRule(NeutronMixin):
 
     def list(self):
@@ -417,7 +427,7 @@ class NeutronFirewallRule(NeutronMixin):
 
 
 @base.resource("neutron", "floatingip", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronFloatingIP(NeutronMixin):
     def name(self):
         return self.raw_resource.get("description", "")
@@ -433,7 +443,7 @@ class NeutronFloatingIP(NeutronMixin):
 
 
 @base.resource("neutron", "trunk", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronTrunk(NeutronMixin):
     # Trunks must be deleted before the parent/subports are deleted
 
@@ -447,7 +457,7 @@ class NeutronTrunk(NeutronMixin):
 
 
 @base.resource("neutron", "port", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronPort(NeutronMixin):
     # NOTE(andreykurilin): port is the kind of resource that can be created
     #   automatically. In this case it doesn't have name field which matches
@@ -465,32 +475,80 @@ class NeutronPort(NeutronMixin):
     def ROUTER_GATEWAY_OWNER(self):  # noqa: N802
         return self._neutron.ROUTER_GATEWAY_OWNER
 
-    def _get_resources(self, resource):
-        if resource not in self._cache:
-            getter = getattr(self._neutron, "list_%s" % resource)
-            resources = getter(tenant_id=self.tenant_uuid)
-            self._cache[resource] = [r for r in resources
-                                     if r["tenant_id"] == self.tenant_uuid]
-        return self._cache[resource]
+    def _get_routers(self):
+        """Return routers of the tenant by their ids."""
+        if "routers" not in self._cache:
+            self._cache["routers"] = {
+                r["id"]: r
+                for r in self._neutron.list_routers(tenant_id=self.tenant_uuid)
+                if r["tenant_id"] == self.tenant_uuid}
+        return self._cache["routers"]
+
+    def _list_ports_page(self, **filters):
+        from neutronclient.common import exceptions as neutron_exc
+
+        try:
+            return next(self._manager().list_ports(retrieve_all=False,
+                                                   **filters))
+        except neutron_exc.NotFound:
+            if "marker" not in filters:
+                raise
+            # the marker port is deleted
+            return None
+
+    def _list_ports(self):
+        """Yield ports of the tenant page by page.
+
+        Every page is requested separately, so a failed request is retried
+        without listing the previous pages again.
+        """
+        filters = {"tenant_id": self.tenant_uuid}
+        if CONF.openstack.neutron_ports_list_page_size:
+            filters["limit"] = CONF.openstack.neutron_ports_list_page_size
+        # ids of the listed ports in the order of listing
+        listed = []
+        listed_ids = set()
+        while True:
+            page = rutils.retry(3, self._list_ports_page, **filters)
+            if page is None:
+                # NOTE: ports are deleted while they are listed, so the
+                #   marker port can be gone. The listing goes on from the
+                #   port listed before it or from the beginning, ports
+                #   which are listed again are skipped.
+                position = listed.index(filters["marker"])
+                if position:
+                    filters["marker"] = listed[position - 1]
+                else:
+                    filters.pop("marker")
+                LOG.debug("Marker port is not found, listing ports from "
+                          "%s" % filters.get("marker", "the beginning"))
+                continue
+            for port in page["ports"]:
+                if port["id"] in listed_ids:
+                    continue
+                listed.append(port["id"])
+                listed_ids.add(port["id"])
+                if port["tenant_id"] == self.tenant_uuid:
+                    yield port
+            if not page["ports"] or not any(
+                    link.get("rel") == "next"
+                    for link in page.get("ports_links", [])):
+                break
+            filters["marker"] = page["ports"][-1]["id"]
 
     def list(self):
-        ports = self._get_resources("ports")
-        for port in ports:
-            if not port.get("name"):
-                parent_name = None
-                if (port["device_owner"] in self.ROUTER_INTERFACE_OWNERS
-                        or port["device_owner"] == self.ROUTER_GATEWAY_OWNER):
-                    # first case is a port created while adding an interface to
-                    #   the subnet
-                    # second case is a port created while adding gateway for
-                    #   the network
-                    port_router = [r for r in self._get_resources("routers")
-                                   if r["id"] == port["device_id"]]
-                    if port_router:
-                        parent_name = port_router[0]["name"]
-                if parent_name:
-                    port["parent_name"] = parent_name
-        return ports
+        router_owners = (set(self.ROUTER_INTERFACE_OWNERS)
+                         | {self.ROUTER_GATEWAY_OWNER})
+        for port in self._list_ports():
+            if not port.get("name") and port["device_owner"] in router_owners:
+                # first case is a port created while adding an interface to
+                #   the subnet
+                # second case is a port created while adding gateway for
+                #   the network
+                router = self._get_routers().get(port["device_id"])
+                if router and router["name"]:
+                    port["parent_name"] = router["name"]
+            yield port
 
     def name(self):
         return self.raw_resource.get("parent_name",
@@ -505,25 +563,25 @@ class NeutronPort(NeutronMixin):
 
 
 @base.resource("neutron", "router", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronRouter(NeutronMixin):
     pass
 
 
 @base.resource("neutron", "subnet", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronSubnet(NeutronMixin):
     pass
 
 
 @base.resource("neutron", "network", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronNetwork(NeutronMixin):
     pass
 
 
 @base.resource("neutron", "security_group", order=next(_neutron_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class NeutronSecurityGroup(NeutronMixin):
     def list(self):
         try:
@@ -539,7 +597,7 @@ class NeutronSecurityGroup(NeutronMixin):
 
 
 @base.resource("neutron", "quota", order=next(_neutron_order),
-               admin_required=True, tenant_resource=True)
+               admin_required=True, tenant_resource=True, delete_before=())
 class NeutronQuota(QuotaMixin):
 
     def delete(self):
@@ -552,37 +610,39 @@ _cinder_order = get_order(400)
 
 
 @base.resource("cinder", "backups", order=next(_cinder_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class CinderVolumeBackup(base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "volume_types", order=next(_cinder_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class CinderVolumeType(base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "volume_snapshots", order=next(_cinder_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class CinderVolumeSnapshot(base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "transfers", order=next(_cinder_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class CinderVolumeTransfer(base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "volumes", order=next(_cinder_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class CinderVolume(base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "image_volumes_cache", order=next(_cinder_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=("glance",))
 class CinderImageVolumeCache(base.ResourceManager):
 
     def _glance(self):
@@ -606,13 +666,14 @@ class CinderImageVolumeCache(base.ResourceManager):
 
 
 @base.resource("cinder", "quotas", order=next(_cinder_order),
-               admin_required=True, tenant_resource=True)
+               admin_required=True, tenant_resource=True, delete_before=())
 class CinderQuotas(QuotaMixin, base.ResourceManager):
     pass
 
 
 @base.resource("cinder", "qos_specs", order=next(_cinder_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class CinderQos(base.ResourceManager):
     pass
 
@@ -623,26 +684,27 @@ _manila_order = get_order(450)
 
 
 @base.resource("manila", "shares", order=next(_manila_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class ManilaShare(base.ResourceManager):
     pass
 
 
 @base.resource("manila", "share_networks", order=next(_manila_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class ManilaShareNetwork(base.ResourceManager):
     pass
 
 
 @base.resource("manila", "security_services", order=next(_manila_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class ManilaSecurityService(base.ResourceManager):
     pass
 
 
 # GLANCE
 
-@base.resource("glance", "images", order=500, tenant_resource=True)
+@base.resource("glance", "images", order=500, tenant_resource=True,
+               delete_before=())
 class GlanceImage(base.ResourceManager):
 
     def _client(self):
@@ -660,7 +722,7 @@ class GlanceImage(base.ResourceManager):
             glancev2 = glance_v2.GlanceV2Service(self.admin or self.user)
             glancev2.reactivate_image(self.raw_resource.id)
         client.delete_image(self.raw_resource.id)
-        task_utils.wait_for_status(
+        polling.wait_for_status(
             self.raw_resource, ["deleted"],
             check_deletion=True,
             update_resource=self._client().get_image,
@@ -670,7 +732,8 @@ class GlanceImage(base.ResourceManager):
 
 # CEILOMETER
 
-@base.resource("ceilometer", "alarms", order=700, tenant_resource=True)
+@base.resource("ceilometer", "alarms", order=700, tenant_resource=True,
+               delete_before=())
 class CeilometerAlarms(SynchronizedDeletion, base.ResourceManager):
 
     def id(self):
@@ -687,7 +750,7 @@ class CeilometerAlarms(SynchronizedDeletion, base.ResourceManager):
 
 # ZAQAR
 
-@base.resource("zaqar", "queues", order=800)
+@base.resource("zaqar", "queues", order=800, delete_before=())
 class ZaqarQueues(SynchronizedDeletion, base.ResourceManager):
 
     def list(self):
@@ -731,13 +794,14 @@ class DesignateResource(SynchronizedDeletion, base.ResourceManager):
 
 
 @base.resource("designate", "servers", order=next(_designate_order),
-               admin_required=True, perform_for_admin_only=True, threads=1)
+               admin_required=True, perform_for_admin_only=True, threads=1,
+               delete_before=())
 class DesignateServer(DesignateResource):
     pass
 
 
 @base.resource("designate", "zones", order=next(_designate_order),
-               tenant_resource=True, threads=1)
+               tenant_resource=True, threads=1, delete_before=())
 class DesignateZones(DesignateResource):
 
     def list(self):
@@ -782,23 +846,99 @@ class SwiftMixin(SynchronizedDeletion, base.ResourceManager):
 
 
 @base.resource("swift", "object", order=next(_swift_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class SwiftObject(SwiftMixin):
 
+    # the default limit of the bulk-delete middleware
+    _bulk_delete_size = 10000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = {}
+
+    def _get_bulk_delete_info(self):
+        """Return bulk-delete capabilities of Swift, requesting them once."""
+        if "bulk_delete" not in self._cache:
+            self._cache["bulk_delete"] = (
+                self._manager().get_capabilities().get("bulk_delete"))
+        return self._cache["bulk_delete"]
+
+    def _list_container(self, container, pages, stop):
+        """Put pages of objects of the container to the queue."""
+        marker = ""
+        while not stop.is_set():
+            objects = rutils.retry(3, self._manager().get_container,
+                                   container, marker=marker)[1]
+            if not objects:
+                break
+            page = [[container, obj["name"]] for obj in objects]
+            while not stop.is_set():
+                try:
+                    pages.put(page, timeout=1)
+                    break
+                except queue.Full:
+                    pass
+            marker = objects[-1]["name"]
+
     def list(self):
-        object_list = []
-        containers = self._manager().get_account(full_listing=True)[1]
-        for con in containers:
-            objects = self._manager().get_container(con["name"],
-                                                    full_listing=True)[1]
-            for obj in objects:
-                raw_resource = [con["name"], obj["name"]]
-                object_list.append(raw_resource)
-        return object_list
+        """Yield objects as soon as containers are listed page by page.
+
+        Containers are listed simultaneously, so deletion of objects starts
+        before all of them are listed.
+        """
+        containers = [con["name"] for con in rutils.retry(
+            3, self._manager().get_account, full_listing=True)[1]]
+        if not containers:
+            return
+        workers = min(CONF.openstack.cleanup_swift_listing_workers,
+                      len(containers))
+        pages = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            listings = [
+                executor.submit(self._list_container, con, pages, stop)
+                for con in containers]
+            try:
+                while True:
+                    try:
+                        yield from pages.get(timeout=0.1)
+                    except queue.Empty:
+                        if all(f.done() for f in listings):
+                            break
+                while not pages.empty():
+                    yield from pages.get()
+                for listing in listings:
+                    # re-raise the error of a listing if any
+                    listing.result()
+            finally:
+                stop.set()
+
+    def bulk_delete(self, raw_resources):
+        bulk_delete = self._get_bulk_delete_info()
+        if not bulk_delete:
+            return raw_resources
+
+        size = bulk_delete.get("max_deletes_per_request",
+                               self._bulk_delete_size)
+        swift = self._manager()
+        left = []
+        for i in range(0, len(raw_resources), size):
+            chunk = {
+                urllib.parse.quote("/%s/%s" % (container, obj)):
+                    [container, obj]
+                for container, obj in raw_resources[i:i + size]}
+            _headers, body = swift.post_account(
+                headers={"Accept": "application/json",
+                         "Content-Type": "text/plain"},
+                query_string="bulk-delete",
+                data="\n".join(chunk))
+            for path, _status in json.loads(body)["Errors"]:
+                left.append(chunk[path])
+        return left
 
 
 @base.resource("swift", "container", order=next(_swift_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class SwiftContainer(SwiftMixin):
 
     def list(self):
@@ -812,20 +952,20 @@ _mistral_order = get_order(1100)
 
 
 @base.resource("mistral", "workbooks", order=next(_mistral_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class MistralWorkbooks(SynchronizedDeletion, base.ResourceManager):
     def delete(self):
         self._manager().delete(self.raw_resource.name)
 
 
 @base.resource("mistral", "workflows", order=next(_mistral_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class MistralWorkflows(SynchronizedDeletion, base.ResourceManager):
     pass
 
 
 @base.resource("mistral", "executions", order=next(_mistral_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class MistralExecutions(SynchronizedDeletion, base.ResourceManager):
 
     def name(self):
@@ -841,7 +981,8 @@ _ironic_order = get_order(1300)
 
 
 @base.resource("ironic", "node", admin_required=True,
-               order=next(_ironic_order), perform_for_admin_only=True)
+               order=next(_ironic_order), perform_for_admin_only=True,
+               delete_before=())
 class IronicNodes(base.ResourceManager):
 
     def id(self):
@@ -863,25 +1004,28 @@ class GnocchiMixin(base.ResourceManager):
 
 
 @base.resource("gnocchi", "archive_policy_rule", order=next(_gnocchi_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class GnocchiArchivePolicyRule(GnocchiMixin):
     pass
 
 
 @base.resource("gnocchi", "archive_policy", order=next(_gnocchi_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class GnocchiArchivePolicy(GnocchiMixin):
     pass
 
 
 @base.resource("gnocchi", "resource_type", order=next(_gnocchi_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class GnocchiResourceType(GnocchiMixin):
     pass
 
 
 @base.resource("gnocchi", "metric", order=next(_gnocchi_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class GnocchiMetric(GnocchiMixin):
 
     def id(self):
@@ -904,7 +1048,7 @@ class GnocchiMetric(GnocchiMixin):
 
 
 @base.resource("gnocchi", "resource", order=next(_gnocchi_order),
-               tenant_resource=True)
+               tenant_resource=True, delete_before=())
 class GnocchiResource(GnocchiMixin):
     def id(self):
         return self.raw_resource["id"]
@@ -956,13 +1100,15 @@ class WatcherMixin(SynchronizedDeletion, base.ResourceManager):
 
 
 @base.resource("watcher", "audit_template", order=next(_watcher_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class WatcherTemplate(WatcherMixin):
     pass
 
 
 @base.resource("watcher", "action_plan", order=next(_watcher_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class WatcherActionPlan(WatcherMixin):
 
     def name(self):
@@ -970,7 +1116,8 @@ class WatcherActionPlan(WatcherMixin):
 
 
 @base.resource("watcher", "audit", order=next(_watcher_order),
-               admin_required=True, perform_for_admin_only=True)
+               admin_required=True, perform_for_admin_only=True,
+               delete_before=())
 class WatcherAudit(WatcherMixin):
 
     def name(self):
@@ -1064,7 +1211,7 @@ class KeystoneEc2(SynchronizedDeletion, base.ResourceManager):
 
 
 @base.resource("barbican", "secrets", order=1500, admin_required=True,
-               perform_for_admin_only=True)
+               perform_for_admin_only=True, delete_before=())
 class BarbicanSecrets(base.ResourceManager):
 
     def id(self):
@@ -1080,12 +1227,12 @@ class BarbicanSecrets(base.ResourceManager):
 
 
 @base.resource("barbican", "containers", order=1500, admin_required=True,
-               perform_for_admin_only=True)
+               perform_for_admin_only=True, delete_before=())
 class BarbicanContainers(base.ResourceManager):
     pass
 
 
 @base.resource("barbican", "orders", order=1500, admin_required=True,
-               perform_for_admin_only=True)
+               perform_for_admin_only=True, delete_before=())
 class BarbicanOrders(base.ResourceManager):
     pass
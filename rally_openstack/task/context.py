@@ -12,9 +12,14 @@
 
 import functools
 
+from rally import exceptions
+from rally.common import broker
+from rally.common import logging
 from rally.task import context
 
 
+LOG = logging.getLogger(__name__)
+
 configure = functools.partial(context.configure, platform="openstack")
 
 
@@ -35,3 +40,40 @@ class OpenStackContext(context.Context):
             if user["tenant_id"] not in processed_tenants:
                 processed_tenants.add(user["tenant_id"])
                 yield user, user["tenant_id"]
+
+    def _run_per_tenants(self, func, threads, users=None):
+        """Call func for a single arbitrary user from each tenant in parallel.
+
+        NOTE: tenants are processed in parallel, so func should collect atomic
+        actions of every tenant separately and extend atomic actions of the
+        context with them at once, to keep them flat.
+
+        :param func: function that accepts user and tenant id
+        :param threads: number of threads to use for broker pattern
+        :type users: list of users
+        :raises ContextSetupFailure: if func failed for any of tenants
+        """
+        failures = []
+
+        def publish(queue):
+            for user, tenant_id in self._iterate_per_tenants(users):
+                queue.append((user, tenant_id))
+
+        def consume(cache, args):
+            user, tenant_id = args
+            try:
+                func(user, tenant_id)
+            except Exception as e:
+                LOG.debug("Failed to set up %s for tenant %s"
+                          % (self.get_name(), tenant_id), exc_info=True)
+                failures.append((tenant_id, e))
+
+        broker.run(publish, consume, threads)
+
+        if failures:
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Failed for %d tenant(s): %s" % (
+                    len(failures),
+                    "; ".join("%s: %s" % (tenant_id, e)
+                              for tenant_id, e in failures)))
@@ -42,6 +42,12 @@ class VolumeGenerator(context.OpenStackContext):
             "volumes_per_tenant": {
                 "type": "integer",
                 "minimum": 1
+            },
+            "resource_management_workers": {
+                "description": "The number of tenants to set up "
+                               "simultaneously.",
+                "type": "integer",
+                "minimum": 1
             }
         },
         "required": ["size"],
@@ -49,7 +55,8 @@ class VolumeGenerator(context.OpenStackContext):
     }
 
     DEFAULT_CONFIG = {
-        "volumes_per_tenant": 1
+        "volumes_per_tenant": 1,
+        "resource_management_workers": 1
     }
 
     def setup(self):
@@ -57,18 +64,25 @@ class VolumeGenerator(context.OpenStackContext):
         volume_type = self.config.get("type", None)
         volumes_per_tenant = self.config["volumes_per_tenant"]
 
-        for user, tenant_id in self._iterate_per_tenants():
+        def create_volumes(user, tenant_id):
             self.context["tenants"][tenant_id].setdefault("volumes", [])
             clients = osclients.Clients(user["credential"])
+            atomic_actions = []
             cinder_service = block.BlockStorage(
                 clients,
                 name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions())
-            for i in range(volumes_per_tenant):
-                vol = cinder_service.create_volume(size,
-                                                   volume_type=volume_type)
-                self.context["tenants"][tenant_id]["volumes"].append(
-                    vol._as_dict())
+                atomic_inst=atomic_actions)
+            try:
+                for i in range(volumes_per_tenant):
+                    vol = cinder_service.create_volume(
+                        size, volume_type=volume_type)
+                    self.context["tenants"][tenant_id]["volumes"].append(
+                        vol._as_dict())
+            finally:
+                self.atomic_actions().extend(atomic_actions)
+
+        self._run_per_tenants(create_volumes,
+                              self.config["resource_management_workers"])
 
     def cleanup(self):
         resource_manager.cleanup(
@@ -99,6 +99,12 @@ class ImageGenerator(context.OpenStackContext):
                 "enum": ["qcow2", "raw", "vhd", "vmdk", "vdi", "iso", "aki",
                          "ari", "ami"],
             },
+            "resource_management_workers": {
+                "description": "The number of tenants to set up "
+                               "simultaneously.",
+                "type": "integer",
+                "minimum": 1
+            },
         },
         "oneOf": [{"description": "It is been used since Rally 0.10.0",
                    "required": ["image_url", "disk_format",
@@ -115,7 +121,8 @@ class ImageGenerator(context.OpenStackContext):
         "additionalProperties": False
     }
 
-    DEFAULT_CONFIG = {"images_per_tenant": 1}
+    DEFAULT_CONFIG = {"images_per_tenant": 1,
+                      "resource_management_workers": 1}
 
     config: dict
 
@@ -165,7 +172,7 @@ class ImageGenerator(context.OpenStackContext):
         if "image_name" in self.config and images_per_tenant == 1:
             image_name = self.config["image_name"]
 
-        for user, tenant_id in self._iterate_per_tenants():
+        def create_images(user, tenant_id):
             current_images = []
             clients = osclients.Clients(user["credential"])
             image_service = image.Image(
@@ -184,6 +191,9 @@ class ImageGenerator(context.OpenStackContext):
 
             self.context["tenants"][tenant_id]["images"] = current_images
 
+        self._run_per_tenants(create_images,
+                              self.config["resource_management_workers"])
+
     def cleanup(self):
         if self.context.get("admin", {}):
             # NOTE(andreykurilin): Glance does not require the admin for
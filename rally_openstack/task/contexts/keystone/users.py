@@ -324,7 +324,9 @@ class UserGenerator(context.OpenStackContext):
         """Authenticate each user (and admin) once so iterations reuse it.
 
         Credentials that are already authenticated (the existing_users path
-        does it while resolving user and tenant ids) are skipped.
+        does it while resolving user and tenant ids) are skipped. Equal
+        credentials (e.g. an existing user listed twice, or the admin also
+        being one of the users) share the auth state of one authentication.
         """
         credentials = [user["credential"] for user in self.context["users"]]
         admin = self.context.get("admin", {}).get("credential")
@@ -334,15 +336,19 @@ class UserGenerator(context.OpenStackContext):
             return
 
         def publish(queue):
+            groups = collections.defaultdict(list)
             for cred in credentials:
                 if not cred.auth:
-                    queue.append(cred)
+                    groups[cred.auth_key()].append(cred)
+            queue.extend(groups.values())
 
-        def consume(cache, cred):
-            clients = osclients.Clients(cred)
+        def consume(cache, group):
+            clients = osclients.Clients(group[0])
             sess, plugin = clients.keystone.get_session()
             plugin.get_access(sess)
-            cred.auth = plugin.get_auth_state()
+            auth_state = plugin.get_auth_state()
+            for cred in group:
+                cred.auth = auth_state
 
         # NOTE(andreykurilin): resource_management_workers is defaulted only
         #   for the new-users path, while this runs for existing users too.
@@ -79,3 +79,4 @@ class ClusterGenerator(context.OpenStackContext):
             users=self.context.get("users", []),
             superclass=magnum_utils.MagnumScenario,
             task_id=self.get_owner_id())
+        magnum_utils.drop_k8s_clients(self.context["task"]["uuid"])
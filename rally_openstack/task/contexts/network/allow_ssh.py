@@ -112,6 +112,28 @@ _RULES_TO_ADD: list[dict[str, str | int]] = [
 class AllowSSH(context.OpenStackContext):
     """Sets up security groups for all users to access VM via SSH."""
 
+    CONFIG_SCHEMA = {
+        "oneOf": [
+            {"type": "null",
+             "description": "Use the default settings."},
+            {
+                "type": "object",
+                "description": "Settings of the context.",
+                "properties": {
+                    "resource_management_workers": {
+                        "description": "The number of tenants to set up "
+                                       "simultaneously.",
+                        "type": "integer",
+                        "minimum": 1
+                    }
+                },
+                "additionalProperties": False
+            }
+        ]
+    }
+
+    DEFAULT_CONFIG = {"resource_management_workers": 1}
+
     def setup(self):
         client = neutron.NeutronService(
             clients=self.context["users"][0]["credential"].clients(),
@@ -125,27 +147,37 @@ class AllowSSH(context.OpenStackContext):
 
         secgroup_name = self.generate_random_name()
         secgroups_per_tenant = {}
-        for user, tenant_id in self._iterate_per_tenants():
+
+        def create_secgroup(user, tenant_id):
+            atomic_actions = []
             client = neutron.NeutronService(
                 clients=user["credential"].clients(),
                 name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions()
+                atomic_inst=atomic_actions
             )
-            secgroup = client.create_security_group(
-                name=secgroup_name,
-                description="Allow ssh access to VMs created by Rally")
-            secgroups_per_tenant[tenant_id] = secgroup
-
-            existing_rules = {
-                _rule_to_key(rule)
-                for rule in secgroup.get("security_group_rules", [])}
-            for new_rule in _RULES_TO_ADD:
-                if _rule_to_key(new_rule) not in existing_rules:
+            try:
+                secgroup = client.create_security_group(
+                    name=secgroup_name,
+                    description="Allow ssh access to VMs created by Rally")
+                secgroups_per_tenant[tenant_id] = secgroup
+
+                existing_rules = {
+                    _rule_to_key(rule)
+                    for rule in secgroup.get("security_group_rules", [])}
+                new_rules = [rule for rule in _RULES_TO_ADD
+                             if _rule_to_key(rule) not in existing_rules]
+                if new_rules:
                     secgroup.setdefault("security_group_rules", [])
-                    secgroup["security_group_rules"].append(
-                        client.create_security_group_rule(
-                            security_group_id=secgroup["id"], **new_rule)
-                    )
+                    secgroup["security_group_rules"].extend(
+                        client.create_security_group_rules(
+                            security_group_id=secgroup["id"],
+                            rules=new_rules))
+            finally:
+                self.atomic_actions().extend(atomic_actions)
+
+        config = self.config or self.DEFAULT_CONFIG
+        self._run_per_tenants(create_secgroup,
+                              config["resource_management_workers"])
 
         for user in self.context["users"]:
             user["secgroup"] = secgroups_per_tenant[user["tenant_id"]]
@@ -84,6 +84,12 @@ class Network(context.OpenStackContext):
                     }
                 },
                 "additionalProperties": False
+            },
+            "resource_management_workers": {
+                "description": "The number of tenants to set up "
+                               "simultaneously.",
+                "type": "integer",
+                "minimum": 1
             }
         },
         "additionalProperties": False
@@ -95,51 +101,58 @@ class Network(context.OpenStackContext):
         "subnets_per_network": 1,
         "network_create_args": {},
         "router": {"external": True},
-        "dualstack": False
+        "dualstack": False,
+        "resource_management_workers": 1
     }
 
     config: dict
 
     def setup(self):
-        # NOTE(rkiran): Some clients are not thread-safe. Thus during
-        #               multithreading/multiprocessing, it is likely the
-        #               sockets are left open. This problem is eliminated by
-        #               creating a connection in setup and cleanup separately.
-
-        for user, tenant_id in self._iterate_per_tenants():
+        network_create_args = self.config["network_create_args"].copy()
+        subnet_create_args = {
+            "start_cidr": (self.config["start_cidr"]
+                           if not self.config["dualstack"] else None)}
+        if "dns_nameservers" in self.config:
+            dns_nameservers = self.config["dns_nameservers"]
+            subnet_create_args["dns_nameservers"] = dns_nameservers
+
+        router_create_args = dict(self.config["router"] or {})
+        if not router_create_args:
+            # old behaviour - empty dict means no router create
+            router_create_args = None
+        elif "external" in router_create_args:
+            external = router_create_args.pop("external")
+            router_create_args["discover_external_gw"] = external
+
+        def create_networks(user, tenant_id):
             self.context["tenants"][tenant_id]["networks"] = []
             self.context["tenants"][tenant_id]["subnets"] = []
 
+            # NOTE(rkiran): Some clients are not thread-safe. Thus during
+            #               multithreading/multiprocessing, it is likely the
+            #               sockets are left open. This problem is eliminated
+            #               by creating a connection in setup and cleanup
+            #               separately.
+            atomic_actions = []
             client = neutron.NeutronService(
                 user["credential"].clients(),
                 name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions()
+                atomic_inst=atomic_actions
             )
-            network_create_args = self.config["network_create_args"].copy()
-            subnet_create_args = {
-                "start_cidr": (self.config["start_cidr"]
-                               if not self.config["dualstack"] else None)}
-            if "dns_nameservers" in self.config:
-                dns_nameservers = self.config["dns_nameservers"]
-                subnet_create_args["dns_nameservers"] = dns_nameservers
-
-            router_create_args = dict(self.config["router"] or {})
-            if not router_create_args:
-                # old behaviour - empty dict means no router create
-                router_create_args = None
-            elif "external" in router_create_args:
-                external = router_create_args.pop("external")
-                router_create_args["discover_external_gw"] = external
-
-            for i in range(self.config["networks_per_tenant"]):
-
-                net_infra = client.create_network_topology(
+            try:
+                # all networks of the tenant are created with one request and
+                #   all their subnets with another one
+                topologies = client.create_network_topologies(
+                    self.config["networks_per_tenant"],
                     network_create_args=network_create_args,
                     subnet_create_args=subnet_create_args,
                     subnets_dualstack=self.config["dualstack"],
                     subnets_count=self.config["subnets_per_network"],
                     router_create_args=router_create_args)
+            finally:
+                self.atomic_actions().extend(atomic_actions)
 
+            for net_infra in topologies:
                 if net_infra["routers"]:
                     router_id = net_infra["routers"][0]["id"]
                 else:
@@ -153,6 +166,9 @@ class Network(context.OpenStackContext):
                     net_infra["subnets"]
                 )
 
+        self._run_per_tenants(create_networks,
+                              self.config["resource_management_workers"])
+
     def cleanup(self):
         resource_manager.cleanup(
             names=[
@@ -74,6 +74,12 @@ class ServerGenerator(context.OpenStackContext):
                     }
                 ]},
                 "minItems": 1
+            },
+            "resource_management_workers": {
+                "description": "The number of tenants to set up "
+                               "simultaneously.",
+                "type": "integer",
+                "minimum": 1
             }
         },
         "required": ["image", "flavor"],
@@ -82,7 +88,8 @@ class ServerGenerator(context.OpenStackContext):
 
     DEFAULT_CONFIG = {
         "servers_per_tenant": 5,
-        "auto_assign_nic": False
+        "auto_assign_nic": False,
+        "resource_management_workers": 1
     }
 
     def setup(self):
@@ -110,13 +117,17 @@ class ServerGenerator(context.OpenStackContext):
             resource_spec=flavor, config={"type": "nova_flavor"},
             output_type=str)
 
-        for iter_, (user, tenant_id) in enumerate(self._iterate_per_tenants()):
+        iterations = dict(
+            (tenant_id, iter_) for iter_, (user, tenant_id)
+            in enumerate(self._iterate_per_tenants()))
+
+        def boot_servers(user, tenant_id):
             LOG.debug("Booting servers for user tenant %s" % user["tenant_id"])
             tmp_context = {"user": user,
                            "tenant": self.context["tenants"][tenant_id],
                            "task": self.context["task"],
                            "owner_id": self.context["owner_id"],
-                           "iteration": iter_}
+                           "iteration": iterations[tenant_id]}
             nova_scenario = nova_utils.NovaScenario(tmp_context)
 
             LOG.debug("Calling _boot_servers with image_id=%(image_id)s "
@@ -138,6 +149,9 @@ class ServerGenerator(context.OpenStackContext):
             self.context["tenants"][tenant_id][
                 "servers"] = current_servers
 
+        self._run_per_tenants(boot_servers,
+                              self.config["resource_management_workers"])
+
     def cleanup(self):
         resource_manager.cleanup(names=["nova.servers"],
                                  users=self.context.get("users", []),
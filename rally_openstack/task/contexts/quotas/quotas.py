@@ -13,6 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from rally import exceptions
+from rally.common import broker
+from rally.common import cfg
 from rally.common import logging
 from rally.common import validation
 
@@ -43,64 +46,136 @@ class Quotas(context.OpenStackContext):
             "cinder": cinder_quotas.CinderQuotas.QUOTAS_SCHEMA,
             "manila": manila_quotas.ManilaQuotas.QUOTAS_SCHEMA,
             "designate": designate_quotas.DesignateQuotas.QUOTAS_SCHEMA,
-            "neutron": neutron_quotas.NeutronQuotas.QUOTAS_SCHEMA
+            "neutron": neutron_quotas.NeutronQuotas.QUOTAS_SCHEMA,
+            "resource_management_workers": {
+                "description": "The number of quotas of tenants to update "
+                               "simultaneously.",
+                "type": "integer",
+                "minimum": 1
+            }
         }
     }
 
-    config: dict[str, dict[str, int]]
+    config: dict
 
     def __init__(self, ctx):
         super().__init__(ctx)
         self.clients = osclients.Clients(
             self.context["admin"]["credential"])
 
-        self.manager = {
-            "nova": nova_quotas.NovaQuotas(self.clients),
-            "cinder": cinder_quotas.CinderQuotas(self.clients),
-            "manila": manila_quotas.ManilaQuotas(self.clients),
-            "designate": designate_quotas.DesignateQuotas(self.clients),
-            "neutron": neutron_quotas.NeutronQuotas(self.clients)
-        }
+        self.manager = self._get_managers(self.clients)
         self.original_quotas = []
 
+    @staticmethod
+    def _get_managers(clients):
+        return {
+            "nova": nova_quotas.NovaQuotas(clients),
+            "cinder": cinder_quotas.CinderQuotas(clients),
+            "manila": manila_quotas.ManilaQuotas(clients),
+            "designate": designate_quotas.DesignateQuotas(clients),
+            "neutron": neutron_quotas.NeutronQuotas(clients)
+        }
+
     def _service_has_quotas(self, service):
         return len(self.config.get(service, {})) > 0
 
-    def setup(self):
-        for tenant_id in self.context["tenants"]:
-            for service in self.manager:
-                if self._service_has_quotas(service):
-                    # NOTE(andreykurilin): in case of existing users it is
-                    #   required to restore original quotas instead of reset
-                    #   to default ones.
-                    if "existing_users" in self.context["config"]:
-                        self.original_quotas.append(
-                            (service, tenant_id,
-                             self.manager[service].get(tenant_id)))
-                    self.manager[service].update(tenant_id,
-                                                 **self.config[service])
+    def _run_per_service(self, func, items):
+        """Call func for each (service, tenant_id, *args) item in parallel.
 
-    def _restore_quotas(self):
-        for service, tenant_id, quotas in self.original_quotas:
+        :param func: function that accepts quotas manager of the service and
+            the item
+        :param items: list of tuples starting with service and tenant id
+        :returns: list of (service, tenant_id, exception) of failed items
+        """
+        failures = []
+        if not items:
+            return failures
+
+        def publish(queue):
+            queue.extend(items)
+
+        def consume(cache, item):
+            # NOTE: every thread uses own clients, since not all of them are
+            #   thread-safe
+            if "managers" not in cache:
+                cache["managers"] = self._get_managers(
+                    osclients.Clients(self.context["admin"]["credential"]))
+            service, tenant_id = item[:2]
             try:
-                self.manager[service].update(tenant_id, **quotas)
+                func(cache["managers"][service], *item)
             except Exception as e:
-                LOG.warning("Failed to restore quotas for tenant %(tenant_id)s"
-                            " in service %(service)s \n reason: %(exc)s" %
-                            {"tenant_id": tenant_id, "service": service,
-                             "exc": e})
+                LOG.debug("Failed to process %s quotas of tenant %s"
+                          % (service, tenant_id), exc_info=True)
+                failures.append((service, tenant_id, e))
+
+        # NOTE: the option is read at runtime, since a config file is loaded
+        #   after the module is imported
+        workers = self.config.get(
+            "resource_management_workers",
+            cfg.CONF.openstack.users_context_resource_management_workers)
+        broker.run(publish, consume, min(workers, len(items)))
+        return failures
+
+    def setup(self):
+        # NOTE(andreykurilin): in case of existing users it is required to
+        #   restore original quotas instead of reset to default ones.
+        # NOTE: quotas of generated tenants are updated without getting
+        #   them first, since they have default values which rarely match
+        #   the requested ones and are deleted at cleanup anyway.
+        existing_users = "existing_users" in self.context["config"]
+
+        def update(manager, service, tenant_id):
+            quotas = self.config[service]
+            if existing_users:
+                current = manager.get(tenant_id)
+                quotas = dict((k, v) for k, v in quotas.items()
+                              if current.get(k) != v)
+                if not quotas:
+                    return
+                self.original_quotas.append(
+                    (service, tenant_id,
+                     dict((k, current.get(k)) for k in quotas)))
+            manager.update(tenant_id, **quotas)
+
+        failures = self._run_per_service(
+            update,
+            [(service, tenant_id)
+             for tenant_id in self.context["tenants"]
+             for service in self.manager
+             if self._service_has_quotas(service)])
+
+        if failures:
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Failed to update %d quota(s): %s" % (
+                    len(failures),
+                    "; ".join("%s quotas of tenant %s: %s"
+                              % (service, tenant_id, e)
+                              for service, tenant_id, e in failures)))
+
+    def _restore_quotas(self):
+        failures = self._run_per_service(
+            lambda manager, service, tenant_id, quotas: manager.update(
+                tenant_id, **quotas),
+            self.original_quotas)
+        for service, tenant_id, e in failures:
+            LOG.warning("Failed to restore quotas for tenant %(tenant_id)s"
+                        " in service %(service)s \n reason: %(exc)s" %
+                        {"tenant_id": tenant_id, "service": service,
+                         "exc": e})
 
     def _delete_quotas(self):
-        for service in self.manager:
-            if self._service_has_quotas(service):
-                for tenant_id in self.context["tenants"]:
-                    try:
-                        self.manager[service].delete(tenant_id)
-                    except Exception as e:
-                        LOG.warning(
-                            "Failed to remove quotas for tenant %(tenant)s "
-                            "in service %(service)s reason: %(e)s" %
-                            {"tenant": tenant_id, "service": service, "e": e})
+        failures = self._run_per_service(
+            lambda manager, service, tenant_id: manager.delete(tenant_id),
+            [(service, tenant_id)
+             for service in self.manager
+             if self._service_has_quotas(service)
+             for tenant_id in self.context["tenants"]])
+        for service, tenant_id, e in failures:
+            LOG.warning(
+                "Failed to remove quotas for tenant %(tenant)s "
+                "in service %(service)s reason: %(e)s" %
+                {"tenant": tenant_id, "service": service, "e": e})
 
     def cleanup(self):
         if self.original_quotas:
@@ -13,8 +13,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import tempfile
-
 from rally.common import broker
 
 from rally_openstack.task.scenarios.swift import utils as swift_utils
@@ -69,31 +67,26 @@ class SwiftObjectMixin:
         """
         objects = []
 
-        with tempfile.TemporaryFile() as dummy_file:
-            # set dummy file to specified object size
-            dummy_file.truncate(object_size)
-
-            def publish(queue):
-                for tenant_id in self.context["tenants"]:
-                    items = self.context["tenants"][tenant_id]["containers"]
-                    for container in items:
-                        for i in range(objects_per_container):
-                            queue.append(container)
-
-            def consume(cache, container):
-                user = container["user"]
-                if user["id"] not in cache:
-                    cache[user["id"]] = swift_utils.SwiftScenario(
-                        {"user": user, "task": self.context.get("task", {})})
-                dummy_file.seek(0)
-                object_name = cache[user["id"]]._upload_object(
-                    container["container"],
-                    dummy_file)[1]
-                container["objects"].append(object_name)
-                objects.append((user["tenant_id"], container["container"],
-                                object_name))
-
-            broker.run(publish, consume, threads)
+        def publish(queue):
+            for tenant_id in self.context["tenants"]:
+                items = self.context["tenants"][tenant_id]["containers"]
+                for container in items:
+                    for i in range(objects_per_container):
+                        queue.append(container)
+
+        def consume(cache, container):
+            user = container["user"]
+            if user["id"] not in cache:
+                cache[user["id"]] = swift_utils.SwiftScenario(
+                    {"user": user, "task": self.context.get("task", {})})
+            object_name = cache[user["id"]]._upload_object(
+                container["container"],
+                swift_utils.ZeroPayload(object_size))[1]
+            container["objects"].append(object_name)
+            objects.append((user["tenant_id"], container["container"],
+                            object_name))
+
+        broker.run(publish, consume, threads)
 
         return objects
 
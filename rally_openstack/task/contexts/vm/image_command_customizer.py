@@ -89,11 +89,15 @@ class ImageCommandCustomizerContext(custom_image.BaseCustomImageGenerator):
     }
 
     def _customize_image(self, server, fip, user):
-        code, out, err = vm_utils.VMScenario(self.context)._run_command(
-            fip["ip"], self.config["port"],
-            self.config["username"], self.config.get("password"),
-            command=self.config["command"],
-            pkey=user["keypair"]["private"])
+        scenario = vm_utils.VMScenario(self.context)
+        try:
+            code, out, err = scenario._run_command(
+                fip["ip"], self.config["port"],
+                self.config["username"], self.config.get("password"),
+                command=self.config["command"],
+                pkey=user["keypair"]["private"])
+        finally:
+            scenario._close_ssh()
 
         if code:
             raise exceptions.ScriptError(
@@ -24,6 +24,7 @@ from rally.task import context
 from rally.task import scenario
 
 from rally_openstack.common import osclients
+from rally_openstack.common import polling
 
 
 configure = functools.partial(scenario.configure, platform="openstack")
@@ -42,6 +43,8 @@ class OpenStackScenario(scenario.Scenario):
     def __init__(self, context=None, admin_clients=None, clients=None):
         super().__init__(context)
         if context:
+            if "owner_id" in context:
+                polling.set_workload(context["owner_id"])
             if admin_clients is None and "admin" in context:
                 self._admin_clients = osclients.Clients(
                     context["admin"]["credential"],
@@ -15,16 +15,15 @@
 import json
 import typing as t
 
-import requests
-
 from rally.common import cfg
 from rally.common import logging
-from rally.common import utils as commonutils
 from rally.task import atomic
 from rally.task import types
 from rally.task import validation
 
 from rally_openstack.common import consts
+from rally_openstack.common import http_session
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 from rally_openstack.task.scenarios.nova import utils as nova_utils
 
@@ -70,24 +69,23 @@ class ElasticsearchLogInstanceName(nova_utils.NovaScenario):
         if additional_query:
             request_data["query"]["bool"].update(additional_query)
 
+        search_url = "http://%(ip)s:%(port)s/_search" % {
+            "ip": logging_vip, "port": elasticsearch_port}
+        session = http_session.get_session()
+
+        def check():
+            resp = session.get(search_url, data=json.dumps(request_data))
+            return resp.json()["hits"]["total"]
+
         LOG.info("Check server ID %s in elasticsearch" % server_id)
-        i = 0
-        while i < retries_total:
-            LOG.debug("Attempt number %s" % (i + 1))
-            resp = requests.get("http://%(ip)s:%(port)s/_search" % {
-                "ip": logging_vip, "port": elasticsearch_port},
-                data=json.dumps(request_data))
-            result = resp.json()
-            if result["hits"]["total"] < 1 and i + 1 >= retries_total:
+        with atomic.ActionTimer(self, "elasticsearch.log_ingest_latency"):
+            total = polling.wait_for_result(
+                check, sleep_time, sleep_time * (retries_total - 1))
+            if total < 1:
                 LOG.debug("No instance data found in Elasticsearch")
-                self.assertGreater(result["hits"]["total"], 0)
-            elif result["hits"]["total"] < 1:
-                i += 1
-                commonutils.interruptable_sleep(sleep_time)
             else:
                 LOG.debug("Instance data found in Elasticsearch")
-                self.assertGreater(result["hits"]["total"], 0)
-                break
+            self.assertGreater(total, 0)
 
     def run(
         self,
@@ -114,9 +112,15 @@ class ElasticsearchLogInstanceName(nova_utils.NovaScenario):
         :param additional_query: map of additional arguments for scenario
                elasticsearch query to check nova info in els index.
         :param query_by_name: query nova server by name if True otherwise by id
-        :param sleep_time: sleep time in seconds between elasticsearch request
+        :param sleep_time: maximum sleep time in seconds between elasticsearch
+                           requests. Delays grow up to it, and the time from
+                           the start of checking until the server is found
+                           is reported as elasticsearch.log_ingest_latency
+                           atomic action.
         :param retries_total: total number of retries to check server name in
-                              elasticsearch
+                              elasticsearch. The server is checked for as long
+                              as retries_total requests with sleep_time
+                              between them would take.
         """
         server = self._boot_server(image, flavor, **(boot_server_kwargs or {}))
         if query_by_name:
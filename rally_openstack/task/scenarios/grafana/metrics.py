@@ -21,6 +21,7 @@ from rally.task import utils
 from rally.task import validation
 
 from rally_openstack.common import consts
+from rally_openstack.common import polling
 from rally_openstack.common.services.grafana import grafana as grafana_service
 from rally_openstack.task import scenario
 
@@ -75,7 +76,7 @@ class PushMetricsInstance(scenario.OpenStackScenario):
                                                      userdata=userdata)
         LOG.info("Server %s create started" % seed)
         self.sleep_between(CONF.openstack.nova_server_boot_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -110,7 +111,8 @@ class PushMetricsInstance(scenario.OpenStackScenario):
                metric. Format: {user: admin, password: pass, port: 9902}
         :param datasource_id: metrics storage datasource ID in Grafana
         :param job_name: job name to push metric in it
-        :param sleep_time: sleep time between checking metrics in seconds
+        :param sleep_time: maximum sleep time between checking metrics in
+                           seconds
         :param retries_total: total number of retries to check metric in
                               Grafana
         """
@@ -152,7 +154,8 @@ class PushMetricLocal(scenario.OpenStackScenario):
                metric. Format: {user: admin, password: pass, port: 9902}
         :param datasource_id: metrics storage datasource ID in Grafana
         :param job_name: job name to push metric in it
-        :param sleep_time: sleep time between checking metrics in seconds
+        :param sleep_time: maximum sleep time between checking metrics in
+                           seconds
         :param retries_total: total number of retries to check metric in
                               Grafana
         """
@@ -21,6 +21,7 @@ from rally.common import logging
 from rally.task import atomic
 from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 
 
@@ -68,7 +69,7 @@ class HeatScenario(scenario.OpenStackScenario):
 
         self.sleep_between(CONF.openstack.heat_stack_create_prepoll_delay)
 
-        stack = utils.wait_for_status(
+        stack = polling.wait_for_status(
             stack,
             ready_statuses=["CREATE_COMPLETE"],
             failure_statuses=["CREATE_FAILED", "ERROR"],
@@ -104,7 +105,7 @@ class HeatScenario(scenario.OpenStackScenario):
 
         self.sleep_between(CONF.openstack.heat_stack_update_prepoll_delay)
 
-        stack = utils.wait_for_status(
+        stack = polling.wait_for_status(
             stack,
             ready_statuses=["UPDATE_COMPLETE"],
             failure_statuses=["UPDATE_FAILED", "ERROR"],
@@ -122,7 +123,7 @@ class HeatScenario(scenario.OpenStackScenario):
         :param stack: stack that needs to be checked
         """
         self.clients("heat").actions.check(stack.id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["CHECK_COMPLETE"],
             failure_statuses=["CHECK_FAILED", "ERROR"],
@@ -139,7 +140,7 @@ class HeatScenario(scenario.OpenStackScenario):
         :param stack: stack object
         """
         stack.delete()
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["DELETE_COMPLETE"],
             failure_statuses=["DELETE_FAILED", "ERROR"],
@@ -156,7 +157,7 @@ class HeatScenario(scenario.OpenStackScenario):
         """
 
         self.clients("heat").actions.suspend(stack.id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["SUSPEND_COMPLETE"],
             failure_statuses=["SUSPEND_FAILED", "ERROR"],
@@ -172,7 +173,7 @@ class HeatScenario(scenario.OpenStackScenario):
         """
 
         self.clients("heat").actions.resume(stack.id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["RESUME_COMPLETE"],
             failure_statuses=["RESUME_FAILED", "ERROR"],
@@ -189,7 +190,7 @@ class HeatScenario(scenario.OpenStackScenario):
         """
         snapshot = self.clients("heat").stacks.snapshot(
             stack.id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["SNAPSHOT_COMPLETE"],
             failure_statuses=["SNAPSHOT_FAILED", "ERROR"],
@@ -206,7 +207,7 @@ class HeatScenario(scenario.OpenStackScenario):
         :param snapshot_id: id of given snapshot
         """
         self.clients("heat").stacks.restore(stack.id, snapshot_id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             stack,
             ready_statuses=["RESTORE_COMPLETE"],
             failure_statuses=["RESTORE_FAILED", "ERROR"],
@@ -269,22 +270,34 @@ class HeatScenario(scenario.OpenStackScenario):
         output_list = stack.to_dict()["outputs"]
         return output_list
 
+    def _list_instances(self, stack):
+        """List server resources of a Heat stack and its nested stacks.
+
+        :param stack: stack to list instances of.
+        """
+        # NOTE: the type is filtered by Heat API, the check on the client side
+        #   is left for clouds which ignore unknown filters
+        return [
+            r for r in self.clients("heat").resources.list(
+                stack.id, nested_depth=1,
+                filters={"type": "OS::Nova::Server"})
+            if r.resource_type == "OS::Nova::Server"]
+
     def _count_instances(self, stack):
         """Count instances in a Heat stack.
 
         :param stack: stack to count instances in.
         """
-        return len([
-            r for r in self.clients("heat").resources.list(stack.id,
-                                                           nested_depth=1)
-            if r.resource_type == "OS::Nova::Server"])
+        return len(self._list_instances(stack))
 
     def _scale_stack(self, stack, output_key, delta):
         """Scale a stack up or down.
 
         Calls the webhook given in the output value identified by
         'output_key', and waits for the stack size to change by
-        'delta'.
+        'delta' and all the instances to be complete. Every check lists
+        the server resources of the stack with a single request and fails
+        on a failed instance.
 
         :param stack: stack to scale up or down
         :param output_key: The name of the output to get the URL from
@@ -295,14 +308,24 @@ class HeatScenario(scenario.OpenStackScenario):
         expected_instances = num_instances + delta
         LOG.debug("Scaling stack %s from %s to %s instances with %s"
                   % (stack.id, num_instances, expected_instances, output_key))
+
+        def is_ready(stack):
+            instances = self._list_instances(stack)
+            for instance in instances:
+                if instance.resource_status.endswith("_FAILED"):
+                    raise exceptions.GetResourceErrorStatus(
+                        resource=instance.physical_resource_id,
+                        status=instance.resource_status,
+                        fault=instance.resource_status_reason)
+            return (len(instances) == expected_instances
+                    and all(i.resource_status.endswith("_COMPLETE")
+                            for i in instances))
+
         with atomic.ActionTimer(self, "heat.scale_with_%s" % output_key):
             self._stack_webhook(stack, output_key)
             utils.wait_for(
                 stack,
-                is_ready=lambda s: (
-                    self._count_instances(s) == expected_instances),
-                failure_statuses=["UPDATE_FAILED", "ERROR"],
-                update_resource=utils.get_from_manager(),
+                is_ready=is_ready,
                 timeout=CONF.openstack.heat_stack_scale_timeout,
                 check_interval=CONF.openstack.heat_stack_scale_poll_interval)
 
@@ -12,12 +12,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import math
 import os
 import random
 import string
+import threading
 import time
 
 from kubernetes import client as k8s_config
+from kubernetes import watch
 from kubernetes.client import api_client
 from kubernetes.client.api import core_v1_api
 from kubernetes.client.rest import ApiException
@@ -28,11 +31,26 @@ from rally.common import utils as common_utils
 from rally.task import atomic
 from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 
 
 CONF = cfg.CONF
 
+# time to retry creation of pods which is forbidden until the service
+# account of a new cluster gets its token
+_K8S_FORBIDDEN_RETRY_TIMEOUT = 300
+
+_k8s_clients = {}
+_k8s_clients_lock = threading.Lock()
+
+
+def drop_k8s_clients(task_id):
+    """Drop k8s API clients created by the process for the task."""
+    with _k8s_clients_lock:
+        for key in [k for k in _k8s_clients if k[1] == task_id]:
+            del _k8s_clients[key]
+
 
 class MagnumScenario(scenario.OpenStackScenario):
     """Base class for Magnum scenarios with basic atomic actions."""
@@ -112,7 +130,7 @@ class MagnumScenario(scenario.OpenStackScenario):
 
         common_utils.interruptable_sleep(
             CONF.openstack.magnum_cluster_create_prepoll_delay)
-        cluster = utils.wait_for_status(
+        cluster = polling.wait_for_status(
             cluster,
             ready_statuses=["CREATE_COMPLETE"],
             failure_statuses=["CREATE_FAILED", "ERROR"],
@@ -149,7 +167,20 @@ class MagnumScenario(scenario.OpenStackScenario):
         return self.clients("magnum").certificates.create(**csr_req)
 
     def _get_k8s_api_client(self):
+        """Return k8s API client of the cluster of the tenant.
+
+        Clients are shared by all iterations of the task in a process, so
+        the connection pool of the cluster is reused. They are dropped by
+        the clusters context at the end of the task.
+        """
         cluster_uuid = self.context["tenant"]["cluster"]
+        key = (os.getpid(), self.context["task"]["uuid"], cluster_uuid)
+        with _k8s_clients_lock:
+            if key not in _k8s_clients:
+                _k8s_clients[key] = self._create_k8s_api_client(cluster_uuid)
+            return _k8s_clients[key]
+
+    def _create_k8s_api_client(self, cluster_uuid):
         cluster = self._get_cluster(cluster_uuid)
         cluster_template = self._get_cluster_template(
             cluster.cluster_template_id)
@@ -201,37 +232,35 @@ class MagnumScenario(scenario.OpenStackScenario):
             podname = podname + random.choice(string.ascii_lowercase)
         manifest["metadata"]["name"] = podname
 
-        for i in range(150):
+        forbidden = []
+
+        def create():
             try:
                 k8s_api.create_namespaced_pod(body=manifest,
                                               namespace="default")
-                break
             except ApiException as e:
                 if e.status != 403:
                     raise
-            time.sleep(2)
-
-        start = time.time()
-        while True:
-            resp = k8s_api.read_namespaced_pod(
-                name=podname, namespace="default")
-
-            if resp.status.conditions:
-                for condition in resp.status.conditions:
-                    if condition.type.lower() == "ready" and \
-                       condition.status.lower() == "true":
-                        return resp
-
-            if (time.time() - start > CONF.openstack.k8s_pod_create_timeout):
-                raise exceptions.TimeoutException(
-                    desired_status="Ready",
-                    resource_name=podname,
-                    resource_type="Pod",
-                    resource_id=resp.metadata.uid,
-                    resource_status=resp.status,
-                    timeout=CONF.openstack.k8s_pod_create_timeout)
-            common_utils.interruptable_sleep(
-                CONF.openstack.k8s_pod_create_poll_interval)
+                forbidden[:] = [e]
+                return False
+            return True
+
+        created = polling.wait_for_result(
+            create, CONF.openstack.k8s_pod_create_poll_interval,
+            _K8S_FORBIDDEN_RETRY_TIMEOUT)
+        if not created:
+            raise forbidden[0]
+
+        def is_ready(pod):
+            return any(condition.type.lower() == "ready"
+                       and condition.status.lower() == "true"
+                       for condition in pod.status.conditions or [])
+
+        return self._wait_for_k8s_object(
+            k8s_api.list_namespaced_pod, podname, "Pod",
+            desired_status="Ready", is_ready=is_ready,
+            get_status=lambda pod: pod.status,
+            timeout=CONF.openstack.k8s_pod_create_timeout)
 
     @atomic.action_timer("magnum.k8s_list_v1rcs")
     def _list_v1rcs(self):
@@ -257,23 +286,52 @@ class MagnumScenario(scenario.OpenStackScenario):
         resp = k8s_api.create_namespaced_replication_controller(
             body=manifest,
             namespace="default")
-        expectd_status = resp.spec.replicas
-        start = time.time()
+        expected_replicas = resp.spec.replicas
+        return self._wait_for_k8s_object(
+            k8s_api.list_namespaced_replication_controller, rcname,
+            "ReplicationController", desired_status=expected_replicas,
+            is_ready=lambda rc: rc.status.replicas == expected_replicas,
+            get_status=lambda rc: rc.status.replicas,
+            timeout=CONF.openstack.k8s_rc_create_timeout)
+
+    def _wait_for_k8s_object(self, list_method, name, resource_type,
+                             desired_status, is_ready, get_status, timeout):
+        """Wait for the k8s object to become ready using the watch API.
+
+        Changes of the object are streamed by the API server, so the time of
+        readiness is not rounded up to a poll interval.
+
+        :param list_method: method of the k8s API client listing the objects
+        :param name: name of the object
+        :param resource_type: kind of the object for the timeout error
+        :param desired_status: status for the timeout error
+        :param is_ready: callable checking the object
+        :param get_status: callable returning status of the object
+        :param timeout: time to wait for the object in seconds
+        :returns: the ready object
+        """
+        deadline = time.time() + timeout
+        k8s_watch = watch.Watch()
+        obj = None
         while True:
-            resp = k8s_api.read_namespaced_replication_controller(
-                name=rcname,
-                namespace="default")
-            status = resp.status.replicas
-            if status == expectd_status:
-                return resp
-            else:
-                if time.time() - start > CONF.openstack.k8s_rc_create_timeout:
-                    raise exceptions.TimeoutException(
-                        desired_status=expectd_status,
-                        resource_name=rcname,
-                        resource_type="ReplicationController",
-                        resource_id=resp.metadata.uid,
-                        resource_status=status,
-                        timeout=CONF.openstack.k8s_rc_create_timeout)
-                common_utils.interruptable_sleep(
-                    CONF.openstack.k8s_rc_create_poll_interval)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            # the API server may close a watch earlier than requested
+            for event in k8s_watch.stream(
+                    list_method, namespace="default",
+                    field_selector="metadata.name=%s" % name,
+                    timeout_seconds=max(int(math.ceil(remaining)), 1)):
+                if event["type"] == "DELETED":
+                    continue
+                obj = event["object"]
+                if is_ready(obj):
+                    k8s_watch.stop()
+                    return obj
+        raise exceptions.TimeoutException(
+            desired_status=desired_status,
+            resource_name=name,
+            resource_type=resource_type,
+            resource_id=obj.metadata.uid if obj else None,
+            resource_status=get_status(obj) if obj else None,
+            timeout=timeout)
@@ -22,6 +22,7 @@ from rally.task import utils as rally_utils
 from rally.task import validation
 
 from rally_openstack.common import consts
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 from rally_openstack.task.contexts.manila import consts as manila_consts
 from rally_openstack.task.scenarios.manila import utils
@@ -142,7 +143,7 @@ class CreateShareAndAccessFromVM(utils.ManilaScenario, vm_utils.VMScenario):
             "interpreter": "/bin/bash"
         }
         try:
-            rally_utils.wait_for_status(
+            polling.wait_for_status(
                 server,
                 ready_statuses=["ACTIVE"],
                 update_resource=rally_utils.get_from_manager(),
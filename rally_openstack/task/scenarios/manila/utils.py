@@ -21,6 +21,7 @@ from rally.common import cfg
 from rally.task import atomic
 from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 from rally_openstack.task.contexts.manila import consts
 
@@ -72,7 +73,7 @@ class ManilaScenario(scenario.OpenStackScenario):
             share_proto, size, **kwargs)
 
         self.sleep_between(CONF.openstack.manila_share_create_prepoll_delay)
-        share = utils.wait_for_status(
+        share = polling.wait_for_status(
             share,
             ready_statuses=["available"],
             update_resource=utils.get_from_manager(),
@@ -89,7 +90,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         """
         share.delete()
         error_statuses = ("error_deleting", )
-        utils.wait_for_status(
+        polling.wait_for_status(
             share,
             ready_statuses=["deleted"],
             check_deletion=True,
@@ -150,7 +151,7 @@ class ManilaScenario(scenario.OpenStackScenario):
                                                          access_result["id"])
 
         # We check if the access in that access_list has the active state
-        utils.wait_for_status(
+        polling.wait_for_status(
             access,
             ready_statuses=["active"],
             update_resource=fn,
@@ -187,7 +188,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         fn = self._update_resource_in_deny_access_share(share,
                                                         access_id)
 
-        utils.wait_for_status(
+        polling.wait_for_status(
             access,
             ready_statuses=["deleted"],
             update_resource=fn,
@@ -215,7 +216,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         :param new_size: new size of the share
         """
         self.clients("manila").shares.extend(share, new_size)
-        utils.wait_for_status(
+        polling.wait_for_status(
             share,
             ready_statuses=["available"],
             update_resource=utils.get_from_manager(),
@@ -230,7 +231,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         :param new_size: new size of the share
         """
         share.shrink(new_size)
-        utils.wait_for_status(
+        polling.wait_for_status(
             share,
             ready_statuses=["available"],
             update_resource=utils.get_from_manager(),
@@ -264,7 +265,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         :param share_network: instance of :class:`ShareNetwork`.
         """
         share_network.delete()
-        utils.wait_for_status(
+        polling.wait_for_status(
             share_network,
             ready_statuses=["deleted"],
             check_deletion=True,
@@ -336,7 +337,7 @@ class ManilaScenario(scenario.OpenStackScenario):
         :param security_service: instance of :class:`SecurityService`.
         """
         security_service.delete()
-        utils.wait_for_status(
+        polling.wait_for_status(
             security_service,
             ready_statuses=["deleted"],
             check_deletion=True,
@@ -20,6 +20,7 @@ from rally.common import cfg
 from rally.task import atomic
 from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.task import scenario
 
 
@@ -124,7 +125,7 @@ class MistralScenario(scenario.OpenStackScenario):
             **params
         )
 
-        execution = utils.wait_for_status(
+        execution = polling.wait_for_status(
             execution, ready_statuses=["SUCCESS"], failure_statuses=["ERROR"],
             update_resource=utils.get_from_manager(),
             timeout=CONF.openstack.mistral_execution_timeout)
@@ -19,8 +19,8 @@ from rally import exceptions
 from rally.common import cfg
 from rally.common import logging
 from rally.task import atomic
-from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.common.services.network import neutron
 from rally_openstack.task import scenario
 
@@ -690,7 +690,7 @@ class NeutronScenario(NeutronBaseScenario):
         neutronclient = self.clients("neutron")
         lb = neutronclient.create_loadbalancer({"loadbalancer": args})
         lb = lb["loadbalancer"]
-        lb = utils.wait_for_status(
+        lb = polling.wait_for_status(
             lb,
             ready_statuses=["ACTIVE"],
             status_attr="provisioning_status",
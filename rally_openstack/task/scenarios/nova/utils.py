@@ -13,6 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import re
+import time
 
 from rally import exceptions
 from rally.common import cfg
@@ -20,6 +23,7 @@ from rally.common import logging
 from rally.task import atomic
 from rally.task import utils
 
+from rally_openstack.common import polling
 from rally_openstack.common.services.image import image as image_service
 from rally_openstack.task import scenario
 from rally_openstack.task.scenarios.cinder import utils as cinder_utils
@@ -30,11 +34,12 @@ CONF = cfg.CONF
 LOG = logging.getLogger(__file__)
 
 
-def list_servers(client, detailed=True):
+def list_servers(client, detailed=True, search_opts=None):
     """List nova servers with pagination
 
     :param client: novaclient instance
     :param detailed: Whether to request detailed server view or not
+    :param search_opts: Filters to apply to the listing (e.g. {"name": ...})
     """
     from novaclient import exceptions as nova_exc
 
@@ -49,7 +54,7 @@ def list_servers(client, detailed=True):
     bad_markers_count = 0
 
     while True:
-        filters = {}
+        filters = dict(search_opts or {})
 
         if marker:
             filters["marker"] = marker
@@ -88,6 +93,85 @@ def list_servers(client, detailed=True):
     return all_servers
 
 
+def wait_for_servers_status(client, servers, ready_statuses,
+                            failure_statuses=("error",), check_deletion=False,
+                            timeout=60, check_interval=1, search_opts=None):
+    """Wait for multiple servers to reach one of ready statuses.
+
+    Instead of fetching every server on its own, all the servers are
+    refreshed with a single paginated listing per poll. Delays between polls
+    are chosen by the configured poll policy.
+
+    :param client: novaclient instance
+    :param servers: List of servers to wait for
+    :param ready_statuses: Statuses to wait for
+    :param failure_statuses: Statuses which mean that a server failed
+    :param check_deletion: Treat servers missing in the listing as ready
+    :param timeout: Max time to wait for all the servers in seconds
+    :param check_interval: Poll interval in seconds
+    :param search_opts: Filters to narrow the listing. By default, only
+        servers with the common name prefix of the servers are listed.
+    :returns: List of updated servers in the same order
+    """
+    ready_statuses = {s.upper() for s in ready_statuses}
+    failure_statuses = {s.upper() for s in failure_statuses or []}
+
+    if search_opts is None:
+        name_prefix = os.path.commonprefix([s.name for s in servers])
+        if name_prefix:
+            search_opts = {"name": "^%s" % re.escape(name_prefix)}
+
+    latest = dict((server.id, server) for server in servers)
+    pending = set(latest)
+    policy = polling.get_policy(
+        check_interval,
+        key=("servers", frozenset(ready_statuses), check_interval))
+    start = time.time()
+
+    while True:
+        listed = dict((server.id, server) for server in list_servers(
+            client, search_opts=search_opts))
+        for server_id in list(pending):
+            if server_id not in listed:
+                if check_deletion:
+                    pending.discard(server_id)
+                    continue
+                raise exceptions.GetResourceNotFound(
+                    resource=latest[server_id])
+            server = latest[server_id] = listed[server_id]
+            status = utils.get_status(server)
+            if status in ready_statuses:
+                pending.discard(server_id)
+            elif status in failure_statuses:
+                raise exceptions.GetResourceErrorStatus(
+                    resource=server,
+                    status=status,
+                    fault="Status in failure list %s" % str(failure_statuses))
+
+        elapsed = time.time() - start
+        if not pending:
+            if policy:
+                policy.finished(elapsed)
+            return [latest[server.id] for server in servers]
+
+        if elapsed >= timeout:
+            # the last known status of every server which is not ready
+            timed_out = [latest[server.id] for server in servers
+                         if server.id in pending]
+            raise exceptions.TimeoutException(
+                desired_status="('%s')" % "', '".join(sorted(ready_statuses)),
+                resource_name=", ".join(s.name for s in timed_out),
+                resource_type="servers",
+                resource_id=", ".join(s.id for s in timed_out),
+                resource_status=", ".join(
+                    "%s: %s" % (s.id, utils.get_status(s))
+                    for s in timed_out),
+                timeout=timeout)
+
+        delay = policy.next_delay(elapsed) if policy else check_interval
+        time.sleep(min(delay, timeout - elapsed))
+
+
 class _LiveMigrateReady:
     def __init__(self, admin_clients, server_id, host_pre_migrate,
                  skip_host_check):
@@ -190,7 +274,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
                 server_name, image, flavor, **kwargs)
 
             self.sleep_between(CONF.openstack.nova_server_boot_prepoll_delay)
-            server = utils.wait_for_status(
+            server = polling.wait_for_status(
                 server,
                 ready_statuses=["ACTIVE"],
                 update_resource=utils.get_from_manager(),
@@ -202,7 +286,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
     def _do_server_reboot(self, server, reboottype):
         server.reboot(reboot_type=reboottype)
         self.sleep_between(CONF.openstack.nova_server_pause_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -279,7 +363,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.rebuild(image, **kwargs)
         self.sleep_between(CONF.openstack.nova_server_rebuild_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -297,7 +381,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         :param server: The server to start and wait to become ACTIVE.
         """
         server.start()
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -315,7 +399,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         :param server: The server to stop.
         """
         server.stop()
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["SHUTOFF"],
             update_resource=utils.get_from_manager(),
@@ -334,7 +418,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.rescue()
         self.sleep_between(CONF.openstack.nova_server_rescue_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["RESCUE"],
             update_resource=utils.get_from_manager(),
@@ -352,7 +436,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.unrescue()
         self.sleep_between(CONF.openstack.nova_server_unrescue_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -371,7 +455,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.suspend()
         self.sleep_between(CONF.openstack.nova_server_suspend_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["SUSPENDED"],
             update_resource=utils.get_from_manager(),
@@ -390,7 +474,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.resume()
         self.sleep_between(CONF.openstack.nova_server_resume_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -409,7 +493,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.pause()
         self.sleep_between(CONF.openstack.nova_server_pause_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["PAUSED"],
             update_resource=utils.get_from_manager(),
@@ -428,7 +512,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.unpause()
         self.sleep_between(CONF.openstack.nova_server_pause_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -447,14 +531,14 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         """
         server.shelve()
         self.sleep_between(CONF.openstack.nova_server_pause_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["SHELVED_OFFLOADED"],
             update_resource=utils.get_from_manager(),
             timeout=CONF.openstack.nova_server_shelve_timeout,
             check_interval=CONF.openstack.nova_server_shelve_poll_interval
         )
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["None"],
             status_attr="OS-EXT-STS:task_state",
@@ -474,7 +558,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         server.unshelve()
 
         self.sleep_between(CONF.openstack. nova_server_unshelve_prepoll_delay)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["ACTIVE"],
             update_resource=utils.get_from_manager(),
@@ -497,7 +581,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
             else:
                 server.delete()
 
-            utils.wait_for_status(
+            polling.wait_for_status(
                 server,
                 ready_statuses=["deleted"],
                 check_deletion=True,
@@ -520,16 +604,14 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
                 else:
                     server.delete()
 
-            for server in servers:
-                utils.wait_for_status(
-                    server,
-                    ready_statuses=["deleted"],
-                    check_deletion=True,
-                    update_resource=utils.get_from_manager(),
-                    timeout=CONF.openstack.nova_server_delete_timeout,
-                    check_interval=(
-                        CONF.openstack.nova_server_delete_poll_interval)
-                )
+            wait_for_servers_status(
+                self.clients("nova"),
+                servers,
+                ready_statuses=["deleted"],
+                check_deletion=True,
+                timeout=CONF.openstack.nova_server_delete_timeout,
+                check_interval=CONF.openstack.nova_server_delete_poll_interval
+            )
 
     @atomic.action_timer("nova.create_server_group")
     def _create_server_group(self, **kwargs):
@@ -592,7 +674,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         glance.delete_image(image.id)
         check_interval = CONF.openstack.nova_server_image_delete_poll_interval
         with atomic.ActionTimer(self, "glance.wait_for_delete"):
-            utils.wait_for_status(
+            polling.wait_for_status(
                 image,
                 ready_statuses=["deleted", "pending_delete"],
                 check_deletion=True,
@@ -619,7 +701,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         image = glance.get_image(image_uuid)
         check_interval = CONF.openstack.nova_server_image_create_poll_interval
         with atomic.ActionTimer(self, "glance.wait_for_image"):
-            image = utils.wait_for_status(
+            image = polling.wait_for_status(
                 image,
                 ready_statuses=["ACTIVE"],
                 update_resource=glance.get_image,
@@ -627,7 +709,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
                 check_interval=check_interval
             )
         with atomic.ActionTimer(self, "nova.wait_for_server"):
-            utils.wait_for_status(
+            polling.wait_for_status(
                 server,
                 ready_statuses=["None"],
                 status_attr="OS-EXT-STS:task_state",
@@ -709,14 +791,14 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
             servers = [s for s in self.clients("nova").servers.list()
                        if s.name.startswith(name_prefix)]
             self.sleep_between(CONF.openstack.nova_server_boot_prepoll_delay)
-            servers = [utils.wait_for_status(
-                server,
+            servers = wait_for_servers_status(
+                self.clients("nova"),
+                servers,
                 ready_statuses=["ACTIVE"],
-                update_resource=utils.
-                get_from_manager(),
                 timeout=CONF.openstack.nova_server_boot_timeout,
-                check_interval=CONF.openstack.nova_server_boot_poll_interval
-            ) for server in servers]
+                check_interval=CONF.openstack.nova_server_boot_poll_interval,
+                search_opts={"name": "^%s" % re.escape(name_prefix)}
+            )
         return servers
 
     @atomic.action_timer("nova.associate_floating_ip")
@@ -785,7 +867,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
     @atomic.action_timer("nova.resize")
     def _resize(self, server, flavor):
         server.resize(flavor)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["VERIFY_RESIZE"],
             update_resource=utils.get_from_manager(),
@@ -796,7 +878,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
     @atomic.action_timer("nova.resize_confirm")
     def _resize_confirm(self, server, status="ACTIVE"):
         server.confirm_resize()
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=[status],
             update_resource=utils.get_from_manager(),
@@ -808,7 +890,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
     @atomic.action_timer("nova.resize_revert")
     def _resize_revert(self, server, status="ACTIVE"):
         server.revert_resize()
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=[status],
             update_resource=utils.get_from_manager(),
@@ -827,7 +909,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         volume_id = volume.id
         attachment = self.clients("nova").volumes.create_server_volume(
             server_id, volume_id, device)
-        utils.wait_for_status(
+        polling.wait_for_status(
             volume,
             ready_statuses=["in-use"],
             update_resource=self._update_volume_resource,
@@ -863,7 +945,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
 
         self.clients("nova").volumes.delete_server_volume(server_id,
                                                           volume.id)
-        utils.wait_for_status(
+        polling.wait_for_status(
             volume,
             ready_statuses=["available"],
             update_resource=self._update_volume_resource,
@@ -926,7 +1008,7 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         server_admin = self.admin_clients("nova").servers.get(server.id)
         host_pre_migrate = getattr(server_admin, "OS-EXT-SRV-ATTR:host")
         server_admin.migrate()
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=["VERIFY_RESIZE"],
             update_resource=utils.get_from_manager(),
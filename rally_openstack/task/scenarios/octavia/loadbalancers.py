@@ -62,8 +62,8 @@ class CreateAndListLoadbalancers(octavia_utils.OctaviaBase):
                 vip_qos_policy_id=vip_qos_policy_id)
             loadbalancers.append(lb)
 
-        for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         self.octavia.load_balancer_list()
 
 
@@ -106,8 +106,9 @@ class CreateAndDeleteLoadbalancers(octavia_utils.OctaviaBase):
                 vip_qos_policy_id=vip_qos_policy_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.load_balancer_delete(
                 loadbalancer["id"])
 
@@ -155,14 +156,15 @@ class CreateAndUpdateLoadBalancers(octavia_utils.OctaviaBase):
                 "name": self.generate_random_name()
             }
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.load_balancer_set(
                 lb_id=loadbalancer["id"],
                 lb_update_args=update_loadbalancer)
         # Wait for all load balancers to finish updating
-        for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
 
 
 @validation.add("required_services", services=[consts.Service.OCTAVIA])
@@ -204,8 +206,9 @@ class CreateAndShowStatsLoadBalancers(octavia_utils.OctaviaBase):
                 vip_qos_policy_id=vip_qos_policy_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.load_balancer_stats_show(
                 loadbalancer["id"])
 
@@ -249,7 +252,8 @@ class CreateAndShowLoadBalancers(octavia_utils.OctaviaBase):
                 vip_qos_policy_id=vip_qos_policy_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.load_balancer_show(
                 loadbalancer["id"])
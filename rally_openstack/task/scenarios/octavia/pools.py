@@ -49,8 +49,9 @@ class CreateAndListPools(utils.OctaviaBase):
                 subnet_id=subnet_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.pool_create(
                 lb_id=loadbalancer["id"],
                 protocol=protocol, lb_algorithm=lb_algorithm)
@@ -83,8 +84,9 @@ class CreateAndDeletePools(utils.OctaviaBase):
                 subnet_id=subnet_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             pools = self.octavia.pool_create(
                 lb_id=loadbalancer["id"],
                 protocol=protocol, lb_algorithm=lb_algorithm)
@@ -121,8 +123,9 @@ class CreateAndUpdatePools(utils.OctaviaBase):
             "name": self.generate_random_name()
         }
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             pools = self.octavia.pool_create(
                 lb_id=loadbalancer["id"],
                 protocol=protocol, lb_algorithm=lb_algorithm)
@@ -156,8 +159,9 @@ class CreateAndShowPools(utils.OctaviaBase):
                 subnet_id=subnet_id)
             loadbalancers.append(lb)
 
+        self.octavia.wait_for_loadbalancers_prov_status(
+            lbs=loadbalancers)
         for loadbalancer in loadbalancers:
-            self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             pools = self.octavia.pool_create(
                 lb_id=loadbalancer["id"],
                 protocol=protocol, lb_algorithm=lb_algorithm)
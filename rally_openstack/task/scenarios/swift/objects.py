@@ -13,8 +13,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import tempfile
-
 from rally.task import validation
 
 from rally_openstack.common import consts
@@ -41,13 +39,10 @@ class CreateContainerAndObjectThenListObjects(utils.SwiftScenario):
         :param kwargs: dict, optional parameters to create container
         """
 
-        with tempfile.TemporaryFile() as dummy_file:
-            # set dummy file to specified object size
-            dummy_file.truncate(object_size)
-            container_name = self._create_container(**kwargs)
-            for i in range(objects_per_container):
-                dummy_file.seek(0)
-                self._upload_object(container_name, dummy_file)
+        container_name = self._create_container(**kwargs)
+        for i in range(objects_per_container):
+            self._upload_object(container_name,
+                                utils.ZeroPayload(object_size))
         self._list_objects(container_name)
 
 
@@ -68,15 +63,11 @@ class CreateContainerAndObjectThenDeleteAll(utils.SwiftScenario):
         """
         container_name = None
         objects_list = []
-        with tempfile.TemporaryFile() as dummy_file:
-            # set dummy file to specified object size
-            dummy_file.truncate(object_size)
-            container_name = self._create_container(**kwargs)
-            for i in range(objects_per_container):
-                dummy_file.seek(0)
-                object_name = self._upload_object(container_name,
-                                                  dummy_file)[1]
-                objects_list.append(object_name)
+        container_name = self._create_container(**kwargs)
+        for i in range(objects_per_container):
+            object_name = self._upload_object(
+                container_name, utils.ZeroPayload(object_size))[1]
+            objects_list.append(object_name)
 
         for object_name in objects_list:
             self._delete_object(container_name, object_name)
@@ -100,15 +91,11 @@ class CreateContainerAndObjectThenDownloadObject(utils.SwiftScenario):
         """
         container_name = None
         objects_list = []
-        with tempfile.TemporaryFile() as dummy_file:
-            # set dummy file to specified object size
-            dummy_file.truncate(object_size)
-            container_name = self._create_container(**kwargs)
-            for i in range(objects_per_container):
-                dummy_file.seek(0)
-                object_name = self._upload_object(container_name,
-                                                  dummy_file)[1]
-                objects_list.append(object_name)
+        container_name = self._create_container(**kwargs)
+        for i in range(objects_per_container):
+            object_name = self._upload_object(
+                container_name, utils.ZeroPayload(object_size))[1]
+            objects_list.append(object_name)
 
         for object_name in objects_list:
             self._download_object(container_name, object_name)
@@ -18,6 +18,46 @@ from rally.task import atomic
 from rally_openstack.task import scenario
 
 
+# NOTE: all payloads are served from this read-only buffer, so uploads of
+#   any size neither allocate memory for the content nor copy it
+_ZEROS = memoryview(bytes(1024 * 1024)).toreadonly()
+
+
+class ZeroPayload:
+    """File-like object content of the given size filled with zero bytes.
+
+    Every upload should use own instance, instances are cheap and do not
+    share a position, so concurrent uploads never contend with each other.
+    A single read returns at most 1 MiB.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._position = 0
+
+    def __len__(self):
+        return self.size
+
+    def read(self, size=-1):
+        remaining = self.size - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        size = min(size, len(_ZEROS))
+        self._position += size
+        return _ZEROS[:size]
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            offset += self.size
+        self._position = max(0, min(offset, self.size))
+        return self._position
+
+
 class SwiftScenario(scenario.OpenStackScenario):
     """Base class for Swift scenarios with basic atomic actions."""
 
@@ -80,7 +120,7 @@ class SwiftScenario(scenario.OpenStackScenario):
         """Upload content to a given container.
 
         :param container_name: str, name of the container to upload object to
-        :param content: file stream, content to upload
+        :param content: file stream (e.g. ZeroPayload), content to upload
         :param kwargs: dict, other optional parameters to put_object
 
         :returns: tuple, (etag and object name)
@@ -0,0 +1,196 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-process reachability prober of VMs.
+
+All echo requests of a process are sent through one unprivileged ICMP
+datagram socket per address family and replies are received by a single
+thread, so waiting for many VMs doesn't spawn a `ping` process per check.
+If ICMP datagram sockets are not permitted (see `net.ipv4.ping_group_range`
+sysctl on Linux), a host is considered reachable when a TCP connection to
+it is either established or refused.
+"""
+
+import os
+import selectors
+import socket
+import struct
+import threading
+import time
+
+import netaddr
+
+from rally.common import cfg
+from rally.common import logging
+
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+_ECHO_REQUEST = {socket.AF_INET: 8, socket.AF_INET6: 128}
+_ECHO_REPLY = {socket.AF_INET: 0, socket.AF_INET6: 129}
+_ICMP_PROTO = {socket.AF_INET: socket.IPPROTO_ICMP,
+               socket.AF_INET6: socket.IPPROTO_ICMPV6}
+_HEADER = struct.Struct("!BBHHH")
+_PAYLOAD = b"rally-openstack-ping"
+_BUFFER_SIZE = 1024
+
+
+def _normalize(address):
+    # link-local IPv6 addresses are returned with a scope id
+    return netaddr.IPAddress(address.split("%", 1)[0]).format()
+
+
+class _Waiter:
+    def __init__(self):
+        self.event = threading.Event()
+        self.sent_at = None
+        self.rtt = None
+
+
+class Prober:
+    """Checks reachability of hosts from any number of threads."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._sockets = {}
+        self._waiters = {}
+        self._seq = 0
+        self._receiver = None
+
+    def ping(self, address, timeout=1.0):
+        """Check that the host replies within the timeout.
+
+        :param address: IPv4 or IPv6 address of the host
+        :param timeout: Time to wait for a reply in seconds
+        :returns: round-trip time in seconds or None if the host is down
+        """
+        ip = netaddr.IPAddress(address)
+        family = socket.AF_INET if ip.version == 4 else socket.AF_INET6
+        sock = self._get_socket(family)
+        if sock is None:
+            return self._tcp_ping(ip.format(), family, timeout)
+        return self._icmp_ping(sock, ip.format(), family, timeout)
+
+    def _get_socket(self, family):
+        with self._lock:
+            if family not in self._sockets:
+                try:
+                    sock = socket.socket(family, socket.SOCK_DGRAM,
+                                         _ICMP_PROTO[family])
+                except OSError as e:
+                    LOG.info("ICMP datagram sockets are not available (%s). "
+                             "TCP connect probes to port %s are used to "
+                             "check VMs instead."
+                             % (e, CONF.openstack.vm_ping_tcp_port))
+                    sock = None
+                else:
+                    sock.setblocking(False)
+                    self._selector.register(sock, selectors.EVENT_READ,
+                                            family)
+                    if self._receiver is None:
+                        self._receiver = threading.Thread(
+                            target=self._receive, daemon=True)
+                        self._receiver.start()
+                self._sockets[family] = sock
+            return self._sockets[family]
+
+    def _icmp_ping(self, sock, address, family, timeout):
+        waiter = _Waiter()
+        with self._lock:
+            self._seq = (self._seq + 1) % 0x10000
+            key = (address, self._seq)
+            self._waiters[key] = waiter
+        # NOTE: the kernel sets the identifier and the checksum of echo
+        #   requests sent through datagram sockets
+        packet = _HEADER.pack(_ECHO_REQUEST[family], 0, 0, 0, key[1])
+        try:
+            waiter.sent_at = time.monotonic()
+            sock.sendto(packet + _PAYLOAD, (address, 0))
+            waiter.event.wait(timeout)
+        except OSError as e:
+            LOG.debug("Failed to send echo request to %s: %s" % (address, e))
+        finally:
+            with self._lock:
+                self._waiters.pop(key, None)
+        return waiter.rtt
+
+    def _receive(self):
+        while True:
+            for key, _events in self._selector.select(timeout=1):
+                try:
+                    data, sender = key.fileobj.recvfrom(_BUFFER_SIZE)
+                except OSError:
+                    continue
+                self._handle_reply(key.data, data, sender[0],
+                                   time.monotonic())
+
+    def _handle_reply(self, family, data, sender, received_at):
+        if family == socket.AF_INET and data and data[0] >> 4 == 4:
+            # some platforms return ICMP replies together with IP header
+            data = data[(data[0] & 0x0F) * 4:]
+        if len(data) < _HEADER.size:
+            return
+        icmp_type, _code, _checksum, _ident, seq = _HEADER.unpack_from(data)
+        if icmp_type != _ECHO_REPLY[family]:
+            return
+        with self._lock:
+            waiter = self._waiters.get((_normalize(sender), seq))
+        if waiter is not None:
+            waiter.rtt = received_at - waiter.sent_at
+            waiter.event.set()
+
+    def _tcp_ping(self, address, family, timeout):
+        started_at = time.monotonic()
+        try:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect((address, CONF.openstack.vm_ping_tcp_port))
+        except ConnectionRefusedError:
+            # the host is up, but nothing listens on the port
+            pass
+        except OSError:
+            return None
+        return time.monotonic() - started_at
+
+
+def ssh_banner_received(address, port=22, timeout=1.0):
+    """Check that an SSH server greets on the port without authenticating.
+
+    :param address: IPv4 or IPv6 address of the host
+    :param port: TCP port of the SSH server
+    :param timeout: Time to wait for the connection and the banner
+    :returns: True if the server sent SSH protocol identification
+    """
+    try:
+        with socket.create_connection((address, port), timeout) as sock:
+            return sock.recv(_BUFFER_SIZE).startswith(b"SSH-")
+    except OSError as e:
+        LOG.debug("SSH server %s:%s is still unavailable: %r"
+                  % (address, port, e))
+        return False
+
+
+_prober = None
+_prober_lock = threading.Lock()
+
+
+def get_prober():
+    """Return the prober shared by all threads of the current process."""
+    global _prober
+    with _prober_lock:
+        # the receiver thread doesn't survive fork of runner processes
+        if _prober is None or _prober.pid != os.getpid():
+            _prober = Prober()
+        return _prober
@@ -15,18 +15,20 @@
 
 import io
 import os.path
-import subprocess
-import sys
+import time
 
 import netaddr
 
+from rally import exceptions
 from rally.common import cfg
 from rally.common import logging
+from rally.common import utils as rutils
 from rally.task import atomic
-from rally.task import utils
 from rally.utils import sshutils
 
+from rally_openstack.common import polling
 from rally_openstack.task.scenarios.nova import utils as nova_utils
+from rally_openstack.task.scenarios.vm import prober
 
 
 LOG = logging.getLogger(__name__)
@@ -35,6 +37,17 @@ LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
 
+def _close_ssh_connections(pool, server_ip=None):
+    """Close SSH connections of the pool to the server or to all servers."""
+    for key in list(pool):
+        if server_ip is None or key[0] == server_ip:
+            try:
+                pool.pop(key).close()
+            except AttributeError:
+                # the connection was never established
+                pass
+
+
 class Host:
 
     ICMP_UP_STATUS = "ICMP UP"
@@ -45,6 +58,7 @@ class Host:
     def __init__(self, ip):
         self.ip = netaddr.IPAddress(ip)
         self.status = self.ICMP_DOWN_STATUS
+        self.rtt = None
 
     @property
     def id(self):
@@ -53,19 +67,11 @@ class Host:
     @classmethod
     def update_status(cls, server):
         """Check ip address is pingable and update status."""
-        ping = "ping" if server.ip.version == 4 else "ping6"
-        if sys.platform.startswith("linux"):
-            cmd = [ping, "-c1", "-w1", server.ip.format()]
-        else:
-            cmd = [ping, "-c1", server.ip.format()]
-
-        proc = subprocess.Popen(cmd,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE)
-        proc.wait()
+        server.rtt = prober.get_prober().ping(server.ip)
         LOG.debug("Host %s is ICMP %s"
-                  % (server.ip.format(), proc.returncode and "down" or "up"))
-        if proc.returncode == 0:
+                  % (server.ip.format(),
+                     "down" if server.rtt is None else "up"))
+        if server.rtt is not None:
             server.status = cls.ICMP_UP_STATUS
         else:
             server.status = cls.ICMP_DOWN_STATUS
@@ -91,6 +97,12 @@ class VMScenario(nova_utils.NovaScenario):
 
     RESOURCE_NAME_PREFIX = "rally_vm_"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # connections are closed explicitly: by _delete_server_with_fip or
+        # by _close_ssh at the end of the workloads which keep the server
+        self._ssh_pool = {}
+
     @atomic.action_timer("vm.run_command_over_ssh")
     def _run_command_over_ssh(self, ssh, command):
         """Run command inside an instance.
@@ -181,33 +193,76 @@ class VMScenario(nova_utils.NovaScenario):
                 self.neutron.delete_floatingip(fip["id"])
 
     def _delete_server_with_fip(self, server, fip, force_delete=False):
+        self._close_ssh(fip["ip"])
         if fip["is_floating"]:
             self._delete_floating_ip(server, fip)
         return self._delete_server(server, force=force_delete)
 
     @atomic.action_timer("vm.wait_for_ssh")
     def _wait_for_ssh(self, ssh, timeout=120, interval=1):
-        ssh.wait(timeout, interval)
+        # probe the SSH banner first to not retry the whole key exchange and
+        # authentication while sshd is not started yet
+        start_time = time.monotonic()
+        while not prober.ssh_banner_received(ssh.host, ssh.port,
+                                             timeout=max(interval, 1)):
+            if time.monotonic() > start_time + timeout:
+                raise exceptions.SSHTimeout(
+                    "Timeout waiting for '%s'" % ssh.host)
+            rutils.interruptable_sleep(interval)
+        ssh.wait(max(start_time + timeout - time.monotonic(), 0), interval)
+
+    def _get_ssh(self, server_ip, port, username, password, pkey=None,
+                 timeout=120, interval=1):
+        """Get SSH connection to the server reused within the iteration.
+
+        All commands executed with the same (ip, port, username) run in
+        separate channels of one SSH transport.
+
+        :returns: a ready sshutils.SSH instance
+        """
+        key = (server_ip, port, username)
+        if key not in self._ssh_pool:
+            ssh = sshutils.SSH(username, server_ip, port=port,
+                               pkey=pkey, password=password)
+            try:
+                self._wait_for_ssh(ssh, timeout, interval)
+            except Exception:
+                _close_ssh_connections({key: ssh})
+                raise
+            self._ssh_pool[key] = ssh
+        return self._ssh_pool[key]
+
+    def _close_ssh(self, server_ip=None):
+        """Close pooled SSH connections to the server or to all servers."""
+        _close_ssh_connections(self._ssh_pool, server_ip)
 
     @atomic.action_timer("vm.wait_for_ping")
     def _wait_for_ping(self, server_ip):
         server = Host(server_ip)
-        utils.wait_for_status(
+        polling.wait_for_status(
             server,
             ready_statuses=[Host.ICMP_UP_STATUS],
             update_resource=Host.update_status,
             timeout=CONF.openstack.vm_ping_timeout,
             check_interval=CONF.openstack.vm_ping_poll_interval
         )
+        if server.rtt is not None:
+            self.add_output(additive={
+                "title": "VM ping round-trip time",
+                "description": "Round-trip time of the first successful "
+                               "check of the VM reachability",
+                "chart_plugin": "StatsTable",
+                "data": [["round-trip time, ms", server.rtt * 1000]]})
 
     def _run_command(self, server_ip, port, username, password, command,
                      pkey=None, timeout=120, interval=1):
         """Run command via SSH on server.
 
-        Create SSH connection for server, wait for server to become available
-        (there is a delay between server being set to ACTIVE and sshd being
-        available). Then call run_command_over_ssh to actually execute the
-        command.
+        Get SSH connection for server, waiting for server to become
+        available on first use (there is a delay between server being set to
+        ACTIVE and sshd being available). Then call run_command_over_ssh to
+        actually execute the command. The connection is kept open for the
+        next commands until the server is deleted.
 
         :param server_ip: server ip address
         :param port: ssh port for SSH connection
@@ -223,13 +278,11 @@ class VMScenario(nova_utils.NovaScenario):
         :returns: tuple (exit_status, stdout, stderr)
         """
         pkey = pkey if pkey else self.context["user"]["keypair"]["private"]
-        ssh = sshutils.SSH(username, server_ip, port=port,
-                           pkey=pkey, password=password)
+        ssh = self._get_ssh(server_ip, port, username, password, pkey=pkey,
+                            timeout=timeout, interval=interval)
         try:
-            self._wait_for_ssh(ssh, timeout, interval)
             return self._run_command_over_ssh(ssh, command)
-        finally:
-            try:
-                ssh.close()
-            except AttributeError:
-                pass
+        except exceptions.SSHError:
+            # the transport may be broken, do not reuse it
+            self._close_ssh(server_ip)
+            raise
@@ -26,9 +26,9 @@ from rally.plugins.common import validators
 from rally.task import atomic
 from rally.task import types
 from rally.task import utils as rally_utils
-from rally.utils import sshutils
 
 from rally_openstack.common import consts
+from rally_openstack.common import polling
 from rally_openstack.common.services.heat import main as heat
 from rally_openstack.task import scenario
 from rally_openstack.task.scenarios.cinder import utils as cinder_utils
@@ -339,19 +339,22 @@ class RuncommandHeat(vm_utils.VMScenario):
             if output["output_key"] == "gate_node":
                 ip = output["output_value"]
                 break
-        ssh = sshutils.SSH(workload["username"], ip, pkey=keypair["private"])
-        ssh.wait()
         script = workload.get("resource")
         if script:
             script = pkgutil.get_data(*script)
         else:
             script = open(workload["file"]).read()
-        ssh.execute("cat > /tmp/.rally-workload", stdin=script)
-        ssh.execute("chmod +x /tmp/.rally-workload")
-        with atomic.ActionTimer(self, "runcommand_heat.workload"):
-            status, out, err = ssh.execute(
-                "/tmp/.rally-workload",
-                stdin=json.dumps(self.stack.stack.outputs))
+        ssh = self._get_ssh(ip, 22, workload["username"], None,
+                            pkey=keypair["private"])
+        try:
+            ssh.execute("cat > /tmp/.rally-workload", stdin=script)
+            ssh.execute("chmod +x /tmp/.rally-workload")
+            with atomic.ActionTimer(self, "runcommand_heat.workload"):
+                status, out, err = ssh.execute(
+                    "/tmp/.rally-workload",
+                    stdin=json.dumps(self.stack.stack.outputs))
+        finally:
+            self._close_ssh(ip)
         rows = []
         for line in out.splitlines():
             row = line.split(":")
@@ -634,7 +637,7 @@ class CheckDesignateDNSResolving(vm_utils.VMScenario):
             "interpreter": "/bin/bash"
         }
         try:
-            rally_utils.wait_for_status(
+            polling.wait_for_status(
                 server,
                 ready_statuses=["ACTIVE"],
                 update_resource=rally_utils.get_from_manager(),
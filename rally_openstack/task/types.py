@@ -14,12 +14,17 @@
 
 from __future__ import annotations
 
+import collections
 import copy
+import functools
 import operator
 import re
+import threading
+import time
 import typing as t
 
 from rally import exceptions
+from rally.common import cfg
 from rally.common import logging
 from rally.common.plugin import plugin
 from rally.task import scenario
@@ -32,11 +37,46 @@ from rally_openstack.common.services.storage import block
 
 
 LOG = logging.getLogger(__name__)
+CONF = cfg.CONF
 
 
 configure = plugin.configure
 
 
+_compile = functools.lru_cache(maxsize=256)(re.compile)
+
+
+class _ResourceList(list):
+    """Listed resources with lazily built lookups by name and regex."""
+
+    def __init__(self, resources: t.Iterable[t.Any]) -> None:
+        super().__init__(resources)
+        self.listed_at = time.monotonic()
+        self._by_name: dict[str, list[t.Any]] | None = None
+        self._by_pattern: dict[str, list[t.Any]] = {}
+
+    def with_name(self, name: str) -> list[t.Any]:
+        if self._by_name is None:
+            by_name = collections.defaultdict(list)
+            for resource in self:
+                by_name[resource.name].append(resource)
+            self._by_name = dict(by_name)
+        return self._by_name.get(name, [])
+
+    def matching(self, pattern: str) -> list[t.Any]:
+        if pattern not in self._by_pattern:
+            regex = _compile(pattern)
+            self._by_pattern[pattern] = [
+                resource for resource in self
+                if regex.search(resource.name or "")]
+        return self._by_pattern[pattern]
+
+
+# resources listed by resource types, shared by all workloads of a task
+_listings: dict[tuple[t.Any, ...], _ResourceList] = {}
+_listings_lock = threading.Lock()
+
+
 class IdOrNameSpec(t.TypedDict, total=False):
     """Specification of a resource to search by its id or exact name."""
 
@@ -134,6 +174,78 @@ class OpenStackResourceType(types.ResourceType):
                 f"credentials to discover resources.")
         return self._clients
 
+    def _list_resources(
+        self,
+        list_resources: t.Callable[[], t.Iterable[t.Any]],
+        key: tuple[t.Any, ...],
+        refresh: bool = False,
+    ) -> tuple[_ResourceList, bool]:
+        """Return resources listed by the callable, reusing earlier listings.
+
+        A listing is reused within the workload. It is also reused by other
+        workloads and contexts of the same task until
+        ``[openstack] resource_types_cache_ttl`` expires.
+
+        :param list_resources: callable listing the resources
+        :param key: hashable arguments of the listing call
+        :param refresh: ignore the cached listings
+        :returns: the resources and whether they come from a cache
+        """
+        workload_key = ("listing",) + key
+        if not refresh and workload_key in self._cache:
+            return self._cache[workload_key], True
+
+        # NOTE: a task of a running workload is a Task object, get() method
+        #   of which looks up tasks in the database
+        task = self._context.get("task")
+        task_id = task["uuid"] if task else None
+        ttl = CONF.openstack.resource_types_cache_ttl
+        task_key = None
+        if task_id and ttl:
+            task_key = (task_id, self.get_name(),
+                        self._get_clients().credential.auth_key()) + key
+            with _listings_lock:
+                resources = _listings.get(task_key)
+            if (not refresh and resources is not None
+                    and time.monotonic() - resources.listed_at < ttl):
+                self._cache[workload_key] = resources
+                return resources, True
+
+        resources = _ResourceList(list_resources())
+        self._cache[workload_key] = resources
+        if task_key is not None:
+            with _listings_lock:
+                now = time.monotonic()
+                for k in [k for k, v in _listings.items()
+                          if now - v.listed_at >= ttl]:
+                    del _listings[k]
+                _listings[task_key] = resources
+        return resources, False
+
+    def _lookup(
+        self,
+        list_resources: t.Callable[[], t.Iterable[t.Any]],
+        find: t.Callable[[_ResourceList], t.Any],
+        *key: t.Any,
+    ) -> t.Any:
+        """Find a resource in the cached listing, listing again on a miss.
+
+        :param list_resources: callable listing the resources
+        :param find: callable returning the resource found in the listing
+            or raising InvalidScenarioArgument
+        :param key: hashable arguments of the listing call
+        """
+        resources, cached = self._list_resources(list_resources, key)
+        try:
+            return find(resources)
+        except exceptions.InvalidScenarioArgument:
+            if not cached:
+                raise
+        # the resource might have been created after the cached listing
+        resources, _cached = self._list_resources(
+            list_resources, key, refresh=True)
+        return find(resources)
+
     def _find_resource(
         self, resource_spec: InexactResourceSpec, resources: t.Sequence[t.Any]
     ) -> t.Any:
@@ -159,10 +271,12 @@ class OpenStackResourceType(types.ResourceType):
 
         :returns: resource object mapped to `name` or `regex`
         """
+        if not isinstance(resources, _ResourceList):
+            resources = _ResourceList(resources)
+
         if "name" in resource_spec:
             # In a case of pattern string exactly matches resource name
-            matching_exact = [resource for resource in resources
-                              if resource.name == resource_spec["name"]]
+            matching_exact = resources.with_name(resource_spec["name"])
             if len(matching_exact) == 1:
                 return matching_exact[0]
             elif len(matching_exact) > 1:
@@ -190,14 +304,12 @@ class OpenStackResourceType(types.ResourceType):
                     "typename": self.get_name().title(),
                     "resource_spec": resource_spec})
 
-        pattern = re.compile(patternstr)
-        matching = [resource for resource in resources
-                    if re.search(pattern, resource.name or "")]
+        matching = resources.matching(patternstr)
         if not matching:
             raise exceptions.InvalidScenarioArgument(
                 "%(typename)s with pattern '%(pattern)s' not found" % {
                     "typename": self.get_name().title(),
-                    "pattern": pattern.pattern})
+                    "pattern": patternstr})
         elif len(matching) > 1:
             if not resource_spec.get("accurate", False):
                 return sorted(matching, key=lambda o: o.name or "")[-1]
@@ -206,7 +318,7 @@ class OpenStackResourceType(types.ResourceType):
                 "%(typename)s with name '%(pattern)s' is ambiguous, possible "
                 "matches by id: %(ids)s" % {
                     "typename": self.get_name().title(),
-                    "pattern": pattern.pattern,
+                    "pattern": patternstr,
                     "ids": ", ".join(map(operator.attrgetter("id"),
                                          matching))})
         return matching[0]
@@ -227,10 +339,12 @@ class Flavor(OpenStackResourceType):
         resource_id = resource_spec.get("id")
         if not resource_id:
             novaclient = self._get_clients().nova()
-            resource_id = types._id_from_name(
-                resource_config=dict(resource_spec),
-                resources=novaclient.flavors.list(),
-                typename="flavor")
+            resource_id = self._lookup(
+                novaclient.flavors.list,
+                lambda flavors: types._id_from_name(
+                    resource_config=dict(resource_spec),
+                    resources=flavors,
+                    typename="flavor"))
         return resource_id
 
 
@@ -250,12 +364,11 @@ class GlanceImage(OpenStackResourceType):
         list_kwargs = resource_spec.get("list_kwargs", {})
 
         if not resource_id:
-            cache_id = hash(frozenset(list_kwargs.items()))
-            if cache_id not in self._cache:
-                glance = image.Image(self._get_clients())
-                self._cache[cache_id] = glance.list_images(**list_kwargs)
-            images = self._cache[cache_id]
-            resource = self._find_resource(resource_spec, images)
+            glance = image.Image(self._get_clients())
+            resource = self._lookup(
+                functools.partial(glance.list_images, **list_kwargs),
+                functools.partial(self._find_resource, resource_spec),
+                frozenset(list_kwargs.items()))
             return resource.id
         return resource_id
 
@@ -328,10 +441,12 @@ class VolumeType(OpenStackResourceType):
         resource_id = resource_spec.get("id")
         if not resource_id:
             cinder = block.BlockStorage(self._get_clients())
-            resource_id = types._id_from_name(
-                resource_config=dict(resource_spec),
-                resources=cinder.list_types(),
-                typename="volume_type")
+            resource_id = self._lookup(
+                cinder.list_types,
+                lambda volume_types: types._id_from_name(
+                    resource_config=dict(resource_spec),
+                    resources=volume_types,
+                    typename="volume_type"))
         return resource_id
 
 
@@ -350,15 +465,18 @@ class NeutronNetwork(OpenStackResourceType):
         resource_id = resource_spec.get("id")
         if resource_id:
             return resource_id
-        else:
-            neutronclient = self._get_clients().neutron()
-            for net in neutronclient.list_networks()["networks"]:
+
+        def find(networks):
+            for net in networks:
                 if net["name"] == resource_spec.get("name"):
                     return net["id"]
+            raise exceptions.InvalidScenarioArgument(
+                f"Neutron network with name '{resource_spec.get('name')}' "
+                f"not found")
 
-        raise exceptions.InvalidScenarioArgument(
-            f"Neutron network with name '{resource_spec.get('name')}' "
-            f"not found")
+        neutronclient = self._get_clients().neutron()
+        return self._lookup(
+            lambda: neutronclient.list_networks()["networks"], find)
 
 
 @plugin.configure(name="watcher_strategy")
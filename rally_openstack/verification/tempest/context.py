@@ -14,6 +14,7 @@
 #    under the License.
 
 import configparser
+import hashlib
 import os
 import re
 
@@ -21,12 +22,12 @@ import requests
 
 from rally import exceptions
 from rally.common import logging
-from rally.task import utils as task_utils
 from rally.verification import context
 from rally.verification import utils
 
 from rally_openstack.common import consts
 from rally_openstack.common import credential
+from rally_openstack.common import polling
 from rally_openstack.common.services.image import image
 from rally_openstack.common.services.network import neutron
 from rally_openstack.verification.tempest import config as conf
@@ -34,6 +35,45 @@ from rally_openstack.verification.tempest import config as conf
 
 LOG = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 1024 * 1024
+# attempts to resume an interrupted download of the image
+_DOWNLOAD_ATTEMPTS = 3
+# seconds to wait for a connection or the next piece of the image
+_DOWNLOAD_TIMEOUT = 60
+# a name without special characters of regexes (dots and dashes may be
+#   escaped) and characters which Glance does not allow in 'in:' filter
+_LITERAL_NAME = re.compile(r"(?:[^.^$*+?{}\[\]\\|(),\"]|\\[.-])+")
+
+
+def _literal_names(regex):
+    """Return names matched by the regex if it matches only exact names.
+
+    '^name$' and '^(name1|name2)$' are such regexes, for others None is
+    returned.
+    """
+    if not (regex.startswith("^") and regex.endswith("$")):
+        return None
+    body = regex[1:-1]
+    for prefix in ("(?:", "("):
+        if body.startswith(prefix) and body.endswith(")"):
+            body = body[len(prefix):-1]
+            break
+    else:
+        if "|" in body:
+            return None
+    names = body.split("|")
+    if not all(_LITERAL_NAME.fullmatch(name) for name in names):
+        return None
+    return [re.sub(r"\\(.)", r"\1", name) for name in names]
+
+
+def _file_checksum(path, algorithm):
+    digest = hashlib.new(algorithm, usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 @context.configure("tempest", order=900)
 class TempestContext(context.VerifierContext):
@@ -59,6 +99,7 @@ class TempestContext(context.VerifierContext):
         self.data_dir = self.verifier.manager.home_dir
         self.image_name = "tempest-image"
 
+        self._discovered_images = {}
         self._created_roles = []
         self._created_images = []
         self._created_flavors = []
@@ -183,70 +224,163 @@ class TempestContext(context.VerifierContext):
                       f"in Tempest config file. {option} = {option_value}")
 
     def _discover_image(self):
+        regex = conf.CONF.openstack.img_name_regex
+        # the image is discovered for several options, list images once
+        if regex in self._discovered_images:
+            return self._discovered_images[regex]
+
         LOG.debug("Trying to discover a public image with name matching "
                   "regular expression '%s'. Note that case insensitive "
-                  "matching is performed."
-                  % conf.CONF.openstack.img_name_regex)
-        image_service = image.Image(self.clients)
-        images = image_service.list_images(status="active",
-                                           visibility="public")
+                  "matching is performed." % regex)
+        pattern = re.compile(regex, re.IGNORECASE)
+        filters = {"status": "active", "visibility": "public"}
+        glance = self.clients.glance("2")
+        images = []
+        names = _literal_names(regex)
+        if names:
+            # NOTE: Glance can't filter images by a regex of the name, but
+            #   exact names are filtered by the server
+            name_filter = (names[0] if len(names) == 1
+                           else "in:%s" % ",".join(names))
+            images = list(glance.images.list(
+                filters=dict(filters, name=name_filter)))
+        if not images:
+            # names are matched case insensitively, unlike by Glance
+            images = list(glance.images.list(filters=filters))
         for image_obj in images:
-            if image_obj.name and re.match(conf.CONF.openstack.img_name_regex,
-                                           image_obj.name, re.IGNORECASE):
+            if image_obj.name and pattern.match(image_obj.name):
                 LOG.debug("The following public image discovered: '%s'."
                           % image_obj.name)
-                return image_obj
+                break
+        else:
+            image_obj = None
+            LOG.debug("There is no public image with name matching regular "
+                      "expression '%s'." % regex)
+        self._discovered_images[regex] = image_obj
+        return image_obj
 
-        LOG.debug("There is no public image with name matching regular "
-                  "expression '%s'." % conf.CONF.openstack.img_name_regex)
+    def _get_image_checksum(self, image=None):
+        """Return the checksum the image file is expected to have.
+
+        :param image: Glance image the file is downloaded from. If it is
+            omitted, the checksum of the image at `img_url` is returned.
+        :returns: tuple of a hash algorithm and a hex digest or None if the
+            checksum is not known
+        """
+        if image is None:
+            checksum = conf.CONF.openstack.img_checksum
+            if not checksum:
+                return None
+            algorithm, _sep, digest = checksum.partition(":")
+            return algorithm.lower(), digest.lower()
+
+        if getattr(image, "os_hash_value", None):
+            return image.os_hash_algo, image.os_hash_value
+        if getattr(image, "checksum", None):
+            return "md5", image.checksum
+        return None
+
+    def _download_image_from_url(self, target_path):
+        url = conf.CONF.openstack.img_url
+        LOG.debug("Downloading image from %s to %s." % (url, target_path))
+        for _attempt in range(_DOWNLOAD_ATTEMPTS):
+            try:
+                offset = os.path.getsize(target_path)
+            except OSError:
+                offset = 0
+            # resume the download of an earlier attempt or run
+            headers = {"Range": "bytes=%d-" % offset} if offset else {}
+            try:
+                response = requests.get(url, stream=True, headers=headers,
+                                        timeout=_DOWNLOAD_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                msg = ("Failed to download image. Possibly there is no "
+                       "connection to Internet. Error: %s."
+                       % (str(err) or "unknown"))
+                raise exceptions.RallyException(msg)
+
+            with response:
+                if response.status_code == 416 and offset:
+                    # the partial file is not a part of the image anymore
+                    os.remove(target_path)
+                    continue
+                if response.status_code == 206:
+                    mode = "ab"
+                elif response.status_code == 200:
+                    mode, offset = "wb", 0
+                elif response.status_code == 404:
+                    raise exceptions.RallyException(
+                        "Failed to download image. Image was not found.")
+                else:
+                    raise exceptions.RallyException(
+                        "Failed to download image. HTTP error code %d."
+                        % response.status_code)
+
+                size = response.headers.get("Content-Length")
+                try:
+                    with open(target_path, mode) as image_file:
+                        for chunk in response.iter_content(
+                                chunk_size=_CHUNK_SIZE):
+                            image_file.write(chunk)
+                except (requests.ConnectionError,
+                        requests.exceptions.ChunkedEncodingError) as err:
+                    LOG.warning("Download of the image is interrupted: %s"
+                                % err)
+                    continue
+            if size is None or os.path.getsize(target_path) == (
+                    offset + int(size)):
+                break
+            LOG.warning("Download of the image is interrupted: %d of %d "
+                        "bytes are received."
+                        % (os.path.getsize(target_path), offset + int(size)))
+        else:
+            raise exceptions.RallyException(
+                "Failed to download image in %d attempts. The downloaded "
+                "part is kept in %s to resume the download later."
+                % (_DOWNLOAD_ATTEMPTS, target_path))
+
+        checksum = self._get_image_checksum()
+        if checksum and _file_checksum(target_path,
+                                       checksum[0]) != checksum[1]:
+            os.remove(target_path)
+            raise exceptions.RallyException(
+                "Failed to download image. The %s checksum of the image "
+                "doesn't match '%s'." % checksum)
 
     def _download_image_from_source(self, target_path, image=None):
+        # the image appears at the target path only once it is complete
+        part_path = target_path + ".part"
         if image:
             LOG.debug("Downloading image '%s' from Glance to %s."
                       % (image.name, target_path))
-            with open(target_path, "wb") as image_file:
+            # NOTE: glanceclient verifies the checksum of the image data
+            #   once all of it is read
+            with open(part_path, "wb") as image_file:
                 for chunk in self.clients.glance().images.data(image.id):
                     image_file.write(chunk)
         else:
-            LOG.debug("Downloading image from %s to %s."
-                      % (conf.CONF.openstack.img_url, target_path))
-            try:
-                response = requests.get(conf.CONF.openstack.img_url,
-                                        stream=True)
-            except requests.ConnectionError as err:
-                msg = ("Failed to download image. Possibly there is no "
-                       "connection to Internet. Error: %s."
-                       % (str(err) or "unknown"))
-                raise exceptions.RallyException(msg)
-
-            if response.status_code == 200:
-                with open(target_path, "wb") as image_file:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:   # filter out keep-alive new chunks
-                            image_file.write(chunk)
-                            image_file.flush()
-            else:
-                if response.status_code == 404:
-                    msg = "Failed to download image. Image was not found."
-                else:
-                    msg = ("Failed to download image. HTTP error code %d."
-                           % response.status_code)
-                raise exceptions.RallyException(msg)
+            self._download_image_from_url(part_path)
+        os.replace(part_path, target_path)
 
         LOG.debug("The image has been successfully downloaded!")
 
     def _download_image(self):
         image_path = os.path.join(self.data_dir, self.image_name)
-        if os.path.isfile(image_path):
-            LOG.debug("Image is already downloaded to %s." % image_path)
-            return
-
+        image = None
         if conf.CONF.openstack.img_name_regex:
             image = self._discover_image()
-            if image:
-                return self._download_image_from_source(image_path, image)
 
-        self._download_image_from_source(image_path)
+        if os.path.isfile(image_path):
+            checksum = self._get_image_checksum(image)
+            if (checksum is None
+                    or _file_checksum(image_path, checksum[0]) == checksum[1]):
+                LOG.debug("Image is already downloaded to %s." % image_path)
+                return
+            LOG.warning("The %s checksum of the image downloaded to %s "
+                        "doesn't match '%s'. Downloading it again."
+                        % (checksum[0], image_path, checksum[1]))
+
+        self._download_image_from_source(image_path, image)
 
     def _discover_or_create_image(self):
         if conf.CONF.openstack.img_name_regex:
@@ -346,7 +480,7 @@ class TempestContext(context.VerifierContext):
         for image_obj in self._created_images:
             LOG.debug("Deleting image '%s'." % image_obj.name)
             self.clients.glance().images.delete(image_obj.id)
-            task_utils.wait_for_status(
+            polling.wait_for_status(
                 image_obj, ["deleted", "pending_delete"],
                 check_deletion=True,
                 update_resource=image_service.get_image,
@@ -0,0 +1,1441 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Stateful fake OpenStack cloud for benchmarking Rally itself.
+
+It serves the parts of Keystone v3, Nova, Neutron, Glance, Cinder and Swift
+REST APIs which are used by contexts, scenarios and cleanup of Rally on a
+single port, keeping resources in memory. Resources are stored by managers
+of `tests.unit.fakes`, so a workload against the fake cloud measures the
+overhead of Rally (clients, contexts, polling, cleanup) rather than the
+cloud.
+
+Start the cloud from the root of the repository:
+
+    python -m tests.ci.fake_cloud --port 5000 --latency 0.01
+
+and register it as an existing platform:
+
+    {"openstack": {"auth_url": "http://127.0.0.1:5000/v3",
+                   "region_name": "RegionOne",
+                   "admin": {"username": "admin", "password": "admin",
+                             "project_name": "admin",
+                             "user_domain_name": "Default",
+                             "project_domain_name": "Default"}}}
+"""
+
+import argparse
+import collections
+import datetime as dt
+import hashlib
+import http.server
+import json
+import random
+import re
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+
+from tests.unit import fakes
+
+
+REGION = "RegionOne"
+DEFAULT_DOMAIN_ID = "default"
+# statuses which resources have right after creation and the ones they
+# get when --build-time passes
+TRANSIENT_STATUSES = {"BUILD": "ACTIVE", "creating": "available",
+                      "saving": "active", "DOWN": "ACTIVE"}
+# query parameters which are not filters by attributes of resources
+NOT_FILTERS = {"limit", "marker", "sort_key", "sort_dir", "sort", "fields",
+               "all_tenants", "all_projects", "is_public", "detailed",
+               "with_count", "offset", "format", "prefix", "delimiter"}
+
+
+class HTTPError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _now():
+    return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _etag(data):
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+class Collection(fakes.FakeManager):
+    """Resources of one kind of an API.
+
+    :param singular: key of a resource in request and response bodies
+    :param plural: key of a list of resources in response bodies
+    :param scoped: whether resources belong to projects
+    :param shared: callable which tells that a resource of another project
+        is visible to everyone
+    :param defaults: attributes of new resources
+    """
+
+    def __init__(self, singular, plural, scoped=True, shared=None,
+                 defaults=None):
+        super().__init__()
+        self.singular = singular
+        self.plural = plural
+        self.scoped = scoped
+        self.shared = shared
+        self.defaults = defaults or {}
+        self._projects = collections.defaultdict(dict)
+
+    def _cache(self, resource):
+        self._projects[resource.items.get("project_id")][resource.id] = (
+            resource)
+        return super()._cache(resource)
+
+    def create(self, data, project_id=None, user_id=None):
+        resource = fakes.FakeResource(self, name=data.get("name"),
+                                      id=data.get("id"))
+        resource.uuid = resource.id
+        item = dict(self.defaults)
+        item.update(data)
+        item["id"] = resource.id
+        item.setdefault("name", "")
+        if self.scoped:
+            item.setdefault("project_id", project_id)
+            item.setdefault("tenant_id", item["project_id"])
+            if user_id:
+                item.setdefault("user_id", user_id)
+        item.setdefault("created_at", _now())
+        resource.items = item
+        resource.created = time.monotonic()
+        return self._cache(resource)
+
+    def delete(self, resource_uuid):
+        resource = self.get(resource_uuid)
+        if resource is not None:
+            self._projects[resource.items.get("project_id")].pop(
+                resource.id, None)
+        super().delete(resource_uuid)
+
+    def visible(self, resource, context):
+        return (not self.scoped or context.is_admin
+                or resource.items.get("project_id") == context.project_id
+                or (self.shared is not None
+                    and self.shared(resource.items)))
+
+    def list(self, context=None, filters=None):
+        if context is None or not self.scoped or context.is_admin:
+            resources = super().list()
+        else:
+            resources = list(self._projects[context.project_id].values())
+            if self.shared is not None:
+                resources.extend(
+                    r for r in super().list()
+                    if r.items.get("project_id") != context.project_id
+                    and self.shared(r.items))
+        filters = {k: v for k, v in (filters or {}).items()
+                   if k not in NOT_FILTERS}
+        return [r for r in resources
+                if all(k not in r.items or str(r.items[k]) == v
+                       or (isinstance(r.items[k], bool)
+                           and str(r.items[k]).lower() == v.lower())
+                       for k, v in filters.items())]
+
+
+class Context:
+    def __init__(self, token, user, project, roles):
+        self.token = token
+        self.user = user
+        self.project = project
+        self.roles = roles
+        self.user_id = user["id"]
+        self.project_id = project["id"] if project else None
+        self.is_admin = any(r["name"] == "admin" for r in roles)
+
+
+class Route:
+    def __init__(self, method, pattern, handler, auth=True):
+        self.method = method
+        self.regex = re.compile(pattern + "$")
+        self.handler = handler
+        self.auth = auth
+
+
+class Cloud:
+    """State and request handlers of the fake cloud.
+
+    :param base_url: URL which the cloud is reachable by
+    :param admin_password: password of "admin" user
+    :param latency: seconds each request takes at least
+    :param error_rate: probability of "503 Service Unavailable" response to
+        a request which is not a token request
+    :param build_time: seconds after which servers, volumes, etc. leave
+        transient statuses (e.g. BUILD, creating)
+    """
+
+    def __init__(self, base_url, admin_password="admin", latency=0,
+                 error_rate=0, build_time=0, seed=None):
+        self.base_url = base_url.rstrip("/")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.build_time = build_time
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self.tokens = {}
+
+        self.domains = Collection("domain", "domains", scoped=False)
+        self.projects = Collection("project", "projects", scoped=False,
+                                   defaults={"enabled": True,
+                                             "description": "",
+                                             "is_domain": False,
+                                             "parent_id": DEFAULT_DOMAIN_ID,
+                                             "domain_id": DEFAULT_DOMAIN_ID})
+        self.users = Collection("user", "users", scoped=False,
+                                defaults={"enabled": True,
+                                          "domain_id": DEFAULT_DOMAIN_ID})
+        self.roles = Collection("role", "roles", scoped=False)
+        self.services = Collection("service", "services", scoped=False)
+        self.assignments = set()
+
+        self.servers = Collection(
+            "server", "servers",
+            defaults={"status": "BUILD", "addresses": {}, "metadata": {},
+                      "OS-EXT-STS:task_state": None,
+                      "OS-EXT-STS:vm_state": "active",
+                      "OS-EXT-STS:locked": False,
+                      "security_groups": [{"name": "default"}]})
+        self.flavors = Collection("flavor", "flavors", scoped=False,
+                                  defaults={"disk": 1, "ram": 64, "vcpus": 1,
+                                            "swap": "", "rxtx_factor": 1.0,
+                                            "OS-FLV-EXT-DATA:ephemeral": 0,
+                                            "os-flavor-access:is_public": True,
+                                            "extra_specs": {}})
+        self.server_groups = Collection("server_group", "server_groups",
+                                        defaults={"policies": [],
+                                                  "members": [],
+                                                  "metadata": {}})
+        self.aggregates = Collection("aggregate", "aggregates", scoped=False,
+                                     defaults={"hosts": [], "metadata": {},
+                                               "availability_zone": None})
+        self.keypairs = Collection("keypair", "keypairs",
+                                   defaults={"type": "ssh",
+                                             "fingerprint": "fake",
+                                             "public_key": "ssh-rsa fake"})
+
+        def shared_net(item):
+            return item.get("shared") or item.get("router:external")
+
+        net_defaults = {"admin_state_up": True, "status": "ACTIVE",
+                        "description": "", "tags": []}
+        self.networks = Collection(
+            "network", "networks", shared=shared_net,
+            defaults=dict(net_defaults, shared=False, subnets=[],
+                          mtu=1450, **{"router:external": False}))
+        self.subnets = Collection(
+            "subnet", "subnets", shared=shared_net,
+            defaults=dict(net_defaults, ip_version=4, enable_dhcp=True,
+                          dns_nameservers=[], host_routes=[],
+                          allocation_pools=[], gateway_ip=None))
+        self.routers = Collection(
+            "router", "routers",
+            defaults=dict(net_defaults, external_gateway_info=None,
+                          routes=[]))
+        self.ports = Collection(
+            "port", "ports",
+            defaults=dict(net_defaults, status="DOWN", device_id="",
+                          device_owner="", fixed_ips=[],
+                          security_groups=[]))
+        self.security_groups = Collection(
+            "security_group", "security_groups",
+            defaults={"description": "", "security_group_rules": [],
+                      "tags": []})
+        self.security_group_rules = Collection(
+            "security_group_rule", "security_group_rules",
+            defaults={"direction": "ingress", "ethertype": "IPv4",
+                      "protocol": None, "port_range_min": None,
+                      "port_range_max": None, "remote_ip_prefix": None,
+                      "remote_group_id": None, "description": ""})
+        self.floatingips = Collection(
+            "floatingip", "floatingips",
+            defaults={"status": "DOWN", "fixed_ip_address": None,
+                      "port_id": None, "router_id": None,
+                      "description": "", "tags": []})
+        self.trunks = Collection(
+            "trunk", "trunks",
+            defaults={"status": "ACTIVE", "sub_ports": [],
+                      "admin_state_up": True, "description": ""})
+
+        self.images = Collection(
+            "image", "images",
+            shared=lambda item: item.get("visibility") == "public",
+            defaults={"status": "queued", "visibility": "shared",
+                      "protected": False, "tags": [], "min_disk": 0,
+                      "min_ram": 0, "size": None, "checksum": None,
+                      "container_format": "bare", "disk_format": "raw",
+                      "os_hidden": False})
+        self.image_data = {}
+
+        self.volumes = Collection(
+            "volume", "volumes",
+            defaults={"status": "creating", "attachments": [],
+                      "bootable": "false", "encrypted": False,
+                      "multiattach": False, "metadata": {},
+                      "availability_zone": "nova", "volume_type": None,
+                      "snapshot_id": None, "source_volid": None,
+                      "description": None})
+        self.snapshots = Collection(
+            "snapshot", "snapshots",
+            defaults={"status": "creating", "metadata": {},
+                      "description": None})
+        self.backups = Collection(
+            "backup", "backups",
+            defaults={"status": "creating", "description": None,
+                      "container": None, "object_count": 0})
+        self.transfers = Collection("transfer", "transfers")
+        self.qos_specs = Collection("qos_specs", "qos_specs", scoped=False,
+                                    defaults={"specs": {},
+                                              "consumer": "back-end"})
+        self.volume_types = Collection(
+            "volume_type", "volume_types", scoped=False,
+            defaults={"is_public": True, "extra_specs": {},
+                      "description": None})
+
+        # account -> container -> object -> (bytes, last modified)
+        self.accounts = collections.defaultdict(dict)
+
+        self.routes = []
+        self._add_identity_routes()
+        self._add_compute_routes()
+        self._add_network_routes()
+        self._add_image_routes()
+        self._add_volume_routes()
+        self._add_object_store_routes()
+        self._bootstrap(admin_password)
+
+    def _bootstrap(self, admin_password):
+        self.domains.create({"id": DEFAULT_DOMAIN_ID, "name": "Default",
+                             "enabled": True, "description": ""})
+
+        admin_role = self.roles.create({"name": "admin"})
+        self.roles.create({"name": "member"})
+        self.roles.create({"name": "reader"})
+        project = self.projects.create({"name": "admin"})
+        user = self.users.create({"name": "admin",
+                                  "password": admin_password,
+                                  "default_project_id": project.id})
+        self.assignments.add((project.id, user.id, admin_role.id))
+
+        for name, ram, vcpus, disk in (("m1.tiny", 512, 1, 1),
+                                       ("m1.small", 2048, 1, 20),
+                                       ("m1.medium", 4096, 2, 40)):
+            self.flavors.create({"name": name, "ram": ram, "vcpus": vcpus,
+                                 "disk": disk})
+        self.images.create({"name": "cirros-0.6.2-x86_64-disk",
+                            "status": "active",
+                            "visibility": "public", "size": 0,
+                            "disk_format": "qcow2"}, project_id=project.id)
+        self.networks.create({"name": "public", "router:external": True},
+                             project_id=project.id)
+        self.volume_types.create({"name": "lvmdriver-1"})
+
+    # common helpers
+
+    def url(self, *parts):
+        return "/".join((self.base_url,) + parts)
+
+    def _get(self, collection, resource_id, context=None):
+        resource = collection.get(resource_id)
+        if resource is None or (context is not None
+                                and not collection.visible(resource,
+                                                           context)):
+            raise HTTPError(404, "%s %s could not be found."
+                            % (collection.singular, resource_id))
+        self._update_status(resource)
+        return resource
+
+    def _update_status(self, resource):
+        status = resource.items.get("status")
+        if (status in TRANSIENT_STATUSES
+                and time.monotonic() - resource.created >= self.build_time):
+            resource.items["status"] = TRANSIENT_STATUSES[status]
+
+    def _list(self, collection, context, query):
+        resources = collection.list(context, query)
+        if "marker" in query:
+            ids = [r.id for r in resources]
+            if query["marker"] in ids:
+                resources = resources[ids.index(query["marker"]) + 1:]
+        if "limit" in query and int(query["limit"]) >= 0:
+            resources = resources[:int(query["limit"])]
+        for resource in resources:
+            self._update_status(resource)
+        return [r.items for r in resources]
+
+    def _create(self, collection, body, create):
+        """Create one resource or a bulk of resources.
+
+        :param collection: Collection instance
+        :param body: request body
+        :param create: callable creating a resource from its attributes
+        """
+        if isinstance(body.get(collection.plural), list):
+            return 201, {collection.plural: [
+                create(data).items for data in body[collection.plural]]}
+        data = body.get(collection.singular)
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Invalid body of %s." % collection.singular)
+        return 201, {collection.singular: create(data).items}
+
+    def _crud(self, prefix, collection):
+        """Register list, create, show, update and delete of a collection.
+
+        :param prefix: path of the collection
+        :param collection: Collection instance
+        """
+        item_path = prefix + r"/(?P<resource_id>[^/]+)"
+
+        def list_(context, query, body, **kw):
+            items = self._list(collection, context, query)
+            return 200, {collection.plural: items}
+
+        def create(context, query, body, **kw):
+            return self._create(
+                collection, body,
+                lambda data: collection.create(data, context.project_id,
+                                               context.user_id))
+
+        def show(context, query, body, resource_id, **kw):
+            resource = self._get(collection, resource_id, context)
+            return 200, {collection.singular: resource.items}
+
+        def update(context, query, body, resource_id, **kw):
+            resource = self._get(collection, resource_id, context)
+            resource.items.update(body.get(collection.singular) or {})
+            resource.items["id"] = resource.id
+            return 200, {collection.singular: resource.items}
+
+        def delete(context, query, body, resource_id, **kw):
+            self._get(collection, resource_id, context)
+            collection.delete(resource_id)
+            return 204, None
+
+        self.routes.extend([
+            Route("GET", prefix, list_),
+            Route("POST", prefix, create),
+            Route("GET", item_path, show),
+            Route("PUT", item_path, update),
+            Route("PATCH", item_path, update),
+            Route("DELETE", item_path, delete)])
+
+    def handle(self, method, path, query, body, headers):
+        """Handle a request.
+
+        :returns: tuple of status code, body and headers of the response
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        for route in self.routes:
+            if route.method != method:
+                continue
+            match = route.regex.match(path)
+            if not match:
+                continue
+            if route.auth and self.error_rate:
+                with self._lock:
+                    failed = self._random.random() < self.error_rate
+                if failed:
+                    return 503, {"error": {"code": 503, "message":
+                                           "Injected error."}}, {}
+            with self._lock:
+                try:
+                    context = None
+                    if route.auth:
+                        context = self._authorize(
+                            headers.get("X-Auth-Token"))
+                    result = route.handler(context=context, query=query,
+                                           body=body, headers=headers,
+                                           **match.groupdict())
+                except HTTPError as e:
+                    return e.code, {"error": {"code": e.code,
+                                              "message": e.message}}, {}
+                except (KeyError, TypeError, ValueError) as e:
+                    return 400, {"error": {"code": 400, "message":
+                                           "Malformed request: %r." % e}}, {}
+            code, response = result[:2]
+            return code, response, result[2] if len(result) > 2 else {}
+        return 404, {"error": {"code": 404, "message": "The fake cloud "
+                                                       "doesn't support %s %s"
+                                                       % (method, path)}}, {}
+
+    def serve(self, method, target, headers, data):
+        """Handle a request given as it is sent over HTTP.
+
+        :param target: path of the request with the query string
+        :param data: body of the request in bytes
+        :returns: tuple of status code, body in bytes and headers of the
+            response
+        """
+        url = urllib.parse.urlsplit(target)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        body = data
+        # objects and image data are passed as is
+        if not (url.path.startswith("/object-store/")
+                or url.path.endswith("/file")):
+            body = json.loads(data) if data else {}
+        code, response, headers = self.handle(
+            method, urllib.parse.unquote(url.path), query, body, headers)
+
+        if isinstance(response, bytes):
+            data, content_type = response, "application/octet-stream"
+        elif response is None:
+            data, content_type = b"", "text/plain"
+        else:
+            data = json.dumps(response).encode("utf-8")
+            content_type = "application/json"
+        return code, data, dict(headers, **{
+            "Content-Type": content_type,
+            "Content-Length": str(len(data)),
+            "X-Openstack-Request-Id": "req-%s" % uuid.uuid4()})
+
+    def _authorize(self, token):
+        context = self.tokens.get(token)
+        if context is None:
+            raise HTTPError(401, "The request you have made requires "
+                                 "authentication.")
+        return context
+
+    # Keystone
+
+    def _add_identity_routes(self):
+        def versions(**kw):
+            return 300, {"versions": {"values": [self._identity_version()]}}
+
+        def version(**kw):
+            return 200, {"version": self._identity_version()}
+
+        self.routes.extend([
+            Route("GET", "/?", versions, auth=False),
+            Route("GET", "/v3/?", version, auth=False),
+            Route("POST", "/v3/auth/tokens", self._issue_token, auth=False),
+            Route("GET", "/v3/auth/tokens", self._validate_token),
+            Route("HEAD", "/v3/auth/tokens", self._validate_token),
+            Route("DELETE", "/v3/auth/tokens", self._revoke_token),
+            Route("GET", "/v3/auth/catalog", self._get_catalog),
+            Route("GET", "/v3/role_assignments", self._list_assignments),
+            Route("GET", "/v3/users/(?P<user_id>[^/]+)/projects",
+                  self._list_user_projects),
+        ])
+        assignment = (r"/v3/projects/(?P<project_id>[^/]+)/users/"
+                      r"(?P<user_id>[^/]+)/roles")
+        self.routes.extend([
+            Route("GET", assignment, self._list_user_roles),
+            Route("PUT", assignment + r"/(?P<role_id>[^/]+)",
+                  self._grant_role),
+            Route("HEAD", assignment + r"/(?P<role_id>[^/]+)",
+                  self._check_role),
+            Route("DELETE", assignment + r"/(?P<role_id>[^/]+)",
+                  self._revoke_role),
+        ])
+
+        def create_user(context, query, body, **kw):
+            user = self.users.create(body["user"])
+            return 201, {"user": self._user_view(user.items)}
+
+        def show_user(context, query, body, resource_id, **kw):
+            user = self._get(self.users, resource_id)
+            return 200, {"user": self._user_view(user.items)}
+
+        def list_users(context, query, body, **kw):
+            users = self._list(self.users, context, query)
+            return 200, {"users": [self._user_view(u) for u in users]}
+
+        def delete_project(context, query, body, resource_id, **kw):
+            self._get(self.projects, resource_id)
+            self.projects.delete(resource_id)
+            self.assignments = {a for a in self.assignments
+                                if a[0] != resource_id}
+            return 204, None
+
+        def delete_user(context, query, body, resource_id, **kw):
+            self._get(self.users, resource_id)
+            self.users.delete(resource_id)
+            self.assignments = {a for a in self.assignments
+                                if a[1] != resource_id}
+            self.tokens = {t: c for t, c in self.tokens.items()
+                           if c.user_id != resource_id}
+            return 204, None
+
+        self.routes.extend([
+            Route("POST", "/v3/users", create_user),
+            Route("GET", "/v3/users", list_users),
+            Route("GET", r"/v3/users/(?P<resource_id>[^/]+)", show_user),
+            Route("DELETE", r"/v3/users/(?P<resource_id>[^/]+)",
+                  delete_user),
+            Route("DELETE", r"/v3/projects/(?P<resource_id>[^/]+)",
+                  delete_project),
+        ])
+        for collection in (self.projects, self.roles, self.domains,
+                           self.services, self.users):
+            self._crud("/v3/" + collection.plural, collection)
+
+    def _identity_version(self):
+        return {"id": "v3.14", "status": "stable",
+                "updated": "2020-04-07T00:00:00Z",
+                "links": [{"rel": "self", "href": self.url("v3/")}],
+                "media-types": [{
+                    "base": "application/json",
+                    "type": "application/vnd.openstack.identity-v3+json"}]}
+
+    @staticmethod
+    def _user_view(user):
+        return {k: v for k, v in user.items() if k != "password"}
+
+    def _find(self, collection, ref, kind):
+        if "id" in ref:
+            resource = collection.get(ref["id"])
+        else:
+            domain = ref.get("domain", {})
+            domain_id = domain.get("id")
+            if domain_id is None and "name" in domain:
+                found = self.domains.find(name=domain["name"])
+                domain_id = found.id if found else None
+            resource = None
+            for candidate in collection.list():
+                if (candidate.items["name"] == ref.get("name")
+                        and candidate.items.get("domain_id",
+                                                domain_id) == domain_id):
+                    resource = candidate
+                    break
+        if resource is None:
+            raise HTTPError(401, "Could not find %s: %s." % (kind, ref))
+        return resource.items
+
+    def _issue_token(self, context, query, body, **kw):
+        auth = body.get("auth", {})
+        identity = auth.get("identity", {})
+        if "password" in identity.get("methods", []):
+            ref = identity["password"]["user"]
+            user = self._find(self.users, ref, "user")
+            if user.get("password") != ref.get("password"):
+                raise HTTPError(401, "The password is incorrect.")
+        elif "token" in identity.get("methods", []):
+            user = self._authorize(identity["token"]["id"]).user
+        else:
+            raise HTTPError(401, "Unsupported authentication method.")
+
+        scope = auth.get("scope") or {}
+        project = None
+        if "project" in scope:
+            project = self._find(self.projects, scope["project"], "project")
+        elif user.get("default_project_id") and not scope:
+            project = self.projects.get(user["default_project_id"]).items
+        roles = []
+        if project is not None:
+            roles = [self.roles.get(role_id).items
+                     for project_id, user_id, role_id in self.assignments
+                     if project_id == project["id"]
+                     and user_id == user["id"]]
+            if not roles:
+                raise HTTPError(401, "User %s has no access to project %s."
+                                % (user["id"], project["id"]))
+        token = uuid.uuid4().hex
+        self.tokens[token] = Context(token, user, project, roles)
+        return 201, self._token_view(self.tokens[token]), {
+            "X-Subject-Token": token}
+
+    def _token_view(self, context):
+        domain = {"id": DEFAULT_DOMAIN_ID, "name": "Default"}
+        token = {
+            "methods": ["password"],
+            "user": {"id": context.user["id"],
+                     "name": context.user["name"], "domain": domain,
+                     "password_expires_at": None},
+            "roles": [{"id": r["id"], "name": r["name"]}
+                      for r in context.roles],
+            "expires_at": "2099-01-01T00:00:00.000000Z",
+            "issued_at": _now(),
+            "audit_ids": [uuid.uuid4().hex[:22]],
+        }
+        if context.project is not None:
+            token["project"] = {"id": context.project["id"],
+                                "name": context.project["name"],
+                                "domain": domain}
+            token["is_domain"] = False
+            token["catalog"] = self._catalog(context.project["id"])
+        return {"token": token}
+
+    def _catalog(self, project_id):
+        services = (
+            ("identity", "keystone", self.url("v3")),
+            ("compute", "nova", self.url("compute", "v2.1")),
+            ("network", "neutron", self.url("network")),
+            ("image", "glance", self.url("image")),
+            ("block-storage", "cinder",
+             self.url("volume", "v3", project_id)),
+            ("volumev3", "cinderv3", self.url("volume", "v3", project_id)),
+            ("object-store", "swift",
+             self.url("object-store", "v1", "AUTH_%s" % project_id)),
+        )
+        return [{"type": service_type, "name": name, "id": name,
+                 "endpoints": [{"id": "%s-%s" % (name, interface),
+                                "interface": interface, "region": REGION,
+                                "region_id": REGION, "url": url}
+                               for interface in ("public", "internal",
+                                                 "admin")]}
+                for service_type, name, url in services]
+
+    def _validate_token(self, context, query, body, headers, **kw):
+        subject = self._authorize(headers.get("X-Subject-Token"))
+        return 200, self._token_view(subject), {
+            "X-Subject-Token": subject.token}
+
+    def _revoke_token(self, context, query, body, headers, **kw):
+        self.tokens.pop(headers.get("X-Subject-Token"), None)
+        return 204, None
+
+    def _get_catalog(self, context, **kw):
+        return 200, {"catalog": self._catalog(context.project_id)}
+
+    def _list_assignments(self, context, query, **kw):
+        assignments = []
+        for project_id, user_id, role_id in sorted(self.assignments):
+            if (query.get("user.id", user_id) != user_id
+                    or query.get("scope.project.id",
+                                 project_id) != project_id
+                    or query.get("role.id", role_id) != role_id):
+                continue
+            assignments.append({"user": {"id": user_id},
+                                "role": {"id": role_id},
+                                "scope": {"project": {"id": project_id}}})
+        return 200, {"role_assignments": assignments}
+
+    def _list_user_projects(self, context, user_id, **kw):
+        project_ids = {a[0] for a in self.assignments if a[1] == user_id}
+        return 200, {"projects": [self.projects.get(p).items
+                                  for p in sorted(project_ids)]}
+
+    def _list_user_roles(self, context, project_id, user_id, **kw):
+        return 200, {"roles": [self.roles.get(a[2]).items
+                               for a in self.assignments
+                               if a[:2] == (project_id, user_id)]}
+
+    def _check_assignment(self, project_id, user_id, role_id):
+        self._get(self.projects, project_id)
+        self._get(self.users, user_id)
+        self._get(self.roles, role_id)
+        return project_id, user_id, role_id
+
+    def _grant_role(self, context, project_id, user_id, role_id, **kw):
+        self.assignments.add(
+            self._check_assignment(project_id, user_id, role_id))
+        return 204, None
+
+    def _check_role(self, context, project_id, user_id, role_id, **kw):
+        if (project_id, user_id, role_id) not in self.assignments:
+            raise HTTPError(404, "Role assignment is not found.")
+        return 204, None
+
+    def _revoke_role(self, context, project_id, user_id, role_id, **kw):
+        self._check_role(context, project_id, user_id, role_id)
+        self.assignments.discard((project_id, user_id, role_id))
+        return 204, None
+
+    # Nova
+
+    def _add_compute_routes(self):
+        def versions(**kw):
+            return 200, {"versions": [self._compute_version()]}
+
+        def version(**kw):
+            return 200, {"version": self._compute_version()}
+
+        self.routes.extend([
+            Route("GET", "/compute/?", versions, auth=False),
+            Route("GET", "/compute/v2.1/?", version, auth=False),
+        ])
+
+        prefix = "/compute/v2.1"
+
+        def create_server(context, query, body, **kw):
+            data = dict(body["server"])
+            data["flavor"] = {"id": data.pop("flavorRef", None)}
+            data["image"] = {"id": data.pop("imageRef", None)} if (
+                data.get("imageRef")) else ""
+            for key in ("min_count", "max_count", "networks",
+                        "block_device_mapping_v2", "user_data"):
+                data.pop(key, None)
+            server = self.servers.create(data, context.project_id,
+                                         context.user_id)
+            server.items["links"] = [
+                {"rel": "self",
+                 "href": self.url("compute", "v2.1", "servers", server.id)}]
+            return 202, {"server": {"id": server.id,
+                                    "links": server.items["links"],
+                                    "adminPass": "fake",
+                                    "security_groups": [
+                                        {"name": "default"}]}}
+
+        def server_action(context, query, body, resource_id, **kw):
+            server = self._get(self.servers, resource_id, context)
+            action = next(iter(body))
+            statuses = {"os-stop": "SHUTOFF", "os-start": "ACTIVE",
+                        "suspend": "SUSPENDED", "resume": "ACTIVE",
+                        "pause": "PAUSED", "unpause": "ACTIVE",
+                        "shelve": "SHELVED_OFFLOADED", "unshelve": "ACTIVE",
+                        "rescue": "RESCUE", "unrescue": "ACTIVE",
+                        "resize": "VERIFY_RESIZE",
+                        "confirmResize": "ACTIVE",
+                        "revertResize": "ACTIVE"}
+            if action in statuses:
+                server.items["status"] = statuses[action]
+            elif action == "lock":
+                server.items["OS-EXT-STS:locked"] = True
+            elif action == "unlock":
+                server.items["OS-EXT-STS:locked"] = False
+            elif action == "createImage":
+                image = self.images.create(
+                    {"name": body[action]["name"], "status": "active",
+                     "size": 0}, context.project_id)
+                return 202, {"image_id": image.id}
+            return 202, None
+
+        def list_flavors(context, query, body, **kw):
+            return 200, {"flavors": self._list(self.flavors, context,
+                                               query)}
+
+        def flavor_extra_specs(context, query, body, resource_id, **kw):
+            flavor = self._get(self.flavors, resource_id)
+            flavor.items["extra_specs"].update(body.get("extra_specs", {}))
+            return 200, {"extra_specs": flavor.items["extra_specs"]}
+
+        def list_keypairs(context, query, body, **kw):
+            return 200, {"keypairs": [
+                {"keypair": k}
+                for k in self._list(self.keypairs, context, query)]}
+
+        def keypair_by_name(context, name):
+            for keypair in self.keypairs.list(context):
+                if keypair.items["name"] == name:
+                    return keypair
+            raise HTTPError(404, "Keypair %s is not found." % name)
+
+        def show_keypair(context, query, body, name, **kw):
+            return 200, {"keypair": keypair_by_name(context, name).items}
+
+        def delete_keypair(context, query, body, name, **kw):
+            self.keypairs.delete(keypair_by_name(context, name).id)
+            return 202, None
+
+        def quotas(context, query, body, project_id, **kw):
+            quota_set = {"id": project_id, "instances": -1, "cores": -1,
+                         "ram": -1, "key_pairs": -1, "server_groups": -1}
+            quota_set.update((body or {}).get("quota_set", {}))
+            return 200, {"quota_set": quota_set}
+
+        def limits(context, query, body, **kw):
+            return 200, {"limits": {"absolute": {}, "rate": []}}
+
+        self.routes.extend([
+            Route("POST", prefix + "/servers", create_server),
+            Route("GET", prefix + "/servers/detail",
+                  lambda context, query, **kw: (200, {
+                      "servers": self._list(self.servers, context,
+                                            query)})),
+            Route("POST", prefix + r"/servers/(?P<resource_id>[^/]+)/action",
+                  server_action),
+            Route("GET", prefix + "/flavors/detail", list_flavors),
+            Route("POST",
+                  prefix + r"/flavors/(?P<resource_id>[^/]+)/os-extra_specs",
+                  flavor_extra_specs),
+            Route("GET", prefix + "/os-keypairs", list_keypairs),
+            Route("GET", prefix + r"/os-keypairs/(?P<name>[^/]+)",
+                  show_keypair),
+            Route("DELETE", prefix + r"/os-keypairs/(?P<name>[^/]+)",
+                  delete_keypair),
+            Route("GET", prefix + r"/os-quota-sets/(?P<project_id>[^/]+)",
+                  quotas),
+            Route("PUT", prefix + r"/os-quota-sets/(?P<project_id>[^/]+)",
+                  quotas),
+            Route("DELETE", prefix + r"/os-quota-sets/(?P<project_id>[^/]+)",
+                  lambda **kw: (202, None)),
+            Route("GET", prefix + "/limits", limits),
+        ])
+        self._crud(prefix + "/servers", self.servers)
+        self._crud(prefix + "/flavors", self.flavors)
+        self._crud(prefix + "/os-keypairs", self.keypairs)
+        self._crud(prefix + "/os-server-groups", self.server_groups)
+        self._crud(prefix + "/os-aggregates", self.aggregates)
+
+    def _compute_version(self):
+        return {"id": "v2.1", "status": "CURRENT", "version": "2.96",
+                "min_version": "2.1", "updated": "2013-07-23T11:33:21Z",
+                "links": [{"rel": "self",
+                           "href": self.url("compute", "v2.1/")}]}
+
+    # Neutron
+
+    def _add_network_routes(self):
+        prefix = "/network/v2.0"
+
+        def versions(**kw):
+            return 200, {"versions": [{
+                "id": "v2.0", "status": "CURRENT",
+                "links": [{"rel": "self", "href": self.url("network",
+                                                           "v2.0/")}]}]}
+
+        def extensions(**kw):
+            return 200, {"extensions": [
+                {"alias": alias, "name": alias, "description": "",
+                 "links": [], "updated": "2013-01-01T00:00:00-00:00"}
+                for alias in ("external-net", "router", "security-group",
+                              "quotas", "extraroute", "dhcp_agent_scheduler",
+                              "standard-attr-tag")]}
+
+        def create_subnet(context, query, body, **kw):
+            def create(data):
+                network = self._get(self.networks, data.get("network_id"),
+                                    context)
+                subnet = self.subnets.create(data, context.project_id)
+                network.items["subnets"].append(subnet.id)
+                return subnet
+
+            return self._create(self.subnets, body, create)
+
+        def delete_subnet(context, query, body, resource_id, **kw):
+            subnet = self._get(self.subnets, resource_id, context)
+            network = self.networks.get(subnet.items["network_id"])
+            if network is not None:
+                network.items["subnets"].remove(resource_id)
+            self.subnets.delete(resource_id)
+            return 204, None
+
+        def delete_network(context, query, body, resource_id, **kw):
+            self._get(self.networks, resource_id, context)
+            if any(p.items["network_id"] == resource_id
+                   and p.items["device_owner"] == "compute:nova"
+                   for p in self.ports.list()):
+                raise HTTPError(409, "Network %s is in use." % resource_id)
+            for subnet in self.subnets.list(filters={
+                    "network_id": resource_id}):
+                self.subnets.delete(subnet.id)
+            for port in self.ports.list(filters={
+                    "network_id": resource_id}):
+                self.ports.delete(port.id)
+            self.networks.delete(resource_id)
+            return 204, None
+
+        def create_security_group(context, query, body, **kw):
+            group = self.security_groups.create(body["security_group"],
+                                                context.project_id)
+            for ethertype in ("IPv4", "IPv6"):
+                self._create_rule(group, context, direction="egress",
+                                  ethertype=ethertype)
+            return 201, {"security_group": group.items}
+
+        def create_rule(context, query, body, **kw):
+            data = body["security_group_rule"]
+            group = self._get(self.security_groups,
+                              data.get("security_group_id"), context)
+            rule = self._create_rule(group, context, **data)
+            return 201, {"security_group_rule": rule.items}
+
+        def delete_rule(context, query, body, resource_id, **kw):
+            rule = self._get(self.security_group_rules, resource_id,
+                             context)
+            group = self.security_groups.get(
+                rule.items["security_group_id"])
+            if group is not None:
+                group.items["security_group_rules"] = [
+                    r for r in group.items["security_group_rules"]
+                    if r["id"] != resource_id]
+            self.security_group_rules.delete(resource_id)
+            return 204, None
+
+        def router_interface(add):
+            def handler(context, query, body, resource_id, **kw):
+                router = self._get(self.routers, resource_id, context)
+                subnet_id = body.get("subnet_id")
+                if add:
+                    subnet = self._get(self.subnets, subnet_id, context)
+                    port = self.ports.create(
+                        {"network_id": subnet.items["network_id"],
+                         "device_id": router.id,
+                         "device_owner": "network:router_interface",
+                         "fixed_ips": [{"subnet_id": subnet_id}]},
+                        context.project_id)
+                else:
+                    port = None
+                    for candidate in self.ports.list(filters={
+                            "device_id": router.id}):
+                        if (body.get("port_id") == candidate.id
+                                or any(ip["subnet_id"] == subnet_id
+                                       for ip in
+                                       candidate.items["fixed_ips"])):
+                            port = candidate
+                    if port is None:
+                        raise HTTPError(404, "Router %s has no interface "
+                                             "on subnet %s."
+                                        % (router.id, subnet_id))
+                    self.ports.delete(port.id)
+                return 200, {"id": router.id, "subnet_id": subnet_id,
+                             "port_id": port.id,
+                             "tenant_id": router.items["project_id"],
+                             "project_id": router.items["project_id"]}
+            return handler
+
+        def quotas(context, query, body, project_id, **kw):
+            quota = {"network": -1, "subnet": -1, "port": -1,
+                     "router": -1, "floatingip": -1,
+                     "security_group": -1, "security_group_rule": -1}
+            quota.update((body or {}).get("quota", {}))
+            return 200, {"quota": quota}
+
+        self.routes.extend([
+            Route("GET", "/network/?", versions, auth=False),
+            Route("GET", prefix + "/extensions", extensions),
+            Route("DELETE", prefix + r"/networks/(?P<resource_id>[^/]+)",
+                  delete_network),
+            Route("POST", prefix + "/subnets", create_subnet),
+            Route("DELETE", prefix + r"/subnets/(?P<resource_id>[^/]+)",
+                  delete_subnet),
+            Route("POST", prefix + "/security-groups",
+                  create_security_group),
+            Route("POST", prefix + "/security-group-rules", create_rule),
+            Route("DELETE",
+                  prefix + r"/security-group-rules/(?P<resource_id>[^/]+)",
+                  delete_rule),
+            Route("PUT", prefix + r"/routers/(?P<resource_id>[^/]+)"
+                  "/add_router_interface", router_interface(add=True)),
+            Route("PUT", prefix + r"/routers/(?P<resource_id>[^/]+)"
+                  "/remove_router_interface", router_interface(add=False)),
+            Route("GET", prefix + r"/quotas/(?P<project_id>[^/]+)", quotas),
+            Route("PUT", prefix + r"/quotas/(?P<project_id>[^/]+)", quotas),
+            Route("DELETE", prefix + r"/quotas/(?P<project_id>[^/]+)",
+                  lambda **kw: (204, None)),
+        ])
+        for path, collection in (
+                ("networks", self.networks), ("subnets", self.subnets),
+                ("routers", self.routers), ("ports", self.ports),
+                ("security-groups", self.security_groups),
+                ("security-group-rules", self.security_group_rules),
+                ("floatingips", self.floatingips),
+                ("trunks", self.trunks)):
+            self._crud(prefix + "/" + path, collection)
+
+    def _create_rule(self, group, context, **data):
+        data["security_group_id"] = group.id
+        rule = self.security_group_rules.create(
+            data, group.items["project_id"] or context.project_id)
+        group.items["security_group_rules"].append(rule.items)
+        return rule
+
+    # Glance
+
+    def _add_image_routes(self):
+        prefix = "/image/v2"
+
+        def versions(**kw):
+            return 300, {"versions": [{
+                "id": "v2.16", "status": "CURRENT",
+                "links": [{"rel": "self", "href": self.url("image",
+                                                           "v2/")}]}]}
+
+        def schema(**kw):
+            return 200, {"name": "image", "properties": {
+                "id": {"type": "string"}, "name": {"type": ["null",
+                                                            "string"]},
+                "status": {"type": "string"},
+                "visibility": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}}},
+                "additionalProperties": {},
+                "links": [{"rel": "self", "href": "{self}"}]}
+
+        def list_images(context, query, body, **kw):
+            images = self._list(self.images, context, query)
+            result = {"images": images, "schema": "/v2/schemas/images",
+                      "first": "/v2/images"}
+            if images and len(images) == int(query.get("limit", -1)):
+                result["next"] = "/v2/images?%s" % urllib.parse.urlencode(
+                    dict(query, marker=images[-1]["id"]))
+            return 200, result
+
+        def create_image(context, query, body, **kw):
+            body.pop("id", None)
+            image = self.images.create(body, context.project_id)
+            image.items["owner"] = context.project_id
+            return 201, image.items
+
+        def show_image(context, query, body, resource_id, **kw):
+            return 200, self._get(self.images, resource_id, context).items
+
+        def update_image(context, query, body, resource_id, **kw):
+            image = self._get(self.images, resource_id, context)
+            for op in body:
+                key = op["path"].lstrip("/")
+                if op["op"] in ("add", "replace"):
+                    image.items[key] = op["value"]
+                elif op["op"] == "remove":
+                    image.items.pop(key, None)
+            return 200, image.items
+
+        def delete_image(context, query, body, resource_id, **kw):
+            self._get(self.images, resource_id, context)
+            self.images.delete(resource_id)
+            self.image_data.pop(resource_id, None)
+            return 204, None
+
+        def upload(context, query, body, resource_id, **kw):
+            image = self._get(self.images, resource_id, context)
+            self.image_data[resource_id] = body
+            image.items.update(status="active", size=len(body),
+                               checksum=_etag(body))
+            return 204, None
+
+        def download(context, query, body, resource_id, **kw):
+            self._get(self.images, resource_id, context)
+            return 200, self.image_data.get(resource_id, b"")
+
+        def tag(add):
+            def handler(context, query, body, resource_id, tag, **kw):
+                image = self._get(self.images, resource_id, context)
+                tags = set(image.items["tags"])
+                (tags.add if add else tags.discard)(tag)
+                image.items["tags"] = sorted(tags)
+                return 204, None
+            return handler
+
+        item = prefix + r"/images/(?P<resource_id>[^/]+)"
+        self.routes.extend([
+            Route("GET", "/image/?", versions, auth=False),
+            Route("GET", prefix + "/schemas/images?", schema),
+            Route("GET", prefix + "/images", list_images),
+            Route("POST", prefix + "/images", create_image),
+            Route("GET", item, show_image),
+            Route("PATCH", item, update_image),
+            Route("DELETE", item, delete_image),
+            Route("PUT", item + "/file", upload),
+            Route("GET", item + "/file", download),
+            Route("PUT", item + r"/tags/(?P<tag>[^/]+)", tag(add=True)),
+            Route("DELETE", item + r"/tags/(?P<tag>[^/]+)", tag(add=False)),
+        ])
+
+    # Cinder
+
+    def _add_volume_routes(self):
+        prefix = r"/volume/v3/(?P<project_id>[^/]+)"
+
+        def versions(**kw):
+            return 300, {"versions": [{
+                "id": "v3.0", "status": "CURRENT", "version": "3.70",
+                "min_version": "3.0", "updated": "2023-08-31T00:00:00Z",
+                "links": [{"rel": "self", "href": self.url("volume",
+                                                           "v3/")}]}]}
+
+        def detail(collection):
+            def handler(context, query, body, **kw):
+                return 200, {collection.plural: self._list(
+                    collection, context, query)}
+            return handler
+
+        def create_volume(context, query, body, **kw):
+            data = dict(body["volume"])
+            data["size"] = int(data.get("size") or 1)
+            if data.get("imageRef"):
+                data["bootable"] = "true"
+            volume = self.volumes.create(data, context.project_id,
+                                         context.user_id)
+            return 202, {"volume": volume.items}
+
+        def volume_action(context, query, body, resource_id, **kw):
+            volume = self._get(self.volumes, resource_id, context)
+            action = next(iter(body))
+            if action == "os-extend":
+                volume.items["size"] = int(body[action]["new_size"])
+            elif action == "os-reset_status":
+                volume.items["status"] = body[action]["status"]
+            elif action == "os-set_bootable":
+                volume.items["bootable"] = str(
+                    body[action]["bootable"]).lower()
+            elif action == "os-volume_upload_image":
+                image = self.images.create(
+                    {"name": body[action]["image_name"], "status": "active",
+                     "size": 0}, context.project_id)
+                return 202, {action: {"image_id": image.id,
+                                      "id": volume.id}}
+            return 202, None
+
+        def delete_volume(context, query, body, resource_id, **kw):
+            self._get(self.volumes, resource_id, context)
+            if self.snapshots.list(filters={"volume_id": resource_id}):
+                raise HTTPError(400, "Volume %s has snapshots."
+                                % resource_id)
+            self.volumes.delete(resource_id)
+            return 202, None
+
+        def quotas(context, query, body, resource_id, **kw):
+            quota_set = {"id": resource_id, "volumes": -1, "gigabytes": -1,
+                         "snapshots": -1, "backups": -1}
+            quota_set.update((body or {}).get("quota_set", {}))
+            return 200, {"quota_set": quota_set}
+
+        self.routes.extend([
+            Route("GET", "/volume/?", versions, auth=False),
+            Route("POST", prefix + "/volumes", create_volume),
+            Route("GET", prefix + "/volumes/detail", detail(self.volumes)),
+            Route("POST", prefix + r"/volumes/(?P<resource_id>[^/]+)/action",
+                  volume_action),
+            Route("DELETE", prefix + r"/volumes/(?P<resource_id>[^/]+)",
+                  delete_volume),
+            Route("GET", prefix + "/snapshots/detail",
+                  detail(self.snapshots)),
+            Route("GET", prefix + "/backups/detail", detail(self.backups)),
+            Route("GET", prefix + "/os-volume-transfer/detail",
+                  detail(self.transfers)),
+            Route("POST",
+                  prefix + r"/(?:snapshots|backups)/[^/]+/action",
+                  lambda **kw: (202, None)),
+            Route("GET", prefix + r"/os-quota-sets/(?P<resource_id>[^/]+)",
+                  quotas),
+            Route("PUT", prefix + r"/os-quota-sets/(?P<resource_id>[^/]+)",
+                  quotas),
+            Route("DELETE",
+                  prefix + r"/os-quota-sets/(?P<resource_id>[^/]+)",
+                  lambda **kw: (200, None)),
+        ])
+        for path, collection in (("volumes", self.volumes),
+                                 ("snapshots", self.snapshots),
+                                 ("backups", self.backups),
+                                 ("types", self.volume_types),
+                                 ("os-volume-transfer", self.transfers),
+                                 ("qos-specs", self.qos_specs)):
+            self._crud(prefix + "/" + path, collection)
+
+    # Swift
+
+    def _add_object_store_routes(self):
+        prefix = r"/object-store/v1/AUTH_(?P<project_id>[^/]+)"
+        container = prefix + r"/(?P<container>[^/]+)"
+        obj = container + r"/(?P<obj>.+)"
+
+        def account(context, project_id):
+            if project_id != context.project_id and not context.is_admin:
+                raise HTTPError(403, "Forbidden.")
+            return self.accounts[project_id]
+
+        def get_container(context, project_id, name):
+            containers = account(context, project_id)
+            if name not in containers:
+                raise HTTPError(404, "Container %s is not found." % name)
+            return containers[name]
+
+        def listing(names, query):
+            names = sorted(name for name in names
+                           if name.startswith(query.get("prefix", ""))
+                           and name > query.get("marker", ""))
+            if "limit" in query:
+                names = names[:int(query["limit"])]
+            return names
+
+        def get_account(context, query, project_id, **kw):
+            containers = account(context, project_id)
+            return 200, [{"name": name, "count": len(containers[name]),
+                          "bytes": sum(len(data) for data, _t
+                                       in containers[name].values())}
+                         for name in listing(containers, query)], {
+                "X-Account-Container-Count": str(len(containers))}
+
+        def head_account(context, query, project_id, **kw):
+            containers = account(context, project_id)
+            return 204, None, {
+                "X-Account-Container-Count": str(len(containers))}
+
+        def put_container(context, query, project_id, container, **kw):
+            containers = account(context, project_id)
+            created = container not in containers
+            containers.setdefault(container, {})
+            return (201 if created else 202), None
+
+        def get_objects(context, query, project_id, container, **kw):
+            objects = get_container(context, project_id, container)
+            return 200, [{"name": name, "bytes": len(objects[name][0]),
+                          "hash": _etag(objects[name][0]),
+                          "last_modified": objects[name][1],
+                          "content_type": "application/octet-stream"}
+                         for name in listing(objects, query)], {
+                "X-Container-Object-Count": str(len(objects))}
+
+        def head_container(context, query, project_id, container, **kw):
+            objects = get_container(context, project_id, container)
+            return 204, None, {
+                "X-Container-Object-Count": str(len(objects))}
+
+        def delete_container(context, query, project_id, container, **kw):
+            if get_container(context, project_id, container):
+                raise HTTPError(409, "Container %s is not empty."
+                                % container)
+            del account(context, project_id)[container]
+            return 204, None
+
+        def put_object(context, query, body, project_id, container, obj,
+                       **kw):
+            objects = get_container(context, project_id, container)
+            objects[obj] = (body, _now())
+            return 201, None, {"Etag": _etag(body)}
+
+        def get_object(context, query, project_id, container, obj, **kw):
+            objects = get_container(context, project_id, container)
+            if obj not in objects:
+                raise HTTPError(404, "Object %s is not found." % obj)
+            data, _modified = objects[obj]
+            return 200, data, {"Etag": _etag(data)}
+
+        def delete_object(context, query, project_id, container, obj, **kw):
+            get_object(context, query, project_id, container, obj)
+            del get_container(context, project_id, container)[obj]
+            return 204, None
+
+        def info(**kw):
+            return 200, {"swift": {"version": "2.31.0"}}
+
+        self.routes.extend([
+            Route("GET", "/object-store/info", info, auth=False),
+            Route("GET", prefix + "/?", get_account),
+            Route("HEAD", prefix + "/?", head_account),
+            Route("PUT", container + "/?", put_container),
+            Route("POST", container + "/?", put_container),
+            Route("GET", container + "/?", get_objects),
+            Route("HEAD", container + "/?", head_container),
+            Route("DELETE", container + "/?", delete_container),
+            Route("PUT", obj, put_object),
+            Route("GET", obj, get_object),
+            Route("HEAD", obj,
+                  lambda **kw: get_object(**kw)[:1] + (None,)),
+            Route("DELETE", obj, delete_object),
+        ])
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are sent separately, so Nagle's algorithm would delay
+    # every response of a keep-alive connection until the client ACKs
+    disable_nagle_algorithm = True
+    cloud = None
+    verbose = False
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if not size:
+                # skip trailers
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _handle(self):
+        code, data, headers = self.cloud.serve(
+            self.command, self.path, self.headers, self._read_body())
+        if code >= 400 and not self.verbose:
+            sys.stderr.write("%s %s -> %s\n"
+                             % (self.command, self.path, code))
+
+        self.send_response(code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def do_GET(self):  # noqa: N802
+        self._handle()
+
+    def do_HEAD(self):  # noqa: N802
+        self._handle()
+
+    def do_POST(self):  # noqa: N802
+        self._handle()
+
+    def do_PUT(self):  # noqa: N802
+        self._handle()
+
+    def do_PATCH(self):  # noqa: N802
+        self._handle()
+
+    def do_DELETE(self):  # noqa: N802
+        self._handle()
+
+    def log_message(self, format, *args):  # noqa: A002
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host, port, **kwargs):
+    """Create HTTP server of a new fake cloud.
+
+    The cloud is available as `cloud` attribute of the server.
+    """
+    handler = type("Handler", (RequestHandler,), {})
+    server = http.server.ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    handler.cloud = server.cloud = Cloud(
+        "http://%s:%s" % (host, server.server_address[1]), **kwargs)
+    return server
+
+
+def main(args):
+    parser = argparse.ArgumentParser(
+        args[0], description="Stateful fake OpenStack cloud.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=5000,
+                        help="Port to listen on.")
+    parser.add_argument("--admin-password", default="admin",
+                        help="Password of 'admin' user.")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="Seconds each request takes at least.")
+    parser.add_argument("--error-rate", type=float, default=0,
+                        help="Probability of '503 Service Unavailable' "
+                             "response to any request except issuing of "
+                             "tokens.")
+    parser.add_argument("--build-time", type=float, default=0,
+                        help="Seconds after which servers, volumes, etc. "
+                             "leave transient statuses like BUILD.")
+    parser.add_argument("--seed", type=int,
+                        help="Seed of injected errors.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log every request.")
+    args = parser.parse_args(args[1:])
+
+    server = make_server(args.host, args.port,
+                         admin_password=args.admin_password,
+                         latency=args.latency, error_rate=args.error_rate,
+                         build_time=args.build_time, seed=args.seed)
+    server.RequestHandlerClass.verbose = args.verbose
+    print("Fake cloud is available at %s/v3" % server.cloud.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,435 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmarks of the overhead of Rally itself.
+
+Client construction, contexts, cleanup and resource type lookups are run
+against the fake cloud of `tests.ci.fake_cloud` at several scales. Requests
+of all clients are passed to the fake cloud in memory instead of sockets, so
+only the time spent by Rally and the client libraries is measured.
+
+Every benchmark records wall time, the number of API calls and peak memory
+allocated by Python. The number of API calls does not depend on the machine,
+so any increase of it relative to the stored baseline is a regression. Wall
+time and memory are reported together with their change relative to the
+baseline, but never fail the run, since they depend on the machine.
+Run the benchmarks from the root of the repository:
+
+    python -m tests.ci.overhead_benchmarks
+
+and store new results as the baseline after an intended change with
+`--update-baseline`.
+"""
+
+import argparse
+import collections
+import contextlib
+import gc
+import io
+import json
+import logging  # noqa: TID251
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+
+from requests import adapters
+from urllib3 import response as urllib3_response
+
+from rally import plugins
+from rally.common import cfg
+from rally.common import utils as rutils
+
+from tests.ci import fake_cloud
+
+
+# options of rally_openstack are registered while plugins are loaded and
+# modules of it use them on import
+plugins.load()
+
+from rally_openstack.common import credential  # noqa: E402
+from rally_openstack.common import osclients  # noqa: E402
+from rally_openstack.task import types  # noqa: E402
+from rally_openstack.task.cleanup import manager  # noqa: E402
+from rally_openstack.task.contexts.keystone import users  # noqa: E402
+from rally_openstack.task.scenarios.nova import utils  # noqa: E402
+
+
+CONF = cfg.CONF
+
+AUTH_URL = "http://fake-cloud:5000"
+BASELINE = os.path.join(os.path.dirname(__file__), "overhead_baseline.json")
+SERVICES = ("nova", "neutron", "glance", "cinder", "swift")
+
+_benchmarks = collections.OrderedDict()
+
+
+def benchmark(name, param, scales):
+    """Register a benchmark.
+
+    The decorated function is called with a new `Environment` and a scale
+    to prepare the run and returns a callable without arguments, only the
+    call of which is measured.
+    """
+    def decorator(func):
+        _benchmarks[name] = (func, param, scales)
+        return func
+    return decorator
+
+
+class Transport:
+    """Passes requests of `requests` library to a fake cloud in memory."""
+
+    def __init__(self, cloud):
+        self.cloud = cloud
+        self.calls = collections.Counter()
+        self._lock = threading.Lock()
+        # clients fetch version documents while discovering endpoints and
+        # threads sharing a session race to do that, so such requests are
+        # not counted to keep the number of API calls reproducible
+        self._discovery = [route.regex for route in cloud.routes
+                           if route.method == "GET" and not route.auth]
+
+    def send(self, adapter, request, **kwargs):
+        url = request.url.split("/", 3)
+        target = "/" + (url[3] if len(url) > 3 else "")
+        body = request.body
+        if body is None:
+            body = b""
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        elif hasattr(body, "read"):
+            body = body.read()
+        elif not isinstance(body, bytes):
+            body = b"".join(chunk if isinstance(chunk, bytes)
+                            else chunk.encode("utf-8") for chunk in body)
+        path = target.split("?")[0]
+        if not (request.method == "GET"
+                and any(regex.match(path) for regex in self._discovery)):
+            with self._lock:
+                self.calls[path.split("/")[1]] += 1
+        code, data, headers = self.cloud.serve(request.method, target,
+                                               request.headers, body)
+        raw = urllib3_response.HTTPResponse(
+            body=io.BytesIO(data), headers=headers, status=code,
+            preload_content=False, decode_content=False,
+            request_method=request.method)
+        return adapter.build_response(request, raw)
+
+    @contextlib.contextmanager
+    def patched(self):
+        transport = self
+
+        def send(adapter, request, **kwargs):
+            return transport.send(adapter, request, **kwargs)
+
+        original = adapters.HTTPAdapter.send
+        adapters.HTTPAdapter.send = send
+        try:
+            yield self
+        finally:
+            adapters.HTTPAdapter.send = original
+
+
+class Environment:
+    """A fake cloud with helpers to fill it for a benchmark."""
+
+    def __init__(self):
+        self.cloud = fake_cloud.Cloud(AUTH_URL)
+        self.transport = Transport(self.cloud)
+        self.task_id = str(uuid.uuid4())
+        self.admin = {"auth_url": AUTH_URL + "/v3",
+                      "region_name": fake_cloud.REGION,
+                      "username": "admin", "password": "admin",
+                      "tenant_name": "admin",
+                      "user_domain_name": "Default",
+                      "project_domain_name": "Default"}
+
+    def admin_credential(self):
+        return credential.OpenStackCredential(**self.admin)
+
+    def add_users(self, tenants, users_per_tenant=1):
+        """Create projects and users with 'member' role in the cloud.
+
+        :returns: users in the format of the users context
+        """
+        role = self.cloud.roles.find(name="member")
+        result = []
+        for i in range(tenants):
+            name = "project-%s" % i
+            project = self.cloud.projects.create(
+                {"name": name, "domain_id": fake_cloud.DEFAULT_DOMAIN_ID,
+                 "enabled": True, "description": ""})
+            for j in range(users_per_tenant):
+                username = "%s-user-%s" % (name, j)
+                user = self.cloud.users.create(
+                    {"name": username, "password": "password",
+                     "domain_id": fake_cloud.DEFAULT_DOMAIN_ID,
+                     "default_project_id": project.id, "enabled": True})
+                self.cloud.assignments.add((project.id, user.id, role.id))
+                result.append({
+                    "id": user.id, "tenant_id": project.id,
+                    "credential": credential.OpenStackCredential(
+                        auth_url=self.admin["auth_url"],
+                        region_name=fake_cloud.REGION,
+                        username=username, password="password",
+                        tenant_name=name, user_domain_name="Default",
+                        project_domain_name="Default")})
+        return result
+
+    def random_name(self):
+        """Return a name which cleanup treats as created by the task."""
+        return _NameGenerator(self.task_id).generate_random_name()
+
+
+class _NameGenerator(rutils.RandomNameGeneratorMixin):
+    RESOURCE_NAME_FORMAT = utils.NovaScenario.RESOURCE_NAME_FORMAT
+
+    def __init__(self, task_id):
+        self.task = {"uuid": task_id}
+
+
+@benchmark("clients", "users", (10, 100))
+def clients(env, scale):
+    """Construct and authenticate clients of all services of users."""
+    creds = [user["credential"] for user in env.add_users(scale)]
+
+    def run():
+        for cred in creds:
+            clients = osclients.Clients(cred)
+            clients.keystone.auth_ref
+            for name in SERVICES:
+                getattr(clients, name)()
+            clients._conn
+    return run
+
+
+@benchmark("users_context", "tenants", (10, 100))
+def users_context(env, scale):
+    """Set up and clean up the users context with 2 users per tenant."""
+    context = {
+        "config": {"users": {"tenants": scale, "users_per_tenant": 2}},
+        "env": {"platforms": {"openstack": {"admin": env.admin,
+                                            "users": []}}},
+        "task": {"uuid": env.task_id},
+        "owner_id": env.task_id}
+
+    def run():
+        generator = users.UserGenerator(context)
+        generator.setup()
+        generator.cleanup()
+    return run
+
+
+@benchmark("cleanup", "resources_per_tenant", (10, 100))
+def cleanup(env, scale):
+    """Clean up servers, volumes and networks of 5 tenants."""
+    users_ = env.add_users(5)
+    flavor = env.cloud.flavors.find(name="m1.tiny")
+    for user in users_:
+        for i in range(scale):
+            env.cloud.servers.create(
+                {"name": env.random_name(), "status": "ACTIVE",
+                 "flavor": {"id": flavor.id}}, user["tenant_id"], user["id"])
+            env.cloud.volumes.create(
+                {"name": env.random_name(), "status": "available",
+                 "size": 1}, user["tenant_id"], user["id"])
+            env.cloud.networks.create(
+                {"name": env.random_name(), "status": "ACTIVE"},
+                user["tenant_id"], user["id"])
+
+    def run():
+        manager.cleanup(
+            names=["nova.servers", "cinder.volumes", "neutron.network"],
+            admin={"credential": env.admin_credential()}, users=users_,
+            superclass=utils.NovaScenario, task_id=env.task_id)
+        left = env.cloud.servers.list() + env.cloud.volumes.list()
+        if left:
+            raise RuntimeError("%d resources are left." % len(left))
+    return run
+
+
+@benchmark("find_resource", "images", (100, 1000))
+def find_resource(env, scale):
+    """Resolve 100 image arguments of workloads by name and by regex."""
+    admin = env.cloud.projects.find(name="admin")
+    for i in range(scale):
+        env.cloud.images.create({"name": "image-%s" % i, "status": "active",
+                                 "visibility": "public"}, admin.id)
+    context = {"admin": {"credential": env.admin_credential()},
+               "task": {"uuid": env.task_id}}
+    indexes = [i * scale // 50 for i in range(50)]
+    specs = [{"name": "image-%s" % i} for i in indexes]
+    specs.extend({"regex": "^image-%s$" % i} for i in indexes)
+
+    def run():
+        cache = {}
+        for spec in specs:
+            resource_type = types.GlanceImage(
+                context, cache, scenario_cls=utils.NovaScenario)
+            resource_type.pre_process(resource_spec=spec, config={},
+                                      output_type=None)
+    return run
+
+
+@benchmark("list_servers", "servers", (100, 1000))
+def list_servers(env, scale):
+    """List servers of a tenant by pages of 50 servers."""
+    user = env.add_users(1)[0]
+    flavor = env.cloud.flavors.find(name="m1.tiny")
+    for i in range(scale):
+        env.cloud.servers.create(
+            {"name": "server-%s" % i, "status": "ACTIVE",
+             "flavor": {"id": flavor.id}}, user["tenant_id"], user["id"])
+    nova = osclients.Clients(user["credential"]).nova()
+
+    def run():
+        CONF.set_override("nova_servers_list_page_size", 50, "openstack")
+        try:
+            servers = utils.list_servers(nova)
+            if len(servers) != scale:
+                raise RuntimeError("%d servers are listed." % len(servers))
+        finally:
+            CONF.clear_override("nova_servers_list_page_size", "openstack")
+    return run
+
+
+def measure(name, scale, repeat=3):
+    """Run a benchmark at the scale.
+
+    Wall time is the minimum of `repeat` runs, the first of which imports
+    modules of client libraries. API calls and memory are measured by
+    another run, since tracing of memory allocations slows the code down.
+
+    :returns: dict with wall time in seconds, peak memory in KiB and
+        number of API calls of the run
+    """
+    func = _benchmarks[name][0]
+
+    def prepare():
+        # every run starts without process-wide caches of earlier runs
+        osclients._auth_states.clear()
+        types._listings.clear()
+        env = Environment()
+        with env.transport.patched():
+            run = func(env, scale)
+        env.transport.calls.clear()
+        gc.collect()
+        return env, run
+
+    durations = []
+    for _i in range(repeat):
+        env, run = prepare()
+        with env.transport.patched():
+            started_at = time.perf_counter()
+            run()
+            durations.append(time.perf_counter() - started_at)
+
+    env, run = prepare()
+    tracemalloc.start()
+    try:
+        with env.transport.patched():
+            run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"wall_time": round(min(durations), 4),
+            "peak_memory": peak // 1024,
+            "api_calls": sum(env.transport.calls.values())}
+
+
+def compare(results, baseline):
+    """Find regressions of results relative to the baseline.
+
+    Only the number of API calls is compared, since wall time and peak
+    memory depend on the machine the benchmarks are run on.
+
+    :returns: list of messages about regressions
+    """
+    regressions = []
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            continue
+        expected = baseline[key]["api_calls"]
+        if result["api_calls"] > expected:
+            regressions.append("%s: api_calls is %s, baseline is %s"
+                               % (key, result["api_calls"], expected))
+    return regressions
+
+
+def _change(result, baseline, metric):
+    if not baseline or not baseline[metric]:
+        return ""
+    return "%+.0f%%" % ((result[metric] / baseline[metric] - 1) * 100)
+
+
+def main(args):
+    parser = argparse.ArgumentParser(
+        args[0], description="Benchmarks of the overhead of Rally itself.")
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK",
+                        help="Benchmarks to run: %s. All by default."
+                             % ", ".join(_benchmarks))
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="JSON file with the baseline results.")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store the results as the baseline.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of runs to take the best wall time of.")
+    args = parser.parse_args(args[1:])
+    unknown = set(args.benchmarks) - set(_benchmarks)
+    if unknown:
+        parser.error("unknown benchmarks: %s" % ", ".join(sorted(unknown)))
+
+    # client libraries warn about deprecations, which is not of interest
+    logging.getLogger().setLevel(logging.ERROR)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    print("%-40s %10s %7s %11s %7s %10s" % (
+        "benchmark", "time, s", "", "memory, KiB", "", "API calls"))
+    for name, (func, param, scales) in _benchmarks.items():
+        if args.benchmarks and name not in args.benchmarks:
+            continue
+        for scale in scales:
+            key = "%s[%s=%s]" % (name, param, scale)
+            result = measure(name, scale, repeat=args.repeat)
+            results[key] = result
+            expected = baseline.get(key)
+            print("%-40s %10.3f %7s %11d %7s %10d" % (
+                key, result["wall_time"],
+                _change(result, expected, "wall_time"),
+                result["peak_memory"],
+                _change(result, expected, "peak_memory"),
+                result["api_calls"]))
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        return 0
+
+    regressions = compare(results, baseline)
+    for regression in regressions:
+        print("REGRESSION %s" % regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
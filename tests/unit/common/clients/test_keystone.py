@@ -20,6 +20,7 @@ import ddt
 from rally import exceptions
 
 from rally_openstack.common import credential as oscredential
+from rally_openstack.common import http_session
 from rally_openstack.common.clients import keystone
 from tests.unit import test
 
@@ -172,6 +173,35 @@ class KeystoneSessionTestCase(KeystoneTestMixin, test.TestCase):
         self.assertIs(first, second)
         self.assertEqual(1, self.ksa.session.Session.call_count)
 
+    def test_get_session_shares_http_pool(self):
+        self._set_up_ksa()
+        self.addCleanup(http_session._adapters.clear)
+        creds = [
+            oscredential.OpenStackCredential(
+                "http://auth_url/v3", "u%s" % i, "p", "t") for i in range(2)]
+        creds.append(oscredential.OpenStackCredential(
+            "http://auth_url/v3", "u", "p", "t", https_insecure=True))
+        for cred in creds:
+            keystone.Keystone(cred, {}).get_session(version="3")
+
+        sessions = [c[1]["session"]
+                    for c in self.ksa.session.Session.call_args_list]
+        self.assertEqual(3, len(set(map(id, sessions))))
+        adapters = [s.get_adapter("https://auth_url") for s in sessions]
+        self.assertIs(adapters[0], adapters[1])
+        self.assertIsNot(adapters[0], adapters[2])
+        self.assertIs(adapters[0], sessions[0].get_adapter("http://auth_url"))
+
+    def test_close(self):
+        ks = keystone.Keystone(self.credential, {})
+        sess = mock.Mock()
+        ks._cache.update({"keystone_session_and_plugin_3": (sess, None),
+                          "keystone_auth_ref": mock.Mock(),
+                          "other": "value"})
+        ks.close()
+        self.assertEqual({"other": "value"}, ks._cache)
+        self.assertFalse(sess.session.close.called)
+
     @ddt.data({"original": "https://example.com/foo/v3",
                "cropped": "https://example.com/foo"},
               {"original": "https://example.com/foo/v2.0/",
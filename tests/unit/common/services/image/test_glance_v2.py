@@ -45,8 +45,9 @@ class GlanceV2ServiceTestCase(test.TestCase):
     @ddt.data({"location": "image_location", "temp": False},
               {"location": "image location", "temp": True})
     @ddt.unpack
+    @mock.patch("%s.source_cache.fetch" % PATH, return_value=None)
     @mock.patch("requests.get")
-    def test_upload(self, mock_requests_get, location, temp):
+    def test_upload(self, mock_requests_get, mock_fetch, location, temp):
         image_id = "foo"
 
         # override the location with a private temp file
@@ -73,6 +74,25 @@ class GlanceV2ServiceTestCase(test.TestCase):
         self.assertFalse(mock_requests_get.called)
         self.gc.images.upload.assert_called_once_with(image_id, mock.ANY)
 
+    @mock.patch("%s.source_cache.fetch" % PATH)
+    @mock.patch("requests.get")
+    def test_upload_from_cache(self, mock_requests_get, mock_fetch):
+        location = "http://example.com/image.qcow2"
+        mock_fetch.return_value = self._get_temp_file_name()
+        with open(mock_fetch.return_value, "wb") as f:
+            f.write(b"fake image data")
+
+        def upload(image_id, image_data):
+            self.assertEqual(b"fake image data", image_data.read())
+
+        self.gc.images.upload.side_effect = upload
+
+        self.service.upload_data("foo", image_location=location)
+
+        mock_fetch.assert_called_once_with(location)
+        self.assertFalse(mock_requests_get.called)
+        self.gc.images.upload.assert_called_once_with("foo", mock.ANY)
+
     @mock.patch("%s.glance_v2.GlanceV2Service.upload_data" % PATH)
     def test_create_image(self, mock_upload_data):
         image_name = "image_name"
@@ -219,13 +239,15 @@ class GlanceV2ServiceTestCase(test.TestCase):
         call_args = self.gc.images.create.call_args[1]
         self.assertEqual(call_args["name"], self.name_generator.return_value)
 
+    @mock.patch("%s.source_cache.fetch" % PATH, return_value=None)
     @mock.patch("requests.get")
-    def test_stage_image_data_from_url(self, mock_requests_get):
+    def test_stage_image_data_from_url(self, mock_requests_get, mock_fetch):
         image_id = "foo"
         location = "http://example.com/image.qcow2"
 
         self.service.stage_image_data(image_id, image_location=location)
 
+        mock_fetch.assert_called_once_with(location)
         mock_requests_get.assert_called_once_with(location, stream=True,
                                                   verify=False)
         self.gc.images.stage.assert_called_once_with(
@@ -0,0 +1,153 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import os
+from unittest import mock
+
+import fixtures
+import requests
+
+from rally_openstack.common.services.image import source_cache
+from tests.unit import test
+
+
+PATH = "rally_openstack.common.services.image.source_cache"
+URL = "http://example.com/image.qcow2"
+
+
+class SourceCacheTestCase(test.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.conf = mock.patch("%s.CONF" % PATH).start()
+        self.conf.openstack.glance_image_cache_dir = self.cache_dir
+        self.conf.openstack.glance_image_cache_size = 1
+        self.mock_head = mock.patch("requests.head").start()
+        self.mock_head.return_value.headers = {"ETag": '"v1"',
+                                               "Content-Length": "4"}
+        self.mock_get = mock.patch("requests.get").start()
+        self.mock_get.return_value.__enter__.return_value.raw = (
+            io.BytesIO(b"data"))
+        self.addCleanup(source_cache._in_use.clear)
+
+    def test_fetch(self):
+        path = source_cache.fetch(URL)
+
+        self.assertEqual(self.cache_dir, os.path.dirname(path))
+        with open(path, "rb") as f:
+            self.assertEqual(b"data", f.read())
+        self.mock_head.assert_called_once_with(URL, allow_redirects=True,
+                                               verify=False)
+        self.mock_get.assert_called_once_with(URL, stream=True, verify=False)
+
+        # the second call is served from the cache
+        self.assertEqual(path, source_cache.fetch(URL))
+        self.assertEqual(1, self.mock_get.call_count)
+        self.assertEqual({path: 2}, source_cache._in_use)
+        source_cache.release(path)
+        source_cache.release(path)
+        self.assertEqual({}, source_cache._in_use)
+
+        # changed source is downloaded again
+        self.mock_head.return_value.headers = {"ETag": '"v2"'}
+        self.mock_get.return_value.__enter__.return_value.raw = (
+            io.BytesIO(b"new data"))
+        new_path = source_cache.fetch(URL)
+        self.assertNotEqual(path, new_path)
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_fetch_disabled(self):
+        self.conf.openstack.glance_image_cache_size = 0
+        self.assertIsNone(source_cache.fetch(URL))
+        self.assertIsNone(source_cache.fetch("/not/an/url"))
+        self.assertFalse(self.mock_head.called)
+
+    def test_fetch_uncacheable(self):
+        self.mock_head.return_value.headers = {}
+        self.assertIsNone(source_cache.fetch(URL))
+
+        self.mock_head.return_value.headers = {
+            "ETag": '"v1"', "Content-Length": str(2 * 1024 * 1024)}
+        self.assertIsNone(source_cache.fetch(URL))
+
+        self.mock_head.side_effect = requests.ConnectionError
+        self.assertIsNone(source_cache.fetch(URL))
+
+        self.assertFalse(self.mock_get.called)
+
+    def test_fetch_failed_download(self):
+        self.mock_get.return_value.__enter__.return_value.raise_for_status\
+            .side_effect = requests.HTTPError
+        self.assertIsNone(source_cache.fetch(URL))
+        self.assertEqual([], os.listdir(self.cache_dir))
+        self.assertEqual({}, source_cache._in_use)
+
+    def test_evict(self):
+        sizes = {"a": 400, "b": 300, "c": 200, ".partial": 500}
+        for i, (name, size) in enumerate(sizes.items()):
+            path = os.path.join(self.cache_dir, name)
+            with open(path, "wb") as f:
+                f.write(b"0" * size)
+            os.utime(path, (i, i))
+
+        source_cache._in_use[os.path.join(self.cache_dir, "a")] = 1
+        source_cache._evict(self.cache_dir, 600)
+
+        self.assertEqual([".partial", "a", "c"],
+                         sorted(os.listdir(self.cache_dir)))
+
+    @mock.patch("%s.release" % PATH)
+    @mock.patch("%s.fetch" % PATH)
+    def test_open_image_data(self, mock_fetch, mock_release):
+        path = os.path.join(self.cache_dir, "image")
+        with open(path, "wb") as f:
+            f.write(b"data")
+
+        with source_cache.open_image_data(path) as image_data:
+            self.assertEqual(b"data", image_data.read())
+        self.assertTrue(image_data.closed)
+        self.assertFalse(mock_fetch.called)
+
+        mock_fetch.return_value = path
+        with source_cache.open_image_data(URL) as image_data:
+            self.assertEqual(b"data", image_data.read())
+        mock_fetch.assert_called_once_with(URL)
+        mock_release.assert_called_once_with(path)
+        self.assertFalse(self.mock_get.called)
+
+    def test_open_image_data_evict_in_use(self):
+        self.conf.openstack.glance_image_cache_size = 0.0001
+        with source_cache.open_image_data(URL) as image_data:
+            path = image_data.name
+            os.utime(path, (0, 0))
+            # another source overflows the cache while the first one is read
+            self.mock_head.return_value.headers = {"ETag": '"v2"',
+                                                   "Content-Length": "101"}
+            self.mock_get.return_value.__enter__.return_value.raw = (
+                io.BytesIO(b"0" * 101))
+            other_path = source_cache.fetch(URL)
+            self.assertTrue(os.path.isfile(path))
+            self.assertEqual(b"data", image_data.read())
+
+        source_cache.release(other_path)
+        source_cache._evict(self.cache_dir, 101)
+        self.assertEqual([os.path.basename(other_path)],
+                         os.listdir(self.cache_dir))
+
+    @mock.patch("%s.fetch" % PATH, return_value=None)
+    def test_open_image_data_not_cached(self, mock_fetch):
+        with source_cache.open_image_data(URL) as image_data:
+            self.assertEqual(self.mock_get.return_value.raw, image_data)
+        self.mock_get.assert_called_once_with(URL, stream=True, verify=False)
+        self.mock_get.return_value.close.assert_called_once_with()
@@ -35,6 +35,7 @@ class LoadBalancerServiceTestCase(test.TestCase):
         self.name_generator = mock.MagicMock()
         self.service = octavia.Octavia(self.clients,
                                        name_generator=self.name_generator)
+        self.addCleanup(octavia._waiters.clear)
         self.mock_wait_for_status = fixtures.MockPatch(
             "rally.task.utils.wait_for_status")
         self.useFixture(self.mock_wait_for_status)
@@ -215,10 +216,14 @@ class LoadBalancerServiceTestCase(test.TestCase):
     def test_pool_create(self):
         self.service.generate_random_name = mock.MagicMock(
             return_value="pool")
+        self.service._wait_for_prov_status = mock.MagicMock()
         self.service.pool_create(
             lb_id="loadbalancer-id",
             protocol="HTTP",
             lb_algorithm="ROUND_ROBIN")
+        pool = self.service._clients.octavia().pool_create.return_value
+        self.service._wait_for_prov_status.assert_called_once_with(
+            "pools", [pool["pool"]])
         self.service._clients.octavia().pool_create \
             .assert_called_once_with(
                 json={"pool": {
@@ -454,10 +459,166 @@ class LoadBalancerServiceTestCase(test.TestCase):
         self._test_atomic_action_timer(self.atomic_actions(),
                                        "octavia.amphora_list")
 
-    @mock.patch("%s.Ocvita.wait_for_loadbalancer_prov_status" % BASE_PATH)
-    def wait_for_loadbalancer_prov_status(self, mock_wait_for_status):
-        fake_lb = {}
-        self.service.wait_for_loadbalancer_prov_status(lb=fake_lb)
-        self.assertTrue(mock_wait_for_status.called)
+    def _set_poll_interval(self):
+        CONF.set_override("octavia_create_loadbalancer_poll_interval", 0,
+                          "openstack")
+        self.addCleanup(CONF.clear_override,
+                        "octavia_create_loadbalancer_poll_interval",
+                        "openstack")
+
+    def test_wait_for_loadbalancer_prov_status(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.side_effect = [
+            {"loadbalancers": [{"id": "lb", "provisioning_status": s}]}
+            for s in ("PENDING_CREATE", "ACTIVE")]
+
+        lb = {"id": "lb", "project_id": "fake_tenant",
+              "provisioning_status": "PENDING_CREATE"}
+        self.assertEqual(
+            {"id": "lb", "provisioning_status": "ACTIVE"},
+            self.service.wait_for_loadbalancer_prov_status(lb=lb))
+        octavia_client.load_balancer_list.assert_called_with(
+            id=["lb"], project_id="fake_tenant")
+        self.assertEqual(2, octavia_client.load_balancer_list.call_count)
+        self._test_atomic_action_timer(self.atomic_actions(),
+                                       "octavia.wait_for_loadbalancers")
+
+    def test_wait_for_loadbalancers_prov_status(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.side_effect = [
+            {"loadbalancers": [{"id": "lb1", "provisioning_status": s1},
+                               {"id": "lb2", "provisioning_status": s2}]}
+            for s1, s2 in (("PENDING_CREATE", "ACTIVE"),
+                           ("ACTIVE", "ACTIVE"))]
+
+        lbs = [{"id": "lb1"}, {"id": "lb2"}]
+        self.assertEqual(
+            [{"id": "lb1", "provisioning_status": "ACTIVE"},
+             {"id": "lb2", "provisioning_status": "ACTIVE"}],
+            self.service.wait_for_loadbalancers_prov_status(lbs=lbs))
+        # all load balancers are checked by one call per interval
+        self.assertEqual(
+            [mock.call(id=["lb1", "lb2"]), mock.call(id=["lb1"])],
+            octavia_client.load_balancer_list.call_args_list)
+        self.assertEqual({}, octavia._waiters[(
+            self.clients.credential.auth_key.return_value, None,
+            "loadbalancers")]._pending)
         self._test_atomic_action_timer(self.atomic_actions(),
                                        "octavia.wait_for_loadbalancers")
+
+    def test_wait_for_loadbalancers_prov_status_error(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.return_value = {
+            "loadbalancers": [
+                {"id": "lb1", "provisioning_status": "PENDING_CREATE"},
+                {"id": "lb2", "provisioning_status": "ERROR"}]}
+
+        # the wait fails without waiting for other load balancers
+        self.assertRaises(
+            exceptions.GetResourceErrorStatus,
+            self.service.wait_for_loadbalancers_prov_status,
+            lbs=[{"id": "lb1"}, {"id": "lb2"}])
+
+    def test_wait_for_loadbalancers_prov_status_not_found(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.return_value = {
+            "loadbalancers": []}
+
+        self.assertRaises(
+            exceptions.GetResourceNotFound,
+            self.service.wait_for_loadbalancers_prov_status,
+            lbs=[{"id": "lb"}])
+        self.assertIsNone(self.service.wait_for_loadbalancer_prov_status(
+            lb={"id": "lb"}, prov_status="DELETED"))
+
+    def test_wait_for_loadbalancers_prov_status_failure(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.side_effect = Exception("oops")
+
+        self.assertRaises(
+            exceptions.GetResourceFailure,
+            self.service.wait_for_loadbalancers_prov_status,
+            lbs=[{"id": "lb"}])
+        self.assertEqual(3, octavia_client.load_balancer_list.call_count)
+
+    def test_wait_for_loadbalancers_prov_status_failed_poll(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.side_effect = [
+            Exception("oops"),
+            {"loadbalancers": [{"id": "lb", "provisioning_status": "ACTIVE"}]}]
+
+        self.assertEqual(
+            [{"id": "lb", "provisioning_status": "ACTIVE"}],
+            self.service.wait_for_loadbalancers_prov_status(
+                lbs=[{"id": "lb"}]))
+
+    def test_wait_for_loadbalancers_prov_status_pages(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.side_effect = [
+            {"loadbalancers": [{"id": "lb1", "provisioning_status": "ACTIVE"}],
+             "loadbalancers_links": [{"rel": "next", "href": "..."}]},
+            {"loadbalancers": [{"id": "lb2", "provisioning_status": "ACTIVE"}],
+             "loadbalancers_links": [{"rel": "previous", "href": "..."}]}]
+
+        self.assertEqual(
+            [{"id": "lb2", "provisioning_status": "ACTIVE"}],
+            self.service.wait_for_loadbalancers_prov_status(
+                lbs=[{"id": "lb2"}]))
+        self.assertEqual(
+            [mock.call(id=["lb2"]), mock.call(id=["lb2"], marker="lb1")],
+            octavia_client.load_balancer_list.call_args_list)
+
+    def test_wait_for_loadbalancers_prov_status_timeout(self):
+        CONF.set_override("octavia_create_loadbalancer_timeout", 0,
+                          "openstack")
+        self.addCleanup(CONF.clear_override,
+                        "octavia_create_loadbalancer_timeout", "openstack")
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.load_balancer_list.return_value = {
+            "loadbalancers": [
+                {"id": "lb", "provisioning_status": "PENDING_CREATE"}]}
+
+        self.assertRaises(
+            exceptions.TimeoutException,
+            self.service.wait_for_loadbalancers_prov_status,
+            lbs=[{"id": "lb", "name": "foo"}])
+        self.assertEqual({}, octavia._waiters[(
+            self.clients.credential.auth_key.return_value, None,
+            "loadbalancers")]._pending)
+
+    def test_wait_for_pool_prov_status(self):
+        self._set_poll_interval()
+        octavia_client = self.service._clients.octavia.return_value
+        octavia_client.pool_list.return_value = {
+            "pools": [{"id": "pool", "provisioning_status": "ACTIVE"}]}
+
+        self.assertEqual(
+            [{"id": "pool", "provisioning_status": "ACTIVE"}],
+            self.service._wait_for_prov_status(
+                "pools", [{"id": "pool", "project_id": "fake_tenant"}]))
+        octavia_client.pool_list.assert_called_once_with(
+            id=["pool"], project_id="fake_tenant")
+
+    def test__get_waiter(self):
+        other_service = octavia.Octavia(self.clients)
+        waiter = self.service._get_waiter("loadbalancers", "tenant")
+
+        # services with the same credential share waiters
+        self.assertIs(waiter,
+                      other_service._get_waiter("loadbalancers", "tenant"))
+        self.assertIsNot(waiter,
+                         self.service._get_waiter("pools", "tenant"))
+
+        self.clients.credential.auth_key.return_value = "other"
+        other_waiter = self.service._get_waiter("loadbalancers", "tenant")
+        self.assertIsNot(waiter, other_waiter)
+        # idle waiters are dropped
+        self.assertEqual([other_waiter], list(octavia._waiters.values()))
@@ -139,6 +139,47 @@ class NeutronServiceTestCase(test.TestCase):
             self.nc.add_interface_router.call_args_list
         )
 
+    def test_create_network_topologies(self):
+        networks = [{"id": "net-1"}, {"id": "net-2"}]
+        self.nc.create_network.return_value = {"networks": networks}
+        routers = [{"id": "router-1"}, {"id": "router-2"}]
+        self.nc.create_router.side_effect = [{"router": r} for r in routers]
+        subnets = [{"id": "subnet-%s" % i} for i in range(4)]
+        self.nc.create_subnet.return_value = {"subnets": subnets}
+
+        topologies = self.neutron.create_network_topologies(
+            2,
+            network_create_args={},
+            router_create_args={},
+            subnet_create_args={"cidr": "10.0.0.0/24"},
+            subnets_count=2
+        )
+
+        self.assertEqual(
+            [{"network": dict(networks[0], subnets=["subnet-0", "subnet-1"]),
+              "routers": [routers[0]],
+              "subnets": subnets[:2]},
+             {"network": dict(networks[1], subnets=["subnet-2", "subnet-3"]),
+              "routers": [routers[1]],
+              "subnets": subnets[2:]}],
+            topologies
+        )
+        self.nc.create_network.assert_called_once_with(
+            {"networks": [{"name": "s-1"}, {"name": "s-2"}]})
+        self.nc.create_subnet.assert_called_once_with({"subnets": [
+            {"name": "s-%s" % i, "network_id": net_id, "ip_version": 4,
+             "cidr": "10.0.0.0/24",
+             "dns_nameservers": self.neutron.IPv4_DEFAULT_DNS_NAMESERVERS}
+            for i, net_id in ((5, "net-1"), (6, "net-1"),
+                              (7, "net-2"), (8, "net-2"))]})
+        self.assertEqual(
+            [mock.call(routers[0]["id"], {"subnet_id": "subnet-0"}),
+             mock.call(routers[0]["id"], {"subnet_id": "subnet-1"}),
+             mock.call(routers[1]["id"], {"subnet_id": "subnet-2"}),
+             mock.call(routers[1]["id"], {"subnet_id": "subnet-3"})],
+            self.nc.add_interface_router.call_args_list
+        )
+
     def test_delete_network_topology(self):
         topo = {
             "network": {"id": "net-id"},
@@ -247,6 +288,41 @@ class NeutronServiceTestCase(test.TestCase):
         self.assertEqual([net1, net2], self.neutron.list_networks())
         self.nc.list_networks.assert_called_once_with()
 
+    def test_create_networks(self):
+        networks = [{"id": "net-1"}, {"id": "net-2"}]
+        self.nc.create_network.return_value = {"networks": networks}
+
+        self.assertEqual(
+            networks,
+            self.neutron.create_networks(2, project_id="project-id"))
+        self.nc.create_network.assert_called_once_with({"networks": [
+            {"name": "s-1", "tenant_id": "project-id"},
+            {"name": "s-2", "tenant_id": "project-id"}]})
+        self._test_atomic_action_timer(self.atomic_inst,
+                                       "neutron.create_networks")
+
+    def test_create_subnets(self):
+        subnets = [{"id": "subnet-1"}, {"id": "subnet-2"}]
+        self.nc.create_subnet.return_value = {"subnets": subnets}
+        subnets_args = [
+            {"network_id": "net-id", "cidr": "10.0.0.0/24",
+             "router_id": "router-id"},
+            {"network_id": "net-id", "cidr": "10.0.1.0/24"}
+        ]
+
+        self.assertEqual(subnets, self.neutron.create_subnets(subnets_args))
+        self.nc.create_subnet.assert_called_once_with({"subnets": [
+            {"name": "s-%s" % i, "network_id": "net-id", "ip_version": 4,
+             "cidr": cidr,
+             "dns_nameservers": self.neutron.IPv4_DEFAULT_DNS_NAMESERVERS}
+            for i, cidr in ((1, "10.0.0.0/24"), (2, "10.0.1.0/24"))]})
+        self.nc.add_interface_router.assert_called_once_with(
+            "router-id", {"subnet_id": "subnet-1"})
+        # arguments of the caller should not be modified
+        self.assertIn("router_id", subnets_args[0])
+        self._test_atomic_action_timer(self.atomic_inst,
+                                       "neutron.create_subnets")
+
     @mock.patch("%s.net_utils.generate_cidr" % PATH)
     def test_create_subnet(self, mock_generate_cidr):
         net_id = "net-id"
@@ -1178,6 +1254,28 @@ class NeutronServiceTestCase(test.TestCase):
             }}
         )
 
+    def test_create_security_group_rules(self):
+        rules = ["foo", "bar"]
+        self.nc.create_security_group_rule.return_value = {
+            "security_group_rules": rules}
+
+        self.assertEqual(
+            rules,
+            self.neutron.create_security_group_rules(
+                security_group_id="sg1",
+                rules=[{}, {"protocol": "icmp", "ethertype": "IPv4"}])
+        )
+        self.nc.create_security_group_rule.assert_called_once_with(
+            {"security_group_rules": [
+                {"security_group_id": "sg1", "direction": "ingress",
+                 "protocol": "tcp"},
+                {"security_group_id": "sg1", "direction": "ingress",
+                 "protocol": "icmp", "ethertype": "IPv4"}
+            ]}
+        )
+        self._test_atomic_action_timer(
+            self.atomic_inst, "neutron.create_security_group_rules")
+
     def test_get_security_group_rule(self):
         security_group_rule = "foo"
         self.nc.show_security_group_rule.return_value = {
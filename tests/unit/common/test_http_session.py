@@ -0,0 +1,49 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from rally_openstack.common import http_session
+from tests.unit import test
+
+
+class HTTPSessionTestCase(test.TestCase):
+
+    @mock.patch("rally_openstack.common.http_session.os.getpid")
+    def test_get_session_per_process(self, mock_getpid):
+        self.addCleanup(http_session._adapters.clear)
+        mock_getpid.return_value = 1
+        first = http_session.get_session()
+        second = http_session.get_session()
+        self.assertIsNot(first, second)
+        self.assertIs(first.get_adapter("http://grafana"),
+                      second.get_adapter("http://grafana"))
+        self.assertIs(first.get_adapter("http://grafana"),
+                      first.get_adapter("https://grafana"))
+
+        mock_getpid.return_value = 2
+        self.assertIsNot(
+            first.get_adapter("http://grafana"),
+            http_session.get_session().get_adapter("http://grafana"))
+
+    def test_get_session_per_tls_settings(self):
+        self.addCleanup(http_session._adapters.clear)
+        first = http_session.get_session(cacert="ca", cert=["c", "k"])
+        self.assertIs(
+            first.get_adapter("https://auth_url"),
+            http_session.get_session(
+                cacert="ca", cert=("c", "k")).get_adapter("https://auth_url"))
+        self.assertIsNot(
+            first.get_adapter("https://auth_url"),
+            http_session.get_session(
+                cacert="ca", insecure=True,
+                cert=("c", "k")).get_adapter("https://auth_url"))
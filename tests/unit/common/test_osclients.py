@@ -256,10 +256,12 @@ class TestCreateKeystoneClient(test.TestCase, OSClientTestCaseUtils):
                 domain_name=None, project_domain_name=None,
                 user_domain_name=None)
         self.assertEqual(
-            [mock.call(timeout=180.0, verify=True, cert=None),
+            [mock.call(timeout=180.0, verify=True, cert=None,
+                       session=mock.ANY),
              mock.call(auth=self.ksa_identity_plugin, timeout=180.0,
                        verify=True, cert=None,
-                       discovery_cache=credential.discovery_cache)],
+                       discovery_cache=credential.discovery_cache,
+                       session=mock.ANY)],
             self.ksa_session.Session.call_args_list
         )
 
@@ -1127,10 +1129,12 @@ class ClientsContainerTestCase(test.TestCase):
         self.assertFalse(plugin.invalidate.called)
 
     def test_refresh_token_refreshes_when_expiring(self):
+        self.addCleanup(osclients._auth_states.clear)
         self.credential.auth = "auth-state"
         clients = osclients.Clients(self.credential)
         keystone = mock.Mock()
         plugin = mock.Mock()
+        plugin.get_auth_state.return_value = "new-auth-state"
         keystone.get_session.return_value = ("session", plugin)
         plugin.get_access.return_value.will_expire_soon.return_value = True
         clients.cache["client:keystone"] = keystone
@@ -1140,6 +1144,44 @@ class ClientsContainerTestCase(test.TestCase):
         plugin.invalidate.assert_called_once_with()
         # get_access is called again after invalidation
         self.assertEqual(2, plugin.get_access.call_count)
+        self.assertEqual("new-auth-state", self.credential.auth)
+        self.assertEqual(
+            {self.credential.auth_key(): "new-auth-state"},
+            osclients._auth_states)
+
+    def test_refresh_token_reuses_refreshed_auth_state(self):
+        self.addCleanup(osclients._auth_states.clear)
+        osclients._auth_states[self.credential.auth_key()] = "new-auth-state"
+        self.credential.auth = "auth-state"
+        clients = osclients.Clients(self.credential)
+        clients.cache["keystone_auth_ref"] = "old-auth-ref"
+        keystone = mock.Mock()
+        plugin = mock.Mock()
+        keystone.get_session.return_value = ("session", plugin)
+        plugin.get_access.return_value.will_expire_soon.return_value = False
+        clients.cache["client:keystone"] = keystone
+
+        clients.refresh_token_if_needed()
+
+        plugin.set_auth_state.assert_called_once_with("new-auth-state")
+        self.assertEqual("new-auth-state", self.credential.auth)
+        self.assertNotIn("keystone_auth_ref", clients.cache)
+        self.assertFalse(plugin.invalidate.called)
+
+    @mock.patch("%s.CONF" % PATH)
+    def test__get_refresh_margin(self, mock_conf):
+        mock_conf.openstack_client_token_refresh_margin = 600
+        mock_conf.openstack_client_token_refresh_jitter = 0.5
+        margins = [osclients._get_refresh_margin(("user-%s" % i,))
+                   for i in range(20)]
+        for margin in margins:
+            self.assertTrue(600 <= margin <= 900)
+        self.assertGreater(len(set(margins)), 1)
+        self.assertEqual(margins[0],
+                         osclients._get_refresh_margin(("user-0",)))
+
+        mock_conf.openstack_client_token_refresh_jitter = 0
+        self.assertEqual(600, osclients._get_refresh_margin(("user-0",)))
 
     def test_create_from_env_unavailable(self):
         with mock.patch(
@@ -0,0 +1,159 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from rally.common import cfg
+
+from rally_openstack.common import polling
+from tests.unit import test
+
+
+CONF = cfg.CONF
+PATH = "rally_openstack.common.polling"
+
+
+class WaitForStatusTestCase(test.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # waits of tests are not scoped to a workload
+        polling.set_workload(None)
+
+    def _set_policy(self, policy):
+        CONF.set_override("poll_policy", policy, "openstack")
+        self.addCleanup(CONF.clear_override, "poll_policy", "openstack")
+
+    def test_get_policy(self):
+        self.assertIsNone(polling.get_policy(3, key="foo"))
+        self._set_policy("learned")
+        policy = polling.get_policy(3, key="foo")
+        self.assertIsInstance(policy, polling.LearnedPolicy)
+        self.assertEqual((None, "foo"), policy._key)
+
+    @mock.patch("rally.task.utils.wait_for_status")
+    def test_wait_for_status_fixed(self, mock_wait_for_status):
+        resource = mock.Mock()
+        update_resource = mock.Mock()
+
+        self.assertEqual(
+            mock_wait_for_status.return_value,
+            polling.wait_for_status(resource, ready_statuses=["ACTIVE"],
+                                    update_resource=update_resource,
+                                    check_interval=3))
+        mock_wait_for_status.assert_called_once_with(
+            resource, ready_statuses=["ACTIVE"],
+            update_resource=update_resource, check_interval=3)
+
+    @mock.patch("%s.random.uniform" % PATH, return_value=0)
+    @mock.patch("%s.time.sleep" % PATH)
+    def test_wait_for_status_exponential(self, mock_sleep, mock_uniform):
+        self._set_policy("exponential")
+        statuses = ["BUILD", "BUILD", "BUILD", "ACTIVE"]
+        update_resource = mock.Mock(
+            side_effect=[mock.Mock(status=s) for s in statuses])
+
+        resource = polling.wait_for_status(
+            mock.Mock(status="BUILD"), ["ACTIVE"],
+            update_resource=update_resource, check_interval=8, timeout=60)
+
+        self.assertEqual("ACTIVE", resource.status)
+        self.assertEqual(4, update_resource.call_count)
+        self.assertEqual(
+            [mock.call(0.5), mock.call(1), mock.call(2)],
+            [c for c in mock_sleep.call_args_list if c != mock.call(0)])
+
+    @mock.patch("%s.time.sleep" % PATH)
+    def test_wait_for_status_learned(self, mock_sleep):
+        self._set_policy("learned")
+        self.addCleanup(polling._durations.clear)
+
+        for i in range(2):
+            polling.wait_for_status(
+                mock.Mock(status="BUILD"), ["active"],
+                update_resource=mock.Mock(return_value=mock.Mock(
+                    status="ACTIVE")),
+                check_interval=2)
+
+        self.assertEqual(
+            [(None, ("Mock", "status", frozenset(["ACTIVE"]), 2))],
+            list(polling._durations))
+
+
+class PolicyTestCase(test.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # waits of tests are not scoped to a workload
+        polling.set_workload(None)
+
+    @mock.patch("%s.random.uniform" % PATH, return_value=0)
+    def test_exponential(self, mock_uniform):
+        policy = polling.ExponentialPolicy(8)
+        self.assertEqual([0.5, 1, 2, 4, 8, 16, 32, 32],
+                         [policy.next_delay(0) for i in range(8)])
+        mock_uniform.assert_called_with(0, 32)
+
+    @mock.patch.dict("%s._durations" % PATH, {(None, "boot"): 40})
+    @mock.patch("%s.random.uniform" % PATH, return_value=0)
+    def test_learned(self, mock_uniform):
+        policy = polling.LearnedPolicy(8, key="boot")
+        self.assertEqual(20, policy.next_delay(0))
+        self.assertEqual(1, policy.next_delay(39))
+        # the expected time passed
+        self.assertEqual(0.5, policy.next_delay(41))
+        self.assertEqual(1, policy.next_delay(42))
+
+        policy.finished(60)
+        self.assertEqual(46, polling._durations[(None, "boot")])
+
+        policy = polling.LearnedPolicy(8, key="delete")
+        self.assertEqual(0.5, policy.next_delay(0))
+        policy.finished(10)
+        self.assertEqual(10, polling._durations[(None, "delete")])
+
+    @mock.patch.dict("%s._durations" % PATH, {(None, "boot"): 40})
+    def test_learned_per_workload(self):
+        polling.set_workload("w1")
+        # durations of other workloads are dropped
+        self.assertEqual({}, polling._durations)
+        polling.LearnedPolicy(8, key="boot").finished(30)
+        self.assertEqual({("w1", "boot"): 30}, polling._durations)
+
+        polling.set_workload("w2")
+        self.assertIsNone(polling.LearnedPolicy(8, key="boot")._expected)
+        self.assertEqual({}, polling._durations)
+
+
+class WaitForResultTestCase(test.TestCase):
+
+    @mock.patch("%s.commonutils.interruptable_sleep" % PATH)
+    @mock.patch("%s.time.time" % PATH)
+    def test_wait_for_result(self, mock_time, mock_interruptable_sleep):
+        mock_time.side_effect = [100, 101, 103, 106]
+        check = mock.Mock(side_effect=[0, 0, 3])
+
+        self.assertEqual(3, polling.wait_for_result(check, 8, timeout=60))
+        self.assertEqual([mock.call(1), mock.call(2)],
+                         mock_interruptable_sleep.call_args_list)
+
+    @mock.patch("%s.commonutils.interruptable_sleep" % PATH)
+    @mock.patch("%s.time.time" % PATH)
+    def test_wait_for_result_timeout(self, mock_time,
+                                     mock_interruptable_sleep):
+        mock_time.side_effect = [100, 109, 110]
+        check = mock.Mock(return_value=None)
+
+        self.assertIsNone(polling.wait_for_result(check, 8, timeout=10))
+        # the last sleep doesn't exceed the timeout
+        mock_interruptable_sleep.assert_called_once_with(1)
+        self.assertEqual(2, check.call_count)
@@ -32,6 +32,15 @@ class ResourceDecoratorTestCase(test.TestCase):
 
         self.assertEqual("service", Fake._service)
         self.assertEqual("res", Fake._resource)
+        self.assertIsNone(Fake._delete_before)
+
+    def test_resource_delete_before(self):
+
+        @base.resource("service", "res", delete_before=["other"])
+        class Fake:
+            pass
+
+        self.assertEqual(("other",), Fake._delete_before)
 
 
 class ResourceManagerTestCase(test.TestCase):
@@ -120,3 +129,10 @@ class ResourceManagerTestCase(test.TestCase):
         base.ResourceManager().list()
         mock_resource_manager__manager.assert_has_calls(
             [mock.call(), mock.call().list()])
+
+    @mock.patch("%s.ResourceManager._manager" % BASE)
+    def test_bulk_delete(self, mock_resource_manager__manager):
+        self.assertEqual(0, base.ResourceManager._bulk_delete_size)
+        self.assertEqual(
+            ["a", "b"], base.ResourceManager().bulk_delete(("a", "b")))
+        self.assertFalse(mock_resource_manager__manager.called)
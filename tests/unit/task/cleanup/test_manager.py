@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
 from unittest import mock
 
 from rally.common import utils
@@ -25,6 +26,42 @@ from tests.unit import test
 BASE = "rally_openstack.task.cleanup.manager"
 
 
+class NameMatcherTestCase(test.TestCase):
+
+    class Default(utils.RandomNameGeneratorMixin):
+        pass
+
+    class Custom(utils.RandomNameGeneratorMixin):
+        RESOURCE_NAME_FORMAT = "c.XXXX+XXXX.x"
+        RESOURCE_NAME_ALLOWED_CHARACTERS = "ab-"
+
+    def test_match(self):
+        classes = [self.Default, self.Custom, self.Default]
+        names = ["rally_6e2f6a5c_abcdefgh", "rally_6e2f6a5c_abcdefgh-1",
+                 "rally_6e2f6a5d_abcdefgh", "rally_6e2f6a5c_abcdefg",
+                 "xrally_6e2f6a5c_abcdefgh", "c.ab-a+b-ba.x", "c.ab-a+b-ba.xy",
+                 "c.ab-a+b-bc.x", "c.abcd+b-ba.x", "foo", ""]
+        for task_id in ("6e2f6a5c-8d7e-4a8f-9b3c-1234567890ab", None):
+            for exact in (True, False):
+                matcher = manager.NameMatcher(classes, task_id=task_id,
+                                              exact=exact)
+                for name in names:
+                    self.assertEqual(
+                        utils.name_matches_object(
+                            name, *classes, task_id=task_id, exact=exact),
+                        matcher.match(name),
+                        "%s %s %s" % (name, task_id, exact))
+
+    def test_match_without_classes(self):
+        self.assertFalse(manager.NameMatcher([]).match("rally_aaa_bbb"))
+
+    def test_invalid_format(self):
+        class Invalid(utils.RandomNameGeneratorMixin):
+            RESOURCE_NAME_FORMAT = "invalid"
+
+        self.assertRaises(ValueError, manager.NameMatcher, [Invalid])
+
+
 class SeekAndDestroyTestCase(test.TestCase):
 
     def setUp(self):
@@ -61,6 +98,19 @@ class SeekAndDestroyTestCase(test.TestCase):
         # NOTE(boris-42): No logs and no exceptions means no bugs!
         self.assertEqual(0, mock_log.call_count)
 
+    @mock.patch("%s.rutils.interruptable_sleep" % BASE)
+    def test__delete_single_resource_deleted_at_once(
+            self, mock_interruptable_sleep):
+        mock_resource = mock.MagicMock(_max_attempts=3, _timeout=10,
+                                       _interval=1)
+        mock_resource.is_deleted.return_value = True
+
+        self.assertTrue(manager.SeekAndDestroy(
+            None, None, None)._delete_single_resource(mock_resource))
+
+        mock_resource.is_deleted.assert_called_once_with()
+        self.assertFalse(mock_interruptable_sleep.called)
+
     @mock.patch("%s.LOG" % BASE)
     def test__delete_single_resource_timeout(self, mock_log):
 
@@ -207,16 +257,16 @@ class SeekAndDestroyTestCase(test.TestCase):
         self.assertTrue(mock_log.warning.mock_called)
         self.assertTrue(mock_log.exception.mock_called)
 
-    @mock.patch("rally.common.utils.name_matches_object")
+    @mock.patch("%s.NameMatcher" % BASE)
     @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
     @mock.patch("%s.SeekAndDestroy._delete_single_resource" % BASE)
     def test__consumer(self, mock__delete_single_resource,
                        mock__get_cached_client,
-                       mock_name_matches_object):
-        mock_mgr = mock.MagicMock(__name__="Test")
+                       mock_name_matcher):
+        mock_mgr = mock.MagicMock(__name__="Test", _bulk_delete_size=0)
         resource_classes = [mock.Mock()]
         task_id = "task_id"
-        mock_name_matches_object.return_value = True
+        mock_name_matcher.return_value.match.return_value = True
 
         consumer = manager.SeekAndDestroy(
             mock_mgr, None, None,
@@ -239,11 +289,14 @@ class SeekAndDestroyTestCase(test.TestCase):
         ])
         mock__delete_single_resource.assert_called_once_with(
             mock_mgr.return_value)
+        mock_name_matcher.assert_called_once_with(resource_classes,
+                                                  task_id=task_id)
+        mock_name_matcher.return_value.match.assert_called_once_with(
+            mock_mgr.return_value.name.return_value)
 
         mock_mgr.reset_mock()
         mock__get_cached_client.reset_mock()
         mock__delete_single_resource.reset_mock()
-        mock_name_matches_object.reset_mock()
 
         consumer(cache, (admin, None, "res2"))
         mock_mgr.assert_called_once_with(
@@ -259,16 +312,13 @@ class SeekAndDestroyTestCase(test.TestCase):
         mock__delete_single_resource.assert_called_once_with(
             mock_mgr.return_value)
 
-    @mock.patch("rally.common.utils.name_matches_object")
     @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
     @mock.patch("%s.SeekAndDestroy._delete_single_resource" % BASE)
     def test__consumer_with_noname_resource(self, mock__delete_single_resource,
-                                            mock__get_cached_client,
-                                            mock_name_matches_object):
-        mock_mgr = mock.MagicMock(__name__="Test")
-        mock_mgr.return_value.name.return_value = True
+                                            mock__get_cached_client):
+        mock_mgr = mock.MagicMock(__name__="Test", _bulk_delete_size=0)
+        mock_mgr.return_value.name.return_value = "foo"
         task_id = "task_id"
-        mock_name_matches_object.return_value = False
 
         consumer = manager.SeekAndDestroy(mock_mgr, None, None,
                                           task_id=task_id)._consumer
@@ -281,17 +331,323 @@ class SeekAndDestroyTestCase(test.TestCase):
         mock__delete_single_resource.assert_called_once_with(
             mock_mgr.return_value)
 
-    @mock.patch("%s.broker.run" % BASE)
-    def test_exterminate(self, mock_broker_run):
+    def test_exterminate(self):
         manager_cls = mock.MagicMock(_threads=5)
         cleaner = manager.SeekAndDestroy(manager_cls, None, None)
-        cleaner._publisher = mock.Mock()
+        cleaner._publisher = mock.Mock(
+            side_effect=lambda queue: [queue.append(i) for i in range(100)])
         cleaner._consumer = mock.Mock()
         cleaner.exterminate()
 
-        mock_broker_run.assert_called_once_with(cleaner._publisher,
-                                                cleaner._consumer,
-                                                consumers_count=5)
+        self.assertEqual(
+            list(range(100)),
+            sorted(c[0][1] for c in cleaner._consumer.call_args_list))
+
+    @mock.patch("%s.LOG" % BASE)
+    def test__run_broker_deletes_while_listing(self, mock_log):
+        cleaner = manager.SeekAndDestroy(mock.MagicMock(_threads=2),
+                                         None, None)
+        consumed = threading.Event()
+        waited = []
+
+        def publisher(queue):
+            queue.append("res1")
+            # the listing goes on after the first resource is deleted
+            waited.append(consumed.wait(timeout=10))
+            queue.append("res2")
+            raise Exception("listing failed")
+
+        def consumer(cache, job):
+            consumed.set()
+            if job == "res2":
+                raise Exception("deletion failed")
+
+        cleaner._publisher = publisher
+        cleaner._consumer = mock.Mock(side_effect=consumer)
+        cleaner._run_broker()
+
+        self.assertEqual([True], waited)
+        self.assertEqual(
+            ["res1", "res2"],
+            [c[0][1] for c in cleaner._consumer.call_args_list])
+        self.assertEqual(2, mock_log.warning.call_count)
+
+    @mock.patch("%s.broker.run" % BASE)
+    def test__run_broker_workers(self, mock_broker_run):
+        cleaner = manager.SeekAndDestroy(mock.MagicMock(_threads=3),
+                                         None, None)
+        cleaner._run_broker()
+
+        publish, consume = mock_broker_run.call_args[0]
+        self.assertEqual({"consumers_count": 4},
+                         mock_broker_run.call_args[1])
+        queue = []
+        publish(queue)
+        # one publisher and three consumers
+        self.assertEqual(4, len(queue))
+        self.assertNotEqual(queue[0], queue[1])
+        self.assertEqual([queue[1]] * 3, queue[1:])
+        worker = mock.Mock()
+        consume({}, worker)
+        worker.assert_called_once_with()
+
+    def _batched_destroyer(self, manager_cls, admin=None, users=None):
+        with mock.patch("%s.CONF" % BASE) as mock_conf:
+            mock_conf.openstack.cleanup_batched_deletion_check = True
+            return manager.SeekAndDestroy(manager_cls, admin, users)
+
+    def test_batched_deletion_check_only_for_default_is_deleted(self):
+        class FakeManager(base.ResourceManager):
+            pass
+
+        class FakeManagerWithCheck(base.ResourceManager):
+            def is_deleted(self):
+                return True
+
+        self.assertTrue(
+            self._batched_destroyer(FakeManager)._batched_deletion_check)
+        self.assertFalse(
+            self._batched_destroyer(
+                FakeManagerWithCheck)._batched_deletion_check)
+        self.assertFalse(
+            manager.SeekAndDestroy(
+                FakeManager, None, None)._batched_deletion_check)
+
+    @mock.patch("%s.NameMatcher.match" % BASE, return_value=True)
+    @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
+    @mock.patch("%s.SeekAndDestroy._delete_single_resource" % BASE)
+    def test__consumer_batched(self, mock__delete_single_resource,
+                               mock__get_cached_client,
+                               mock_name_matcher_match):
+        mock_mgr = mock.MagicMock(__name__="Test", _bulk_delete_size=0)
+        mock_mgr.return_value.id.side_effect = ["id1", "id1", "id2", "id2",
+                                                "id3", "id3"]
+        mock__delete_single_resource.side_effect = [True, True, False]
+        destroyer = self._batched_destroyer(mock_mgr)
+        destroyer._batched_deletion_check = True
+
+        user = {"id": "a", "tenant_id": "uuid1"}
+        destroyer._consumer(None, ("admin", user, "res1"))
+        destroyer._consumer(None, ("admin", None, "res2"))
+        destroyer._consumer(None, ("admin", user, "res3"))
+
+        mock__delete_single_resource.assert_has_calls(
+            [mock.call(mock_mgr.return_value, wait=False)] * 3)
+        self.assertEqual({("uuid1", "a"), (None, None)},
+                         set(destroyer._pending_deletions))
+        self.assertEqual(
+            ["id1"],
+            list(destroyer._pending_deletions[("uuid1", "a")]["resources"]))
+        self.assertEqual(
+            ["id2"],
+            list(destroyer._pending_deletions[(None, None)]["resources"]))
+
+    @mock.patch("%s.NameMatcher.match" % BASE, return_value=True)
+    @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
+    @mock.patch("%s.SeekAndDestroy._bulk_delete" % BASE)
+    def test__consumer_bulk(self, mock__bulk_delete, mock__get_cached_client,
+                            mock_name_matcher_match):
+        mock_mgr = mock.MagicMock(__name__="Test", _bulk_delete_size=2)
+        destroyer = manager.SeekAndDestroy(mock_mgr, None, None)
+
+        user = {"id": "a", "tenant_id": "uuid1"}
+        destroyer._consumer(None, ("admin", user, "res1"))
+        destroyer._consumer(None, ("admin", None, "res2"))
+        self.assertFalse(mock__bulk_delete.called)
+        destroyer._consumer(None, ("admin", user, "res3"))
+
+        mock__bulk_delete.assert_called_once_with(
+            "admin", user, ["res1", "res3"])
+        self.assertEqual(
+            {(None, None): {"admin": "admin", "user": None,
+                            "resources": ["res2"]}},
+            destroyer._bulk_deletions)
+
+    @mock.patch("%s.LOG" % BASE)
+    @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
+    @mock.patch("%s.SeekAndDestroy._delete_single_resource" % BASE)
+    def test__bulk_delete(self, mock__delete_single_resource,
+                          mock__get_cached_client, mock_log):
+        mock_mgr = mock.MagicMock(__name__="Test")
+        mock_mgr.return_value.bulk_delete.return_value = ["res2"]
+        destroyer = manager.SeekAndDestroy(mock_mgr, None, None)
+        user = {"id": "a", "tenant_id": "uuid1"}
+
+        destroyer._bulk_delete("admin", user, ["res1", "res2"])
+
+        mock_mgr.return_value.bulk_delete.assert_called_once_with(
+            ["res1", "res2"])
+        mock_client = mock__get_cached_client.return_value
+        mock_mgr.assert_called_with(resource="res2", admin=mock_client,
+                                    user=mock_client, tenant_uuid="uuid1")
+        mock__delete_single_resource.assert_called_once_with(
+            mock_mgr.return_value)
+
+        # everything is deleted one by one if bulk deletion fails
+        mock__delete_single_resource.reset_mock()
+        mock_mgr.return_value.bulk_delete.side_effect = Exception
+        destroyer._bulk_delete("admin", user, ["res1", "res2"])
+        self.assertEqual(2, mock__delete_single_resource.call_count)
+        self.assertEqual(1, mock_log.warning.call_count)
+
+        # one manager is used for all batches of the user
+        bulk_manager_calls = [c for c in mock_mgr.call_args_list
+                              if "resource" not in c[1]]
+        self.assertEqual(
+            [mock.call(admin=mock_client, user=mock_client,
+                       tenant_uuid="uuid1")],
+            bulk_manager_calls)
+
+    @mock.patch("%s.SeekAndDestroy._bulk_delete" % BASE)
+    def test_exterminate_bulk(self, mock__bulk_delete):
+        cleaner = manager.SeekAndDestroy(
+            mock.MagicMock(_threads=5), None, None)
+        batch = {"admin": "admin", "user": None, "resources": ["res"]}
+
+        def publisher(queue):
+            cleaner._bulk_deletions[(None, None)] = batch
+
+        cleaner._publisher = publisher
+        cleaner.exterminate()
+
+        mock__bulk_delete.assert_called_once_with("admin", None, ["res"])
+        self.assertEqual({}, cleaner._bulk_deletions)
+
+    @mock.patch("%s.SeekAndDestroy._get_cached_client" % BASE)
+    def test__list_existing_ids(self, mock__get_cached_client):
+        mock_mgr = mock.MagicMock()
+        mock_mgr.return_value.list.return_value = [
+            {"id": "a", "status": "ACTIVE"},
+            {"id": "b", "status": "deleted"},
+            {"id": "c", "status": "DELETE_COMPLETE"},
+            {"id": "d", "status": "DELETING"}]
+        mock_mgr.return_value.id.side_effect = ["a", "d"]
+        destroyer = manager.SeekAndDestroy(mock_mgr, None, None)
+
+        user = {"id": "u", "tenant_id": "t"}
+        self.assertEqual({"a", "d"},
+                         destroyer._list_existing_ids("admin", user))
+        mock_client = mock__get_cached_client.return_value
+        mock_mgr.assert_any_call(admin=mock_client, user=mock_client,
+                                 tenant_uuid="t")
+        mock_mgr.assert_any_call(resource={"id": "a", "status": "ACTIVE"},
+                                 admin=mock_client, user=mock_client,
+                                 tenant_uuid="t")
+
+    @mock.patch("%s.LOG" % BASE)
+    @mock.patch("%s.SeekAndDestroy._list_existing_ids" % BASE)
+    def test__wait_for_pending_deletions(self, mock__list_existing_ids,
+                                         mock_log):
+        mock_mgr = mock.MagicMock(__name__="Test", _timeout=10, _interval=0,
+                                  _max_attempts=3)
+        destroyer = manager.SeekAndDestroy(mock_mgr, None, None)
+        user = {"id": "u", "tenant_id": "t"}
+        destroyer._pending_deletions = {
+            ("t", "u"): {"admin": "admin", "user": user,
+                         "resources": {"a": {}, "b": {}}},
+            (None, None): {"admin": "admin", "user": None,
+                           "resources": {"c": {}}}}
+        mock__list_existing_ids.side_effect = [{"a", "b", "x"}, set(),
+                                               Exception, {"x"}]
+
+        destroyer._wait_for_pending_deletions()
+
+        self.assertEqual({}, destroyer._pending_deletions)
+        mock__list_existing_ids.assert_has_calls(
+            [mock.call("admin", user), mock.call("admin", None),
+             mock.call("admin", user), mock.call("admin", user)])
+        self.assertEqual(1, mock_log.exception.call_count)
+        self.assertFalse(mock_log.warning.called)
+
+    @mock.patch("%s.LOG" % BASE)
+    @mock.patch("%s.SeekAndDestroy._list_existing_ids" % BASE)
+    def test__wait_for_pending_deletions_timeout(self, mock__list_existing_ids,
+                                                 mock_log):
+        mock_mgr = mock.MagicMock(_timeout=0.02, _interval=0.025,
+                                  _max_attempts=3)
+        destroyer = manager.SeekAndDestroy(mock_mgr, None, None)
+        destroyer._pending_deletions = {
+            (None, None): {"admin": "admin", "user": None,
+                           "resources": {"a": {"service": "s",
+                                               "resource": "r",
+                                               "uuid": "a"}}}}
+        mock__list_existing_ids.return_value = {"a"}
+
+        destroyer._wait_for_pending_deletions()
+
+        mock__list_existing_ids.assert_called_once_with("admin", None)
+        mock_log.warning.assert_called_once_with(
+            "Resource deletion failed, timeout occurred for s.r: a.")
+        self.assertEqual({}, destroyer._pending_deletions)
+
+    @mock.patch("%s.SeekAndDestroy._run_broker" % BASE)
+    @mock.patch("%s.SeekAndDestroy._wait_for_pending_deletions" % BASE)
+    def test_exterminate_batched(self, mock__wait_for_pending_deletions,
+                                 mock__run_broker):
+        cleaner = manager.SeekAndDestroy(mock.MagicMock(_threads=5),
+                                         None, None)
+        cleaner.exterminate()
+        self.assertFalse(mock__wait_for_pending_deletions.called)
+
+        cleaner._batched_deletion_check = True
+        cleaner.exterminate()
+        mock__wait_for_pending_deletions.assert_called_once_with()
+        self.assertEqual(2, mock__run_broker.call_count)
+
+
+class RunByDependenciesTestCase(test.TestCase):
+
+    def _mgr(self, service, resource, order, delete_before=None):
+        return mock.MagicMock(_service=service, _resource=resource,
+                              _order=order, _delete_before=delete_before)
+
+    def test__must_be_deleted_before(self):
+        barrier = self._mgr("keystone", "user", 10)
+        nova = self._mgr("nova", "servers", 1, ("neutron", "cinder.volumes"))
+        nova_keypairs = self._mgr("nova", "keypairs", 2, ())
+        neutron = self._mgr("neutron", "port", 3, ())
+        volumes = self._mgr("cinder", "volumes", 4, ())
+        backups = self._mgr("cinder", "backups", 5, ())
+        swift = self._mgr("swift", "object", 0, ())
+
+        self.assertTrue(manager._must_be_deleted_before(nova, nova_keypairs))
+        self.assertTrue(manager._must_be_deleted_before(nova, neutron))
+        self.assertTrue(manager._must_be_deleted_before(nova, volumes))
+        self.assertFalse(manager._must_be_deleted_before(nova, backups))
+        self.assertFalse(manager._must_be_deleted_before(neutron, nova))
+        self.assertFalse(manager._must_be_deleted_before(swift, nova))
+        self.assertFalse(manager._must_be_deleted_before(nova, swift))
+        for mgr in (nova, neutron, volumes, swift):
+            self.assertTrue(manager._must_be_deleted_before(mgr, barrier))
+            self.assertFalse(manager._must_be_deleted_before(barrier, mgr))
+
+    def test__run_by_dependencies(self):
+        servers = self._mgr("nova", "servers", 1, ("neutron",))
+        port = self._mgr("neutron", "port", 2, ())
+        network = self._mgr("neutron", "network", 3, ())
+        swift = self._mgr("swift", "object", 4, ())
+        users = self._mgr("keystone", "user", 5)
+
+        order = []
+        events = {"swift": threading.Event()}
+
+        def func(mgr):
+            if mgr is servers:
+                # swift doesn't depend on nova, so it should not wait
+                self.assertTrue(events["swift"].wait(5))
+            if mgr is swift:
+                events["swift"].set()
+            if mgr is port:
+                raise Exception("Failed")
+            order.append(mgr)
+
+        manager._run_by_dependencies(
+            [servers, port, network, swift, users], func, workers=3)
+
+        self.assertEqual(4, len(order))
+        self.assertEqual(users, order[-1])
+        self.assertLess(order.index(swift), order.index(servers))
+        self.assertLess(order.index(servers), order.index(network))
 
 
 class ResourceManagerTestCase(test.TestCase):
@@ -360,11 +716,12 @@ class ResourceManagerTestCase(test.TestCase):
                                                         admin_required=False))
 
     @mock.patch("rally.common.plugin.discover.itersubclasses")
+    @mock.patch("%s.NameMatcher" % BASE)
     @mock.patch("%s.SeekAndDestroy" % BASE)
     @mock.patch("%s.find_resource_managers" % BASE,
                 return_value=[mock.MagicMock(), mock.MagicMock()])
     def test_cleanup(self, mock_find_resource_managers, mock_seek_and_destroy,
-                     mock_itersubclasses):
+                     mock_name_matcher, mock_itersubclasses):
         class A(utils.RandomNameGeneratorMixin):
             pass
 
@@ -380,17 +737,47 @@ class ResourceManagerTestCase(test.TestCase):
 
         mock_find_resource_managers.assert_called_once_with(["a", "b"], True)
 
+        # one matcher is shared by all managers
+        mock_name_matcher.assert_called_once_with([A], task_id="task_id")
         mock_seek_and_destroy.assert_has_calls([
             mock.call(mock_find_resource_managers.return_value[0],
                       "admin",
                       ["user"],
                       resource_classes=[A],
-                      task_id="task_id"),
+                      task_id="task_id",
+                      name_matcher=mock_name_matcher.return_value),
             mock.call().exterminate(),
             mock.call(mock_find_resource_managers.return_value[1],
                       "admin",
                       ["user"],
                       resource_classes=[A],
-                      task_id="task_id"),
+                      task_id="task_id",
+                      name_matcher=mock_name_matcher.return_value),
             mock.call().exterminate()
         ])
+
+    @mock.patch("%s._run_by_dependencies" % BASE)
+    @mock.patch("%s.SeekAndDestroy" % BASE)
+    @mock.patch("%s.find_resource_managers" % BASE,
+                return_value=[mock.MagicMock(), mock.MagicMock()])
+    @mock.patch("%s.CONF" % BASE)
+    def test_cleanup_in_parallel(self, mock_conf, mock_find_resource_managers,
+                                 mock_seek_and_destroy,
+                                 mock__run_by_dependencies):
+        mock_conf.openstack.cleanup_resource_managers_workers = 4
+
+        manager.cleanup(names=["a"], admin="admin", users=["user"],
+                        superclass=utils.RandomNameGeneratorMixin,
+                        task_id="task_id")
+
+        self.assertFalse(mock_seek_and_destroy.called)
+        mock__run_by_dependencies.assert_called_once_with(
+            mock_find_resource_managers.return_value, mock.ANY, 4)
+
+        exterminate = mock__run_by_dependencies.call_args[0][1]
+        exterminate(mock_find_resource_managers.return_value[1])
+        mock_seek_and_destroy.assert_called_once_with(
+            mock_find_resource_managers.return_value[1], "admin", ["user"],
+            resource_classes=mock.ANY, task_id="task_id",
+            name_matcher=mock.ANY)
+        mock_seek_and_destroy.return_value.exterminate.assert_called_once_with()
@@ -641,15 +641,83 @@ class NeutronPortTestCase(test.TestCase):
             list_routers = mock.Mock()
 
         neutron = FakeNeutronClient
-        neutron.list_ports.return_value = {"ports": ports}
+        neutron.list_ports.side_effect = [
+            iter([{"ports": ports[:4],
+                   "ports_links": [{"rel": "next", "href": "..."}]}]),
+            iter([{"ports": ports[4:], "ports_links": []}])]
         neutron.list_routers.return_value = {"routers": routers}
 
         user = mock.Mock(neutron=neutron)
-        self.assertEqual(expected_ports, resources.NeutronPort(
-            user=user, tenant_uuid=tenant_uuid).list())
-        neutron.list_ports.assert_called_once_with(tenant_id=tenant_uuid)
+        self.assertEqual(expected_ports, list(resources.NeutronPort(
+            user=user, tenant_uuid=tenant_uuid).list()))
+        self.assertEqual(
+            [mock.call(retrieve_all=False, tenant_id=tenant_uuid,
+                       limit=1000),
+             mock.call(retrieve_all=False, tenant_id=tenant_uuid,
+                       limit=1000, marker="id4")],
+            neutron.list_ports.call_args_list)
         neutron.list_routers.assert_called_once_with(tenant_id=tenant_uuid)
 
+    def test_list_marker_deleted(self):
+        ports = [{"tenant_id": "t", "id": "id%s" % i, "name": "foo"}
+                 for i in range(6)]
+        neutron = mock.Mock()
+        next_link = [{"rel": "next", "href": "..."}]
+        neutron.list_ports.side_effect = [
+            iter([{"ports": ports[:3], "ports_links": next_link}]),
+            # ports id1 and id2 are deleted while the listing goes on
+            neutron_exceptions.PortNotFoundClient,
+            neutron_exceptions.PortNotFoundClient,
+            iter([{"ports": ports[3:5], "ports_links": next_link}]),
+            iter([{"ports": [], "ports_links": []}])]
+        user = mock.Mock()
+        user.neutron.return_value = neutron
+
+        self.assertEqual(ports[:5], list(resources.NeutronPort(
+            user=user, tenant_uuid="t")._list_ports()))
+        self.assertEqual(
+            [None, "id2", "id1", "id0", "id4"],
+            [c[1].get("marker") for c in neutron.list_ports.call_args_list])
+
+    def test_list_first_marker_deleted(self):
+        ports = [{"tenant_id": "t", "id": "id%s" % i, "name": "foo"}
+                 for i in range(3)]
+        neutron = mock.Mock()
+        next_link = [{"rel": "next", "href": "..."}]
+        neutron.list_ports.side_effect = [
+            iter([{"ports": ports[:1], "ports_links": next_link}]),
+            neutron_exceptions.PortNotFoundClient,
+            # the listing starts again and already listed ports are skipped
+            iter([{"ports": ports[1:], "ports_links": []}])]
+        user = mock.Mock()
+        user.neutron.return_value = neutron
+
+        self.assertEqual(ports, list(resources.NeutronPort(
+            user=user, tenant_uuid="t")._list_ports()))
+        self.assertEqual(
+            [None, "id0", None],
+            [c[1].get("marker") for c in neutron.list_ports.call_args_list])
+
+    @mock.patch("%s.CONF" % BASE)
+    def test_list_without_pagination(self, mock_conf):
+        mock_conf.openstack.neutron_ports_list_page_size = 0
+        neutron = mock.Mock()
+        # a failed request is retried
+        neutron.list_ports.side_effect = [
+            Exception,
+            iter([{"ports": [{"tenant_id": "t", "id": "id1",
+                              "name": "foo"}]}])]
+        user = mock.Mock()
+        user.neutron.return_value = neutron
+
+        self.assertEqual(
+            [{"tenant_id": "t", "id": "id1", "name": "foo"}],
+            list(resources.NeutronPort(user=user, tenant_uuid="t").list()))
+        self.assertEqual(
+            [mock.call(retrieve_all=False, tenant_id="t")] * 2,
+            neutron.list_ports.call_args_list)
+        self.assertFalse(neutron.list_routers.called)
+
 
 @ddt.ddt
 class NeutronSecurityGroupTestCase(test.TestCase):
@@ -913,16 +981,88 @@ class SwiftObjectTestCase(test.TestCase):
 
     @mock.patch("%s.SwiftMixin._manager" % BASE)
     def test_list(self, mock_swift_mixin__manager):
-        containers = [mock.MagicMock(), mock.MagicMock()]
-        objects = [mock.MagicMock(), mock.MagicMock(), mock.MagicMock()]
-        mock_swift_mixin__manager().get_account.return_value = (
-            "header", containers)
-        mock_swift_mixin__manager().get_container.return_value = (
-            "header", objects)
-        self.assertEqual(len(containers),
-                         len(resources.SwiftContainer().list()))
-        self.assertEqual(len(containers) * len(objects),
-                         len(resources.SwiftObject().list()))
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_account.return_value = (
+            "header", [{"name": "c1"}, {"name": "c2"}, {"name": "c3"}])
+        pages = {
+            ("c1", ""): [{"name": "o1"}, {"name": "o2"}],
+            ("c1", "o2"): [{"name": "o3"}],
+            ("c1", "o3"): [],
+            ("c2", ""): [],
+            ("c3", ""): [{"name": "o4"}],
+            ("c3", "o4"): []}
+        swift.get_container.side_effect = (
+            lambda container, marker: ("header", pages[(container, marker)]))
+
+        objects = resources.SwiftObject().list()
+
+        self.assertEqual(
+            [["c1", "o1"], ["c1", "o2"], ["c1", "o3"], ["c3", "o4"]],
+            sorted(objects))
+        self.assertEqual(len(pages), swift.get_container.call_count)
+
+    @mock.patch("%s.SwiftMixin._manager" % BASE)
+    def test_list_fails(self, mock_swift_mixin__manager):
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_account.return_value = ("header", [{"name": "c1"}])
+        swift.get_container.side_effect = ValueError
+
+        self.assertRaises(ValueError, list, resources.SwiftObject().list())
+        self.assertEqual(3, swift.get_container.call_count)
+
+    @mock.patch("%s.SwiftMixin._manager" % BASE)
+    def test_list_without_containers(self, mock_swift_mixin__manager):
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_account.return_value = ("header", [])
+
+        self.assertEqual([], list(resources.SwiftObject().list()))
+
+    @mock.patch("%s.SwiftMixin._manager" % BASE)
+    def test_bulk_delete(self, mock_swift_mixin__manager):
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_capabilities.return_value = {
+            "bulk_delete": {"max_deletes_per_request": 2}}
+        swift.post_account.side_effect = [
+            ({}, b'{"Errors": [["/c1/o%201", "409 Conflict"]]}'),
+            ({}, b'{"Errors": []}')]
+        raw_resources = [["c1", "o 1"], ["c1", "o2"], ["c2", "o3"]]
+
+        self.assertEqual(
+            [["c1", "o 1"]],
+            resources.SwiftObject().bulk_delete(raw_resources))
+
+        headers = {"Accept": "application/json",
+                   "Content-Type": "text/plain"}
+        self.assertEqual(
+            [mock.call(headers=headers, query_string="bulk-delete",
+                       data="/c1/o%201\n/c1/o2"),
+             mock.call(headers=headers, query_string="bulk-delete",
+                       data="/c2/o3")],
+            swift.post_account.call_args_list)
+
+    @mock.patch("%s.SwiftMixin._manager" % BASE)
+    def test_bulk_delete_not_supported(self, mock_swift_mixin__manager):
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_capabilities.return_value = {"swift": {}}
+        raw_resources = [["c1", "o1"]]
+
+        self.assertEqual(raw_resources,
+                         resources.SwiftObject().bulk_delete(raw_resources))
+        self.assertFalse(swift.post_account.called)
+
+    @mock.patch("%s.SwiftMixin._manager" % BASE)
+    def test_bulk_delete_caches_capabilities(self, mock_swift_mixin__manager):
+        swift = mock_swift_mixin__manager.return_value
+        swift.get_capabilities.return_value = {
+            "bulk_delete": {"max_deletes_per_request": 10}}
+        swift.post_account.return_value = ({}, b'{"Errors": []}')
+        swift_object = resources.SwiftObject()
+
+        swift_object.bulk_delete([["c1", "o1"]])
+        swift_object.bulk_delete([["c1", "o2"]])
+
+        swift.get_capabilities.assert_called_once_with()
+        self.assertEqual(2, swift.post_account.call_count)
 
 
 class SwiftContainerTestCase(test.TestCase):
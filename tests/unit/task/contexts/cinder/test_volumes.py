@@ -50,6 +50,8 @@ class VolumeGeneratorTestCase(test.ScenarioTestCase):
         self.assertEqual(inst.config, self.context["config"]["volumes"])
 
     @ddt.data({"config": {"size": 1, "volumes_per_tenant": 5}},
+              {"config": {"size": 1, "volumes_per_tenant": 5,
+                          "resource_management_workers": 2}},
               {"config": {"size": 1, "type": None, "volumes_per_tenant": 5}},
               {"config": {"size": 1, "type": -1, "volumes_per_tenant": 5},
                "valid": False})
@@ -94,6 +96,8 @@ class VolumeGeneratorTestCase(test.ScenarioTestCase):
         })
 
         new_context = copy.deepcopy(self.context)
+        new_context["config"]["volumes"].setdefault(
+            "resource_management_workers", 1)
         for id_ in tenants.keys():
             new_context["tenants"][id_].setdefault("volumes", [])
             for i in range(volumes_per_tenant):
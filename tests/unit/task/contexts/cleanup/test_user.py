@@ -75,12 +75,14 @@ class UserCleanupTestCase(test.TestCase):
                       None,
                       ctx["users"],
                       resource_classes=[ResourceClass],
-                      task_id="task_id"),
+                      task_id="task_id",
+                      name_matcher=mock.ANY),
             mock.call().exterminate(),
             mock.call(mock_find_resource_managers.return_value[1],
                       None,
                       ctx["users"],
                       resource_classes=[ResourceClass],
-                      task_id="task_id"),
+                      task_id="task_id",
+                      name_matcher=mock.ANY),
             mock.call().exterminate()
         ])
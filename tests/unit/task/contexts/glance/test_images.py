@@ -114,6 +114,7 @@ class ImageGeneratorTestCase(test.ScenarioTestCase):
             expected_image_args["min_disk"] = min_disk
 
         new_context = copy.deepcopy(self.context)
+        new_context["config"]["images"]["resource_management_workers"] = 1
         for tenant_id in new_context["tenants"].keys():
             new_context["tenants"][tenant_id]["images"] = [
                 image_service.create_image.return_value.id
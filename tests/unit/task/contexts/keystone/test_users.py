@@ -125,6 +125,31 @@ class UserGeneratorBaseTestCase(test.ScenarioTestCase):
         user_generator.use_existing_users.assert_called_once_with()
         self.assertFalse(user_generator.create_users.called)
 
+    def test__seed_auth_state(self):
+        creds = [oscredential.OpenStackCredential(
+            "https://example.com", "user-%s" % i, "pass", "tenant")
+            for i in (0, 1, 1)]
+        creds.append(oscredential.OpenStackCredential(
+            "https://example.com", "user-2", "pass", "tenant", auth="seeded"))
+        admin = oscredential.OpenStackCredential(
+            "https://example.com", "user-0", "pass", "tenant")
+        plugin = self.keystone.get_session.return_value[1]
+        plugin.get_auth_state.side_effect = ["state-a", "state-b"]
+
+        user_generator = users.UserGenerator(self.context)
+        self.context["users"] = [{"credential": c} for c in creds]
+        self.context["admin"] = {"credential": admin}
+        self.osclients.Clients.reset_mock()
+        user_generator._seed_auth_state()
+
+        # one authentication per distinct identity which is not seeded yet
+        self.assertEqual(2, self.osclients.Clients.call_count)
+        self.assertEqual(creds[0].auth, admin.auth)
+        self.assertEqual(creds[1].auth, creds[2].auth)
+        self.assertEqual({"state-a", "state-b"},
+                         {creds[0].auth, creds[1].auth})
+        self.assertEqual("seeded", creds[3].auth)
+
     def test_cleanup(self):
         user_generator = users.UserGenerator(self.context)
         user_generator._remove_default_security_group = mock.Mock()
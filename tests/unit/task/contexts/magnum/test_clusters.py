@@ -22,6 +22,7 @@ from tests.unit import test
 
 CTX = "rally_openstack.task.contexts.magnum"
 SCN = "rally_openstack.task.scenarios"
+MAGNUM_UTILS = "%s.magnum.utils" % SCN
 
 
 class ClustersGeneratorTestCase(test.ScenarioTestCase):
@@ -143,8 +144,9 @@ class ClustersGeneratorTestCase(test.ScenarioTestCase):
                       for i in range(tenants_count)]
         mock__create_cluster.assert_has_calls(mock_calls)
 
+    @mock.patch("%s.drop_k8s_clients" % MAGNUM_UTILS)
     @mock.patch("%s.cluster_templates.resource_manager.cleanup" % CTX)
-    def test_cleanup(self, mock_cleanup):
+    def test_cleanup(self, mock_cleanup, mock_drop_k8s_clients):
         self.context.update({
             "users": mock.MagicMock()
         })
@@ -155,3 +157,5 @@ class ClustersGeneratorTestCase(test.ScenarioTestCase):
             users=self.context["users"],
             superclass=magnum_utils.MagnumScenario,
             task_id=self.context["owner_id"])
+        mock_drop_k8s_clients.assert_called_once_with(
+            self.context["task"]["uuid"])
@@ -111,7 +111,7 @@ class ShareNetworksTestCase(test.TestCase):
     def setUp(self):
         super(self.__class__, self).setUp()
         self.ctxt_use_existing = {
-            "task": mock.MagicMock(),
+            "task": {"uuid": "task_id"},
             "config": {
                 "existing_users": {"foo": "bar"},
                 consts.SHARE_NETWORKS_CONTEXT_NAME: {
@@ -61,6 +61,11 @@ class AllowSSHContextTestCase(test.TestCase):
                     "security_group_rules": []
                 }
             }
+            nc.create_security_group_rule.side_effect = lambda body: {
+                "security_group_rules": [
+                    dict(rule, id="rule-%s" % j)
+                    for j, rule in enumerate(body["security_group_rules"])]
+            }
 
         allow_ssh.AllowSSH(self.ctx).setup()
 
@@ -92,17 +97,48 @@ class AllowSSHContextTestCase(test.TestCase):
                 rules = copy.deepcopy(allow_ssh._RULES_TO_ADD)
                 for rule in rules:
                     rule["security_group_id"] = secgroup["id"]
+                nc.create_security_group_rule.assert_called_once_with(
+                    {"security_group_rules": rules})
                 self.assertEqual(
-                    [mock.call({"security_group_rule": rule})
-                     for rule in rules],
-                    nc.create_security_group_rule.call_args_list
-                )
+                    len(rules), len(secgroup["security_group_rules"]))
 
                 processed_tenants[user["tenant_id"]] = secgroup
 
             self.assertEqual(processed_tenants[user["tenant_id"]]["id"],
                              user["secgroup"]["id"])
 
+    def test_setup_with_existing_rules(self):
+        existing_rule = dict(allow_ssh._RULES_TO_ADD[0], id="rule")
+        for user in self.ctx["users"]:
+            clients = user["credential"].clients.return_value
+            nc = clients.neutron.return_value
+            nc.list_extensions.return_value = {
+                "extensions": [{"alias": "security-group"}]
+            }
+            nc.create_security_group.return_value = {
+                "security_group": {
+                    "id": "security-group",
+                    "security_group_rules": [existing_rule]
+                }
+            }
+            nc.create_security_group_rule.return_value = {
+                "security_group_rules": [{"id": "new-rule"}]
+            }
+
+        allow_ssh.AllowSSH(self.ctx).setup()
+
+        rules = copy.deepcopy(allow_ssh._RULES_TO_ADD[1:])
+        for rule in rules:
+            rule["security_group_id"] = "security-group"
+        # the first user of every tenant is used
+        for user in (self.ctx["users"][0], self.ctx["users"][2]):
+            nc = user["credential"].clients.return_value.neutron.return_value
+            nc.create_security_group_rule.assert_called_once_with(
+                {"security_group_rules": rules})
+        for user in self.ctx["users"]:
+            self.assertEqual([existing_rule, {"id": "new-rule"}],
+                             user["secgroup"]["security_group_rules"])
+
     def test_setup_no_security_group_extension(self):
         clients = self.ctx["users"][0]["credential"].clients.return_value
         nc = clients.neutron.return_value
@@ -118,3 +154,29 @@ class AllowSSHContextTestCase(test.TestCase):
             if i == 0:
                 continue
             self.assertFalse(user["credential"].clients.called)
+
+    @mock.patch("%s.AllowSSH._run_per_tenants" % CTX)
+    def test_setup_workers(self, mock_allow_ssh__run_per_tenants):
+        user = self.ctx["users"][0]
+        nc = user["credential"].clients.return_value.neutron.return_value
+        nc.list_extensions.return_value = {
+            "extensions": [{"alias": "security-group"}]
+        }
+        nc.create_security_group.return_value = {
+            "security_group": {"id": "security-group"}}
+        nc.create_security_group_rule.return_value = {
+            "security_group_rules": []}
+        self.ctx["users"] = [user]
+        mock_allow_ssh__run_per_tenants.side_effect = (
+            lambda func, workers: func(user, user["tenant_id"]))
+
+        for config, workers in ((None, 1),
+                                ({}, 1),
+                                ({"resource_management_workers": 5}, 5)):
+            mock_allow_ssh__run_per_tenants.reset_mock()
+            self.ctx["config"] = {"allow_ssh": config}
+
+            allow_ssh.AllowSSH(self.ctx).setup()
+
+            mock_allow_ssh__run_per_tenants.assert_called_once_with(
+                mock.ANY, workers)
@@ -73,9 +73,9 @@ class NetworkTestCase(test.TestCase):
             {"id": "subnet2-id", "name": "subnet2-name"}
         ]
         router = {"id": "router"}
-        nc.create_network.return_value = {"network": network.copy()}
+        nc.create_network.return_value = {"networks": [network.copy()]}
         nc.create_router.return_value = {"router": router.copy()}
-        nc.create_subnet.side_effect = [{"subnet": s} for s in subnets]
+        nc.create_subnet.return_value = {"subnets": subnets}
 
         network_context.Network(ctx).setup()
 
@@ -91,19 +91,15 @@ class NetworkTestCase(test.TestCase):
         )
 
         nc.create_network.assert_called_once_with(
-            {"network": {"name": mock.ANY}})
+            {"networks": [{"name": mock.ANY}]})
         nc.create_router.assert_called_once_with(
             {"router": {"name": mock.ANY}})
-        self.assertEqual(
-            [
-                mock.call({"subnet": {
-                    "name": mock.ANY, "network_id": network["id"],
-                    "dns_nameservers": mock.ANY,
-                    "ip_version": 4,
-                    "cidr": mock.ANY}})
-                for i in range(2)],
-            nc.create_subnet.call_args_list
-        )
+        nc.create_subnet.assert_called_once_with({"subnets": [
+            {"name": mock.ANY, "network_id": network["id"],
+             "dns_nameservers": mock.ANY,
+             "ip_version": 4,
+             "cidr": mock.ANY}
+            for i in range(2)]})
         self.assertEqual(
             [
                 mock.call(router["id"], {"subnet_id": subnets[0]["id"]}),
@@ -127,9 +123,9 @@ class NetworkTestCase(test.TestCase):
             {"id": "subnet2-id", "name": "subnet2-name"}
         ]
         router = {"id": "router"}
-        nc.create_network.return_value = {"network": network.copy()}
+        nc.create_network.return_value = {"networks": [network.copy()]}
         nc.create_router.return_value = {"router": router.copy()}
-        nc.create_subnet.side_effect = [{"subnet": s} for s in subnets]
+        nc.create_subnet.return_value = {"subnets": subnets}
 
         network_context.Network(ctx).setup()
 
@@ -145,23 +141,53 @@ class NetworkTestCase(test.TestCase):
         )
 
         nc.create_network.assert_called_once_with(
-            {"network": {"name": mock.ANY}})
-        self.assertEqual(
-            [
-                mock.call({"subnet": {
-                    "name": mock.ANY, "network_id": network["id"],
-                    # rally.task.context.Context converts list to unchangeable
-                    #   collection - tuple
-                    "dns_nameservers": tuple(dns_nameservers),
-                    "ip_version": 4,
-                    "cidr": mock.ANY}})
-                for i in range(2)],
-            nc.create_subnet.call_args_list
-        )
+            {"networks": [{"name": mock.ANY}]})
+        nc.create_subnet.assert_called_once_with({"subnets": [
+            {"name": mock.ANY, "network_id": network["id"],
+             # rally.task.context.Context converts list to unchangeable
+             #   collection - tuple
+             "dns_nameservers": tuple(dns_nameservers),
+             "ip_version": 4,
+             "cidr": mock.ANY}
+            for i in range(2)]})
 
         self.assertFalse(nc.create_router.called)
         self.assertFalse(nc.add_interface_router.called)
 
+    @mock.patch("%s.neutron.NeutronService" % PATH)
+    def test_setup_in_parallel(self, mock_neutron_service):
+        ctx = self.get_context(networks_per_tenant=2, router=None,
+                               resource_management_workers=2)
+        topologies = {
+            "foo_tenant": [{"network": {"id": "foo-net-%s" % i},
+                            "subnets": [{"id": "foo-subnet-%s" % i}],
+                            "routers": []} for i in range(2)],
+            "bar_tenant": [{"network": {"id": "bar-net"},
+                            "subnets": [{"id": "bar-subnet"}],
+                            "routers": [{"id": "bar-router"}]}]}
+        clients = {user["credential"].clients.return_value: user["tenant_id"]
+                   for user in ctx["users"]}
+
+        def neutron_service(clients_obj, name_generator, atomic_inst):
+            service = mock.Mock()
+            service.create_network_topologies.return_value = topologies[
+                clients[clients_obj]]
+            return service
+
+        mock_neutron_service.side_effect = neutron_service
+
+        network_context.Network(ctx).setup()
+
+        self.assertEqual(
+            [{"id": "foo-net-0", "router_id": None},
+             {"id": "foo-net-1", "router_id": None}],
+            ctx["tenants"]["foo_tenant"]["networks"])
+        self.assertEqual(
+            [{"id": "foo-subnet-0"}, {"id": "foo-subnet-1"}],
+            ctx["tenants"]["foo_tenant"]["subnets"])
+        self.assertEqual([{"id": "bar-net", "router_id": "bar-router"}],
+                         ctx["tenants"]["bar_tenant"]["networks"])
+
     @mock.patch("%s.resource_manager.cleanup" % PATH)
     def test_cleanup(self, mock_cleanup):
         ctx = self.get_context()
@@ -47,7 +47,8 @@ class ServerGeneratorTestCase(test.ScenarioTestCase):
             "tenants": self._gen_tenants(tenants_count)})
 
         inst = servers.ServerGenerator(self.context)
-        self.assertEqual({"auto_assign_nic": False, "servers_per_tenant": 5},
+        self.assertEqual({"auto_assign_nic": False, "servers_per_tenant": 5,
+                          "resource_management_workers": 1},
                          inst.config)
 
     @mock.patch("%s.nova.utils.NovaScenario._boot_servers" % SCN,
@@ -90,7 +91,8 @@ class ServerGeneratorTestCase(test.ScenarioTestCase):
                     "flavor": {
                         "name": "m1.tiny",
                     },
-                    "nics": ["foo", "bar"]
+                    "nics": ["foo", "bar"],
+                    "resource_management_workers": 2
                 },
             },
             "admin": {
@@ -18,6 +18,7 @@ from unittest import mock
 
 import ddt
 
+from rally import exceptions
 from rally.common import logging
 from rally.task import context
 
@@ -114,24 +115,26 @@ class QuotasTestCase(test.TestCase):
 
         tenants = ctx["tenants"]
         cinder_quotas = ctx["config"]["quotas"]["cinder"]
-        cinder_quo.get.return_value = cinder_quotas
+        original_quotas = dict((k, 10) for k in cinder_quotas)
+        cinder_quo.get.return_value = original_quotas
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 cinder_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **cinder_quotas)
-                              for tenant in tenants],
-                             cinder_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    cinder_quo.get.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **cinder_quotas)
+                                   for tenant in tenants],
+                                  cinder_quo.update.call_args_list)
             mock_cinder_quotas.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **cinder_quotas)
-                              for tenant in tenants],
-                             cinder_quo.update.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **original_quotas)
+                                   for tenant in tenants],
+                                  cinder_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             cinder_quo.delete.call_args_list)
+            self.assertCountEqual([mock.call(tenant) for tenant in tenants],
+                                  cinder_quo.delete.call_args_list)
 
     @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
     @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
@@ -161,24 +164,26 @@ class QuotasTestCase(test.TestCase):
 
         tenants = ctx["tenants"]
         nova_quotas = ctx["config"]["quotas"]["nova"]
-        nova_quo.get.return_value = nova_quotas
+        original_quotas = dict((k, 10) for k in nova_quotas)
+        nova_quo.get.return_value = original_quotas
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 nova_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **nova_quotas)
-                              for tenant in tenants],
-                             nova_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    nova_quo.get.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **nova_quotas)
+                                   for tenant in tenants],
+                                  nova_quo.update.call_args_list)
             mock_nova_quotas.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **nova_quotas)
-                              for tenant in tenants],
-                             nova_quo.update.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **original_quotas)
+                                   for tenant in tenants],
+                                  nova_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             nova_quo.delete.call_args_list)
+            self.assertCountEqual([mock.call(tenant) for tenant in tenants],
+                                  nova_quo.delete.call_args_list)
 
     @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
     @mock.patch("%s.neutron_quotas.NeutronQuotas" % QUOTAS_PATH)
@@ -203,24 +208,84 @@ class QuotasTestCase(test.TestCase):
 
         tenants = ctx["tenants"]
         neutron_quotas = ctx["config"]["quotas"]["neutron"]
-        neutron_quo.get.return_value = neutron_quotas
+        original_quotas = dict((k, 10) for k in neutron_quotas)
+        neutron_quo.get.return_value = original_quotas
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 neutron_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **neutron_quotas)
-                              for tenant in tenants],
-                             neutron_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    neutron_quo.get.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **neutron_quotas)
+                                   for tenant in tenants],
+                                  neutron_quo.update.call_args_list)
             neutron_quo.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **neutron_quotas)
-                              for tenant in tenants],
-                             neutron_quo.update.call_args_list)
+            self.assertCountEqual([mock.call(tenant, **original_quotas)
+                                   for tenant in tenants],
+                                  neutron_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             neutron_quo.delete.call_args_list)
+            self.assertCountEqual([mock.call(tenant) for tenant in tenants],
+                                  neutron_quo.delete.call_args_list)
+
+    @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
+    @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
+    def test_unchanged_quotas_are_not_updated(self, mock_nova_quotas,
+                                              mock_clients):
+        nova_quo = mock_nova_quotas.return_value
+        ctx = copy.deepcopy(self.context)
+        ctx["config"]["existing_users"] = None
+        ctx["config"]["quotas"] = {"nova": {"instances": 10, "cores": 20}}
+        nova_quo.get.side_effect = lambda tenant_id: {
+            "t1": {"instances": 10, "cores": 20, "ram": 1},
+            "t2": {"instances": 10, "cores": 5, "ram": 1}}[tenant_id]
+
+        with quotas.Quotas(ctx) as quotas_ctx:
+            quotas_ctx.setup()
+            nova_quo.update.assert_called_once_with("t2", cores=20)
+            self.assertEqual([("nova", "t2", {"cores": 5})],
+                             quotas_ctx.original_quotas)
+            nova_quo.update.reset_mock()
+
+        nova_quo.update.assert_called_once_with("t2", cores=5)
+        self.assertFalse(nova_quo.delete.called)
+
+    @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
+    @mock.patch("%s.cinder_quotas.CinderQuotas" % QUOTAS_PATH)
+    @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
+    def test_setup_failures(self, mock_nova_quotas, mock_cinder_quotas,
+                            mock_clients):
+        mock_nova_quotas.return_value.update.side_effect = (
+            lambda tenant_id, **kw: 1 / 0 if tenant_id == "t2" else None)
+        ctx = copy.deepcopy(self.context)
+        ctx["config"]["quotas"] = {"nova": {"instances": 10},
+                                   "cinder": {"volumes": 10},
+                                   "resource_management_workers": 3}
+
+        quotas_ctx = quotas.Quotas(ctx)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              quotas_ctx.setup)
+
+        self.assertIn("Failed to update 1 quota(s): nova quotas of tenant "
+                      "t2: division by zero", str(e))
+        self.assertEqual(
+            2, mock_cinder_quotas.return_value.update.call_count)
+
+    @mock.patch("%s.quotas.broker.run" % QUOTAS_PATH)
+    @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
+    def test_setup_workers_option(self, mock_clients, mock_broker_run):
+        quotas.cfg.CONF.set_override(
+            "users_context_resource_management_workers", 1, "openstack")
+        self.addCleanup(quotas.cfg.CONF.clear_override,
+                        "users_context_resource_management_workers",
+                        "openstack")
+        ctx = copy.deepcopy(self.context)
+        ctx["config"]["quotas"] = {"nova": {"instances": 10}}
+
+        quotas.Quotas(ctx).setup()
+
+        mock_broker_run.assert_called_once_with(mock.ANY, mock.ANY, 1)
 
     @mock.patch("rally_openstack.task.contexts."
                 "quotas.quotas.osclients.Clients")
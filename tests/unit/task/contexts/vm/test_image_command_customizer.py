@@ -73,6 +73,7 @@ class ImageCommandCustomizerContextVMTestCase(test.TestCase):
                      "script_file": "foo_script"})
 
         self.assertEqual((0, "foo_stdout", "foo_stderr"), retval)
+        mock_vm_scenario.return_value._close_ssh.assert_called_once_with()
 
     @mock.patch("%s.vm_utils.VMScenario" % BASE)
     def test_customize_image_fail(self, mock_vm_scenario):
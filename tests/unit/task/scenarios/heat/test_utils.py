@@ -200,11 +200,19 @@ class HeatScenarioTestCase(test.ScenarioTestCase):
         self.assertEqual(scenario._count_instances(self.stack), 2)
         self.clients("heat").resources.list.assert_called_once_with(
             self.stack.id,
-            nested_depth=1)
+            nested_depth=1,
+            filters={"type": "OS::Nova::Server"})
+
+    def _instance(self, status):
+        return mock.Mock(resource_type="OS::Nova::Server",
+                         resource_status=status)
 
     def test__scale_stack(self):
         scenario = utils.HeatScenario(self.context)
-        scenario._count_instances = mock.Mock(side_effect=[3, 3, 2])
+        scenario._list_instances = mock.Mock(side_effect=[
+            [self._instance("CREATE_COMPLETE")] * 3,
+            [self._instance("CREATE_COMPLETE")] * 3,
+            [self._instance("CREATE_COMPLETE")] * 2])
         scenario._stack_webhook = mock.Mock()
 
         scenario._scale_stack(self.stack, "test_output_key", -1)
@@ -214,14 +222,34 @@ class HeatScenarioTestCase(test.ScenarioTestCase):
         self.mock_wait_for.mock.assert_called_once_with(
             self.stack,
             is_ready=mock.ANY,
-            failure_statuses=["UPDATE_FAILED", "ERROR"],
-            update_resource=self.mock_get_from_manager.mock.return_value,
             timeout=CONF.openstack.heat_stack_scale_timeout,
             check_interval=CONF.openstack.heat_stack_scale_poll_interval)
-        self.mock_get_from_manager.mock.assert_called_once_with()
+        self.assertFalse(self.mock_get_from_manager.mock.called)
+
+        is_ready = self.mock_wait_for.mock.call_args[1]["is_ready"]
+        self.assertFalse(is_ready(self.stack))
+        self.assertTrue(is_ready(self.stack))
 
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "heat.scale_with_test_output_key")
+        self.assertEqual([], scenario.atomic_actions()[0]["children"])
+
+    def test__scale_stack_instances_not_complete(self):
+        scenario = utils.HeatScenario(self.context)
+        scenario._list_instances = mock.Mock(side_effect=[
+            [self._instance("CREATE_COMPLETE")],
+            [self._instance("CREATE_COMPLETE"),
+             self._instance("CREATE_IN_PROGRESS")],
+            [self._instance("CREATE_COMPLETE"),
+             mock.Mock(resource_status="CREATE_FAILED")]])
+        scenario._stack_webhook = mock.Mock()
+
+        scenario._scale_stack(self.stack, "test_output_key", 1)
+
+        is_ready = self.mock_wait_for.mock.call_args[1]["is_ready"]
+        self.assertFalse(is_ready(self.stack))
+        self.assertRaises(exceptions.GetResourceErrorStatus,
+                          is_ready, self.stack)
 
     @mock.patch("requests.post")
     def test_stack_webhook(self, mock_post):
@@ -62,7 +62,7 @@ class PoolsTestCase(test.ScenarioTestCase):
             mock_has_calls)
         for lb in loadbalancer:
             self.assertEqual(
-                1, loadbalancer_service.wait_for_loadbalancer_prov_status
+                1, loadbalancer_service.wait_for_loadbalancers_prov_status
                 .call_count)
             self.assertEqual(1,
                              loadbalancer_service.pool_create.call_count)
@@ -89,7 +89,7 @@ class PoolsTestCase(test.ScenarioTestCase):
             mock_has_calls)
         for lb in loadbalancer:
             self.assertEqual(
-                1, loadbalancer_service.wait_for_loadbalancer_prov_status
+                1, loadbalancer_service.wait_for_loadbalancers_prov_status
                 .call_count)
             self.assertEqual(1,
                              loadbalancer_service.pool_create.call_count)
@@ -117,7 +117,7 @@ class PoolsTestCase(test.ScenarioTestCase):
             mock_has_calls)
         for lb in loadbalancer:
             self.assertEqual(
-                1, loadbalancer_service.wait_for_loadbalancer_prov_status
+                1, loadbalancer_service.wait_for_loadbalancers_prov_status
                 .call_count)
             self.assertEqual(1,
                              loadbalancer_service.pool_create.call_count)
@@ -145,7 +145,7 @@ class PoolsTestCase(test.ScenarioTestCase):
             mock_has_calls)
         for lb in loadbalancer:
             self.assertEqual(
-                1, loadbalancer_service.wait_for_loadbalancer_prov_status
+                1, loadbalancer_service.wait_for_loadbalancers_prov_status
                 .call_count)
             self.assertEqual(1,
                              loadbalancer_service.pool_create.call_count)
@@ -36,6 +36,7 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         self.cluster = mock.Mock()
         self.pod = mock.Mock()
         self.scenario = utils.MagnumScenario(self.context)
+        self.addCleanup(utils._k8s_clients.clear)
 
     def test_list_cluster_templates(self):
         fake_list = [self.cluster_template]
@@ -216,7 +217,9 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         config.cert_file = None
         config.key_file = None
         _api_client = mock_api_client.return_value
-        self.scenario._get_k8s_api_client()
+        k8s_api = self.scenario._get_k8s_api_client()
+        # the client is created once per cluster
+        self.assertIs(k8s_api, self.scenario._get_k8s_api_client())
         mock_configuration_object.assert_called_once_with()
         if hasattr(kubernetes_client, "ConfigurationObject"):
             # k8s-python < 4.0.0
@@ -225,6 +228,27 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
             mock_api_client.assert_called_once_with(config)
         mock_core_v1_api.assert_called_once_with(_api_client)
 
+        mock_core_v1_api.return_value = mock.Mock()
+        self.context["tenant"]["cluster"] = "other_cluster_uuid"
+        self.assertEqual(mock_core_v1_api.return_value,
+                         self.scenario._get_k8s_api_client())
+
+    @mock.patch(MAGNUM_UTILS + ".MagnumScenario._create_k8s_api_client")
+    def test_drop_k8s_clients(self, mock__create_k8s_api_client):
+        self.context["tenant"] = {"id": "rally_tenant_id",
+                                  "cluster": "rally_cluster_uuid"}
+        other_context = dict(self.context, task={"uuid": "other_task"})
+        utils.MagnumScenario(self.context)._get_k8s_api_client()
+        utils.MagnumScenario(other_context)._get_k8s_api_client()
+        self.assertEqual(2, len(utils._k8s_clients))
+
+        utils.drop_k8s_clients("other_task")
+
+        self.assertEqual(
+            [(os.getpid(), self.context["task"]["uuid"],
+              "rally_cluster_uuid")],
+            list(utils._k8s_clients))
+
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_list_v1pods(self, mock__get_k8s_api_client):
         k8s_api = mock__get_k8s_api_client.return_value
@@ -234,63 +258,82 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         self._test_atomic_action_timer(
             self.scenario.atomic_actions(), "magnum.k8s_list_v1pods")
 
-    @mock.patch("random.choice")
+    @mock.patch("rally_openstack.common.polling.commonutils"
+                ".interruptable_sleep")
+    @mock.patch(MAGNUM_UTILS + ".watch.Watch")
+    @mock.patch("random.choice", return_value="a")
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_create_v1pod(self, mock__get_k8s_api_client,
-                          mock_random_choice):
+                          mock_random_choice, mock_watch,
+                          mock_interruptable_sleep):
         k8s_api = mock__get_k8s_api_client.return_value
         manifest = (
             {"apiVersion": "v1", "kind": "Pod",
              "metadata": {"name": "nginx"}})
-        podname = manifest["metadata"]["name"] + "-"
-        for i in range(5):
-            podname = podname + mock_random_choice.return_value
         k8s_api.create_namespaced_pod = mock.MagicMock(
             side_effect=[ApiException(status=403), self.pod])
         not_ready_pod = kubernetes_client.models.V1Pod()
         not_ready_status = kubernetes_client.models.V1PodStatus()
         not_ready_status.phase = "not_ready"
         not_ready_pod.status = not_ready_status
-        almost_ready_pod = kubernetes_client.models.V1Pod()
-        almost_ready_status = kubernetes_client.models.V1PodStatus()
-        almost_ready_status.phase = "almost_ready"
-        almost_ready_pod.status = almost_ready_status
         ready_pod = kubernetes_client.models.V1Pod()
         ready_condition = kubernetes_client.models.V1PodCondition(
             status="True", type="Ready")
         ready_status = kubernetes_client.models.V1PodStatus()
         ready_status.phase = "Running"
         ready_status.conditions = [ready_condition]
-        ready_pod_metadata = kubernetes_client.models.V1ObjectMeta()
-        ready_pod_metadata.uid = "123456789"
-        ready_pod_spec = kubernetes_client.models.V1PodSpec(
-            node_name="host_abc",
-            containers=[]
-        )
         ready_pod.status = ready_status
-        ready_pod.metadata = ready_pod_metadata
-        ready_pod.spec = ready_pod_spec
-        k8s_api.read_namespaced_pod = mock.MagicMock(
-            side_effect=[not_ready_pod, almost_ready_pod, ready_pod])
-        self.scenario._create_v1pod(manifest)
+        mock_stream = mock_watch.return_value.stream
+        mock_stream.return_value = iter([
+            {"type": "ADDED", "object": not_ready_pod},
+            {"type": "MODIFIED", "object": ready_pod}])
+
+        self.assertEqual(ready_pod, self.scenario._create_v1pod(manifest))
+
         k8s_api.create_namespaced_pod.assert_called_with(
             body=manifest, namespace="default")
-        k8s_api.read_namespaced_pod.assert_called_with(
-            name=podname, namespace="default")
+        self.assertEqual(2, k8s_api.create_namespaced_pod.call_count)
+        self.assertEqual(1, mock_interruptable_sleep.call_count)
+        mock_stream.assert_called_once_with(
+            k8s_api.list_namespaced_pod, namespace="default",
+            field_selector="metadata.name=nginx-aaaaa",
+            timeout_seconds=1200)
+        mock_watch.return_value.stop.assert_called_once_with()
         self._test_atomic_action_timer(
             self.scenario.atomic_actions(), "magnum.k8s_create_v1pod")
 
-    @mock.patch("time.time")
-    @mock.patch("random.choice")
+    @mock.patch("rally_openstack.common.polling.commonutils"
+                ".interruptable_sleep")
+    @mock.patch(MAGNUM_UTILS + ".watch.Watch")
+    @mock.patch("random.choice", return_value="a")
+    @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
+    def test_create_v1pod_forbidden(self, mock__get_k8s_api_client,
+                                    mock_random_choice, mock_watch,
+                                    mock_interruptable_sleep):
+        k8s_api = mock__get_k8s_api_client.return_value
+        manifest = (
+            {"apiVersion": "v1", "kind": "Pod",
+             "metadata": {"name": "nginx"}})
+        k8s_api.create_namespaced_pod.side_effect = ApiException(status=403)
+
+        with mock.patch.object(utils, "_K8S_FORBIDDEN_RETRY_TIMEOUT", 0):
+            e = self.assertRaises(ApiException,
+                                  self.scenario._create_v1pod, manifest)
+        self.assertEqual(403, e.status)
+        self.assertFalse(mock_watch.return_value.stream.called)
+
+    @mock.patch(MAGNUM_UTILS + ".time")
+    @mock.patch(MAGNUM_UTILS + ".watch.Watch")
+    @mock.patch("random.choice", return_value="a")
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_create_v1pod_timeout(self, mock__get_k8s_api_client,
-                                  mock_random_choice, mock_time):
+                                  mock_random_choice, mock_watch, mock_time):
         k8s_api = mock__get_k8s_api_client.return_value
         manifest = (
             {"apiVersion": "v1", "kind": "Pod",
              "metadata": {"name": "nginx"}})
         k8s_api.create_namespaced_pod.return_value = self.pod
-        mock_time.side_effect = [1, 2, 3, 4, 5, 1800, 1801]
+        mock_time.time.side_effect = [1, 2, 1800]
         not_ready_pod = kubernetes_client.models.V1Pod()
         not_ready_status = kubernetes_client.models.V1PodStatus()
         not_ready_status.phase = "not_ready"
@@ -298,13 +341,17 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         not_ready_pod_metadata.uid = "123456789"
         not_ready_pod.status = not_ready_status
         not_ready_pod.metadata = not_ready_pod_metadata
-        k8s_api.read_namespaced_pod = mock.MagicMock(
-            side_effect=[not_ready_pod
-                         for i in range(4)])
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "ADDED", "object": not_ready_pod}])
 
-        self.assertRaises(
+        e = self.assertRaises(
             exceptions.TimeoutException,
             self.scenario._create_v1pod, manifest)
+        self.assertIn("123456789", e.format_message())
+        mock_watch.return_value.stream.assert_called_once_with(
+            k8s_api.list_namespaced_pod, namespace="default",
+            field_selector="metadata.name=nginx-aaaaa",
+            timeout_seconds=1199)
 
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_list_v1rcs(self, mock__get_k8s_api_client):
@@ -315,10 +362,11 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         self._test_atomic_action_timer(
             self.scenario.atomic_actions(), "magnum.k8s_list_v1rcs")
 
-    @mock.patch("random.choice")
+    @mock.patch(MAGNUM_UTILS + ".watch.Watch")
+    @mock.patch("random.choice", return_value="a")
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_create_v1rc(self, mock__get_k8s_api_client,
-                         mock_random_choice):
+                         mock_random_choice, mock_watch):
         k8s_api = mock__get_k8s_api_client.return_value
         manifest = (
             {"apiVersion": "v1",
@@ -329,10 +377,7 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
                       "template": {"metadata":
                                    {"labels":
                                     {"name": "nginx"}}}}})
-        suffix = "-"
-        for i in range(5):
-            suffix = suffix + mock_random_choice.return_value
-        rcname = manifest["metadata"]["name"] + suffix
+        rcname = "nginx-controller-aaaaa"
         rc = kubernetes_client.models.V1ReplicationController()
         rc.spec = kubernetes_client.models.V1ReplicationControllerSpec()
         rc.spec.replicas = manifest["spec"]["replicas"]
@@ -351,21 +396,30 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         ready_rc_metadata.name = rcname
         ready_rc.status = ready_rc_status
         ready_rc.metadata = ready_rc_metadata
-        k8s_api.read_namespaced_replication_controller = mock.MagicMock(
-            side_effect=[not_ready_rc, ready_rc])
-        self.scenario._create_v1rc(manifest)
+        mock_stream = mock_watch.return_value.stream
+        # the first watch is closed by the server before the rc is ready
+        mock_stream.side_effect = [
+            iter([{"type": "ADDED", "object": not_ready_rc}]),
+            iter([{"type": "MODIFIED", "object": ready_rc}])]
+
+        self.assertEqual(ready_rc, self.scenario._create_v1rc(manifest))
+
         (k8s_api.create_namespaced_replication_controller
             .assert_called_once_with(body=manifest, namespace="default"))
-        (k8s_api.read_namespaced_replication_controller
-            .assert_called_with(name=rcname, namespace="default"))
+        mock_stream.assert_called_with(
+            k8s_api.list_namespaced_replication_controller,
+            namespace="default", field_selector="metadata.name=%s" % rcname,
+            timeout_seconds=mock.ANY)
+        self.assertEqual(2, mock_stream.call_count)
         self._test_atomic_action_timer(
             self.scenario.atomic_actions(), "magnum.k8s_create_v1rc")
 
-    @mock.patch("time.time")
-    @mock.patch("random.choice")
+    @mock.patch(MAGNUM_UTILS + ".time")
+    @mock.patch(MAGNUM_UTILS + ".watch.Watch")
+    @mock.patch("random.choice", return_value="a")
     @mock.patch(MAGNUM_UTILS + ".MagnumScenario._get_k8s_api_client")
     def test_create_v1rc_timeout(self, mock__get_k8s_api_client,
-                                 mock_random_choice, mock_time):
+                                 mock_random_choice, mock_watch, mock_time):
         k8s_api = mock__get_k8s_api_client.return_value
         manifest = (
             {"apiVersion": "v1",
@@ -379,7 +433,7 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         rc = kubernetes_client.models.V1ReplicationController()
         rc.spec = kubernetes_client.models.V1ReplicationControllerSpec()
         rc.spec.replicas = manifest["spec"]["replicas"]
-        mock_time.side_effect = [1, 2, 3, 4, 5, 1800, 1801]
+        mock_time.time.side_effect = [1, 2, 1800]
         k8s_api.create_namespaced_replication_controller.return_value = rc
         not_ready_rc = kubernetes_client.models.V1ReplicationController()
         not_ready_rc_status = (
@@ -388,9 +442,9 @@ class MagnumScenarioTestCase(test.ScenarioTestCase):
         not_ready_rc_metadata.uid = "123456789"
         not_ready_rc.status = not_ready_rc_status
         not_ready_rc.metadata = not_ready_rc_metadata
-        k8s_api.read_namespaced_replication_controller = mock.MagicMock(
-            side_effect=[not_ready_rc
-                         for i in range(4)])
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "ADDED", "object": not_ready_rc},
+            {"type": "DELETED", "object": not_ready_rc}])
 
         self.assertRaises(
             exceptions.TimeoutException,
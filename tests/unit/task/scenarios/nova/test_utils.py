@@ -416,20 +416,12 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
         self._test_atomic_action_timer(nova_scenario.atomic_actions(),
                                        "nova.unrescue_server")
 
-    def _test_delete_servers(self, force=False):
+    @mock.patch("%s.wait_for_servers_status" % NOVA_UTILS)
+    def _test_delete_servers(self, mock_wait_for_servers_status, force=False):
         servers = [self.server, self.server1]
         nova_scenario = utils.NovaScenario(context=self.context)
         nova_scenario._delete_servers(servers, force=force)
-        check_interval = CONF.openstack.nova_server_delete_poll_interval
-        expected = []
         for server in servers:
-            expected.append(mock.call(
-                server,
-                ready_statuses=["deleted"],
-                check_deletion=True,
-                update_resource=self.mock_get_from_manager.mock.return_value,
-                check_interval=check_interval,
-                timeout=CONF.openstack.nova_server_delete_timeout))
             if force:
                 server.force_delete.assert_called_once_with()
                 self.assertFalse(server.delete.called)
@@ -437,7 +429,13 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
                 server.delete.assert_called_once_with()
                 self.assertFalse(server.force_delete.called)
 
-        self.mock_wait_for_status.mock.assert_has_calls(expected)
+        mock_wait_for_servers_status.assert_called_once_with(
+            self.clients("nova"),
+            servers,
+            ready_statuses=["deleted"],
+            check_deletion=True,
+            check_interval=CONF.openstack.nova_server_delete_poll_interval,
+            timeout=CONF.openstack.nova_server_delete_timeout)
         timer_name = "nova.%sdelete_servers" % ("force_" if force else "")
         self._test_atomic_action_timer(nova_scenario.atomic_actions(),
                                        timer_name)
@@ -475,13 +473,15 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
         {"auto_assign_nic": False, "nics": [{"net-id": "foo"}]},
         {"auto_assign_nic": False, "nics": [{"net-name": "foo_name"}]})
     @ddt.unpack
-    def test__boot_servers(self, image_id="image", flavor_id="flavor",
+    @mock.patch("%s.wait_for_servers_status" % NOVA_UTILS)
+    def test__boot_servers(self, mock_wait_for_servers_status,
+                           image_id="image", flavor_id="flavor",
                            requests=1, instances_amount=1,
                            auto_assign_nic=False, **kwargs):
         servers = [mock.Mock() for i in range(instances_amount)]
         self.clients("nova").servers.list.return_value = servers
         scenario = utils.NovaScenario(context=self.context)
-        scenario.generate_random_name = mock.Mock()
+        scenario.generate_random_name = mock.Mock(return_value="s_rally_x")
         scenario._pick_random_nic = mock.Mock(
             return_value=[{"net-id": "foo"}])
         scenario._get_network_id = mock.Mock(return_value="foo")
@@ -504,18 +504,14 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
             for i in range(requests)]
         self.clients("nova").servers.create.assert_has_calls(create_calls)
 
-        wait_for_status_calls = [
-            mock.call(
-                servers[i],
-                ready_statuses=["ACTIVE"],
-                update_resource=self.mock_get_from_manager.mock.return_value,
-                check_interval=CONF.openstack.nova_server_boot_poll_interval,
-                timeout=CONF.openstack.nova_server_boot_timeout)
-            for i in range(instances_amount)]
-        self.mock_wait_for_status.mock.assert_has_calls(wait_for_status_calls)
-
-        self.mock_get_from_manager.mock.assert_has_calls(
-            [mock.call() for i in range(instances_amount)])
+        mock_wait_for_servers_status.assert_called_once_with(
+            self.clients("nova"),
+            servers,
+            ready_statuses=["ACTIVE"],
+            check_interval=CONF.openstack.nova_server_boot_poll_interval,
+            timeout=CONF.openstack.nova_server_boot_timeout,
+            search_opts={"name": "^s_rally_x"})
+        self.assertFalse(self.mock_wait_for_status.mock.called)
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "nova.boot_servers")
 
@@ -1453,3 +1449,118 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
             ],
             nc.servers._list.call_args_list
         )
+
+    def _server(self, server_id, status):
+        server = mock.Mock(id=server_id, status=status)
+        server.name = "rally_%s" % server_id
+        return server
+
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status(self, mock_list_servers):
+        nc = mock.Mock()
+        s1 = self._server("id1", "BUILD")
+        s2 = self._server("id2", "BUILD")
+        mock_list_servers.side_effect = [
+            [s1, s2, self._server("other", "ERROR")],
+            [self._server("id1", "ACTIVE"), s2],
+            [self._server("id2", "ACTIVE")]]
+
+        result = utils.wait_for_servers_status(
+            nc, [s1, s2], ready_statuses=["active"], check_interval=0,
+            search_opts={"name": "foo"})
+
+        self.assertEqual(["id1", "id2"], [s.id for s in result])
+        self.assertEqual(["ACTIVE", "ACTIVE"], [s.status for s in result])
+        mock_list_servers.assert_has_calls(
+            [mock.call(nc, search_opts={"name": "foo"})] * 3)
+
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_deletion(self, mock_list_servers):
+        s1 = self._server("id1", "ACTIVE")
+        s2 = self._server("id2", "ACTIVE")
+        mock_list_servers.side_effect = [
+            [s1, self._server("id2", "DELETED")], []]
+
+        utils.wait_for_servers_status(
+            mock.Mock(), [s1, s2], ready_statuses=["deleted"],
+            check_deletion=True, check_interval=0)
+
+        self.assertEqual(2, mock_list_servers.call_count)
+
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_not_found(self, mock_list_servers):
+        mock_list_servers.return_value = []
+        self.assertRaises(rally_exceptions.GetResourceNotFound,
+                          utils.wait_for_servers_status,
+                          mock.Mock(), [self._server("id1", "BUILD")],
+                          ready_statuses=["active"])
+
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_error(self, mock_list_servers):
+        mock_list_servers.return_value = [self._server("id1", "ACTIVE"),
+                                          self._server("id2", "ERROR")]
+        self.assertRaises(rally_exceptions.GetResourceErrorStatus,
+                          utils.wait_for_servers_status,
+                          mock.Mock(),
+                          [self._server("id1", "BUILD"),
+                           self._server("id2", "BUILD")],
+                          ready_statuses=["active"])
+
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_name_prefix(self, mock_list_servers):
+        nc = mock.Mock()
+        s1 = self._server("id1", "ACTIVE")
+        s2 = self._server("id2", "ACTIVE")
+        mock_list_servers.return_value = [s1, s2]
+
+        utils.wait_for_servers_status(nc, [s1, s2], ready_statuses=["active"])
+
+        mock_list_servers.assert_called_once_with(
+            nc, search_opts={"name": "^rally_id"})
+
+    @mock.patch("%s.time" % NOVA_UTILS)
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_timeout(self, mock_list_servers,
+                                             mock_time):
+        mock_time.time.side_effect = [1, 2, 5, 8, 10, 11]
+        s1 = self._server("id1", "BUILD")
+        s2 = self._server("id2", "REBUILD")
+        s3 = self._server("id3", "BUILD")
+        mock_list_servers.return_value = [
+            s1, s2, self._server("id3", "ACTIVE")]
+
+        e = self.assertRaises(rally_exceptions.TimeoutException,
+                              utils.wait_for_servers_status,
+                              mock.Mock(), [s1, s2, s3],
+                              ready_statuses=["active"], timeout=10,
+                              check_interval=3)
+
+        self.assertIn("servers rally_id1, rally_id2:id1, id2", "%s" % e)
+        self.assertIn("current status id1: BUILD, id2: REBUILD", "%s" % e)
+        self.assertEqual(5, mock_list_servers.call_count)
+        self.assertEqual([mock.call(3)] * 3 + [mock.call(1)],
+                         mock_time.sleep.call_args_list)
+
+    @mock.patch("%s.time" % NOVA_UTILS)
+    @mock.patch("%s.list_servers" % NOVA_UTILS)
+    def test_wait_for_servers_status_poll_policy(self, mock_list_servers,
+                                                 mock_time):
+        CONF.set_override("poll_policy", "learned", "openstack")
+        self.addCleanup(CONF.clear_override, "poll_policy", "openstack")
+        self.addCleanup(utils.polling._durations.clear)
+        mock_time.time.side_effect = [0, 1, 3]
+        s1 = self._server("id1", "BUILD")
+        mock_list_servers.side_effect = [[s1],
+                                         [self._server("id1", "ACTIVE")]]
+
+        utils.wait_for_servers_status(
+            mock.Mock(), [s1], ready_statuses=["active"], check_interval=8)
+
+        # the first delay of a policy without history is a fraction of the
+        # interval
+        (delay,), _kw = mock_time.sleep.call_args
+        self.assertLess(delay, 8)
+        self.assertEqual(
+            {(utils.polling._workload.id,
+              ("servers", frozenset(["ACTIVE"]), 8)): 3},
+            utils.polling._durations)
@@ -35,6 +35,10 @@ class SwiftObjectsTestCase(test.ScenarioTestCase):
 
         self.assertEqual(1, scenario._create_container.call_count)
         self.assertEqual(5, scenario._upload_object.call_count)
+        payloads = [c[0][1] for c in scenario._upload_object.call_args_list]
+        # every upload streams own payload
+        self.assertEqual(5, len(set(map(id, payloads))))
+        self.assertEqual([100] * 5, [len(p) for p in payloads])
         scenario._list_objects.assert_called_once_with("AA")
 
     def test_create_container_and_object_then_delete_all(self):
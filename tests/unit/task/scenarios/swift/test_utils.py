@@ -154,3 +154,40 @@ class SwiftScenarioTestCase(test.ScenarioTestCase):
             **kw)
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "swift.delete_object")
+
+
+class ZeroPayloadTestCase(test.TestCase):
+
+    def test_read(self):
+        payload = utils.ZeroPayload(3 * 1024 * 1024 + 10)
+        self.assertEqual(3 * 1024 * 1024 + 10, len(payload))
+
+        chunks = []
+        chunk = payload.read(65536)
+        while chunk:
+            chunks.append(chunk)
+            chunk = payload.read(65536)
+        self.assertEqual(3 * 1024 * 1024 + 10, sum(len(c) for c in chunks))
+        self.assertEqual(b"\0" * 10, bytes(chunks[-1]))
+        self.assertEqual(len(payload), payload.tell())
+
+        # a single read is limited by the shared buffer
+        payload.seek(0)
+        self.assertEqual(1024 * 1024, len(payload.read()))
+        self.assertRaises(TypeError, payload.read(1).__setitem__, 0, 1)
+
+    def test_seek(self):
+        payload = utils.ZeroPayload(100)
+        self.assertEqual(90, payload.seek(-10, 2))
+        self.assertEqual(95, payload.seek(5, 1))
+        self.assertEqual(5, len(payload.read(10)))
+        self.assertEqual(0, payload.seek(-1))
+        self.assertEqual(100, payload.seek(200))
+        self.assertEqual(b"", bytes(payload.read()))
+
+    def test_instances_do_not_share_position(self):
+        first = utils.ZeroPayload(10)
+        second = utils.ZeroPayload(10)
+        first.read(7)
+        self.assertEqual(10, len(second.read()))
+        self.assertEqual(3, len(first.read()))
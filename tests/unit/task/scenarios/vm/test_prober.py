@@ -0,0 +1,144 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import socket
+import struct
+from unittest import mock
+
+from rally_openstack.task.scenarios.vm import prober
+from tests.unit import test
+
+
+PATH = "rally_openstack.task.scenarios.vm.prober"
+
+
+class ProberTestCase(test.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.prober = prober.Prober()
+
+    def _reply(self, seq, icmp_type=0):
+        return struct.pack("!BBHHH", icmp_type, 0, 0, 42, seq)
+
+    @mock.patch("%s.threading.Thread" % PATH)
+    @mock.patch("%s.socket.socket" % PATH)
+    def test_ping_icmp(self, mock_socket, mock_thread):
+        sock = mock_socket.return_value
+
+        def sendto(packet, address):
+            icmp_type, _code, _checksum, _ident, seq = struct.unpack(
+                "!BBHHH", packet[:8])
+            self.assertEqual(8, icmp_type)
+            self.assertEqual(("1.2.3.4", 0), address)
+            self.prober._handle_reply(
+                socket.AF_INET, self._reply(seq), "1.2.3.4",
+                self.prober._waiters[address[0], seq].sent_at + 0.5)
+
+        sock.sendto.side_effect = sendto
+        with mock.patch.object(self.prober, "_selector") as mock_selector:
+            self.assertEqual(0.5, self.prober.ping("1.2.3.4"))
+            self.assertEqual(0.5, self.prober.ping("1.2.3.4"))
+
+        # one socket and one receiver thread is shared by all pings
+        mock_socket.assert_called_once_with(
+            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        mock_selector.register.assert_called_once_with(
+            sock, mock.ANY, socket.AF_INET)
+        mock_thread.assert_called_once_with(
+            target=self.prober._receive, daemon=True)
+        mock_thread.return_value.start.assert_called_once_with()
+        self.assertEqual(2, sock.sendto.call_count)
+        self.assertEqual({}, self.prober._waiters)
+
+    @mock.patch("%s.threading.Thread" % PATH)
+    @mock.patch("%s.socket.socket" % PATH)
+    def test_ping_icmp_timeout(self, mock_socket, mock_thread):
+        with mock.patch.object(self.prober, "_selector"):
+            self.assertIsNone(self.prober.ping("1.2.3.4", timeout=0))
+        self.assertEqual({}, self.prober._waiters)
+
+    def test__handle_reply(self):
+        waiter = prober._Waiter()
+        waiter.sent_at = 10
+        self.prober._waiters[("1ce:c01d:bee2:15:a5:900d:a5:11fe", 7)] = waiter
+
+        # replies of other hosts and other packets are ignored
+        self.prober._handle_reply(socket.AF_INET6, self._reply(7, 129),
+                                  "1ce:c01d:bee2:15:a5:900d:a5:11ff", 11)
+        self.prober._handle_reply(socket.AF_INET6, self._reply(7, 1),
+                                  "1ce:c01d:bee2:15:a5:900d:a5:11fe", 11)
+        self.prober._handle_reply(socket.AF_INET6, b"\x81",
+                                  "1ce:c01d:bee2:15:a5:900d:a5:11fe", 11)
+        self.assertFalse(waiter.event.is_set())
+
+        self.prober._handle_reply(
+            socket.AF_INET6, self._reply(7, 129),
+            "1ce:c01d:bee2:15:a5:900d:a5:11fe%eth0", 12)
+        self.assertTrue(waiter.event.is_set())
+        self.assertEqual(2, waiter.rtt)
+
+    def test__handle_reply_with_ip_header(self):
+        waiter = prober._Waiter()
+        waiter.sent_at = 10
+        self.prober._waiters[("1.2.3.4", 7)] = waiter
+
+        self.prober._handle_reply(socket.AF_INET,
+                                  b"\x45" + b"\x00" * 19 + self._reply(7),
+                                  "1.2.3.4", 11)
+        self.assertEqual(1, waiter.rtt)
+
+    @mock.patch("%s.socket.socket" % PATH)
+    def test_ping_tcp(self, mock_socket):
+        icmp_sock_error = PermissionError()
+        tcp_sock = mock.MagicMock()
+        mock_socket.side_effect = [icmp_sock_error, tcp_sock, tcp_sock,
+                                   tcp_sock]
+        tcp_sock = tcp_sock.__enter__.return_value
+        tcp_sock.connect.side_effect = [None, ConnectionRefusedError(),
+                                        TimeoutError()]
+
+        self.assertIsNotNone(self.prober.ping("1.2.3.4", timeout=3))
+        self.assertIsNotNone(self.prober.ping("1.2.3.4", timeout=3))
+        self.assertIsNone(self.prober.ping("1.2.3.4", timeout=3))
+
+        self.assertEqual(
+            [mock.call(socket.AF_INET, socket.SOCK_DGRAM,
+                       socket.IPPROTO_ICMP)]
+            + [mock.call(socket.AF_INET, socket.SOCK_STREAM)] * 3,
+            mock_socket.call_args_list)
+        tcp_sock.settimeout.assert_called_with(3)
+        tcp_sock.connect.assert_called_with(("1.2.3.4", 22))
+
+    @mock.patch("%s.socket.create_connection" % PATH)
+    def test_ssh_banner_received(self, mock_create_connection):
+        sock = mock_create_connection.return_value.__enter__.return_value
+        sock.recv.side_effect = [b"SSH-2.0-OpenSSH_8.9\r\n", b""]
+
+        self.assertTrue(prober.ssh_banner_received("1.2.3.4", 2222, 3))
+        self.assertFalse(prober.ssh_banner_received("1.2.3.4", 2222, 3))
+        mock_create_connection.assert_called_with(("1.2.3.4", 2222), 3)
+
+        mock_create_connection.side_effect = ConnectionRefusedError()
+        self.assertFalse(prober.ssh_banner_received("1.2.3.4"))
+
+    @mock.patch("%s.os.getpid" % PATH)
+    def test_get_prober(self, mock_getpid):
+        mock_getpid.return_value = 1
+        self.addCleanup(setattr, prober, "_prober", None)
+
+        first = prober.get_prober()
+        self.assertIs(first, prober.get_prober())
+
+        # a new process gets its own prober
+        mock_getpid.return_value = 2
+        self.assertIsNot(first, prober.get_prober())
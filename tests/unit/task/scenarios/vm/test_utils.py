@@ -13,11 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import subprocess
 from unittest import mock
 
 import netaddr
 
+from rally import exceptions
 from rally.common import cfg
 
 from rally_openstack.task.scenarios.vm import utils
@@ -97,15 +97,42 @@ class VMScenarioTestCase(test.ScenarioTestCase):
             ["foo", "bar", "arg1", "arg2"],
             stdin=None)
 
-    def test__wait_for_ssh(self):
+    @mock.patch(VMTASKS_UTILS + ".rutils.interruptable_sleep")
+    @mock.patch(VMTASKS_UTILS + ".time.monotonic")
+    @mock.patch(VMTASKS_UTILS + ".prober.ssh_banner_received")
+    def test__wait_for_ssh(self, mock_ssh_banner_received, mock_monotonic,
+                           mock_interruptable_sleep):
+        mock_ssh_banner_received.side_effect = [False, False, True]
+        mock_monotonic.side_effect = [0, 1, 2, 3]
         ssh = mock.MagicMock()
         vm_scenario = utils.VMScenario(self.context)
         vm_scenario._wait_for_ssh(ssh)
-        ssh.wait.assert_called_once_with(120, 1)
+        self.assertEqual(
+            [mock.call(ssh.host, ssh.port, timeout=1)] * 3,
+            mock_ssh_banner_received.call_args_list)
+        self.assertEqual([mock.call(1)] * 2,
+                         mock_interruptable_sleep.call_args_list)
+        ssh.wait.assert_called_once_with(117, 1)
+        self._test_atomic_action_timer(vm_scenario.atomic_actions(),
+                                       "vm.wait_for_ssh")
+
+    @mock.patch(VMTASKS_UTILS + ".rutils.interruptable_sleep")
+    @mock.patch(VMTASKS_UTILS + ".time.monotonic")
+    @mock.patch(VMTASKS_UTILS + ".prober.ssh_banner_received")
+    def test__wait_for_ssh_timeout(self, mock_ssh_banner_received,
+                                   mock_monotonic, mock_interruptable_sleep):
+        mock_ssh_banner_received.return_value = False
+        mock_monotonic.side_effect = [0, 60, 121]
+        ssh = mock.MagicMock()
+        vm_scenario = utils.VMScenario(self.context)
+        self.assertRaises(exceptions.SSHTimeout,
+                          vm_scenario._wait_for_ssh, ssh)
+        self.assertFalse(ssh.wait.called)
 
     def test__wait_for_ping(self):
         vm_scenario = utils.VMScenario(self.context)
         vm_scenario._ping_ip_address = mock.Mock(return_value=True)
+        vm_scenario.add_output = mock.Mock()
         vm_scenario._wait_for_ping(netaddr.IPAddress("1.2.3.4"))
         self.mock_wait_for_status.mock.assert_called_once_with(
             utils.Host("1.2.3.4"),
@@ -113,24 +140,101 @@ class VMScenarioTestCase(test.ScenarioTestCase):
             update_resource=utils.Host.update_status,
             timeout=CONF.openstack.vm_ping_timeout,
             check_interval=CONF.openstack.vm_ping_poll_interval)
+        self.assertFalse(vm_scenario.add_output.called)
+
+    def test__wait_for_ping_with_rtt(self):
+        vm_scenario = utils.VMScenario(self.context)
+        vm_scenario.add_output = mock.Mock()
+
+        def update_status(server, **kwargs):
+            server.rtt = 0.25
+            return server
+
+        self.mock_wait_for_status.mock.side_effect = update_status
+        vm_scenario._wait_for_ping(netaddr.IPAddress("1.2.3.4"))
+        vm_scenario.add_output.assert_called_once_with(additive={
+            "title": "VM ping round-trip time",
+            "description": mock.ANY,
+            "chart_plugin": "StatsTable",
+            "data": [["round-trip time, ms", 250.0]]})
 
     @mock.patch(VMTASKS_UTILS + ".VMScenario._run_command_over_ssh")
+    @mock.patch(VMTASKS_UTILS + ".VMScenario._wait_for_ssh")
     @mock.patch("rally.utils.sshutils.SSH")
     def test__run_command(self, mock_sshutils_ssh,
+                          mock_vm_scenario__wait_for_ssh,
                           mock_vm_scenario__run_command_over_ssh):
         vm_scenario = utils.VMScenario(self.context)
         vm_scenario.context = {"user": {"keypair": {"private": "ssh"}}}
-        vm_scenario._run_command("1.2.3.4", 22, "username", "password",
-                                 command={"script_file": "foo",
-                                          "interpreter": "bar"})
+        for i in range(2):
+            vm_scenario._run_command("1.2.3.4", 22, "username", "password",
+                                     command={"script_file": "foo",
+                                              "interpreter": "bar"})
 
+        # the connection is established once and reused
         mock_sshutils_ssh.assert_called_once_with(
             "username", "1.2.3.4",
             port=22, pkey="ssh", password="password")
-        mock_sshutils_ssh.return_value.wait.assert_called_once_with(120, 1)
-        mock_vm_scenario__run_command_over_ssh.assert_called_once_with(
-            mock_sshutils_ssh.return_value,
-            {"script_file": "foo", "interpreter": "bar"})
+        mock_vm_scenario__wait_for_ssh.assert_called_once_with(
+            mock_sshutils_ssh.return_value, 120, 1)
+        self.assertEqual(
+            [mock.call(mock_sshutils_ssh.return_value,
+                       {"script_file": "foo", "interpreter": "bar"})] * 2,
+            mock_vm_scenario__run_command_over_ssh.call_args_list)
+        self.assertFalse(mock_sshutils_ssh.return_value.close.called)
+
+        vm_scenario._close_ssh("1.2.3.4")
+        mock_sshutils_ssh.return_value.close.assert_called_once_with()
+        self.assertEqual({}, vm_scenario._ssh_pool)
+
+    @mock.patch(VMTASKS_UTILS + ".VMScenario._run_command_over_ssh")
+    @mock.patch(VMTASKS_UTILS + ".VMScenario._wait_for_ssh")
+    @mock.patch("rally.utils.sshutils.SSH")
+    def test__run_command_broken_connection(
+            self, mock_sshutils_ssh, mock_vm_scenario__wait_for_ssh,
+            mock_vm_scenario__run_command_over_ssh):
+        mock_vm_scenario__run_command_over_ssh.side_effect = (
+            exceptions.SSHError("Socket error."))
+        vm_scenario = utils.VMScenario(self.context)
+        self.assertRaises(exceptions.SSHError, vm_scenario._run_command,
+                          "1.2.3.4", 22, "username", "password",
+                          command={"script_inline": "foo"}, pkey="ssh")
+
+        mock_sshutils_ssh.return_value.close.assert_called_once_with()
+        self.assertEqual({}, vm_scenario._ssh_pool)
+
+    @mock.patch(VMTASKS_UTILS + ".VMScenario._wait_for_ssh")
+    @mock.patch("rally.utils.sshutils.SSH")
+    def test__get_ssh_wait_fails(self, mock_sshutils_ssh,
+                                 mock_vm_scenario__wait_for_ssh):
+        mock_vm_scenario__wait_for_ssh.side_effect = exceptions.SSHTimeout
+        vm_scenario = utils.VMScenario(self.context)
+
+        self.assertRaises(exceptions.SSHTimeout, vm_scenario._get_ssh,
+                          "1.2.3.4", 22, "username", "password")
+
+        mock_sshutils_ssh.return_value.close.assert_called_once_with()
+        self.assertEqual({}, vm_scenario._ssh_pool)
+
+    @mock.patch(VMTASKS_UTILS + ".VMScenario._wait_for_ssh")
+    @mock.patch("rally.utils.sshutils.SSH")
+    def test__get_ssh_closed_with_server(self, mock_sshutils_ssh,
+                                         mock_vm_scenario__wait_for_ssh):
+        mock_sshutils_ssh.side_effect = [mock.Mock(), mock.Mock()]
+        scenario, server = self.get_scenario()
+        ssh = scenario._get_ssh("foo_ip", 22, "username", "password")
+        other_ssh = scenario._get_ssh("bar_ip", 22, "username", "password")
+        self.assertFalse(ssh.close.called)
+
+        scenario._delete_server_with_fip(
+            server, {"ip": "foo_ip", "id": None, "is_floating": False})
+
+        ssh.close.assert_called_once_with()
+        self.assertEqual([("bar_ip", 22, "username")],
+                         list(scenario._ssh_pool))
+        scenario._close_ssh()
+        other_ssh.close.assert_called_once_with()
+        self.assertEqual({}, scenario._ssh_pool)
 
     def get_scenario(self):
         server = mock.Mock(
@@ -248,62 +352,23 @@ class VMScenarioTestCase(test.ScenarioTestCase):
 
 class HostTestCase(test.TestCase):
 
-    @mock.patch(VMTASKS_UTILS + ".sys")
-    @mock.patch("subprocess.Popen")
-    def test__ping_ip_address_linux(self, mock_popen, mock_sys):
-        mock_popen.return_value.returncode = 0
-        mock_sys.platform = "linux2"
-
-        host = utils.Host("1.2.3.4")
-        self.assertEqual(utils.Host.ICMP_UP_STATUS,
-                         utils.Host.update_status(host).status)
-
-        mock_popen.assert_called_once_with(
-            ["ping", "-c1", "-w1", str(host.ip)],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        mock_popen.return_value.wait.assert_called_once_with()
-
-    @mock.patch(VMTASKS_UTILS + ".sys")
-    @mock.patch("subprocess.Popen")
-    def test__ping_ip_address_linux_ipv6(self, mock_popen, mock_sys):
-        mock_popen.return_value.returncode = 0
-        mock_sys.platform = "linux2"
-
-        host = utils.Host("1ce:c01d:bee2:15:a5:900d:a5:11fe")
-        self.assertEqual(utils.Host.ICMP_UP_STATUS,
-                         utils.Host.update_status(host).status)
-
-        mock_popen.assert_called_once_with(
-            ["ping6", "-c1", "-w1", str(host.ip)],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        mock_popen.return_value.wait.assert_called_once_with()
-
-    @mock.patch(VMTASKS_UTILS + ".sys")
-    @mock.patch("subprocess.Popen")
-    def test__ping_ip_address_other_os(self, mock_popen, mock_sys):
-        mock_popen.return_value.returncode = 0
-        mock_sys.platform = "freebsd10"
+    @mock.patch(VMTASKS_UTILS + ".prober.get_prober")
+    def test_update_status(self, mock_get_prober):
+        mock_ping = mock_get_prober.return_value.ping
+        mock_ping.return_value = 0.01
 
         host = utils.Host("1.2.3.4")
         self.assertEqual(utils.Host.ICMP_UP_STATUS,
                          utils.Host.update_status(host).status)
+        self.assertEqual(0.01, host.rtt)
+        mock_ping.assert_called_once_with(host.ip)
 
-        mock_popen.assert_called_once_with(
-            ["ping", "-c1", str(host.ip)],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        mock_popen.return_value.wait.assert_called_once_with()
-
-    @mock.patch(VMTASKS_UTILS + ".sys")
-    @mock.patch("subprocess.Popen")
-    def test__ping_ip_address_other_os_ipv6(self, mock_popen, mock_sys):
-        mock_popen.return_value.returncode = 0
-        mock_sys.platform = "freebsd10"
+    @mock.patch(VMTASKS_UTILS + ".prober.get_prober")
+    def test_update_status_down(self, mock_get_prober):
+        mock_get_prober.return_value.ping.return_value = None
 
         host = utils.Host("1ce:c01d:bee2:15:a5:900d:a5:11fe")
-        self.assertEqual(utils.Host.ICMP_UP_STATUS,
+        host.status = utils.Host.ICMP_UP_STATUS
+        self.assertEqual(utils.Host.ICMP_DOWN_STATUS,
                          utils.Host.update_status(host).status)
-
-        mock_popen.assert_called_once_with(
-            ["ping6", "-c1", str(host.ip)],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        mock_popen.return_value.wait.assert_called_once_with()
+        self.assertIsNone(host.rtt)
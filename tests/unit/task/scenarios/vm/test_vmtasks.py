@@ -261,7 +261,7 @@ class VMTasksTestCase(test.ScenarioTestCase):
                       "title": "Script Output"})
 
     @mock.patch("%s.heat" % BASE)
-    @mock.patch("%s.sshutils" % BASE)
+    @mock.patch("%s.vm_utils.sshutils" % BASE)
     def test_runcommand_heat(self, mock_sshutils, mock_heat):
         fake_ssh = mock.Mock()
         fake_ssh.execute.return_value = [0, "key:val", ""]
@@ -276,6 +276,7 @@ class VMTasksTestCase(test.ScenarioTestCase):
             "tenant": {"networks": [{"router_id": "1"}]}
         }
         scenario = vmtasks.RuncommandHeat(context)
+        scenario._wait_for_ssh = mock.Mock()
         scenario.generate_random_name = mock.Mock(return_value="name")
         scenario.add_output = mock.Mock()
         workload = {"username": "admin",
@@ -289,6 +290,11 @@ class VMTasksTestCase(test.ScenarioTestCase):
                     "description": "Data generated by workload",
                     "title": "Workload summary"}
         scenario.add_output.assert_called_once_with(complete=expected)
+        mock_sshutils.SSH.assert_called_once_with(
+            "admin", "ok", port=22, pkey="pk", password=None)
+        scenario._wait_for_ssh.assert_called_once_with(fake_ssh, 120, 1)
+        self.assertEqual(3, fake_ssh.execute.call_count)
+        fake_ssh.close.assert_called_once_with()
 
     def create_env_for_designate(self, zone_config=None):
         scenario = vmtasks.CheckDesignateDNSResolving(self.context)
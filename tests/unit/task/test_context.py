@@ -12,23 +12,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from rally import exceptions
+
 from rally_openstack.task import context
 from tests.unit import test
 
 
-class TenantIteratorTestCase(test.TestCase):
+class DummyContext(context.OpenStackContext):
+    def __init__(self, ctx):
+        self.context = ctx
 
-    def test__iterate_per_tenant(self):
+    def setup(self):
+        pass
 
-        class DummyContext(context.OpenStackContext):
-            def __init__(self, ctx):
-                self.context = ctx
+    def cleanup(self):
+        pass
 
-            def setup(self):
-                pass
 
-            def cleanup(self):
-                pass
+class TenantIteratorTestCase(test.TestCase):
+
+    def test__iterate_per_tenant(self):
 
         users = []
         tenants_count = 2
@@ -45,3 +48,30 @@ class TenantIteratorTestCase(test.TestCase):
             DummyContext({"users": users})._iterate_per_tenants())
 
         self.assertEqual(expected_result, real_result)
+
+    def test__run_per_tenants(self):
+        users = [{"id": str(i), "tenant_id": str(i % 3)} for i in range(9)]
+        processed = []
+
+        def func(user, tenant_id):
+            processed.append((user["id"], tenant_id))
+
+        DummyContext({"users": users})._run_per_tenants(func, 2)
+
+        self.assertEqual([("0", "0"), ("1", "1"), ("2", "2")],
+                         sorted(processed))
+
+    def test__run_per_tenants_failed(self):
+        users = [{"id": str(i), "tenant_id": str(i)} for i in range(3)]
+
+        def func(user, tenant_id):
+            if tenant_id != "1":
+                raise Exception("Failed %s" % tenant_id)
+
+        ctx = DummyContext({"users": users})
+        ctx.get_name = lambda: "dummy"
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              ctx._run_per_tenants, func, 3)
+        self.assertIn("Failed for 2 tenant(s)", "%s" % e)
+        self.assertIn("0: Failed 0", "%s" % e)
+        self.assertIn("2: Failed 2", "%s" % e)
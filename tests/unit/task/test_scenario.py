@@ -22,6 +22,8 @@ from rally_openstack.task import scenario as base_scenario
 from tests.unit import test
 
 
+SCENARIO = "rally_openstack.task.scenario"
+
 CREDENTIAL_WITHOUT_HMAC = OpenStackCredential(
     "auth_url",
     "username",
@@ -44,9 +46,11 @@ class OpenStackScenarioTestCase(test.TestCase):
         self.context = test.get_test_context()
         self.context.update({"foo": "bar"})
 
-    def test_init(self):
+    @mock.patch("%s.polling.set_workload" % SCENARIO)
+    def test_init(self, mock_set_workload):
         scenario = base_scenario.OpenStackScenario(self.context)
         self.assertEqual(self.context, scenario.context)
+        mock_set_workload.assert_called_once_with(self.context["owner_id"])
 
     def test_init_admin_context(self):
         self.context["admin"] = {"credential": mock.Mock()}
@@ -18,6 +18,7 @@ from unittest import mock
 import ddt
 
 from rally import exceptions
+from rally.common import objects
 from rally.task import scenario
 
 from rally_openstack.task import types
@@ -25,6 +26,9 @@ from tests.unit import fakes
 from tests.unit import test
 
 
+PATH = "rally_openstack.task.types"
+
+
 @ddt.ddt
 class OpenStackResourceTypeTestCase(test.TestCase):
 
@@ -94,6 +98,87 @@ class OpenStackResourceTypeTestCase(test.TestCase):
         for key in keys:
             self.assertIn("description", schema["properties"][key])
 
+    def _make_cached_type(self, task_id="task-uuid"):
+        if not hasattr(self, "_type_cls"):
+            self.addCleanup(types._listings.clear)
+            self._type_cls = type(self._make_type({}))
+        ftype = self._type_cls({"task": {"uuid": task_id}},
+                               scenario_cls=scenario.Scenario)
+        ftype._clients = mock.Mock()
+        ftype._clients.credential.auth_key.return_value = ("user",)
+        return ftype
+
+    @mock.patch("%s.time.monotonic" % PATH, return_value=100)
+    def test__list_resources(self, mock_monotonic):
+        list_resources = mock.Mock(side_effect=lambda: ["a", "b"])
+
+        ftype = self._make_cached_type()
+        resources, cached = ftype._list_resources(list_resources, ("k",))
+        self.assertEqual(["a", "b"], resources)
+        self.assertFalse(cached)
+        self.assertEqual(
+            (resources, True),
+            ftype._list_resources(list_resources, ("k",)))
+
+        # another workload of the same task reuses the listing
+        ftype = self._make_cached_type()
+        self.assertEqual((resources, True),
+                         ftype._list_resources(list_resources, ("k",)))
+        self.assertEqual(1, list_resources.call_count)
+
+        # ... but not the listing made with other arguments
+        ftype._list_resources(list_resources, ("other",))
+        self.assertEqual(2, list_resources.call_count)
+
+        # ... or in other task
+        ftype = self._make_cached_type("other-task")
+        ftype._list_resources(list_resources, ("k",))
+        self.assertEqual(3, list_resources.call_count)
+
+        # the listing expires
+        mock_monotonic.return_value += 120
+        ftype = self._make_cached_type()
+        new_resources, cached = ftype._list_resources(list_resources, ("k",))
+        self.assertFalse(cached)
+        self.assertIsNot(resources, new_resources)
+        self.assertEqual(4, list_resources.call_count)
+        # expired listings are dropped
+        self.assertEqual(1, len(types._listings))
+
+    def test__list_resources_of_task_object(self):
+        list_resources = mock.Mock(return_value=["a"])
+        ftype = self._make_cached_type()
+        ftype._context["task"] = objects.Task({"uuid": "task-uuid"})
+
+        ftype._list_resources(list_resources, ())
+        self.assertIn(("task-uuid", ftype.get_name(), ("user",)),
+                      types._listings)
+
+    def test__list_resources_without_task(self):
+        list_resources = mock.Mock(return_value=["a"])
+        for i in range(2):
+            ftype = self._make_cached_type(task_id=None)
+            ftype._list_resources(list_resources, ())
+        self.assertEqual(2, list_resources.call_count)
+        self.assertEqual({}, types._listings)
+
+    def test__lookup(self):
+        ftype = self._make_cached_type()
+        resources = [["a"], ["a", "b"]]
+        list_resources = mock.Mock(side_effect=resources)
+
+        def find(listing):
+            if "b" not in listing:
+                raise exceptions.InvalidScenarioArgument()
+            return "b"
+
+        self.assertRaises(exceptions.InvalidScenarioArgument,
+                          ftype._lookup, list_resources, find)
+        self.assertEqual(1, list_resources.call_count)
+        # "b" is not in the cached listing, so it is listed again
+        self.assertEqual("b", ftype._lookup(list_resources, find))
+        self.assertEqual(2, list_resources.call_count)
+
     def test__find_resource(self):
 
         @types.configure(name=self.id())
@@ -0,0 +1,215 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import http.client
+import json
+import threading
+from unittest import mock
+
+from tests.ci import fake_cloud
+from tests.unit import test
+
+
+PATH = "tests.ci.fake_cloud"
+
+
+class CloudTestCase(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cloud = fake_cloud.Cloud("http://127.0.0.1:5000")
+        self.admin = self._login("admin", "admin", "admin")
+
+    def _login(self, username, password, project_name):
+        code, body, headers = self.cloud.handle(
+            "POST", "/v3/auth/tokens", {}, {"auth": {
+                "identity": {"methods": ["password"], "password": {
+                    "user": {"name": username, "password": password,
+                             "domain": {"name": "Default"}}}},
+                "scope": {"project": {"name": project_name,
+                                      "domain": {"name": "Default"}}}}},
+            {})
+        self.assertEqual(201, code, body)
+        return headers["X-Subject-Token"]
+
+    def _call(self, method, path, token, body=None, query=None):
+        return self.cloud.handle(method, path, query or {}, body or {},
+                                 {"X-Auth-Token": token})[:2]
+
+    def _create_member(self, name):
+        code, project = self._call("POST", "/v3/projects", self.admin,
+                                   {"project": {"name": name}})
+        code, user = self._call("POST", "/v3/users", self.admin,
+                                {"user": {"name": name, "password": "p"}})
+        role = self.cloud.roles.find(name="member")
+        code, _body = self._call(
+            "PUT", "/v3/projects/%s/users/%s/roles/%s" % (
+                project["project"]["id"], user["user"]["id"], role.id),
+            self.admin)
+        self.assertEqual(204, code)
+        return self._login(name, "p", name), project["project"]["id"]
+
+    def test_issue_token(self):
+        code, body, headers = self.cloud.handle(
+            "GET", "/v3/auth/tokens", {}, {},
+            {"X-Auth-Token": self.admin, "X-Subject-Token": self.admin})
+        self.assertEqual(200, code)
+        token = body["token"]
+        self.assertEqual("admin", token["project"]["name"])
+        self.assertEqual(["admin"], [r["name"] for r in token["roles"]])
+        catalog = {s["type"]: s["endpoints"][0]["url"]
+                   for s in token["catalog"]}
+        self.assertEqual(
+            "http://127.0.0.1:5000/volume/v3/%s" % token["project"]["id"],
+            catalog["volumev3"])
+
+        code, body, headers = self.cloud.handle(
+            "POST", "/v3/auth/tokens", {}, {"auth": {"identity": {
+                "methods": ["password"], "password": {
+                    "user": {"name": "admin", "password": "wrong",
+                             "domain": {"id": "default"}}}}}}, {})
+        self.assertEqual(401, code)
+
+    def test_unauthorized(self):
+        self.assertEqual(401, self._call("GET", "/compute/v2.1/servers",
+                                         "wrong-token")[0])
+
+    def test_unsupported_request(self):
+        code, body = self._call("GET", "/compute/v2.1/os-hypervisors",
+                                self.admin)
+        self.assertEqual(404, code)
+        self.assertIn("doesn't support", body["error"]["message"])
+
+    def test_resources_of_projects(self):
+        token, project_id = self._create_member("foo")
+        other_token, _other_project_id = self._create_member("bar")
+
+        code, body = self._call("POST", "/network/v2.0/networks", token,
+                                {"networks": [{"name": "a"}, {"name": "b"}]})
+        self.assertEqual(201, code)
+        network = body["networks"][0]
+        self.assertEqual(project_id, network["tenant_id"])
+
+        self.assertEqual(
+            ["a", "b"],
+            [n["name"] for n in self._call(
+                "GET", "/network/v2.0/networks", token,
+                query={"router:external": "false"})[1]["networks"]])
+        # the external network is shared
+        self.assertEqual(
+            ["public"],
+            [n["name"] for n in self._call(
+                "GET", "/network/v2.0/networks",
+                other_token)[1]["networks"]])
+        self.assertEqual(
+            404, self._call("GET", "/network/v2.0/networks/%s"
+                            % network["id"], other_token)[0])
+        self.assertEqual(
+            3, len(self._call("GET", "/network/v2.0/networks",
+                              self.admin)[1]["networks"]))
+
+        self.assertEqual(
+            204, self._call("DELETE", "/network/v2.0/networks/%s"
+                            % network["id"], token)[0])
+        self.assertEqual(
+            404, self._call("GET", "/network/v2.0/networks/%s"
+                            % network["id"], token)[0])
+
+    @mock.patch("%s.time.monotonic" % PATH)
+    def test_build_time(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.cloud.build_time = 5
+        flavor = self.cloud.flavors.find(name="m1.tiny")
+
+        code, body = self._call("POST", "/compute/v2.1/servers", self.admin,
+                                {"server": {"name": "vm",
+                                            "flavorRef": flavor.id}})
+        self.assertEqual(202, code)
+        path = "/compute/v2.1/servers/%s" % body["server"]["id"]
+        self.assertEqual(
+            "BUILD",
+            self._call("GET", path, self.admin)[1]["server"]["status"])
+
+        mock_monotonic.return_value = 105
+        self.assertEqual(
+            "ACTIVE",
+            self._call("GET", path, self.admin)[1]["server"]["status"])
+
+    def test_error_rate(self):
+        self.cloud = fake_cloud.Cloud("http://127.0.0.1:5000", error_rate=1)
+        token = self._login("admin", "admin", "admin")
+
+        self.assertEqual(503, self._call("GET", "/v3/projects", token)[0])
+
+    def test_delete_user(self):
+        token, _project_id = self._create_member("foo")
+        user = self.cloud.users.find(name="foo")
+
+        self.assertEqual(
+            204, self._call("DELETE", "/v3/users/%s" % user.id,
+                            self.admin)[0])
+        self.assertEqual(401, self._call("GET", "/v3/auth/catalog",
+                                         token)[0])
+        self.assertFalse([a for a in self.cloud.assignments
+                          if a[1] == user.id])
+
+
+class ServerTestCase(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = fake_cloud.make_server("127.0.0.1", 0)
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _request(self, conn, method, path, body=None, headers=None,
+                 encode_chunked=False):
+        conn.request(method, path, body=body, headers=headers or {},
+                     encode_chunked=encode_chunked)
+        response = conn.getresponse()
+        return response.status, response.read(), response
+
+    def test_swift_objects(self):
+        conn = http.client.HTTPConnection(*self.server.server_address)
+        self.addCleanup(conn.close)
+        status, body, response = self._request(
+            conn, "POST", "/v3/auth/tokens",
+            json.dumps({"auth": {"identity": {
+                "methods": ["password"], "password": {
+                    "user": {"name": "admin", "password": "admin",
+                             "domain": {"name": "Default"}}}}}}),
+            {"Content-Type": "application/json"})
+        self.assertEqual(201, status)
+        token = response.getheader("X-Subject-Token")
+        project_id = json.loads(body)["token"]["project"]["id"]
+        container = "/object-store/v1/AUTH_%s/c" % project_id
+        headers = {"X-Auth-Token": token}
+
+        # requests of one keep-alive connection
+        self.assertEqual(
+            201, self._request(conn, "PUT", container, b"", headers)[0])
+        self.assertEqual(
+            201, self._request(conn, "PUT", container + "/o",
+                               iter([b"foo", b"bar"]), headers,
+                               encode_chunked=True)[0])
+        status, body, response = self._request(conn, "GET",
+                                               container + "/o",
+                                               headers=headers)
+        self.assertEqual((200, b"foobar"), (status, body))
+        status, body, response = self._request(
+            conn, "GET", container + "?format=json", headers=headers)
+        self.assertEqual(["o"], [o["name"] for o in json.loads(body)])
+        self.assertEqual(
+            409, self._request(conn, "DELETE", container,
+                               headers=headers)[0])
@@ -0,0 +1,77 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import requests
+from osprofiler import profiler
+
+from tests.ci import overhead_benchmarks
+from tests.unit import test
+
+
+class TransportTestCase(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        # a profiler left by other tests would add trace headers to requests
+        profiler.clean()
+
+    def test_send(self):
+        env = overhead_benchmarks.Environment()
+
+        with env.transport.patched():
+            response = requests.post(
+                overhead_benchmarks.AUTH_URL + "/v3/auth/tokens",
+                json={"auth": {"identity": {
+                    "methods": ["password"], "password": {
+                        "user": {"name": "admin", "password": "admin",
+                                 "domain": {"name": "Default"}}}}}})
+            token = response.headers["X-Subject-Token"]
+            project_id = response.json()["token"]["project"]["id"]
+            container = "%s/object-store/v1/AUTH_%s/c" % (
+                overhead_benchmarks.AUTH_URL, project_id)
+            headers = {"X-Auth-Token": token}
+            requests.put(container, headers=headers)
+            requests.put(container + "/o", headers=headers,
+                         data=iter([b"foo", b"bar"]))
+            response = requests.get(container + "/o", headers=headers)
+
+        self.assertEqual((200, b"foobar"),
+                         (response.status_code, response.content))
+        self.assertEqual({"v3": 1, "object-store": 3},
+                         env.transport.calls)
+
+    def test_benchmarks(self):
+        for name, (func, param, scales) in (
+                overhead_benchmarks._benchmarks.items()):
+            env = overhead_benchmarks.Environment()
+            with env.transport.patched():
+                func(env, 2)()
+            self.assertTrue(env.transport.calls, name)
+
+
+class CompareTestCase(test.TestCase):
+    def test_compare(self):
+        baseline = {
+            "a[x=1]": {"wall_time": 1.0, "peak_memory": 100,
+                       "api_calls": 10},
+            "b[x=1]": {"wall_time": 1.0, "peak_memory": 100,
+                       "api_calls": 10}}
+        results = {
+            "a[x=1]": {"wall_time": 3.0, "peak_memory": 300,
+                       "api_calls": 10},
+            "b[x=1]": {"wall_time": 1.6, "peak_memory": 130,
+                       "api_calls": 11},
+            "c[x=1]": {"wall_time": 100, "peak_memory": 100,
+                       "api_calls": 100}}
+
+        self.assertEqual(["b[x=1]: api_calls is 11, baseline is 10"],
+                         overhead_benchmarks.compare(results, baseline))
@@ -13,10 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
 import os
 from unittest import mock
 
 import ddt
+import fixtures
 import requests
 
 from rally import exceptions
@@ -74,36 +76,82 @@ class TempestContextTestCase(test.TestCase):
         self.context.conf.add_section("orchestration")
         self.context.conf.add_section("scenario")
 
-    @mock.patch("%s.open" % PATH, side_effect=mock.mock_open(), create=True)
-    def test__download_image_from_glance(self, mock_open):
-        self.mock_isfile.return_value = False
-        img_path = os.path.join(self.context.data_dir, "foo")
+    def _use_data_dir(self):
+        self.context.data_dir = self.useFixture(fixtures.TempDir()).path
+        self.mock_isfile.side_effect = os.path.exists
+        return os.path.join(self.context.data_dir, "foo")
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test__download_image_from_glance(self):
+        img_path = self._use_data_dir()
         img = mock.MagicMock()
         glanceclient = self.context.clients.glance()
-        glanceclient.images.data.return_value = "data"
+        glanceclient.images.data.return_value = [b"da", b"ta"]
 
         self.context._download_image_from_source(img_path, img)
-        mock_open.assert_called_once_with(img_path, "wb")
+
         glanceclient.images.data.assert_called_once_with(img.id)
-        mock_open().write.assert_has_calls([mock.call("d"),
-                                            mock.call("a"),
-                                            mock.call("t"),
-                                            mock.call("a")])
+        self.assertEqual(b"data", self._read(img_path))
+        self.assertFalse(os.path.exists(img_path + ".part"))
 
-    @mock.patch("%s.open" % PATH, side_effect=mock.mock_open())
-    @mock.patch("requests.get", return_value=mock.MagicMock(status_code=200))
-    def test__download_image_from_url_success(self, mock_get, mock_open):
-        self.mock_isfile.return_value = False
-        img_path = os.path.join(self.context.data_dir, "foo")
-        mock_get.return_value.iter_content.return_value = "data"
+    @mock.patch("requests.get")
+    def test__download_image_from_url_success(self, mock_get):
+        img_path = self._use_data_dir()
+        mock_get.return_value = mock.MagicMock(
+            status_code=200, headers={"Content-Length": "4"})
+        mock_get.return_value.iter_content.return_value = [b"da", b"ta"]
+
+        self.context._download_image_from_source(img_path)
+
+        mock_get.assert_called_once_with(CONF.openstack.img_url,
+                                         stream=True, headers={},
+                                         timeout=60)
+        self.assertEqual(b"data", self._read(img_path))
+        self.assertFalse(os.path.exists(img_path + ".part"))
+
+    @mock.patch("requests.get")
+    def test__download_image_from_url_resumed(self, mock_get):
+        img_path = self._use_data_dir()
+
+        def interrupted():
+            yield b"a"
+            raise requests.exceptions.ChunkedEncodingError()
+
+        # the partial file of an earlier run
+        with open(img_path + ".part", "wb") as f:
+            f.write(b"d")
+        mock_get.side_effect = [
+            mock.MagicMock(status_code=206, headers={"Content-Length": "3"},
+                           iter_content=mock.Mock(return_value=interrupted())),
+            mock.MagicMock(status_code=206, headers={"Content-Length": "2"},
+                           iter_content=mock.Mock(return_value=[b"ta"]))]
 
         self.context._download_image_from_source(img_path)
-        mock_get.assert_called_once_with(CONF.openstack.img_url, stream=True)
-        mock_open.assert_called_once_with(img_path, "wb")
-        mock_open().write.assert_has_calls([mock.call("d"),
-                                            mock.call("a"),
-                                            mock.call("t"),
-                                            mock.call("a")])
+
+        self.assertEqual(
+            [mock.call(CONF.openstack.img_url, stream=True,
+                       headers={"Range": "bytes=1-"}, timeout=60),
+             mock.call(CONF.openstack.img_url, stream=True,
+                       headers={"Range": "bytes=2-"}, timeout=60)],
+            mock_get.call_args_list)
+        self.assertEqual(b"data", self._read(img_path))
+
+    @mock.patch("requests.get")
+    def test__download_image_from_url_checksum_mismatch(self, mock_get):
+        img_path = self._use_data_dir()
+        CONF.set_override("img_checksum", "md5:123abc", "openstack")
+        self.addCleanup(CONF.clear_override, "img_checksum", "openstack")
+        mock_get.return_value = mock.MagicMock(status_code=200, headers={})
+        mock_get.return_value.iter_content.return_value = [b"data"]
+
+        self.assertRaises(exceptions.RallyException,
+                          self.context._download_image_from_source,
+                          img_path)
+        self.assertFalse(os.path.exists(img_path))
+        self.assertFalse(os.path.exists(img_path + ".part"))
 
     @mock.patch("requests.get")
     @ddt.data(404, 500)
@@ -165,37 +213,81 @@ class TempestContextTestCase(test.TestCase):
         self.assertIn(role3, created_roles)
         self.assertIn(role4, created_roles)
 
-    @mock.patch("rally_openstack.common.services.image.image.Image")
-    def test__discover_image(self, mock_image):
-        client = mock_image.return_value
-        client.list_images.return_value = [fakes.FakeImage(name="Foo"),
-                                           fakes.FakeImage(name="CirrOS")]
+    def test__discover_image(self):
+        glanceclient = self.context.clients.glance.return_value
+        glanceclient.images.list.return_value = [
+            fakes.FakeImage(name="Foo"), fakes.FakeImage(name="CirrOS")]
 
         image = self.context._discover_image()
         self.assertEqual("CirrOS", image.name)
+        self.context.clients.glance.assert_called_once_with("2")
+        glanceclient.images.list.assert_called_once_with(
+            filters={"status": "active", "visibility": "public"})
+
+    @ddt.data(("^CirrOS$", "CirrOS"),
+              ("^cirros-0\\.6\\.2$", "cirros-0.6.2"),
+              ("^(CirrOS|TestVM)$", "in:CirrOS,TestVM"))
+    @ddt.unpack
+    def test__discover_image_by_name(self, regex, name_filter):
+        CONF.set_override("img_name_regex", regex, "openstack")
+        self.addCleanup(CONF.clear_override, "img_name_regex", "openstack")
+        glanceclient = self.context.clients.glance.return_value
+        image = fakes.FakeImage(name=name_filter.split(",")[-1])
+        glanceclient.images.list.return_value = [image]
+
+        self.assertEqual(image, self.context._discover_image())
+        glanceclient.images.list.assert_called_once_with(
+            filters={"status": "active", "visibility": "public",
+                     "name": name_filter})
+
+    def test__discover_image_by_name_case_insensitive(self):
+        CONF.set_override("img_name_regex", "^cirros$", "openstack")
+        self.addCleanup(CONF.clear_override, "img_name_regex", "openstack")
+        glanceclient = self.context.clients.glance.return_value
+        image = fakes.FakeImage(name="CirrOS")
+        glanceclient.images.list.side_effect = [[], [image]]
+
+        self.assertEqual(image, self.context._discover_image())
+        self.assertEqual(
+            [mock.call(filters={"status": "active", "visibility": "public",
+                                "name": "cirros"}),
+             mock.call(filters={"status": "active", "visibility": "public"})],
+            glanceclient.images.list.call_args_list)
 
-    @mock.patch("%s.open" % PATH, side_effect=mock.mock_open(), create=True)
-    @mock.patch("rally_openstack.common.services.image.image.Image")
-    @mock.patch("os.path.isfile", return_value=False)
-    def test__download_image(self, mock_isfile, mock_image, mock_open):
+    def test__download_image(self):
+        self._use_data_dir()
         img_1 = mock.MagicMock()
         img_1.name = "Foo"
-        img_2 = mock.MagicMock()
+        img_2 = mock.MagicMock(
+            os_hash_algo="sha256",
+            os_hash_value=hashlib.sha256(b"data").hexdigest())
         img_2.name = "CirrOS"
         glanceclient = self.context.clients.glance()
-        glanceclient.images.data.return_value = "data"
-        mock_image.return_value.list_images.return_value = [img_1, img_2]
+        glanceclient.images.data.return_value = [b"data"]
+        glanceclient.images.list.return_value = [img_1, img_2]
+        img_path = os.path.join(self.context.data_dir, self.context.image_name)
 
         self.context._download_image()
-        img_path = os.path.join(self.context.data_dir, self.context.image_name)
-        mock_image.return_value.list_images.assert_called_once_with(
-            status="active", visibility="public")
+
+        glanceclient.images.list.assert_called_once_with(
+            filters={"status": "active", "visibility": "public"})
         glanceclient.images.data.assert_called_once_with(img_2.id)
-        mock_open.assert_called_once_with(img_path, "wb")
-        mock_open().write.assert_has_calls([mock.call("d"),
-                                            mock.call("a"),
-                                            mock.call("t"),
-                                            mock.call("a")])
+        self.assertEqual(b"data", self._read(img_path))
+
+        # the verified image is reused and the checksum is taken from the
+        #   listed image
+        self.context._download_image()
+        glanceclient.images.list.assert_called_once_with(
+            filters={"status": "active", "visibility": "public"})
+        glanceclient.images.data.assert_called_once_with(img_2.id)
+        self.assertFalse(glanceclient.images.get.called)
+
+        # the corrupted image is downloaded again
+        with open(img_path, "wb") as f:
+            f.write(b"dat")
+        self.context._download_image()
+        self.assertEqual(2, glanceclient.images.data.call_count)
+        self.assertEqual(b"data", self._read(img_path))
 
     # We can choose any option to test the '_configure_option' method. So let's
     # configure the 'flavor_ref' option.
@@ -215,7 +307,9 @@ class TempestContextTestCase(test.TestCase):
     @mock.patch("rally_openstack.common.services.image.image.Image")
     def test__discover_or_create_image_when_image_exists(self, mock_image):
         client = mock_image.return_value
-        client.list_images.return_value = [fakes.FakeImage(name="CirrOS")]
+        glanceclient = self.context.clients.glance.return_value
+        glanceclient.images.list.return_value = [
+            fakes.FakeImage(name="CirrOS")]
 
         image = self.context._discover_or_create_image()
         self.assertEqual("CirrOS", image.name)
@@ -225,6 +319,8 @@ class TempestContextTestCase(test.TestCase):
     @mock.patch("rally_openstack.common.services.image.image.Image")
     def test__discover_or_create_image(self, mock_image):
         client = mock_image.return_value
+        glanceclient = self.context.clients.glance.return_value
+        glanceclient.images.list.return_value = []
 
         image = self.context._discover_or_create_image()
         self.assertEqual(image, mock_image().create_image.return_value)